@@ -1,116 +1,390 @@
 import logging
 import os
-from argparse import ArgumentParser
+from argparse import ArgumentParser, BooleanOptionalAction
 from logging import Logger
 from pathlib import Path
 
 import gradio as gr
+import httpx
 from dotenv import load_dotenv
 from pydantic import BaseModel
 
+from .external_api import (
+    ExternalApiHttpClientConfig,
+    ExternalApiHttpClients,
+    ExternalApiMetadataCache,
+    ExternalApiPrefetcher,
+    YoutubeApiQuotaTracker,
+)
 from .graphql_client.client import Client
+from .store import (
+    LiveUpdateSubscriber,
+    PersonAccountIndexStore,
+    ProgramListStore,
+    ReferenceDataStore,
+)
 from .tab import (
+    EventConcurrencyConfig,
     create_create_game_tab,
     create_create_program_niconico_video_tab,
     create_create_program_person_tab,
     create_create_program_tab,
     create_create_program_twitter_announcement_tab,
     create_create_program_youtube_live_live_archive_tab,
+    create_create_program_youtube_live_live_archives_bulk_tab,
     create_create_program_youtube_video_live_archive_tab,
 )
-from .utility.logging_utility import setup_logger
+from .utility.logging_utility import LogFormat, setup_logger
+from .utility.metrics_utility import InstrumentedClient, add_metrics_route
+from .utility.tracing_utility import (
+    FileSpanExporter,
+    OtlpHttpSpanExporter,
+    SpanExporter,
+    setup_tracing,
+)
 
 
 class LaunchGradioArgument(BaseModel):
     youtube_api_key: str
     hasura_endpoint: str
     hasura_admin_secret: str
+    hasura_max_connections: int
+    hasura_ws_endpoint: str | None
     basic_auth_username: str | None
     basic_auth_password: str | None
     state_session_capacity: int
+    reference_data_ttl: float
+    program_list_ttl: float
+    external_api_connect_timeout: float
+    external_api_read_timeout: float
+    external_api_max_connections: int
+    external_api_keepalive_expiry: float
+    external_api_http2: bool
+    external_api_metadata_cache_file: Path | None
+    external_api_metadata_cache_max_bytes: int
+    youtube_metadata_cache_ttl: float
+    niconico_metadata_cache_ttl: float
+    twitter_metadata_cache_ttl: float
+    youtube_api_daily_quota: int
+    external_api_prefetch_debounce: float
+    default_concurrency_limit: int
+    hasura_concurrency_limit: int
+    external_api_concurrency_limit: int
+    queue_max_size: int
+    max_threads: int
+    trace_file: Path | None
+    otlp_traces_endpoint: str | None
 
 
 class AppConfig(BaseModel):
     log_level: int
     log_file: Path | None
+    log_format: LogFormat
+    log_file_max_bytes: int
+    log_file_backup_count: int
+    log_file_rotate_when: str | None
+    log_queue: bool
     youtube_api_key: str | None
     hasura_endpoint: str | None
     hasura_admin_secret: str | None
+    hasura_max_connections: int
+    hasura_ws_endpoint: str | None
     basic_auth_username: str | None
     basic_auth_password: str | None
     state_session_capacity: int
-
-
-def launch_gradio(
-    args: LaunchGradioArgument,
+    reference_data_ttl: float
+    program_list_ttl: float
+    external_api_connect_timeout: float
+    external_api_read_timeout: float
+    external_api_max_connections: int
+    external_api_keepalive_expiry: float
+    external_api_http2: bool
+    external_api_metadata_cache_file: Path | None
+    external_api_metadata_cache_max_bytes: int
+    youtube_metadata_cache_ttl: float
+    niconico_metadata_cache_ttl: float
+    twitter_metadata_cache_ttl: float
+    youtube_api_daily_quota: int
+    external_api_prefetch_debounce: float
+    default_concurrency_limit: int
+    hasura_concurrency_limit: int
+    external_api_concurrency_limit: int
+    queue_max_size: int
+    max_threads: int
+    trace_file: Path | None
+    otlp_traces_endpoint: str | None
+
+
+def create_gradio_blocks(
+    graphql_client: Client,
+    reference_data_store: ReferenceDataStore,
+    program_list_store: ProgramListStore,
+    person_account_index_store: PersonAccountIndexStore,
+    youtube_api_key: str,
+    external_api_http_clients: ExternalApiHttpClients,
+    external_api_metadata_cache: ExternalApiMetadataCache,
+    youtube_api_quota_tracker: YoutubeApiQuotaTracker,
+    external_api_prefetcher: ExternalApiPrefetcher,
+    event_concurrency_config: EventConcurrencyConfig,
     logger: Logger,
-) -> None:
-    hasura_endpoint = args.hasura_endpoint
-    hasura_admin_secret = args.hasura_admin_secret
-    youtube_api_key = args.youtube_api_key
-    basic_auth_username = args.basic_auth_username
-    basic_auth_password = args.basic_auth_password
-    state_session_capacity = args.state_session_capacity
-
-    auth: tuple[str, str] | None = None
-    if basic_auth_username is not None or basic_auth_password is not None:
-        if basic_auth_username is None or basic_auth_password is None:
-            raise Exception(
-                "Basic authentication is enabled but"
-                "one of (basic_auth_username, basic_auth_password) is None. "
-                "Set both values."
-            )
-
-        auth = (
-            basic_auth_username,
-            basic_auth_password,
-        )
-
-    graphql_client = Client(
-        url=hasura_endpoint,
-        headers={
-            "X-Hasura-Admin-Secret": hasura_admin_secret,
-        },
-    )
-
+) -> gr.Blocks:
+    # The contents of each tab are rendered when the tab is selected first
     with gr.Blocks(
         title="Amaterus Admin Gradio",
     ) as demo:
         create_create_game_tab(
             graphql_client=graphql_client,
+            reference_data_store=reference_data_store,
+            event_concurrency_config=event_concurrency_config,
             logger=logger,
         )
         create_create_program_tab(
             graphql_client=graphql_client,
+            reference_data_store=reference_data_store,
+            program_list_store=program_list_store,
+            event_concurrency_config=event_concurrency_config,
             logger=logger,
         )
         create_create_program_person_tab(
             graphql_client=graphql_client,
+            reference_data_store=reference_data_store,
+            program_list_store=program_list_store,
+            event_concurrency_config=event_concurrency_config,
             logger=logger,
         )
         create_create_program_twitter_announcement_tab(
             graphql_client=graphql_client,
+            reference_data_store=reference_data_store,
+            program_list_store=program_list_store,
+            person_account_index_store=person_account_index_store,
+            external_api_http_clients=external_api_http_clients,
+            external_api_metadata_cache=external_api_metadata_cache,
+            external_api_prefetcher=external_api_prefetcher,
+            event_concurrency_config=event_concurrency_config,
             logger=logger,
         )
         create_create_program_youtube_live_live_archive_tab(
             graphql_client=graphql_client,
+            reference_data_store=reference_data_store,
+            program_list_store=program_list_store,
+            person_account_index_store=person_account_index_store,
+            youtube_api_key=youtube_api_key,
+            external_api_http_clients=external_api_http_clients,
+            external_api_metadata_cache=external_api_metadata_cache,
+            youtube_api_quota_tracker=youtube_api_quota_tracker,
+            external_api_prefetcher=external_api_prefetcher,
+            event_concurrency_config=event_concurrency_config,
+            logger=logger,
+        )
+        create_create_program_youtube_live_live_archives_bulk_tab(
+            graphql_client=graphql_client,
+            reference_data_store=reference_data_store,
+            program_list_store=program_list_store,
             youtube_api_key=youtube_api_key,
+            external_api_http_clients=external_api_http_clients,
+            external_api_metadata_cache=external_api_metadata_cache,
+            youtube_api_quota_tracker=youtube_api_quota_tracker,
+            event_concurrency_config=event_concurrency_config,
             logger=logger,
         )
         create_create_program_youtube_video_live_archive_tab(
             graphql_client=graphql_client,
+            reference_data_store=reference_data_store,
+            program_list_store=program_list_store,
+            person_account_index_store=person_account_index_store,
             youtube_api_key=youtube_api_key,
+            external_api_http_clients=external_api_http_clients,
+            external_api_metadata_cache=external_api_metadata_cache,
+            youtube_api_quota_tracker=youtube_api_quota_tracker,
+            external_api_prefetcher=external_api_prefetcher,
+            event_concurrency_config=event_concurrency_config,
             logger=logger,
         )
         create_create_program_niconico_video_tab(
             graphql_client=graphql_client,
+            reference_data_store=reference_data_store,
+            program_list_store=program_list_store,
+            person_account_index_store=person_account_index_store,
+            external_api_http_clients=external_api_http_clients,
+            external_api_metadata_cache=external_api_metadata_cache,
+            external_api_prefetcher=external_api_prefetcher,
+            event_concurrency_config=event_concurrency_config,
             logger=logger,
         )
 
+    return demo
+
+
+def launch_gradio(
+    args: LaunchGradioArgument,
+    logger: Logger,
+) -> None:
+    hasura_endpoint = args.hasura_endpoint
+    hasura_admin_secret = args.hasura_admin_secret
+    hasura_max_connections = args.hasura_max_connections
+    hasura_ws_endpoint = args.hasura_ws_endpoint
+    youtube_api_key = args.youtube_api_key
+    basic_auth_username = args.basic_auth_username
+    basic_auth_password = args.basic_auth_password
+    state_session_capacity = args.state_session_capacity
+    reference_data_ttl = args.reference_data_ttl
+    program_list_ttl = args.program_list_ttl
+    external_api_connect_timeout = args.external_api_connect_timeout
+    external_api_read_timeout = args.external_api_read_timeout
+    external_api_max_connections = args.external_api_max_connections
+    external_api_keepalive_expiry = args.external_api_keepalive_expiry
+    external_api_http2 = args.external_api_http2
+    external_api_metadata_cache_file = args.external_api_metadata_cache_file
+    external_api_metadata_cache_max_bytes = args.external_api_metadata_cache_max_bytes
+    youtube_metadata_cache_ttl = args.youtube_metadata_cache_ttl
+    niconico_metadata_cache_ttl = args.niconico_metadata_cache_ttl
+    twitter_metadata_cache_ttl = args.twitter_metadata_cache_ttl
+    youtube_api_daily_quota = args.youtube_api_daily_quota
+    external_api_prefetch_debounce = args.external_api_prefetch_debounce
+    default_concurrency_limit = args.default_concurrency_limit
+    hasura_concurrency_limit = args.hasura_concurrency_limit
+    external_api_concurrency_limit = args.external_api_concurrency_limit
+    queue_max_size = args.queue_max_size
+    max_threads = args.max_threads
+    trace_file = args.trace_file
+    otlp_traces_endpoint = args.otlp_traces_endpoint
+
+    # Spans are exported in a background thread
+    span_exporters: list[SpanExporter] = []
+    if trace_file is not None:
+        span_exporters.append(FileSpanExporter(trace_file=trace_file))
+    if otlp_traces_endpoint is not None:
+        span_exporters.append(OtlpHttpSpanExporter(endpoint=otlp_traces_endpoint))
+    setup_tracing(
+        exporters=span_exporters,
+        logger=logger,
+    )
+
+    auth: tuple[str, str] | None = None
+    if basic_auth_username is not None or basic_auth_password is not None:
+        if basic_auth_username is None or basic_auth_password is None:
+            raise Exception(
+                "Basic authentication is enabled but"
+                "one of (basic_auth_username, basic_auth_password) is None. "
+                "Set both values."
+            )
+
+        auth = (
+            basic_auth_username,
+            basic_auth_password,
+        )
+
+    graphql_headers = {
+        "X-Hasura-Admin-Secret": hasura_admin_secret,
+    }
+    # Records the latency and errors of each GraphQL operation for /metrics
+    graphql_client = InstrumentedClient(
+        url=hasura_endpoint,
+        headers=graphql_headers,
+        http_client=httpx.AsyncClient(
+            headers=graphql_headers,
+            limits=httpx.Limits(
+                max_connections=hasura_max_connections,
+                max_keepalive_connections=hasura_max_connections,
+            ),
+        ),
+        ws_url=hasura_ws_endpoint if hasura_ws_endpoint is not None else "",
+        ws_connection_init_payload={
+            "headers": graphql_headers,
+        },
+    )
+
+    reference_data_store = ReferenceDataStore(
+        graphql_client=graphql_client,
+        ttl_seconds=reference_data_ttl,
+        logger=logger,
+    )
+    program_list_store = ProgramListStore(
+        graphql_client=graphql_client,
+        ttl_seconds=program_list_ttl,
+        logger=logger,
+    )
+    # Not followed by LiveUpdateSubscriber, so it expires with the reference data TTL
+    person_account_index_store = PersonAccountIndexStore(
+        graphql_client=graphql_client,
+        ttl_seconds=reference_data_ttl,
+        logger=logger,
+    )
+
+    # Shared by all sessions so that connections to each provider are reused
+    external_api_http_clients = ExternalApiHttpClients(
+        config=ExternalApiHttpClientConfig(
+            connect_timeout=external_api_connect_timeout,
+            read_timeout=external_api_read_timeout,
+            max_connections=external_api_max_connections,
+            keepalive_expiry=external_api_keepalive_expiry,
+            http2=external_api_http2,
+        ),
+    )
+
+    external_api_metadata_cache = ExternalApiMetadataCache(
+        database_file=external_api_metadata_cache_file,
+        max_bytes=external_api_metadata_cache_max_bytes,
+        ttl_seconds_by_provider={
+            "youtube": youtube_metadata_cache_ttl,
+            "niconico": niconico_metadata_cache_ttl,
+            "twitter": twitter_metadata_cache_ttl,
+        },
+        logger=logger,
+    )
+    # Stored next to the metadata cache so that the usage survives restarts
+    youtube_api_quota_tracker = YoutubeApiQuotaTracker(
+        database_file=external_api_metadata_cache_file,
+        daily_quota=youtube_api_daily_quota,
+        logger=logger,
+    )
+    # Fetches the metadata of a URL or ID while the operator is still typing
+    external_api_prefetcher = ExternalApiPrefetcher(
+        debounce_seconds=external_api_prefetch_debounce,
+        logger=logger,
+    )
+
+    if hasura_ws_endpoint is not None:
+        live_update_subscriber = LiveUpdateSubscriber(
+            graphql_client=graphql_client,
+            reference_data_store=reference_data_store,
+            program_list_store=program_list_store,
+            logger=logger,
+        )
+        live_update_subscriber.start()
+
+    demo = create_gradio_blocks(
+        graphql_client=graphql_client,
+        reference_data_store=reference_data_store,
+        program_list_store=program_list_store,
+        person_account_index_store=person_account_index_store,
+        youtube_api_key=youtube_api_key,
+        external_api_http_clients=external_api_http_clients,
+        external_api_metadata_cache=external_api_metadata_cache,
+        youtube_api_quota_tracker=youtube_api_quota_tracker,
+        external_api_prefetcher=external_api_prefetcher,
+        event_concurrency_config=EventConcurrencyConfig(
+            hasura_concurrency_limit=hasura_concurrency_limit,
+            external_api_concurrency_limit=external_api_concurrency_limit,
+        ),
+        logger=logger,
+    )
+
+    # Events over the limit wait in the queue; a full queue rejects new events
+    # immediately instead of letting them pile up
+    demo.queue(
+        default_concurrency_limit=default_concurrency_limit,
+        max_size=queue_max_size,
+    )
     demo.launch(
         auth=auth,
         state_session_capacity=state_session_capacity,
+        max_threads=max_threads,
+        prevent_thread_lock=True,
     )
+    # Served by the FastAPI app of Gradio for Prometheus
+    add_metrics_route(app=demo.app)
+    demo.block_thread()
 
 
 def load_app_config_from_env() -> AppConfig:
@@ -126,6 +400,20 @@ def load_app_config_from_env() -> AppConfig:
     if hasura_admin_secret is not None and len(hasura_admin_secret) == 0:
         hasura_admin_secret = None
 
+    hasura_max_connections_string = os.environ.get(
+        "AMATERUS_ADMIN_GRADIO_HASURA_MAX_CONNECTIONS"
+    )
+    hasura_max_connections = 100
+    if (
+        hasura_max_connections_string is not None
+        and len(hasura_max_connections_string) > 0
+    ):
+        hasura_max_connections = int(hasura_max_connections_string)
+
+    hasura_ws_endpoint = os.environ.get("AMATERUS_ADMIN_GRADIO_HASURA_WS_ENDPOINT")
+    if hasura_ws_endpoint is not None and len(hasura_ws_endpoint) == 0:
+        hasura_ws_endpoint = None
+
     basic_auth_username = os.environ.get("AMATERUS_ADMIN_GRADIO_BASIC_AUTH_USERNAME")
     if basic_auth_username is not None and len(basic_auth_username) == 0:
         basic_auth_username = None
@@ -147,6 +435,186 @@ def load_app_config_from_env() -> AppConfig:
     if state_session_capacity_string is not None:
         state_session_capacity = int(state_session_capacity_string)
 
+    reference_data_ttl_string = os.environ.get(
+        "AMATERUS_ADMIN_GRADIO_REFERENCE_DATA_TTL"
+    )
+    reference_data_ttl = 300.0
+    if reference_data_ttl_string is not None and len(reference_data_ttl_string) > 0:
+        reference_data_ttl = float(reference_data_ttl_string)
+
+    program_list_ttl_string = os.environ.get("AMATERUS_ADMIN_GRADIO_PROGRAM_LIST_TTL")
+    program_list_ttl = 300.0
+    if program_list_ttl_string is not None and len(program_list_ttl_string) > 0:
+        program_list_ttl = float(program_list_ttl_string)
+
+    external_api_connect_timeout_string = os.environ.get(
+        "AMATERUS_ADMIN_GRADIO_EXTERNAL_API_CONNECT_TIMEOUT"
+    )
+    external_api_connect_timeout = 5.0
+    if (
+        external_api_connect_timeout_string is not None
+        and len(external_api_connect_timeout_string) > 0
+    ):
+        external_api_connect_timeout = float(external_api_connect_timeout_string)
+
+    external_api_read_timeout_string = os.environ.get(
+        "AMATERUS_ADMIN_GRADIO_EXTERNAL_API_READ_TIMEOUT"
+    )
+    external_api_read_timeout = 15.0
+    if (
+        external_api_read_timeout_string is not None
+        and len(external_api_read_timeout_string) > 0
+    ):
+        external_api_read_timeout = float(external_api_read_timeout_string)
+
+    external_api_max_connections_string = os.environ.get(
+        "AMATERUS_ADMIN_GRADIO_EXTERNAL_API_MAX_CONNECTIONS"
+    )
+    external_api_max_connections = 20
+    if (
+        external_api_max_connections_string is not None
+        and len(external_api_max_connections_string) > 0
+    ):
+        external_api_max_connections = int(external_api_max_connections_string)
+
+    external_api_keepalive_expiry_string = os.environ.get(
+        "AMATERUS_ADMIN_GRADIO_EXTERNAL_API_KEEPALIVE_EXPIRY"
+    )
+    external_api_keepalive_expiry = 60.0
+    if (
+        external_api_keepalive_expiry_string is not None
+        and len(external_api_keepalive_expiry_string) > 0
+    ):
+        external_api_keepalive_expiry = float(external_api_keepalive_expiry_string)
+
+    external_api_http2_string = os.environ.get(
+        "AMATERUS_ADMIN_GRADIO_EXTERNAL_API_HTTP2"
+    )
+    external_api_http2 = False
+    if external_api_http2_string is not None and len(external_api_http2_string) > 0:
+        external_api_http2 = external_api_http2_string.lower() in ("1", "true", "yes")
+
+    external_api_metadata_cache_file_string = os.environ.get(
+        "AMATERUS_ADMIN_GRADIO_EXTERNAL_API_METADATA_CACHE_FILE"
+    )
+    external_api_metadata_cache_file: Path | None = None
+    if (
+        external_api_metadata_cache_file_string is not None
+        and len(external_api_metadata_cache_file_string) > 0
+    ):
+        external_api_metadata_cache_file = Path(external_api_metadata_cache_file_string)
+
+    external_api_metadata_cache_max_bytes_string = os.environ.get(
+        "AMATERUS_ADMIN_GRADIO_EXTERNAL_API_METADATA_CACHE_MAX_BYTES"
+    )
+    external_api_metadata_cache_max_bytes = 64 * 1024 * 1024
+    if (
+        external_api_metadata_cache_max_bytes_string is not None
+        and len(external_api_metadata_cache_max_bytes_string) > 0
+    ):
+        external_api_metadata_cache_max_bytes = int(
+            external_api_metadata_cache_max_bytes_string
+        )
+
+    youtube_metadata_cache_ttl_string = os.environ.get(
+        "AMATERUS_ADMIN_GRADIO_YOUTUBE_METADATA_CACHE_TTL"
+    )
+    youtube_metadata_cache_ttl = 600.0
+    if (
+        youtube_metadata_cache_ttl_string is not None
+        and len(youtube_metadata_cache_ttl_string) > 0
+    ):
+        youtube_metadata_cache_ttl = float(youtube_metadata_cache_ttl_string)
+
+    niconico_metadata_cache_ttl_string = os.environ.get(
+        "AMATERUS_ADMIN_GRADIO_NICONICO_METADATA_CACHE_TTL"
+    )
+    niconico_metadata_cache_ttl = 86400.0
+    if (
+        niconico_metadata_cache_ttl_string is not None
+        and len(niconico_metadata_cache_ttl_string) > 0
+    ):
+        niconico_metadata_cache_ttl = float(niconico_metadata_cache_ttl_string)
+
+    twitter_metadata_cache_ttl_string = os.environ.get(
+        "AMATERUS_ADMIN_GRADIO_TWITTER_METADATA_CACHE_TTL"
+    )
+    twitter_metadata_cache_ttl = 86400.0
+    if (
+        twitter_metadata_cache_ttl_string is not None
+        and len(twitter_metadata_cache_ttl_string) > 0
+    ):
+        twitter_metadata_cache_ttl = float(twitter_metadata_cache_ttl_string)
+
+    youtube_api_daily_quota_string = os.environ.get(
+        "AMATERUS_ADMIN_GRADIO_YOUTUBE_API_DAILY_QUOTA"
+    )
+    youtube_api_daily_quota = 10000
+    if (
+        youtube_api_daily_quota_string is not None
+        and len(youtube_api_daily_quota_string) > 0
+    ):
+        youtube_api_daily_quota = int(youtube_api_daily_quota_string)
+
+    external_api_prefetch_debounce_string = os.environ.get(
+        "AMATERUS_ADMIN_GRADIO_EXTERNAL_API_PREFETCH_DEBOUNCE"
+    )
+    external_api_prefetch_debounce = 0.5
+    if (
+        external_api_prefetch_debounce_string is not None
+        and len(external_api_prefetch_debounce_string) > 0
+    ):
+        external_api_prefetch_debounce = float(external_api_prefetch_debounce_string)
+
+    default_concurrency_limit_string = os.environ.get(
+        "AMATERUS_ADMIN_GRADIO_DEFAULT_CONCURRENCY_LIMIT"
+    )
+    default_concurrency_limit = 4
+    if (
+        default_concurrency_limit_string is not None
+        and len(default_concurrency_limit_string) > 0
+    ):
+        default_concurrency_limit = int(default_concurrency_limit_string)
+
+    hasura_concurrency_limit_string = os.environ.get(
+        "AMATERUS_ADMIN_GRADIO_HASURA_CONCURRENCY_LIMIT"
+    )
+    hasura_concurrency_limit = 16
+    if (
+        hasura_concurrency_limit_string is not None
+        and len(hasura_concurrency_limit_string) > 0
+    ):
+        hasura_concurrency_limit = int(hasura_concurrency_limit_string)
+
+    external_api_concurrency_limit_string = os.environ.get(
+        "AMATERUS_ADMIN_GRADIO_EXTERNAL_API_CONCURRENCY_LIMIT"
+    )
+    external_api_concurrency_limit = 8
+    if (
+        external_api_concurrency_limit_string is not None
+        and len(external_api_concurrency_limit_string) > 0
+    ):
+        external_api_concurrency_limit = int(external_api_concurrency_limit_string)
+
+    queue_max_size_string = os.environ.get("AMATERUS_ADMIN_GRADIO_QUEUE_MAX_SIZE")
+    queue_max_size = 100
+    if queue_max_size_string is not None and len(queue_max_size_string) > 0:
+        queue_max_size = int(queue_max_size_string)
+
+    max_threads_string = os.environ.get("AMATERUS_ADMIN_GRADIO_MAX_THREADS")
+    max_threads = 40
+    if max_threads_string is not None and len(max_threads_string) > 0:
+        max_threads = int(max_threads_string)
+
+    trace_file_string = os.environ.get("AMATERUS_ADMIN_GRADIO_TRACE_FILE")
+    trace_file: Path | None = None
+    if trace_file_string is not None and len(trace_file_string) > 0:
+        trace_file = Path(trace_file_string)
+
+    otlp_traces_endpoint = os.environ.get("AMATERUS_ADMIN_GRADIO_OTLP_TRACES_ENDPOINT")
+    if otlp_traces_endpoint is not None and len(otlp_traces_endpoint) == 0:
+        otlp_traces_endpoint = None
+
     log_level_string = os.environ.get("AMATERUS_ADMIN_GRADIO_LOG_LEVEL")
     log_level = logging.INFO
     if log_level_string is not None and len(log_level_string) > 0:
@@ -157,15 +625,76 @@ def load_app_config_from_env() -> AppConfig:
     if log_file_string is not None and len(log_file_string) > 0:
         log_file = Path(log_file_string)
 
+    log_format_string = os.environ.get("AMATERUS_ADMIN_GRADIO_LOG_FORMAT")
+    log_format: LogFormat = "text"
+    if log_format_string is not None and len(log_format_string) > 0:
+        if log_format_string not in ("text", "json"):
+            raise Exception(f"Unsupported log format: {log_format_string}")
+        log_format = "json" if log_format_string == "json" else "text"
+
+    log_file_max_bytes_string = os.environ.get(
+        "AMATERUS_ADMIN_GRADIO_LOG_FILE_MAX_BYTES"
+    )
+    log_file_max_bytes = 0
+    if log_file_max_bytes_string is not None and len(log_file_max_bytes_string) > 0:
+        log_file_max_bytes = int(log_file_max_bytes_string)
+
+    log_file_backup_count_string = os.environ.get(
+        "AMATERUS_ADMIN_GRADIO_LOG_FILE_BACKUP_COUNT"
+    )
+    log_file_backup_count = 5
+    if (
+        log_file_backup_count_string is not None
+        and len(log_file_backup_count_string) > 0
+    ):
+        log_file_backup_count = int(log_file_backup_count_string)
+
+    log_file_rotate_when = os.environ.get("AMATERUS_ADMIN_GRADIO_LOG_FILE_ROTATE_WHEN")
+    if log_file_rotate_when is not None and len(log_file_rotate_when) == 0:
+        log_file_rotate_when = None
+
+    log_queue_string = os.environ.get("AMATERUS_ADMIN_GRADIO_LOG_QUEUE")
+    log_queue = False
+    if log_queue_string is not None and len(log_queue_string) > 0:
+        log_queue = log_queue_string.lower() in ("1", "true", "yes")
+
     return AppConfig(
         youtube_api_key=youtube_api_key,
         hasura_endpoint=hasura_endpoint,
         hasura_admin_secret=hasura_admin_secret,
+        hasura_max_connections=hasura_max_connections,
+        hasura_ws_endpoint=hasura_ws_endpoint,
         basic_auth_username=basic_auth_username,
         basic_auth_password=basic_auth_password,
         state_session_capacity=state_session_capacity,
+        reference_data_ttl=reference_data_ttl,
+        program_list_ttl=program_list_ttl,
+        external_api_connect_timeout=external_api_connect_timeout,
+        external_api_read_timeout=external_api_read_timeout,
+        external_api_max_connections=external_api_max_connections,
+        external_api_keepalive_expiry=external_api_keepalive_expiry,
+        external_api_http2=external_api_http2,
+        external_api_metadata_cache_file=external_api_metadata_cache_file,
+        external_api_metadata_cache_max_bytes=external_api_metadata_cache_max_bytes,
+        youtube_metadata_cache_ttl=youtube_metadata_cache_ttl,
+        niconico_metadata_cache_ttl=niconico_metadata_cache_ttl,
+        twitter_metadata_cache_ttl=twitter_metadata_cache_ttl,
+        youtube_api_daily_quota=youtube_api_daily_quota,
+        external_api_prefetch_debounce=external_api_prefetch_debounce,
+        default_concurrency_limit=default_concurrency_limit,
+        hasura_concurrency_limit=hasura_concurrency_limit,
+        external_api_concurrency_limit=external_api_concurrency_limit,
+        queue_max_size=queue_max_size,
+        max_threads=max_threads,
+        trace_file=trace_file,
+        otlp_traces_endpoint=otlp_traces_endpoint,
         log_level=log_level,
         log_file=log_file,
+        log_format=log_format,
+        log_file_max_bytes=log_file_max_bytes,
+        log_file_backup_count=log_file_backup_count,
+        log_file_rotate_when=log_file_rotate_when,
+        log_queue=log_queue,
     )
 
 
@@ -192,6 +721,32 @@ def main() -> None:
         type=Path,
         default=app_config.log_file,
     )
+    parser.add_argument(
+        "--log_format",
+        type=str,
+        choices=["text", "json"],
+        default=app_config.log_format,
+    )
+    parser.add_argument(
+        "--log_file_max_bytes",
+        type=int,
+        default=app_config.log_file_max_bytes,
+    )
+    parser.add_argument(
+        "--log_file_backup_count",
+        type=int,
+        default=app_config.log_file_backup_count,
+    )
+    parser.add_argument(
+        "--log_file_rotate_when",
+        type=str,
+        default=app_config.log_file_rotate_when,
+    )
+    parser.add_argument(
+        "--log_queue",
+        action=BooleanOptionalAction,
+        default=app_config.log_queue,
+    )
     parser.add_argument(
         "--youtube_api_key",
         type=str,
@@ -210,6 +765,16 @@ def main() -> None:
         default=app_config.hasura_admin_secret,
         required=app_config.hasura_admin_secret is None,
     )
+    parser.add_argument(
+        "--hasura_max_connections",
+        type=int,
+        default=app_config.hasura_max_connections,
+    )
+    parser.add_argument(
+        "--hasura_ws_endpoint",
+        type=str,
+        default=app_config.hasura_ws_endpoint,
+    )
     parser.add_argument(
         "--basic_auth_username",
         type=str,
@@ -225,17 +790,154 @@ def main() -> None:
         type=int,
         default=app_config.state_session_capacity,
     )
+    parser.add_argument(
+        "--reference_data_ttl",
+        type=float,
+        default=app_config.reference_data_ttl,
+    )
+    parser.add_argument(
+        "--program_list_ttl",
+        type=float,
+        default=app_config.program_list_ttl,
+    )
+    parser.add_argument(
+        "--external_api_connect_timeout",
+        type=float,
+        default=app_config.external_api_connect_timeout,
+    )
+    parser.add_argument(
+        "--external_api_read_timeout",
+        type=float,
+        default=app_config.external_api_read_timeout,
+    )
+    parser.add_argument(
+        "--external_api_max_connections",
+        type=int,
+        default=app_config.external_api_max_connections,
+    )
+    parser.add_argument(
+        "--external_api_keepalive_expiry",
+        type=float,
+        default=app_config.external_api_keepalive_expiry,
+    )
+    parser.add_argument(
+        "--external_api_http2",
+        action=BooleanOptionalAction,
+        default=app_config.external_api_http2,
+    )
+    parser.add_argument(
+        "--external_api_metadata_cache_file",
+        type=Path,
+        default=app_config.external_api_metadata_cache_file,
+    )
+    parser.add_argument(
+        "--external_api_metadata_cache_max_bytes",
+        type=int,
+        default=app_config.external_api_metadata_cache_max_bytes,
+    )
+    parser.add_argument(
+        "--youtube_metadata_cache_ttl",
+        type=float,
+        default=app_config.youtube_metadata_cache_ttl,
+    )
+    parser.add_argument(
+        "--niconico_metadata_cache_ttl",
+        type=float,
+        default=app_config.niconico_metadata_cache_ttl,
+    )
+    parser.add_argument(
+        "--twitter_metadata_cache_ttl",
+        type=float,
+        default=app_config.twitter_metadata_cache_ttl,
+    )
+    parser.add_argument(
+        "--youtube_api_daily_quota",
+        type=int,
+        default=app_config.youtube_api_daily_quota,
+    )
+    parser.add_argument(
+        "--external_api_prefetch_debounce",
+        type=float,
+        default=app_config.external_api_prefetch_debounce,
+    )
+    parser.add_argument(
+        "--default_concurrency_limit",
+        type=int,
+        default=app_config.default_concurrency_limit,
+    )
+    parser.add_argument(
+        "--hasura_concurrency_limit",
+        type=int,
+        default=app_config.hasura_concurrency_limit,
+    )
+    parser.add_argument(
+        "--external_api_concurrency_limit",
+        type=int,
+        default=app_config.external_api_concurrency_limit,
+    )
+    parser.add_argument(
+        "--queue_max_size",
+        type=int,
+        default=app_config.queue_max_size,
+    )
+    parser.add_argument(
+        "--max_threads",
+        type=int,
+        default=app_config.max_threads,
+    )
+    parser.add_argument(
+        "--trace_file",
+        type=Path,
+        default=app_config.trace_file,
+    )
+    parser.add_argument(
+        "--otlp_traces_endpoint",
+        type=str,
+        default=app_config.otlp_traces_endpoint,
+    )
 
     args = parser.parse_args()
 
     log_level: int = args.log_level
     log_file: Path | None = args.log_file
+    log_format: LogFormat = args.log_format
+    log_file_max_bytes: int = args.log_file_max_bytes
+    log_file_backup_count: int = args.log_file_backup_count
+    log_file_rotate_when: str | None = args.log_file_rotate_when
+    log_queue: bool = args.log_queue
     youtube_api_key: str = args.youtube_api_key
     hasura_endpoint: str = args.hasura_endpoint
     hasura_admin_secret: str = args.hasura_admin_secret
+    hasura_max_connections: int = args.hasura_max_connections
+    hasura_ws_endpoint: str | None = args.hasura_ws_endpoint
     basic_auth_username: str | None = args.basic_auth_username
     basic_auth_password: str | None = args.basic_auth_password
     state_session_capacity: int = args.state_session_capacity
+    reference_data_ttl: float = args.reference_data_ttl
+    program_list_ttl: float = args.program_list_ttl
+    external_api_connect_timeout: float = args.external_api_connect_timeout
+    external_api_read_timeout: float = args.external_api_read_timeout
+    external_api_max_connections: int = args.external_api_max_connections
+    external_api_keepalive_expiry: float = args.external_api_keepalive_expiry
+    external_api_http2: bool = args.external_api_http2
+    external_api_metadata_cache_file: Path | None = (
+        args.external_api_metadata_cache_file
+    )
+    external_api_metadata_cache_max_bytes: int = (
+        args.external_api_metadata_cache_max_bytes
+    )
+    youtube_metadata_cache_ttl: float = args.youtube_metadata_cache_ttl
+    niconico_metadata_cache_ttl: float = args.niconico_metadata_cache_ttl
+    twitter_metadata_cache_ttl: float = args.twitter_metadata_cache_ttl
+    youtube_api_daily_quota: int = args.youtube_api_daily_quota
+    external_api_prefetch_debounce: float = args.external_api_prefetch_debounce
+    default_concurrency_limit: int = args.default_concurrency_limit
+    hasura_concurrency_limit: int = args.hasura_concurrency_limit
+    external_api_concurrency_limit: int = args.external_api_concurrency_limit
+    queue_max_size: int = args.queue_max_size
+    max_threads: int = args.max_threads
+    trace_file: Path | None = args.trace_file
+    otlp_traces_endpoint: str | None = args.otlp_traces_endpoint
 
     logging.basicConfig(
         level=log_level,
@@ -246,6 +948,11 @@ def main() -> None:
         logger=logger,
         log_level=log_level,
         log_file=log_file,
+        log_format=log_format,
+        log_file_max_bytes=log_file_max_bytes,
+        log_file_backup_count=log_file_backup_count,
+        log_file_rotate_when=log_file_rotate_when,
+        log_queue=log_queue,
     )
 
     launch_gradio(
@@ -253,9 +960,32 @@ def main() -> None:
             youtube_api_key=youtube_api_key,
             hasura_endpoint=hasura_endpoint,
             hasura_admin_secret=hasura_admin_secret,
+            hasura_max_connections=hasura_max_connections,
+            hasura_ws_endpoint=hasura_ws_endpoint,
             basic_auth_username=basic_auth_username,
             basic_auth_password=basic_auth_password,
             state_session_capacity=state_session_capacity,
+            reference_data_ttl=reference_data_ttl,
+            program_list_ttl=program_list_ttl,
+            external_api_connect_timeout=external_api_connect_timeout,
+            external_api_read_timeout=external_api_read_timeout,
+            external_api_max_connections=external_api_max_connections,
+            external_api_keepalive_expiry=external_api_keepalive_expiry,
+            external_api_http2=external_api_http2,
+            external_api_metadata_cache_file=external_api_metadata_cache_file,
+            external_api_metadata_cache_max_bytes=external_api_metadata_cache_max_bytes,
+            youtube_metadata_cache_ttl=youtube_metadata_cache_ttl,
+            niconico_metadata_cache_ttl=niconico_metadata_cache_ttl,
+            twitter_metadata_cache_ttl=twitter_metadata_cache_ttl,
+            youtube_api_daily_quota=youtube_api_daily_quota,
+            external_api_prefetch_debounce=external_api_prefetch_debounce,
+            default_concurrency_limit=default_concurrency_limit,
+            hasura_concurrency_limit=hasura_concurrency_limit,
+            external_api_concurrency_limit=external_api_concurrency_limit,
+            queue_max_size=queue_max_size,
+            max_threads=max_threads,
+            trace_file=trace_file,
+            otlp_traces_endpoint=otlp_traces_endpoint,
         ),
         logger=logger,
     )
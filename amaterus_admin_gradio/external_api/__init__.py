@@ -0,0 +1,75 @@
+from .http_client import (
+    ExternalApiHttpClientConfig,
+    ExternalApiHttpClients,
+    create_external_api_http_client,
+)
+from .metadata_cache import (
+    ExternalApiMetadataCache,
+    ExternalApiMetadataCacheEntry,
+    ExternalApiMetadataCacheStatistics,
+    ExternalApiProvider,
+)
+from .niconico_api import (
+    NiconicoVideoApiDataResponse,
+    extract_niconico_api_data_json_text_html5lib,
+    extract_niconico_api_data_json_text_streaming,
+    fetch_niconico_video_data,
+    parse_remote_niconico_content_id,
+)
+from .prefetcher import ExternalApiPrefetcher, ExternalApiPrefetchKey
+from .twitter_api import (
+    FetchTwitterTweetOembedApiResponse,
+    fetch_twitter_tweet_oembed_data,
+    parse_remote_tweet_id,
+    parse_twitter_screen_name,
+)
+from .youtube_api import (
+    YOUTUBE_API_VIDEOS_FIELDS,
+    YOUTUBE_API_VIDEOS_LIST_QUOTA_COST,
+    YOUTUBE_API_VIDEOS_MAX_ID_COUNT,
+    YoutubeApiVideoResponse,
+    YoutubeApiVideoResponseItem,
+    estimate_youtube_video_quota_cost,
+    fetch_youtube_live_data,
+    fetch_youtube_video_data,
+    fetch_youtube_video_data_batch,
+    fetch_youtube_videos,
+    is_remote_youtube_video_id,
+    parse_remote_youtube_video_id,
+)
+from .youtube_api_quota import YoutubeApiQuotaStatistics, YoutubeApiQuotaTracker
+
+__all__ = [
+    "ExternalApiHttpClientConfig",
+    "ExternalApiHttpClients",
+    "create_external_api_http_client",
+    "ExternalApiMetadataCache",
+    "ExternalApiMetadataCacheEntry",
+    "ExternalApiMetadataCacheStatistics",
+    "ExternalApiProvider",
+    "ExternalApiPrefetcher",
+    "ExternalApiPrefetchKey",
+    "NiconicoVideoApiDataResponse",
+    "extract_niconico_api_data_json_text_html5lib",
+    "extract_niconico_api_data_json_text_streaming",
+    "fetch_niconico_video_data",
+    "parse_remote_niconico_content_id",
+    "FetchTwitterTweetOembedApiResponse",
+    "fetch_twitter_tweet_oembed_data",
+    "parse_remote_tweet_id",
+    "parse_twitter_screen_name",
+    "YoutubeApiVideoResponse",
+    "YoutubeApiVideoResponseItem",
+    "YOUTUBE_API_VIDEOS_FIELDS",
+    "YOUTUBE_API_VIDEOS_LIST_QUOTA_COST",
+    "YOUTUBE_API_VIDEOS_MAX_ID_COUNT",
+    "estimate_youtube_video_quota_cost",
+    "fetch_youtube_live_data",
+    "fetch_youtube_video_data",
+    "fetch_youtube_video_data_batch",
+    "fetch_youtube_videos",
+    "is_remote_youtube_video_id",
+    "parse_remote_youtube_video_id",
+    "YoutubeApiQuotaStatistics",
+    "YoutubeApiQuotaTracker",
+]
@@ -0,0 +1,59 @@
+import httpx
+from pydantic import BaseModel
+
+
+class ExternalApiHttpClientConfig(BaseModel):
+    connect_timeout: float
+    read_timeout: float
+    max_connections: int
+    keepalive_expiry: float
+    http2: bool
+
+
+def create_external_api_http_client(
+    config: ExternalApiHttpClientConfig,
+    headers: dict[str, str] | None = None,
+) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        headers=headers,
+        timeout=httpx.Timeout(
+            timeout=config.read_timeout,
+            connect=config.connect_timeout,
+        ),
+        limits=httpx.Limits(
+            max_connections=config.max_connections,
+            max_keepalive_connections=config.max_connections,
+            keepalive_expiry=config.keepalive_expiry,
+        ),
+        http2=config.http2,
+    )
+
+
+class ExternalApiHttpClients:
+    def __init__(
+        self,
+        config: ExternalApiHttpClientConfig,
+    ) -> None:
+        self.youtube = create_external_api_http_client(
+            config=config,
+        )
+        self.niconico = create_external_api_http_client(
+            config=config,
+            headers={
+                "User-Agent": (
+                    "facebookexternalhit/1.1;Googlebot/2.1;"
+                    "Amaterusbot (+https://amaterus.aoirint.com)"
+                ),
+            },
+        )
+        self.twitter = create_external_api_http_client(
+            config=config,
+            headers={
+                "User-Agent": "Amaterusbot (+https://amaterus.aoirint.com)",
+            },
+        )
+
+    async def aclose(self) -> None:
+        await self.youtube.aclose()
+        await self.niconico.aclose()
+        await self.twitter.aclose()
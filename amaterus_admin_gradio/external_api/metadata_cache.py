@@ -0,0 +1,345 @@
+import asyncio
+import sqlite3
+import threading
+import time
+from logging import Logger
+from pathlib import Path
+from typing import Literal
+
+from pydantic import BaseModel
+
+ExternalApiProvider = Literal["youtube", "niconico", "twitter"]
+
+# The database file may be shared with YoutubeApiQuotaTracker, so a write
+# waits for the other connection instead of failing with "database is locked"
+SQLITE_BUSY_TIMEOUT_SECONDS = 30.0
+
+
+class ExternalApiMetadataCacheStatistics(BaseModel):
+    hit_count: int
+    miss_count: int
+    eviction_count: int
+    entry_count: int
+    total_bytes: int
+
+
+class ExternalApiMetadataCacheEntry(BaseModel):
+    value: str
+    # ETag of the response the value came from and the remote IDs requested
+    # together in that response (comma separated)
+    etag: str | None
+    etag_scope: str | None
+    is_fresh: bool
+
+
+class ExternalApiMetadataCache:
+    def __init__(
+        self,
+        database_file: Path | None,
+        max_bytes: int,
+        ttl_seconds_by_provider: dict[ExternalApiProvider, float],
+        logger: Logger,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.ttl_seconds_by_provider = ttl_seconds_by_provider
+        self.logger = logger
+
+        if database_file is not None:
+            database_file.parent.mkdir(parents=True, exist_ok=True)
+
+        # Used from the Gradio event loop and worker threads
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            database=str(database_file) if database_file is not None else ":memory:",
+            check_same_thread=False,
+            isolation_level=None,
+            timeout=SQLITE_BUSY_TIMEOUT_SECONDS,
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS external_api_metadata (
+                provider TEXT NOT NULL,
+                remote_id TEXT NOT NULL,
+                value TEXT NOT NULL,
+                etag TEXT,
+                etag_scope TEXT,
+                size INTEGER NOT NULL,
+                fetched_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                PRIMARY KEY (provider, remote_id)
+            )
+            """
+        )
+        column_names = {
+            row[1]
+            for row in self._connection.execute(
+                "PRAGMA table_info(external_api_metadata)"
+            ).fetchall()
+        }
+        for column_name in ("etag", "etag_scope"):
+            if column_name not in column_names:
+                self._connection.execute(
+                    f"ALTER TABLE external_api_metadata ADD COLUMN {column_name} TEXT"
+                )
+
+        self._connection.execute(
+            """
+            CREATE INDEX IF NOT EXISTS external_api_metadata_accessed_at_index
+            ON external_api_metadata (accessed_at)
+            """
+        )
+
+        row = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM external_api_metadata"
+        ).fetchone()
+        self._total_bytes: int = row[0]
+
+        self._hit_counts: dict[str, int] = {}
+        self._miss_counts: dict[str, int] = {}
+        self._eviction_count = 0
+
+    def get(
+        self,
+        provider: ExternalApiProvider,
+        remote_id: str,
+    ) -> str | None:
+        entry = self.get_entry(
+            provider=provider,
+            remote_id=remote_id,
+        )
+        if entry is None or not entry.is_fresh:
+            return None
+
+        return entry.value
+
+    async def get_async(
+        self,
+        provider: ExternalApiProvider,
+        remote_id: str,
+    ) -> str | None:
+        # SQLite blocks (disk I/O, waiting for the lock), so the async callers
+        # use a worker thread instead of the event loop
+        return await asyncio.to_thread(
+            self.get,
+            provider=provider,
+            remote_id=remote_id,
+        )
+
+    def get_entry(
+        self,
+        provider: ExternalApiProvider,
+        remote_id: str,
+    ) -> ExternalApiMetadataCacheEntry | None:
+        # Expired entries are returned too so that they can be revalidated
+        now = time.time()
+        ttl_seconds = self.ttl_seconds_by_provider[provider]
+
+        with self._lock:
+            row = self._connection.execute(
+                """
+                SELECT value, etag, etag_scope, fetched_at
+                FROM external_api_metadata
+                WHERE provider = ? AND remote_id = ?
+                """,
+                (provider, remote_id),
+            ).fetchone()
+            if row is None:
+                self._miss_counts[provider] = self._miss_counts.get(provider, 0) + 1
+                return None
+
+            is_fresh = now - row[3] < ttl_seconds
+            if is_fresh:
+                self._connection.execute(
+                    """
+                    UPDATE external_api_metadata SET accessed_at = ?
+                    WHERE provider = ? AND remote_id = ?
+                    """,
+                    (now, provider, remote_id),
+                )
+                self._hit_counts[provider] = self._hit_counts.get(provider, 0) + 1
+            else:
+                self._miss_counts[provider] = self._miss_counts.get(provider, 0) + 1
+
+            return ExternalApiMetadataCacheEntry(
+                value=row[0],
+                etag=row[1],
+                etag_scope=row[2],
+                is_fresh=is_fresh,
+            )
+
+    async def get_entry_async(
+        self,
+        provider: ExternalApiProvider,
+        remote_id: str,
+    ) -> ExternalApiMetadataCacheEntry | None:
+        return await asyncio.to_thread(
+            self.get_entry,
+            provider=provider,
+            remote_id=remote_id,
+        )
+
+    def put(
+        self,
+        provider: ExternalApiProvider,
+        remote_id: str,
+        value: str,
+        etag: str | None = None,
+        etag_scope: str | None = None,
+    ) -> None:
+        now = time.time()
+        size = len(value.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            row = self._connection.execute(
+                """
+                SELECT size FROM external_api_metadata
+                WHERE provider = ? AND remote_id = ?
+                """,
+                (provider, remote_id),
+            ).fetchone()
+            old_size: int = row[0] if row is not None else 0
+
+            self._connection.execute(
+                """
+                INSERT OR REPLACE INTO external_api_metadata
+                (
+                    provider, remote_id, value, etag, etag_scope,
+                    size, fetched_at, accessed_at
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (provider, remote_id, value, etag, etag_scope, size, now, now),
+            )
+            self._total_bytes += size - old_size
+
+            self._evict()
+
+    async def put_async(
+        self,
+        provider: ExternalApiProvider,
+        remote_id: str,
+        value: str,
+        etag: str | None = None,
+        etag_scope: str | None = None,
+    ) -> None:
+        # Includes the eviction of the least recently used entries
+        await asyncio.to_thread(
+            self.put,
+            provider=provider,
+            remote_id=remote_id,
+            value=value,
+            etag=etag,
+            etag_scope=etag_scope,
+        )
+
+    def refresh(
+        self,
+        provider: ExternalApiProvider,
+        remote_id: str,
+    ) -> None:
+        # The remote side answered "not modified"; restart the TTL
+        now = time.time()
+
+        with self._lock:
+            self._connection.execute(
+                """
+                UPDATE external_api_metadata SET fetched_at = ?, accessed_at = ?
+                WHERE provider = ? AND remote_id = ?
+                """,
+                (now, now, provider, remote_id),
+            )
+
+    async def refresh_async(
+        self,
+        provider: ExternalApiProvider,
+        remote_id: str,
+    ) -> None:
+        await asyncio.to_thread(
+            self.refresh,
+            provider=provider,
+            remote_id=remote_id,
+        )
+
+    def _evict(self) -> None:
+        # Remove the least recently used entries until the cache fits
+        while self._total_bytes > self.max_bytes:
+            row = self._connection.execute(
+                """
+                SELECT provider, remote_id, size FROM external_api_metadata
+                ORDER BY accessed_at ASC LIMIT 1
+                """
+            ).fetchone()
+            if row is None:
+                self._total_bytes = 0
+                return
+
+            self._connection.execute(
+                """
+                DELETE FROM external_api_metadata
+                WHERE provider = ? AND remote_id = ?
+                """,
+                (row[0], row[1]),
+            )
+            self._total_bytes -= row[2]
+            self._eviction_count += 1
+
+            self.logger.debug("External API metadata %s/%s evicted", row[0], row[1])
+
+    def invalidate(
+        self,
+        provider: ExternalApiProvider | None = None,
+    ) -> None:
+        with self._lock:
+            if provider is None:
+                self._connection.execute("DELETE FROM external_api_metadata")
+            else:
+                self._connection.execute(
+                    "DELETE FROM external_api_metadata WHERE provider = ?",
+                    (provider,),
+                )
+
+            row = self._connection.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM external_api_metadata"
+            ).fetchone()
+            self._total_bytes = row[0]
+
+    def get_statistics(
+        self,
+        provider: ExternalApiProvider | None = None,
+    ) -> ExternalApiMetadataCacheStatistics:
+        with self._lock:
+            if provider is None:
+                row = self._connection.execute(
+                    """
+                    SELECT COUNT(*), COALESCE(SUM(size), 0)
+                    FROM external_api_metadata
+                    """
+                ).fetchone()
+                hit_count = sum(self._hit_counts.values())
+                miss_count = sum(self._miss_counts.values())
+            else:
+                row = self._connection.execute(
+                    """
+                    SELECT COUNT(*), COALESCE(SUM(size), 0)
+                    FROM external_api_metadata WHERE provider = ?
+                    """,
+                    (provider,),
+                ).fetchone()
+                hit_count = self._hit_counts.get(provider, 0)
+                miss_count = self._miss_counts.get(provider, 0)
+
+            return ExternalApiMetadataCacheStatistics(
+                hit_count=hit_count,
+                miss_count=miss_count,
+                eviction_count=self._eviction_count,
+                entry_count=row[0],
+                total_bytes=row[1],
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
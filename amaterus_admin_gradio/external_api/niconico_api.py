@@ -0,0 +1,175 @@
+import json
+import os
+import re
+from datetime import datetime
+from html.parser import HTMLParser
+from typing import AsyncIterable, AsyncIterator
+from urllib.parse import urlparse
+
+import httpx
+from bs4 import BeautifulSoup, Tag
+from pydantic import BaseModel
+
+from ..utility.tracing_utility import set_span_attribute, start_span, trace_async
+from .metadata_cache import ExternalApiMetadataCache
+
+NICONICO_INITIAL_WATCH_DATA_ELEMENT_ID = "js-initial-watch-data"
+NICONICO_API_DATA_ATTRIBUTE_NAME = "data-api-data"
+
+
+class NiconicoVideoApiDataResponseVideoThumbnail(BaseModel):
+    url: str
+
+
+class NiconicoVideoApiDataResponseVideo(BaseModel):
+    id: str
+    title: str
+    registeredAt: datetime
+    thumbnail: NiconicoVideoApiDataResponseVideoThumbnail
+
+
+class NiconicoVideoApiDataResponseOwner(BaseModel):
+    id: int
+    nickname: str
+
+
+class NiconicoVideoApiDataResponse(BaseModel):
+    video: NiconicoVideoApiDataResponseVideo
+    owner: NiconicoVideoApiDataResponseOwner
+
+
+def parse_remote_niconico_content_id(
+    niconico_video_url_or_id: str,
+) -> str:
+    niconico_video_url_or_id = niconico_video_url_or_id.strip()
+
+    if niconico_video_url_or_id.startswith("https://"):
+        urlp = urlparse(niconico_video_url_or_id)
+        if urlp.netloc != "www.nicovideo.jp":
+            raise Exception(f"Invalid URL: {niconico_video_url_or_id}")
+
+        remote_niconico_content_id = os.path.basename(urlp.path)
+        if len(remote_niconico_content_id) == 0:
+            raise Exception(f"Invalid URL: {niconico_video_url_or_id}")
+
+        return remote_niconico_content_id
+
+    if not re.match(r"^sm\d+$", niconico_video_url_or_id) and not re.match(
+        r"^so\d+$", niconico_video_url_or_id
+    ):
+        raise Exception(f"Invalid Niconico video ID: {niconico_video_url_or_id}")
+
+    return niconico_video_url_or_id
+
+
+class NiconicoInitialWatchDataParser(HTMLParser):
+    def __init__(self) -> None:
+        super().__init__()
+        self.api_data_json_text: str | None = None
+
+    def handle_starttag(
+        self,
+        tag: str,
+        attrs: list[tuple[str, str | None]],
+    ) -> None:
+        if self.api_data_json_text is not None:
+            return
+
+        attr_dict = dict(attrs)
+        if attr_dict.get("id") != NICONICO_INITIAL_WATCH_DATA_ELEMENT_ID:
+            return
+
+        self.api_data_json_text = attr_dict.get(NICONICO_API_DATA_ATTRIBUTE_NAME)
+
+
+async def extract_niconico_api_data_json_text_streaming(
+    html_chunks: AsyncIterable[str],
+) -> str | None:
+    # Stops reading the page as soon as the element has been seen
+    parser = NiconicoInitialWatchDataParser()
+    async for html_chunk in html_chunks:
+        parser.feed(html_chunk)
+        if parser.api_data_json_text is not None:
+            return parser.api_data_json_text
+
+    return None
+
+
+def extract_niconico_api_data_json_text_html5lib(
+    html: str,
+) -> str | None:
+    bs = BeautifulSoup(html, "html5lib")
+    js_initial_watch_data_tag = bs.find(id=NICONICO_INITIAL_WATCH_DATA_ELEMENT_ID)
+    if not isinstance(js_initial_watch_data_tag, Tag):
+        return None
+
+    api_data_json_text = js_initial_watch_data_tag.attrs.get(
+        NICONICO_API_DATA_ATTRIBUTE_NAME,
+    )
+    if not isinstance(api_data_json_text, str):
+        return None
+
+    return api_data_json_text
+
+
+@trace_async(name="fetch_niconico_video_data")
+async def fetch_niconico_video_data(
+    niconico_video_url_or_id: str,
+    http_client: httpx.AsyncClient,
+    metadata_cache: ExternalApiMetadataCache | None = None,
+) -> NiconicoVideoApiDataResponse:
+    remote_niconico_content_id = parse_remote_niconico_content_id(
+        niconico_video_url_or_id=niconico_video_url_or_id,
+    )
+
+    if metadata_cache is not None:
+        cached_api_data_json = await metadata_cache.get_async(
+            provider="niconico",
+            remote_id=remote_niconico_content_id,
+        )
+        set_span_attribute("external_api.cache_hit", cached_api_data_json is not None)
+        if cached_api_data_json is not None:
+            return NiconicoVideoApiDataResponse.model_validate_json(
+                cached_api_data_json,
+            )
+
+    html_chunks: list[str] = []
+    async with http_client.stream(
+        "GET",
+        f"https://www.nicovideo.jp/watch/{remote_niconico_content_id}",
+    ) as res:
+        set_span_attribute("http.response.status_code", res.status_code)
+        res.raise_for_status()
+
+        # The chunks read so far are kept for the html5lib fallback
+        async def iter_html_chunks() -> AsyncIterator[str]:
+            async for html_chunk in res.aiter_text():
+                html_chunks.append(html_chunk)
+                yield html_chunk
+
+        api_data_json_text = await extract_niconico_api_data_json_text_streaming(
+            html_chunks=iter_html_chunks(),
+        )
+
+    if api_data_json_text is None:
+        # The whole page has been read here
+        with start_span(name="extract_niconico_api_data_json_text_html5lib"):
+            api_data_json_text = extract_niconico_api_data_json_text_html5lib(
+                html="".join(html_chunks),
+            )
+        if api_data_json_text is None:
+            raise Exception(
+                f"Niconico watch data not found: {remote_niconico_content_id}"
+            )
+
+    api_data_dict = json.loads(api_data_json_text)
+    api_data_response = NiconicoVideoApiDataResponse.model_validate(api_data_dict)
+
+    if metadata_cache is not None:
+        await metadata_cache.put_async(
+            provider="niconico",
+            remote_id=remote_niconico_content_id,
+            value=api_data_response.model_dump_json(),
+        )
+
+    return api_data_response
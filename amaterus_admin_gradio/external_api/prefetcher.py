@@ -0,0 +1,79 @@
+import asyncio
+from logging import Logger
+from typing import Any, Awaitable, Callable, TypeVar, cast
+
+from ..utility.single_flight import SingleFlight
+from .metadata_cache import ExternalApiProvider
+
+T = TypeVar("T")
+
+ExternalApiPrefetchKey = tuple[ExternalApiProvider, str]
+
+
+class ExternalApiPrefetcher:
+    def __init__(
+        self,
+        debounce_seconds: float,
+        logger: Logger,
+    ) -> None:
+        self.debounce_seconds = debounce_seconds
+        self.logger = logger
+
+        # A fetch started by a prefetch is shared with the fetch button.
+        # A finished fetch is served by the metadata cache
+        self._single_flight: SingleFlight[Any] = SingleFlight()
+
+        # Prefetches waiting for the input to settle, by session and field
+        self._pending_tasks: dict[tuple[str, str], asyncio.Task[None]] = {}
+
+    def schedule(
+        self,
+        session_id: str,
+        field: str,
+        key: ExternalApiPrefetchKey,
+        fn: Callable[[], Awaitable[Any]],
+    ) -> None:
+        self.cancel(session_id=session_id, field=field)
+
+        pending_key = (session_id, field)
+        task = asyncio.create_task(self._prefetch(key=key, fn=fn))
+        self._pending_tasks[pending_key] = task
+
+        def on_done(done_task: asyncio.Task[None]) -> None:
+            if self._pending_tasks.get(pending_key) is done_task:
+                del self._pending_tasks[pending_key]
+
+        task.add_done_callback(on_done)
+
+    def cancel(
+        self,
+        session_id: str,
+        field: str,
+    ) -> None:
+        # A fetch that has already started keeps running for the other callers
+        pending_task = self._pending_tasks.pop((session_id, field), None)
+        if pending_task is not None:
+            pending_task.cancel()
+
+    async def _prefetch(
+        self,
+        key: ExternalApiPrefetchKey,
+        fn: Callable[[], Awaitable[Any]],
+    ) -> None:
+        await asyncio.sleep(self.debounce_seconds)
+
+        try:
+            await self.fetch(key=key, fn=fn)
+        except Exception:
+            # The fetch button fetches again and shows the error
+            self.logger.debug("Failed to prefetch %s %s", *key, exc_info=True)
+
+    async def fetch(
+        self,
+        key: ExternalApiPrefetchKey,
+        fn: Callable[[], Awaitable[T]],
+    ) -> T:
+        return cast(T, await self._single_flight.do_async(key, fn))
+
+    def get_pending_count(self) -> int:
+        return len(self._pending_tasks)
@@ -0,0 +1,108 @@
+import os
+import re
+from urllib.parse import urlparse
+
+import httpx
+from pydantic import BaseModel
+
+from ..utility.tracing_utility import set_span_attribute, trace_async
+from .metadata_cache import ExternalApiMetadataCache
+
+
+class FetchTwitterTweetOembedApiResponse(BaseModel):
+    author_url: str
+    author_name: str
+    url: str
+    html: str
+
+
+def parse_remote_tweet_id(
+    twitter_tweet_url_or_id: str,
+) -> str:
+    twitter_tweet_url_or_id = twitter_tweet_url_or_id.strip()
+
+    if twitter_tweet_url_or_id.startswith("https://"):
+        urlp = urlparse(twitter_tweet_url_or_id)
+        if urlp.netloc != "twitter.com" and urlp.netloc != "x.com":
+            raise Exception(f"Invalid URL: {twitter_tweet_url_or_id}")
+
+        remote_tweet_id = os.path.basename(urlp.path)
+        if len(remote_tweet_id) == 0:
+            raise Exception(f"Invalid URL: {twitter_tweet_url_or_id}")
+
+        return remote_tweet_id
+
+    if not re.match(r"^\d+$", twitter_tweet_url_or_id):
+        raise Exception(f"Invalid Twitter tweet ID: {twitter_tweet_url_or_id}")
+
+    return twitter_tweet_url_or_id
+
+
+def parse_twitter_screen_name(
+    twitter_tweet_url_or_id: str,
+) -> str | None:
+    # https://x.com/<screen_name>/status/<id>.
+    # None for an ID or a URL without the screen name (e.g. /i/web/status/<id>)
+    twitter_tweet_url_or_id = twitter_tweet_url_or_id.strip()
+    if not twitter_tweet_url_or_id.startswith("https://"):
+        return None
+
+    urlp = urlparse(twitter_tweet_url_or_id)
+    if urlp.netloc != "twitter.com" and urlp.netloc != "x.com":
+        return None
+
+    path_parts = urlp.path.strip("/").split("/")
+    if len(path_parts) < 3 or path_parts[1] != "status":
+        return None
+
+    screen_name = path_parts[0]
+    if screen_name == "i" or not re.match(r"^\w+$", screen_name):
+        return None
+
+    return screen_name
+
+
+@trace_async(name="fetch_twitter_tweet_oembed_data")
+async def fetch_twitter_tweet_oembed_data(
+    twitter_tweet_url_or_id: str,
+    http_client: httpx.AsyncClient,
+    metadata_cache: ExternalApiMetadataCache | None = None,
+) -> FetchTwitterTweetOembedApiResponse:
+    remote_tweet_id = parse_remote_tweet_id(
+        twitter_tweet_url_or_id=twitter_tweet_url_or_id,
+    )
+
+    if metadata_cache is not None:
+        cached_api_response_json = await metadata_cache.get_async(
+            provider="twitter",
+            remote_id=remote_tweet_id,
+        )
+        set_span_attribute(
+            "external_api.cache_hit", cached_api_response_json is not None
+        )
+        if cached_api_response_json is not None:
+            return FetchTwitterTweetOembedApiResponse.model_validate_json(
+                cached_api_response_json,
+            )
+
+    res = await http_client.get(
+        "https://publish.twitter.com/oembed",
+        params={
+            "url": f"https://twitter.com/i/status/{remote_tweet_id}",
+            "partner": "",
+            "hide_thread": "false",
+        },
+    )
+    set_span_attribute("http.response.status_code", res.status_code)
+    res.raise_for_status()
+
+    api_response = FetchTwitterTweetOembedApiResponse.model_validate(res.json())
+
+    if metadata_cache is not None:
+        await metadata_cache.put_async(
+            provider="twitter",
+            remote_id=remote_tweet_id,
+            value=api_response.model_dump_json(),
+        )
+
+    return api_response
@@ -0,0 +1,311 @@
+import asyncio
+import math
+import re
+from datetime import datetime
+from urllib.parse import parse_qs, urlparse
+
+import httpx
+from pydantic import BaseModel
+
+from ..utility.tracing_utility import set_span_attribute, trace_async
+from .metadata_cache import ExternalApiMetadataCache, ExternalApiMetadataCacheEntry
+from .youtube_api_quota import YoutubeApiQuotaTracker
+
+# Maximum number of IDs accepted by a single videos.list request
+YOUTUBE_API_VIDEOS_MAX_ID_COUNT = 50
+
+# Quota units charged per videos.list request, regardless of the ID count
+YOUTUBE_API_VIDEOS_LIST_QUOTA_COST = 1
+
+# Partial response selector; only the attributes read by the models below
+YOUTUBE_API_VIDEOS_FIELDS = (
+    "items("
+    "id,"
+    "snippet(title,channelId,channelTitle,liveBroadcastContent,publishedAt),"
+    "liveStreamingDetails(actualStartTime,actualEndTime)"
+    ")"
+)
+
+
+class YoutubeApiVideoResponseItemSnippet(BaseModel):
+    title: str
+    channelId: str
+    channelTitle: str
+    liveBroadcastContent: str
+    # Missing from the entries cached before it was requested
+    publishedAt: datetime | None = None
+
+
+class YoutubeApiVideoResponseLiveStreamingDetails(BaseModel):
+    actualStartTime: datetime | None = None
+    actualEndTime: datetime | None = None
+
+
+class YoutubeApiVideoResponseItem(BaseModel):
+    id: str
+    snippet: YoutubeApiVideoResponseItemSnippet | None = None
+    liveStreamingDetails: YoutubeApiVideoResponseLiveStreamingDetails | None = None
+
+
+class YoutubeApiVideoResponse(BaseModel):
+    items: list[YoutubeApiVideoResponseItem]
+    etag: str | None = None
+
+
+def parse_remote_youtube_video_id(
+    youtube_video_url_or_id: str,
+) -> str:
+    youtube_video_url_or_id = youtube_video_url_or_id.strip()
+
+    if youtube_video_url_or_id.startswith("https://"):
+        urlp = urlparse(youtube_video_url_or_id)
+        if urlp.netloc != "www.youtube.com":
+            raise Exception(f"Invalid URL: {youtube_video_url_or_id}")
+
+        remote_youtube_video_id_param_list = parse_qs(urlp.query).get("v")
+        if (
+            remote_youtube_video_id_param_list is None
+            or len(remote_youtube_video_id_param_list) == 0
+        ):
+            raise Exception(f"Invalid URL: {youtube_video_url_or_id}")
+
+        return remote_youtube_video_id_param_list[0]
+
+    if "," in youtube_video_url_or_id:
+        raise Exception(f"Invalid YouTube video ID: {youtube_video_url_or_id}")
+
+    return youtube_video_url_or_id
+
+
+def is_remote_youtube_video_id(remote_youtube_video_id: str) -> bool:
+    # A partial input (e.g. while typing) is not requested, not to spend the quota
+    return re.fullmatch(r"[A-Za-z0-9_-]{11}", remote_youtube_video_id) is not None
+
+
+def estimate_youtube_video_quota_cost(
+    remote_youtube_video_count: int,
+) -> int:
+    # Upper bound; cached videos are not requested
+    return (
+        math.ceil(remote_youtube_video_count / YOUTUBE_API_VIDEOS_MAX_ID_COUNT)
+        * YOUTUBE_API_VIDEOS_LIST_QUOTA_COST
+    )
+
+
+@trace_async(name="fetch_youtube_videos")
+async def fetch_youtube_videos(
+    remote_youtube_video_id_list: list[str],
+    youtube_api_key: str,
+    http_client: httpx.AsyncClient,
+    etag: str | None = None,
+    quota_tracker: YoutubeApiQuotaTracker | None = None,
+) -> YoutubeApiVideoResponse | None:
+    # Returns None if etag is given and the response has not been modified
+    if len(remote_youtube_video_id_list) > YOUTUBE_API_VIDEOS_MAX_ID_COUNT:
+        raise Exception(
+            f"Too many YouTube video IDs: {len(remote_youtube_video_id_list)} > "
+            f"{YOUTUBE_API_VIDEOS_MAX_ID_COUNT}"
+        )
+
+    headers: dict[str, str] = {}
+    if etag is not None:
+        headers["If-None-Match"] = etag
+
+    res = await http_client.get(
+        "https://www.googleapis.com/youtube/v3/videos",
+        params={
+            "key": youtube_api_key,
+            "part": "id,snippet,liveStreamingDetails",
+            "id": ",".join(remote_youtube_video_id_list),
+            "fields": YOUTUBE_API_VIDEOS_FIELDS,
+        },
+        headers=headers,
+    )
+    set_span_attribute("youtube.video_id_count", len(remote_youtube_video_id_list))
+    set_span_attribute("http.response.status_code", res.status_code)
+    if etag is not None and res.status_code == httpx.codes.NOT_MODIFIED:
+        return None
+
+    # Not modified responses reuse the cached body without a charge,
+    # but failed requests are charged as well
+    if quota_tracker is not None:
+        await quota_tracker.record_async(units=YOUTUBE_API_VIDEOS_LIST_QUOTA_COST)
+
+    res.raise_for_status()
+
+    youtube_api_video_response = YoutubeApiVideoResponse.model_validate(res.json())
+    youtube_api_video_response.etag = res.headers.get("ETag")
+    return youtube_api_video_response
+
+
+@trace_async(name="fetch_youtube_video_data_batch")
+async def fetch_youtube_video_data_batch(
+    youtube_video_url_or_id_list: list[str],
+    youtube_api_key: str,
+    http_client: httpx.AsyncClient,
+    metadata_cache: ExternalApiMetadataCache | None = None,
+    quota_tracker: YoutubeApiQuotaTracker | None = None,
+) -> dict[str, YoutubeApiVideoResponseItem]:
+    # One request per 50 videos. Deleted or private videos are missing
+    # from the returned dict.
+    # dict keeps the input order and drops duplicated IDs
+    remote_youtube_video_id_list = list(
+        dict.fromkeys(
+            map(
+                lambda youtube_video_url_or_id: parse_remote_youtube_video_id(
+                    youtube_video_url_or_id=youtube_video_url_or_id,
+                ),
+                youtube_video_url_or_id_list,
+            ),
+        ),
+    )
+
+    items: dict[str, YoutubeApiVideoResponseItem] = {}
+    stale_entries: dict[str, ExternalApiMetadataCacheEntry] = {}
+    if metadata_cache is not None:
+        for remote_youtube_video_id in remote_youtube_video_id_list:
+            entry = await metadata_cache.get_entry_async(
+                provider="youtube",
+                remote_id=remote_youtube_video_id,
+            )
+            if entry is None:
+                continue
+
+            if entry.is_fresh:
+                items[remote_youtube_video_id] = (
+                    YoutubeApiVideoResponseItem.model_validate_json(entry.value)
+                )
+            else:
+                stale_entries[remote_youtube_video_id] = entry
+
+    # An ETag belongs to a whole response. Expired entries can be revalidated
+    # only when exactly the same set of videos is requested again.
+    revalidation_groups: dict[tuple[str, str], list[str]] = {}
+    for remote_youtube_video_id, entry in stale_entries.items():
+        if entry.etag is None or entry.etag_scope is None:
+            continue
+
+        revalidation_groups.setdefault((entry.etag, entry.etag_scope), []).append(
+            remote_youtube_video_id
+        )
+
+    video_requests: list[tuple[str | None, list[str]]] = []
+    for (etag, etag_scope), group_id_list in revalidation_groups.items():
+        scope_id_list = etag_scope.split(",")
+        if set(scope_id_list) == set(group_id_list):
+            video_requests.append((etag, scope_id_list))
+
+    revalidating_id_set = {
+        remote_youtube_video_id
+        for _, request_id_list in video_requests
+        for remote_youtube_video_id in request_id_list
+    }
+    missing_remote_youtube_video_id_list = [
+        remote_youtube_video_id
+        for remote_youtube_video_id in remote_youtube_video_id_list
+        if remote_youtube_video_id not in items
+        and remote_youtube_video_id not in revalidating_id_set
+    ]
+    for index in range(
+        0,
+        len(missing_remote_youtube_video_id_list),
+        YOUTUBE_API_VIDEOS_MAX_ID_COUNT,
+    ):
+        video_requests.append(
+            (
+                None,
+                missing_remote_youtube_video_id_list[
+                    index : index + YOUTUBE_API_VIDEOS_MAX_ID_COUNT
+                ],
+            )
+        )
+
+    set_span_attribute("youtube.video_id_count", len(remote_youtube_video_id_list))
+    set_span_attribute("external_api.cache_hit_count", len(items))
+    youtube_api_video_response_list = await asyncio.gather(
+        *(
+            fetch_youtube_videos(
+                remote_youtube_video_id_list=request_id_list,
+                youtube_api_key=youtube_api_key,
+                http_client=http_client,
+                etag=etag,
+                quota_tracker=quota_tracker,
+            )
+            for etag, request_id_list in video_requests
+        ),
+    )
+
+    for (_, request_id_list), youtube_api_video_response in zip(
+        video_requests,
+        youtube_api_video_response_list,
+    ):
+        if youtube_api_video_response is None:
+            # Not modified
+            for remote_youtube_video_id in request_id_list:
+                if metadata_cache is not None:
+                    await metadata_cache.refresh_async(
+                        provider="youtube",
+                        remote_id=remote_youtube_video_id,
+                    )
+
+                items[remote_youtube_video_id] = (
+                    YoutubeApiVideoResponseItem.model_validate_json(
+                        stale_entries[remote_youtube_video_id].value,
+                    )
+                )
+            continue
+
+        etag_scope = ",".join(sorted(request_id_list))
+        for item in youtube_api_video_response.items:
+            items[item.id] = item
+
+            if metadata_cache is not None:
+                await metadata_cache.put_async(
+                    provider="youtube",
+                    remote_id=item.id,
+                    value=item.model_dump_json(),
+                    etag=youtube_api_video_response.etag,
+                    etag_scope=etag_scope,
+                )
+
+    return {
+        remote_youtube_video_id: items[remote_youtube_video_id]
+        for remote_youtube_video_id in remote_youtube_video_id_list
+        if remote_youtube_video_id in items
+    }
+
+
+@trace_async(name="fetch_youtube_live_data")
+async def fetch_youtube_live_data(
+    youtube_live_url_or_id: str,
+    youtube_api_key: str,
+    http_client: httpx.AsyncClient,
+    metadata_cache: ExternalApiMetadataCache | None = None,
+    quota_tracker: YoutubeApiQuotaTracker | None = None,
+) -> YoutubeApiVideoResponse:
+    items = await fetch_youtube_video_data_batch(
+        youtube_video_url_or_id_list=[youtube_live_url_or_id],
+        youtube_api_key=youtube_api_key,
+        http_client=http_client,
+        metadata_cache=metadata_cache,
+        quota_tracker=quota_tracker,
+    )
+    return YoutubeApiVideoResponse(items=list(items.values()))
+
+
+@trace_async(name="fetch_youtube_video_data")
+async def fetch_youtube_video_data(
+    youtube_video_url_or_id: str,
+    youtube_api_key: str,
+    http_client: httpx.AsyncClient,
+    metadata_cache: ExternalApiMetadataCache | None = None,
+    quota_tracker: YoutubeApiQuotaTracker | None = None,
+) -> YoutubeApiVideoResponse:
+    items = await fetch_youtube_video_data_batch(
+        youtube_video_url_or_id_list=[youtube_video_url_or_id],
+        youtube_api_key=youtube_api_key,
+        http_client=http_client,
+        metadata_cache=metadata_cache,
+        quota_tracker=quota_tracker,
+    )
+    return YoutubeApiVideoResponse(items=list(items.values()))
@@ -0,0 +1,106 @@
+import asyncio
+import sqlite3
+import threading
+from datetime import datetime
+from logging import Logger
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+from pydantic import BaseModel
+
+from .metadata_cache import SQLITE_BUSY_TIMEOUT_SECONDS
+
+# The YouTube Data API quota resets at midnight Pacific Time
+YOUTUBE_API_QUOTA_TIMEZONE = ZoneInfo("America/Los_Angeles")
+
+
+class YoutubeApiQuotaStatistics(BaseModel):
+    date: str
+    used_units: int
+    daily_quota: int
+    remaining_units: int
+
+
+class YoutubeApiQuotaTracker:
+    def __init__(
+        self,
+        database_file: Path | None,
+        daily_quota: int,
+        logger: Logger,
+    ) -> None:
+        self.daily_quota = daily_quota
+        self.logger = logger
+
+        if database_file is not None:
+            database_file.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            database=str(database_file) if database_file is not None else ":memory:",
+            check_same_thread=False,
+            isolation_level=None,
+            timeout=SQLITE_BUSY_TIMEOUT_SECONDS,
+        )
+        # The database file is shared with ExternalApiMetadataCache.
+        # Readers do not block the writer of the other connection
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS youtube_api_quota_usage (
+                date TEXT NOT NULL PRIMARY KEY,
+                used_units INTEGER NOT NULL
+            )
+            """
+        )
+
+    def _get_today(self) -> str:
+        return datetime.now(tz=YOUTUBE_API_QUOTA_TIMEZONE).date().isoformat()
+
+    def record(self, units: int) -> None:
+        today = self._get_today()
+
+        with self._lock:
+            self._connection.execute(
+                """
+                INSERT INTO youtube_api_quota_usage (date, used_units) VALUES (?, ?)
+                ON CONFLICT (date) DO UPDATE SET used_units = used_units + ?
+                """,
+                (today, units, units),
+            )
+
+    async def record_async(self, units: int) -> None:
+        # SQLite blocks (disk I/O, waiting for the other connection), so the async
+        # callers use a worker thread instead of the event loop
+        await asyncio.to_thread(self.record, units=units)
+
+    def get_used_units(self) -> int:
+        today = self._get_today()
+
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT used_units FROM youtube_api_quota_usage WHERE date = ?",
+                (today,),
+            ).fetchone()
+
+        used_units: int = row[0] if row is not None else 0
+        return used_units
+
+    def get_remaining_units(self) -> int:
+        return max(self.daily_quota - self.get_used_units(), 0)
+
+    async def get_remaining_units_async(self) -> int:
+        return await asyncio.to_thread(self.get_remaining_units)
+
+    def get_statistics(self) -> YoutubeApiQuotaStatistics:
+        used_units = self.get_used_units()
+        return YoutubeApiQuotaStatistics(
+            date=self._get_today(),
+            used_units=used_units,
+            daily_quota=self.daily_quota,
+            remaining_units=max(self.daily_quota - used_units, 0),
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
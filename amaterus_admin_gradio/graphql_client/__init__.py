@@ -1,1180 +1,1189 @@
 # Generated by ariadne-codegen
 
-from .base_client import BaseClient
-from .base_model import BaseModel, Upload
-from .client import Client
-from .create_game import CreateGame, CreateGameGame
-from .create_program import CreateProgram, CreateProgramProgram
-from .create_program_niconico_video import (
-    CreateProgramNiconicoVideo,
-    CreateProgramNiconicoVideoProgramNiconicoVideo,
-)
-from .create_program_person import CreateProgramPerson, CreateProgramPersonProgramPerson
-from .create_program_twitter_announcement import (
-    CreateProgramTwitterAnnouncement,
-    CreateProgramTwitterAnnouncementProgramTwitterAnnouncement,
-)
-from .create_program_youtube_live_live_archive import (
-    CreateProgramYoutubeLiveLiveArchive,
-    CreateProgramYoutubeLiveLiveArchiveProgramLiveArchive,
-)
-from .create_program_youtube_video_live_archive import (
-    CreateProgramYoutubeVideoLiveArchive,
-    CreateProgramYoutubeVideoLiveArchiveProgramLiveArchive,
-)
-from .create_twitter_tweet import CreateTwitterTweet, CreateTwitterTweetTwitterTweet
-from .create_twitter_tweet_image import (
-    CreateTwitterTweetImage,
-    CreateTwitterTweetImageTwitterTweetImage,
-)
-from .enums import (
-    amongus_maps_constraint,
-    amongus_maps_select_column,
-    amongus_maps_select_column_amongus_maps_aggregate_bool_exp_bool_and_arguments_columns,
-    amongus_maps_select_column_amongus_maps_aggregate_bool_exp_bool_or_arguments_columns,
-    amongus_maps_update_column,
-    amongus_match_mods_constraint,
-    amongus_match_mods_select_column,
-    amongus_match_mods_update_column,
-    amongus_match_player_result_roles_constraint,
-    amongus_match_player_result_roles_select_column,
-    amongus_match_player_result_roles_update_column,
-    amongus_match_players_constraint,
-    amongus_match_players_select_column,
-    amongus_match_players_update_column,
-    amongus_matches_constraint,
-    amongus_matches_select_column,
-    amongus_matches_select_column_amongus_matches_aggregate_bool_exp_bool_and_arguments_columns,
-    amongus_matches_select_column_amongus_matches_aggregate_bool_exp_bool_or_arguments_columns,
-    amongus_matches_update_column,
-    amongus_mod_versions_constraint,
-    amongus_mod_versions_select_column,
-    amongus_mod_versions_update_column,
-    amongus_mods_constraint,
-    amongus_mods_select_column,
-    amongus_mods_update_column,
-    amongus_roles_constraint,
-    amongus_roles_select_column,
-    amongus_roles_select_column_amongus_roles_aggregate_bool_exp_bool_and_arguments_columns,
-    amongus_roles_select_column_amongus_roles_aggregate_bool_exp_bool_or_arguments_columns,
-    amongus_roles_update_column,
-    amongus_vanilla_versions_constraint,
-    amongus_vanilla_versions_select_column,
-    amongus_vanilla_versions_update_column,
-    amongusvr_maps_constraint,
-    amongusvr_maps_select_column,
-    amongusvr_maps_update_column,
-    amongusvr_match_players_constraint,
-    amongusvr_match_players_select_column,
-    amongusvr_match_players_update_column,
-    amongusvr_matches_constraint,
-    amongusvr_matches_select_column,
-    amongusvr_matches_select_column_amongusvr_matches_aggregate_bool_exp_bool_and_arguments_columns,
-    amongusvr_matches_select_column_amongusvr_matches_aggregate_bool_exp_bool_or_arguments_columns,
-    amongusvr_matches_update_column,
-    cursor_ordering,
-    fallguys_custom_round_twitter_announcements_constraint,
-    fallguys_custom_round_twitter_announcements_select_column,
-    fallguys_custom_round_twitter_announcements_select_column_fallguys_custom_round_twitter_announcements_aggregate_bool_exp_bool_and_arguments_columns,
-    fallguys_custom_round_twitter_announcements_select_column_fallguys_custom_round_twitter_announcements_aggregate_bool_exp_bool_or_arguments_columns,
-    fallguys_custom_round_twitter_announcements_update_column,
-    fallguys_custom_rounds_constraint,
-    fallguys_custom_rounds_select_column,
-    fallguys_custom_rounds_update_column,
-    fallguys_match_rounds_constraint,
-    fallguys_match_rounds_select_column,
-    fallguys_match_rounds_select_column_fallguys_match_rounds_aggregate_bool_exp_bool_and_arguments_columns,
-    fallguys_match_rounds_select_column_fallguys_match_rounds_aggregate_bool_exp_bool_or_arguments_columns,
-    fallguys_match_rounds_update_column,
-    fallguys_matches_constraint,
-    fallguys_matches_select_column,
-    fallguys_matches_select_column_fallguys_matches_aggregate_bool_exp_bool_and_arguments_columns,
-    fallguys_matches_select_column_fallguys_matches_aggregate_bool_exp_bool_or_arguments_columns,
-    fallguys_matches_update_column,
-    fallguys_rounds_constraint,
-    fallguys_rounds_select_column,
-    fallguys_rounds_update_column,
-    fediverse_accounts_constraint,
-    fediverse_accounts_select_column,
-    fediverse_accounts_update_column,
-    games_constraint,
-    games_select_column,
-    games_update_column,
-    mariokart8deluxe_battle_courses_constraint,
-    mariokart8deluxe_battle_courses_select_column,
-    mariokart8deluxe_battle_courses_update_column,
-    mariokart8deluxe_battle_match_players_constraint,
-    mariokart8deluxe_battle_match_players_select_column,
-    mariokart8deluxe_battle_match_players_update_column,
-    mariokart8deluxe_battle_matches_constraint,
-    mariokart8deluxe_battle_matches_select_column,
-    mariokart8deluxe_battle_matches_select_column_mariokart8deluxe_battle_matches_aggregate_bool_exp_bool_and_arguments_columns,
-    mariokart8deluxe_battle_matches_select_column_mariokart8deluxe_battle_matches_aggregate_bool_exp_bool_or_arguments_columns,
-    mariokart8deluxe_battle_matches_update_column,
-    mariokart8deluxe_battle_rules_constraint,
-    mariokart8deluxe_battle_rules_select_column,
-    mariokart8deluxe_battle_rules_update_column,
-    mariokart8deluxe_consoles_constraint,
-    mariokart8deluxe_consoles_select_column,
-    mariokart8deluxe_consoles_update_column,
-    mariokart8deluxe_courses_constraint,
-    mariokart8deluxe_courses_select_column,
-    mariokart8deluxe_courses_update_column,
-    mariokart8deluxe_cups_constraint,
-    mariokart8deluxe_cups_select_column,
-    mariokart8deluxe_cups_update_column,
-    mariokart8deluxe_race_players_constraint,
-    mariokart8deluxe_race_players_select_column,
-    mariokart8deluxe_race_players_update_column,
-    mariokart8deluxe_race_rules_constraint,
-    mariokart8deluxe_race_rules_select_column,
-    mariokart8deluxe_race_rules_update_column,
-    mariokart8deluxe_races_constraint,
-    mariokart8deluxe_races_select_column,
-    mariokart8deluxe_races_select_column_mariokart8deluxe_races_aggregate_bool_exp_bool_and_arguments_columns,
-    mariokart8deluxe_races_select_column_mariokart8deluxe_races_aggregate_bool_exp_bool_or_arguments_columns,
-    mariokart8deluxe_races_update_column,
-    niconico_accounts_constraint,
-    niconico_accounts_select_column,
-    niconico_accounts_update_column,
-    niconico_channels_constraint,
-    niconico_channels_select_column,
-    niconico_channels_update_column,
-    niconico_communities_constraint,
-    niconico_communities_select_column,
-    niconico_communities_update_column,
-    niconico_plus_channels_constraint,
-    niconico_plus_channels_select_column,
-    niconico_plus_channels_update_column,
-    niconico_videos_constraint,
-    niconico_videos_select_column,
-    niconico_videos_update_column,
-    order_by,
-    person_fediverse_accounts_constraint,
-    person_fediverse_accounts_select_column,
-    person_fediverse_accounts_update_column,
-    person_niconico_accounts_constraint,
-    person_niconico_accounts_select_column,
-    person_niconico_accounts_update_column,
-    person_niconico_channels_constraint,
-    person_niconico_channels_select_column,
-    person_niconico_channels_update_column,
-    person_niconico_communities_constraint,
-    person_niconico_communities_select_column,
-    person_niconico_communities_update_column,
-    person_niconico_plus_channels_constraint,
-    person_niconico_plus_channels_select_column,
-    person_niconico_plus_channels_update_column,
-    person_twitter_accounts_constraint,
-    person_twitter_accounts_select_column,
-    person_twitter_accounts_update_column,
-    person_youtube_channels_constraint,
-    person_youtube_channels_select_column,
-    person_youtube_channels_update_column,
-    persons_constraint,
-    persons_select_column,
-    persons_update_column,
-    program_amongus_maps_constraint,
-    program_amongus_maps_select_column,
-    program_amongus_maps_update_column,
-    program_amongus_mods_constraint,
-    program_amongus_mods_select_column,
-    program_amongus_mods_update_column,
-    program_amongus_vanilla_versions_constraint,
-    program_amongus_vanilla_versions_select_column,
-    program_amongus_vanilla_versions_update_column,
-    program_live_archives_constraint,
-    program_live_archives_select_column,
-    program_live_archives_update_column,
-    program_niconico_videos_constraint,
-    program_niconico_videos_select_column,
-    program_niconico_videos_update_column,
-    program_persons_constraint,
-    program_persons_select_column,
-    program_persons_select_column_program_persons_aggregate_bool_exp_bool_and_arguments_columns,
-    program_persons_select_column_program_persons_aggregate_bool_exp_bool_or_arguments_columns,
-    program_persons_update_column,
-    program_projects_constraint,
-    program_projects_select_column,
-    program_projects_update_column,
-    program_twitter_announcements_constraint,
-    program_twitter_announcements_select_column,
-    program_twitter_announcements_update_column,
-    programs_constraint,
-    programs_select_column,
-    programs_update_column,
-    project_niconico_videos_constraint,
-    project_niconico_videos_select_column,
-    project_niconico_videos_update_column,
-    projects_constraint,
-    projects_select_column,
-    projects_update_column,
-    twitter_accounts_constraint,
-    twitter_accounts_select_column,
-    twitter_accounts_update_column,
-    twitter_tweet_images_constraint,
-    twitter_tweet_images_select_column,
-    twitter_tweet_images_update_column,
-    twitter_tweets_constraint,
-    twitter_tweets_select_column,
-    twitter_tweets_update_column,
-    youtube_channels_constraint,
-    youtube_channels_select_column,
-    youtube_channels_update_column,
-    youtube_lives_constraint,
-    youtube_lives_select_column,
-    youtube_lives_update_column,
-    youtube_videos_constraint,
-    youtube_videos_select_column,
-    youtube_videos_update_column,
-)
-from .exceptions import (
-    GraphQLClientError,
-    GraphQLClientGraphQLError,
-    GraphQLClientGraphQLMultiError,
-    GraphQLClientHttpError,
-    GraphQLClientInvalidResponseError,
-)
-from .get_create_program_initial_data import (
-    GetCreateProgramInitialData,
-    GetCreateProgramInitialDataGameList,
-    GetCreateProgramInitialDataProjectList,
-)
-from .get_create_program_niconico_video_initial_data import (
-    GetCreateProgramNiconicoVideoInitialData,
-    GetCreateProgramNiconicoVideoInitialDataPersonList,
-    GetCreateProgramNiconicoVideoInitialDataProjectList,
-)
-from .get_create_program_person_initial_data import (
-    GetCreateProgramPersonInitialData,
-    GetCreateProgramPersonInitialDataPersonList,
-    GetCreateProgramPersonInitialDataProjectList,
-)
-from .get_create_program_twitter_announcement_initial_data import (
-    GetCreateProgramTwitterAnnouncementInitialData,
-    GetCreateProgramTwitterAnnouncementInitialDataPersonList,
-    GetCreateProgramTwitterAnnouncementInitialDataProjectList,
-    GetCreateProgramTwitterAnnouncementInitialDataTwitterAccountList,
-)
-from .get_create_program_youtube_live_live_archive_initial_data import (
-    GetCreateProgramYoutubeLiveLiveArchiveInitialData,
-    GetCreateProgramYoutubeLiveLiveArchiveInitialDataPersonList,
-    GetCreateProgramYoutubeLiveLiveArchiveInitialDataProjectList,
-)
-from .get_create_program_youtube_video_live_archive_initial_data import (
-    GetCreateProgramYoutubeVideoLiveArchiveInitialData,
-    GetCreateProgramYoutubeVideoLiveArchiveInitialDataPersonList,
-    GetCreateProgramYoutubeVideoLiveArchiveInitialDataProjectList,
-)
-from .get_program_project_list_by_project_id import (
-    GetProgramProjectListByProjectId,
-    GetProgramProjectListByProjectIdProject,
-    GetProgramProjectListByProjectIdProjectProgramProjectList,
-    GetProgramProjectListByProjectIdProjectProgramProjectListProgram,
-)
-from .get_twitter_account_by_screen_name import (
-    GetTwitterAccountByScreenName,
-    GetTwitterAccountByScreenNameTwitterAccountList,
-)
-from .input_types import (
-    Boolean_comparison_exp,
-    Int_comparison_exp,
-    String_comparison_exp,
-    amongus_maps_aggregate_bool_exp,
-    amongus_maps_aggregate_bool_exp_bool_and,
-    amongus_maps_aggregate_bool_exp_bool_or,
-    amongus_maps_aggregate_bool_exp_count,
-    amongus_maps_aggregate_order_by,
-    amongus_maps_arr_rel_insert_input,
-    amongus_maps_bool_exp,
-    amongus_maps_insert_input,
-    amongus_maps_max_order_by,
-    amongus_maps_min_order_by,
-    amongus_maps_obj_rel_insert_input,
-    amongus_maps_on_conflict,
-    amongus_maps_order_by,
-    amongus_maps_pk_columns_input,
-    amongus_maps_set_input,
-    amongus_maps_stream_cursor_input,
-    amongus_maps_stream_cursor_value_input,
-    amongus_maps_updates,
-    amongus_match_mods_bool_exp,
-    amongus_match_mods_insert_input,
-    amongus_match_mods_on_conflict,
-    amongus_match_mods_order_by,
-    amongus_match_mods_pk_columns_input,
-    amongus_match_mods_set_input,
-    amongus_match_mods_stream_cursor_input,
-    amongus_match_mods_stream_cursor_value_input,
-    amongus_match_mods_updates,
-    amongus_match_player_result_roles_aggregate_bool_exp,
-    amongus_match_player_result_roles_aggregate_bool_exp_count,
-    amongus_match_player_result_roles_aggregate_order_by,
-    amongus_match_player_result_roles_arr_rel_insert_input,
-    amongus_match_player_result_roles_avg_order_by,
-    amongus_match_player_result_roles_bool_exp,
-    amongus_match_player_result_roles_inc_input,
-    amongus_match_player_result_roles_insert_input,
-    amongus_match_player_result_roles_max_order_by,
-    amongus_match_player_result_roles_min_order_by,
-    amongus_match_player_result_roles_on_conflict,
-    amongus_match_player_result_roles_order_by,
-    amongus_match_player_result_roles_pk_columns_input,
-    amongus_match_player_result_roles_set_input,
-    amongus_match_player_result_roles_stddev_order_by,
-    amongus_match_player_result_roles_stddev_pop_order_by,
-    amongus_match_player_result_roles_stddev_samp_order_by,
-    amongus_match_player_result_roles_stream_cursor_input,
-    amongus_match_player_result_roles_stream_cursor_value_input,
-    amongus_match_player_result_roles_sum_order_by,
-    amongus_match_player_result_roles_updates,
-    amongus_match_player_result_roles_var_pop_order_by,
-    amongus_match_player_result_roles_var_samp_order_by,
-    amongus_match_player_result_roles_variance_order_by,
-    amongus_match_players_aggregate_bool_exp,
-    amongus_match_players_aggregate_bool_exp_count,
-    amongus_match_players_aggregate_order_by,
-    amongus_match_players_arr_rel_insert_input,
-    amongus_match_players_bool_exp,
-    amongus_match_players_insert_input,
-    amongus_match_players_max_order_by,
-    amongus_match_players_min_order_by,
-    amongus_match_players_on_conflict,
-    amongus_match_players_order_by,
-    amongus_match_players_pk_columns_input,
-    amongus_match_players_set_input,
-    amongus_match_players_stream_cursor_input,
-    amongus_match_players_stream_cursor_value_input,
-    amongus_match_players_updates,
-    amongus_matches_aggregate_bool_exp,
-    amongus_matches_aggregate_bool_exp_bool_and,
-    amongus_matches_aggregate_bool_exp_bool_or,
-    amongus_matches_aggregate_bool_exp_count,
-    amongus_matches_aggregate_order_by,
-    amongus_matches_arr_rel_insert_input,
-    amongus_matches_avg_order_by,
-    amongus_matches_bool_exp,
-    amongus_matches_inc_input,
-    amongus_matches_insert_input,
-    amongus_matches_max_order_by,
-    amongus_matches_min_order_by,
-    amongus_matches_obj_rel_insert_input,
-    amongus_matches_on_conflict,
-    amongus_matches_order_by,
-    amongus_matches_pk_columns_input,
-    amongus_matches_set_input,
-    amongus_matches_stddev_order_by,
-    amongus_matches_stddev_pop_order_by,
-    amongus_matches_stddev_samp_order_by,
-    amongus_matches_stream_cursor_input,
-    amongus_matches_stream_cursor_value_input,
-    amongus_matches_sum_order_by,
-    amongus_matches_updates,
-    amongus_matches_var_pop_order_by,
-    amongus_matches_var_samp_order_by,
-    amongus_matches_variance_order_by,
-    amongus_mod_versions_aggregate_bool_exp,
-    amongus_mod_versions_aggregate_bool_exp_count,
-    amongus_mod_versions_aggregate_order_by,
-    amongus_mod_versions_arr_rel_insert_input,
-    amongus_mod_versions_bool_exp,
-    amongus_mod_versions_insert_input,
-    amongus_mod_versions_max_order_by,
-    amongus_mod_versions_min_order_by,
-    amongus_mod_versions_obj_rel_insert_input,
-    amongus_mod_versions_on_conflict,
-    amongus_mod_versions_order_by,
-    amongus_mod_versions_pk_columns_input,
-    amongus_mod_versions_set_input,
-    amongus_mod_versions_stream_cursor_input,
-    amongus_mod_versions_stream_cursor_value_input,
-    amongus_mod_versions_updates,
-    amongus_mods_bool_exp,
-    amongus_mods_insert_input,
-    amongus_mods_obj_rel_insert_input,
-    amongus_mods_on_conflict,
-    amongus_mods_order_by,
-    amongus_mods_pk_columns_input,
-    amongus_mods_set_input,
-    amongus_mods_stream_cursor_input,
-    amongus_mods_stream_cursor_value_input,
-    amongus_mods_updates,
-    amongus_roles_aggregate_bool_exp,
-    amongus_roles_aggregate_bool_exp_bool_and,
-    amongus_roles_aggregate_bool_exp_bool_or,
-    amongus_roles_aggregate_bool_exp_count,
-    amongus_roles_aggregate_order_by,
-    amongus_roles_arr_rel_insert_input,
-    amongus_roles_avg_order_by,
-    amongus_roles_bool_exp,
-    amongus_roles_inc_input,
-    amongus_roles_insert_input,
-    amongus_roles_max_order_by,
-    amongus_roles_min_order_by,
-    amongus_roles_on_conflict,
-    amongus_roles_order_by,
-    amongus_roles_pk_columns_input,
-    amongus_roles_set_input,
-    amongus_roles_stddev_order_by,
-    amongus_roles_stddev_pop_order_by,
-    amongus_roles_stddev_samp_order_by,
-    amongus_roles_stream_cursor_input,
-    amongus_roles_stream_cursor_value_input,
-    amongus_roles_sum_order_by,
-    amongus_roles_updates,
-    amongus_roles_var_pop_order_by,
-    amongus_roles_var_samp_order_by,
-    amongus_roles_variance_order_by,
-    amongus_vanilla_versions_bool_exp,
-    amongus_vanilla_versions_insert_input,
-    amongus_vanilla_versions_obj_rel_insert_input,
-    amongus_vanilla_versions_on_conflict,
-    amongus_vanilla_versions_order_by,
-    amongus_vanilla_versions_pk_columns_input,
-    amongus_vanilla_versions_set_input,
-    amongus_vanilla_versions_stream_cursor_input,
-    amongus_vanilla_versions_stream_cursor_value_input,
-    amongus_vanilla_versions_updates,
-    amongusvr_maps_bool_exp,
-    amongusvr_maps_insert_input,
-    amongusvr_maps_obj_rel_insert_input,
-    amongusvr_maps_on_conflict,
-    amongusvr_maps_order_by,
-    amongusvr_maps_pk_columns_input,
-    amongusvr_maps_set_input,
-    amongusvr_maps_stream_cursor_input,
-    amongusvr_maps_stream_cursor_value_input,
-    amongusvr_maps_updates,
-    amongusvr_match_players_aggregate_bool_exp,
-    amongusvr_match_players_aggregate_bool_exp_count,
-    amongusvr_match_players_aggregate_order_by,
-    amongusvr_match_players_arr_rel_insert_input,
-    amongusvr_match_players_bool_exp,
-    amongusvr_match_players_insert_input,
-    amongusvr_match_players_max_order_by,
-    amongusvr_match_players_min_order_by,
-    amongusvr_match_players_on_conflict,
-    amongusvr_match_players_order_by,
-    amongusvr_match_players_pk_columns_input,
-    amongusvr_match_players_set_input,
-    amongusvr_match_players_stream_cursor_input,
-    amongusvr_match_players_stream_cursor_value_input,
-    amongusvr_match_players_updates,
-    amongusvr_matches_aggregate_bool_exp,
-    amongusvr_matches_aggregate_bool_exp_bool_and,
-    amongusvr_matches_aggregate_bool_exp_bool_or,
-    amongusvr_matches_aggregate_bool_exp_count,
-    amongusvr_matches_aggregate_order_by,
-    amongusvr_matches_arr_rel_insert_input,
-    amongusvr_matches_avg_order_by,
-    amongusvr_matches_bool_exp,
-    amongusvr_matches_inc_input,
-    amongusvr_matches_insert_input,
-    amongusvr_matches_max_order_by,
-    amongusvr_matches_min_order_by,
-    amongusvr_matches_obj_rel_insert_input,
-    amongusvr_matches_on_conflict,
-    amongusvr_matches_order_by,
-    amongusvr_matches_pk_columns_input,
-    amongusvr_matches_set_input,
-    amongusvr_matches_stddev_order_by,
-    amongusvr_matches_stddev_pop_order_by,
-    amongusvr_matches_stddev_samp_order_by,
-    amongusvr_matches_stream_cursor_input,
-    amongusvr_matches_stream_cursor_value_input,
-    amongusvr_matches_sum_order_by,
-    amongusvr_matches_updates,
-    amongusvr_matches_var_pop_order_by,
-    amongusvr_matches_var_samp_order_by,
-    amongusvr_matches_variance_order_by,
-    fallguys_custom_round_twitter_announcements_aggregate_bool_exp,
-    fallguys_custom_round_twitter_announcements_aggregate_bool_exp_bool_and,
-    fallguys_custom_round_twitter_announcements_aggregate_bool_exp_bool_or,
-    fallguys_custom_round_twitter_announcements_aggregate_bool_exp_count,
-    fallguys_custom_round_twitter_announcements_aggregate_order_by,
-    fallguys_custom_round_twitter_announcements_arr_rel_insert_input,
-    fallguys_custom_round_twitter_announcements_bool_exp,
-    fallguys_custom_round_twitter_announcements_insert_input,
-    fallguys_custom_round_twitter_announcements_max_order_by,
-    fallguys_custom_round_twitter_announcements_min_order_by,
-    fallguys_custom_round_twitter_announcements_on_conflict,
-    fallguys_custom_round_twitter_announcements_order_by,
-    fallguys_custom_round_twitter_announcements_pk_columns_input,
-    fallguys_custom_round_twitter_announcements_set_input,
-    fallguys_custom_round_twitter_announcements_stream_cursor_input,
-    fallguys_custom_round_twitter_announcements_stream_cursor_value_input,
-    fallguys_custom_round_twitter_announcements_updates,
-    fallguys_custom_rounds_aggregate_bool_exp,
-    fallguys_custom_rounds_aggregate_bool_exp_count,
-    fallguys_custom_rounds_aggregate_order_by,
-    fallguys_custom_rounds_arr_rel_insert_input,
-    fallguys_custom_rounds_bool_exp,
-    fallguys_custom_rounds_insert_input,
-    fallguys_custom_rounds_max_order_by,
-    fallguys_custom_rounds_min_order_by,
-    fallguys_custom_rounds_obj_rel_insert_input,
-    fallguys_custom_rounds_on_conflict,
-    fallguys_custom_rounds_order_by,
-    fallguys_custom_rounds_pk_columns_input,
-    fallguys_custom_rounds_set_input,
-    fallguys_custom_rounds_stream_cursor_input,
-    fallguys_custom_rounds_stream_cursor_value_input,
-    fallguys_custom_rounds_updates,
-    fallguys_match_rounds_aggregate_bool_exp,
-    fallguys_match_rounds_aggregate_bool_exp_bool_and,
-    fallguys_match_rounds_aggregate_bool_exp_bool_or,
-    fallguys_match_rounds_aggregate_bool_exp_count,
-    fallguys_match_rounds_aggregate_order_by,
-    fallguys_match_rounds_arr_rel_insert_input,
-    fallguys_match_rounds_avg_order_by,
-    fallguys_match_rounds_bool_exp,
-    fallguys_match_rounds_inc_input,
-    fallguys_match_rounds_insert_input,
-    fallguys_match_rounds_max_order_by,
-    fallguys_match_rounds_min_order_by,
-    fallguys_match_rounds_on_conflict,
-    fallguys_match_rounds_order_by,
-    fallguys_match_rounds_pk_columns_input,
-    fallguys_match_rounds_set_input,
-    fallguys_match_rounds_stddev_order_by,
-    fallguys_match_rounds_stddev_pop_order_by,
-    fallguys_match_rounds_stddev_samp_order_by,
-    fallguys_match_rounds_stream_cursor_input,
-    fallguys_match_rounds_stream_cursor_value_input,
-    fallguys_match_rounds_sum_order_by,
-    fallguys_match_rounds_updates,
-    fallguys_match_rounds_var_pop_order_by,
-    fallguys_match_rounds_var_samp_order_by,
-    fallguys_match_rounds_variance_order_by,
-    fallguys_matches_aggregate_bool_exp,
-    fallguys_matches_aggregate_bool_exp_bool_and,
-    fallguys_matches_aggregate_bool_exp_bool_or,
-    fallguys_matches_aggregate_bool_exp_count,
-    fallguys_matches_aggregate_order_by,
-    fallguys_matches_arr_rel_insert_input,
-    fallguys_matches_avg_order_by,
-    fallguys_matches_bool_exp,
-    fallguys_matches_inc_input,
-    fallguys_matches_insert_input,
-    fallguys_matches_max_order_by,
-    fallguys_matches_min_order_by,
-    fallguys_matches_obj_rel_insert_input,
-    fallguys_matches_on_conflict,
-    fallguys_matches_order_by,
-    fallguys_matches_pk_columns_input,
-    fallguys_matches_set_input,
-    fallguys_matches_stddev_order_by,
-    fallguys_matches_stddev_pop_order_by,
-    fallguys_matches_stddev_samp_order_by,
-    fallguys_matches_stream_cursor_input,
-    fallguys_matches_stream_cursor_value_input,
-    fallguys_matches_sum_order_by,
-    fallguys_matches_updates,
-    fallguys_matches_var_pop_order_by,
-    fallguys_matches_var_samp_order_by,
-    fallguys_matches_variance_order_by,
-    fallguys_rounds_bool_exp,
-    fallguys_rounds_insert_input,
-    fallguys_rounds_obj_rel_insert_input,
-    fallguys_rounds_on_conflict,
-    fallguys_rounds_order_by,
-    fallguys_rounds_pk_columns_input,
-    fallguys_rounds_set_input,
-    fallguys_rounds_stream_cursor_input,
-    fallguys_rounds_stream_cursor_value_input,
-    fallguys_rounds_updates,
-    fediverse_accounts_bool_exp,
-    fediverse_accounts_insert_input,
-    fediverse_accounts_obj_rel_insert_input,
-    fediverse_accounts_on_conflict,
-    fediverse_accounts_order_by,
-    fediverse_accounts_pk_columns_input,
-    fediverse_accounts_set_input,
-    fediverse_accounts_stream_cursor_input,
-    fediverse_accounts_stream_cursor_value_input,
-    fediverse_accounts_updates,
-    games_bool_exp,
-    games_insert_input,
-    games_obj_rel_insert_input,
-    games_on_conflict,
-    games_order_by,
-    games_pk_columns_input,
-    games_set_input,
-    games_stream_cursor_input,
-    games_stream_cursor_value_input,
-    games_updates,
-    mariokart8deluxe_battle_courses_bool_exp,
-    mariokart8deluxe_battle_courses_inc_input,
-    mariokart8deluxe_battle_courses_insert_input,
-    mariokart8deluxe_battle_courses_obj_rel_insert_input,
-    mariokart8deluxe_battle_courses_on_conflict,
-    mariokart8deluxe_battle_courses_order_by,
-    mariokart8deluxe_battle_courses_pk_columns_input,
-    mariokart8deluxe_battle_courses_set_input,
-    mariokart8deluxe_battle_courses_stream_cursor_input,
-    mariokart8deluxe_battle_courses_stream_cursor_value_input,
-    mariokart8deluxe_battle_courses_updates,
-    mariokart8deluxe_battle_match_players_aggregate_bool_exp,
-    mariokart8deluxe_battle_match_players_aggregate_bool_exp_count,
-    mariokart8deluxe_battle_match_players_aggregate_order_by,
-    mariokart8deluxe_battle_match_players_arr_rel_insert_input,
-    mariokart8deluxe_battle_match_players_bool_exp,
-    mariokart8deluxe_battle_match_players_insert_input,
-    mariokart8deluxe_battle_match_players_max_order_by,
-    mariokart8deluxe_battle_match_players_min_order_by,
-    mariokart8deluxe_battle_match_players_on_conflict,
-    mariokart8deluxe_battle_match_players_order_by,
-    mariokart8deluxe_battle_match_players_pk_columns_input,
-    mariokart8deluxe_battle_match_players_set_input,
-    mariokart8deluxe_battle_match_players_stream_cursor_input,
-    mariokart8deluxe_battle_match_players_stream_cursor_value_input,
-    mariokart8deluxe_battle_match_players_updates,
-    mariokart8deluxe_battle_matches_aggregate_bool_exp,
-    mariokart8deluxe_battle_matches_aggregate_bool_exp_bool_and,
-    mariokart8deluxe_battle_matches_aggregate_bool_exp_bool_or,
-    mariokart8deluxe_battle_matches_aggregate_bool_exp_count,
-    mariokart8deluxe_battle_matches_aggregate_order_by,
-    mariokart8deluxe_battle_matches_arr_rel_insert_input,
-    mariokart8deluxe_battle_matches_avg_order_by,
-    mariokart8deluxe_battle_matches_bool_exp,
-    mariokart8deluxe_battle_matches_inc_input,
-    mariokart8deluxe_battle_matches_insert_input,
-    mariokart8deluxe_battle_matches_max_order_by,
-    mariokart8deluxe_battle_matches_min_order_by,
-    mariokart8deluxe_battle_matches_obj_rel_insert_input,
-    mariokart8deluxe_battle_matches_on_conflict,
-    mariokart8deluxe_battle_matches_order_by,
-    mariokart8deluxe_battle_matches_pk_columns_input,
-    mariokart8deluxe_battle_matches_set_input,
-    mariokart8deluxe_battle_matches_stddev_order_by,
-    mariokart8deluxe_battle_matches_stddev_pop_order_by,
-    mariokart8deluxe_battle_matches_stddev_samp_order_by,
-    mariokart8deluxe_battle_matches_stream_cursor_input,
-    mariokart8deluxe_battle_matches_stream_cursor_value_input,
-    mariokart8deluxe_battle_matches_sum_order_by,
-    mariokart8deluxe_battle_matches_updates,
-    mariokart8deluxe_battle_matches_var_pop_order_by,
-    mariokart8deluxe_battle_matches_var_samp_order_by,
-    mariokart8deluxe_battle_matches_variance_order_by,
-    mariokart8deluxe_battle_rules_bool_exp,
-    mariokart8deluxe_battle_rules_inc_input,
-    mariokart8deluxe_battle_rules_insert_input,
-    mariokart8deluxe_battle_rules_obj_rel_insert_input,
-    mariokart8deluxe_battle_rules_on_conflict,
-    mariokart8deluxe_battle_rules_order_by,
-    mariokart8deluxe_battle_rules_pk_columns_input,
-    mariokart8deluxe_battle_rules_set_input,
-    mariokart8deluxe_battle_rules_stream_cursor_input,
-    mariokart8deluxe_battle_rules_stream_cursor_value_input,
-    mariokart8deluxe_battle_rules_updates,
-    mariokart8deluxe_consoles_bool_exp,
-    mariokart8deluxe_consoles_insert_input,
-    mariokart8deluxe_consoles_obj_rel_insert_input,
-    mariokart8deluxe_consoles_on_conflict,
-    mariokart8deluxe_consoles_order_by,
-    mariokart8deluxe_consoles_pk_columns_input,
-    mariokart8deluxe_consoles_set_input,
-    mariokart8deluxe_consoles_stream_cursor_input,
-    mariokart8deluxe_consoles_stream_cursor_value_input,
-    mariokart8deluxe_consoles_updates,
-    mariokart8deluxe_courses_aggregate_bool_exp,
-    mariokart8deluxe_courses_aggregate_bool_exp_count,
-    mariokart8deluxe_courses_aggregate_order_by,
-    mariokart8deluxe_courses_arr_rel_insert_input,
-    mariokart8deluxe_courses_avg_order_by,
-    mariokart8deluxe_courses_bool_exp,
-    mariokart8deluxe_courses_inc_input,
-    mariokart8deluxe_courses_insert_input,
-    mariokart8deluxe_courses_max_order_by,
-    mariokart8deluxe_courses_min_order_by,
-    mariokart8deluxe_courses_obj_rel_insert_input,
-    mariokart8deluxe_courses_on_conflict,
-    mariokart8deluxe_courses_order_by,
-    mariokart8deluxe_courses_pk_columns_input,
-    mariokart8deluxe_courses_set_input,
-    mariokart8deluxe_courses_stddev_order_by,
-    mariokart8deluxe_courses_stddev_pop_order_by,
-    mariokart8deluxe_courses_stddev_samp_order_by,
-    mariokart8deluxe_courses_stream_cursor_input,
-    mariokart8deluxe_courses_stream_cursor_value_input,
-    mariokart8deluxe_courses_sum_order_by,
-    mariokart8deluxe_courses_updates,
-    mariokart8deluxe_courses_var_pop_order_by,
-    mariokart8deluxe_courses_var_samp_order_by,
-    mariokart8deluxe_courses_variance_order_by,
-    mariokart8deluxe_cups_bool_exp,
-    mariokart8deluxe_cups_inc_input,
-    mariokart8deluxe_cups_insert_input,
-    mariokart8deluxe_cups_obj_rel_insert_input,
-    mariokart8deluxe_cups_on_conflict,
-    mariokart8deluxe_cups_order_by,
-    mariokart8deluxe_cups_pk_columns_input,
-    mariokart8deluxe_cups_set_input,
-    mariokart8deluxe_cups_stream_cursor_input,
-    mariokart8deluxe_cups_stream_cursor_value_input,
-    mariokart8deluxe_cups_updates,
-    mariokart8deluxe_race_players_aggregate_bool_exp,
-    mariokart8deluxe_race_players_aggregate_bool_exp_count,
-    mariokart8deluxe_race_players_aggregate_order_by,
-    mariokart8deluxe_race_players_arr_rel_insert_input,
-    mariokart8deluxe_race_players_bool_exp,
-    mariokart8deluxe_race_players_insert_input,
-    mariokart8deluxe_race_players_max_order_by,
-    mariokart8deluxe_race_players_min_order_by,
-    mariokart8deluxe_race_players_on_conflict,
-    mariokart8deluxe_race_players_order_by,
-    mariokart8deluxe_race_players_pk_columns_input,
-    mariokart8deluxe_race_players_set_input,
-    mariokart8deluxe_race_players_stream_cursor_input,
-    mariokart8deluxe_race_players_stream_cursor_value_input,
-    mariokart8deluxe_race_players_updates,
-    mariokart8deluxe_race_rules_bool_exp,
-    mariokart8deluxe_race_rules_inc_input,
-    mariokart8deluxe_race_rules_insert_input,
-    mariokart8deluxe_race_rules_obj_rel_insert_input,
-    mariokart8deluxe_race_rules_on_conflict,
-    mariokart8deluxe_race_rules_order_by,
-    mariokart8deluxe_race_rules_pk_columns_input,
-    mariokart8deluxe_race_rules_set_input,
-    mariokart8deluxe_race_rules_stream_cursor_input,
-    mariokart8deluxe_race_rules_stream_cursor_value_input,
-    mariokart8deluxe_race_rules_updates,
-    mariokart8deluxe_races_aggregate_bool_exp,
-    mariokart8deluxe_races_aggregate_bool_exp_bool_and,
-    mariokart8deluxe_races_aggregate_bool_exp_bool_or,
-    mariokart8deluxe_races_aggregate_bool_exp_count,
-    mariokart8deluxe_races_aggregate_order_by,
-    mariokart8deluxe_races_arr_rel_insert_input,
-    mariokart8deluxe_races_avg_order_by,
-    mariokart8deluxe_races_bool_exp,
-    mariokart8deluxe_races_inc_input,
-    mariokart8deluxe_races_insert_input,
-    mariokart8deluxe_races_max_order_by,
-    mariokart8deluxe_races_min_order_by,
-    mariokart8deluxe_races_obj_rel_insert_input,
-    mariokart8deluxe_races_on_conflict,
-    mariokart8deluxe_races_order_by,
-    mariokart8deluxe_races_pk_columns_input,
-    mariokart8deluxe_races_set_input,
-    mariokart8deluxe_races_stddev_order_by,
-    mariokart8deluxe_races_stddev_pop_order_by,
-    mariokart8deluxe_races_stddev_samp_order_by,
-    mariokart8deluxe_races_stream_cursor_input,
-    mariokart8deluxe_races_stream_cursor_value_input,
-    mariokart8deluxe_races_sum_order_by,
-    mariokart8deluxe_races_updates,
-    mariokart8deluxe_races_var_pop_order_by,
-    mariokart8deluxe_races_var_samp_order_by,
-    mariokart8deluxe_races_variance_order_by,
-    niconico_accounts_bool_exp,
-    niconico_accounts_insert_input,
-    niconico_accounts_obj_rel_insert_input,
-    niconico_accounts_on_conflict,
-    niconico_accounts_order_by,
-    niconico_accounts_pk_columns_input,
-    niconico_accounts_set_input,
-    niconico_accounts_stream_cursor_input,
-    niconico_accounts_stream_cursor_value_input,
-    niconico_accounts_updates,
-    niconico_channels_bool_exp,
-    niconico_channels_insert_input,
-    niconico_channels_obj_rel_insert_input,
-    niconico_channels_on_conflict,
-    niconico_channels_order_by,
-    niconico_channels_pk_columns_input,
-    niconico_channels_set_input,
-    niconico_channels_stream_cursor_input,
-    niconico_channels_stream_cursor_value_input,
-    niconico_channels_updates,
-    niconico_communities_bool_exp,
-    niconico_communities_insert_input,
-    niconico_communities_obj_rel_insert_input,
-    niconico_communities_on_conflict,
-    niconico_communities_order_by,
-    niconico_communities_pk_columns_input,
-    niconico_communities_set_input,
-    niconico_communities_stream_cursor_input,
-    niconico_communities_stream_cursor_value_input,
-    niconico_communities_updates,
-    niconico_plus_channels_bool_exp,
-    niconico_plus_channels_insert_input,
-    niconico_plus_channels_obj_rel_insert_input,
-    niconico_plus_channels_on_conflict,
-    niconico_plus_channels_order_by,
-    niconico_plus_channels_pk_columns_input,
-    niconico_plus_channels_set_input,
-    niconico_plus_channels_stream_cursor_input,
-    niconico_plus_channels_stream_cursor_value_input,
-    niconico_plus_channels_updates,
-    niconico_videos_bool_exp,
-    niconico_videos_insert_input,
-    niconico_videos_obj_rel_insert_input,
-    niconico_videos_on_conflict,
-    niconico_videos_order_by,
-    niconico_videos_pk_columns_input,
-    niconico_videos_set_input,
-    niconico_videos_stream_cursor_input,
-    niconico_videos_stream_cursor_value_input,
-    niconico_videos_updates,
-    person_fediverse_accounts_aggregate_bool_exp,
-    person_fediverse_accounts_aggregate_bool_exp_count,
-    person_fediverse_accounts_aggregate_order_by,
-    person_fediverse_accounts_arr_rel_insert_input,
-    person_fediverse_accounts_bool_exp,
-    person_fediverse_accounts_insert_input,
-    person_fediverse_accounts_max_order_by,
-    person_fediverse_accounts_min_order_by,
-    person_fediverse_accounts_on_conflict,
-    person_fediverse_accounts_order_by,
-    person_fediverse_accounts_pk_columns_input,
-    person_fediverse_accounts_set_input,
-    person_fediverse_accounts_stream_cursor_input,
-    person_fediverse_accounts_stream_cursor_value_input,
-    person_fediverse_accounts_updates,
-    person_niconico_accounts_aggregate_bool_exp,
-    person_niconico_accounts_aggregate_bool_exp_count,
-    person_niconico_accounts_aggregate_order_by,
-    person_niconico_accounts_arr_rel_insert_input,
-    person_niconico_accounts_bool_exp,
-    person_niconico_accounts_insert_input,
-    person_niconico_accounts_max_order_by,
-    person_niconico_accounts_min_order_by,
-    person_niconico_accounts_on_conflict,
-    person_niconico_accounts_order_by,
-    person_niconico_accounts_pk_columns_input,
-    person_niconico_accounts_set_input,
-    person_niconico_accounts_stream_cursor_input,
-    person_niconico_accounts_stream_cursor_value_input,
-    person_niconico_accounts_updates,
-    person_niconico_channels_aggregate_bool_exp,
-    person_niconico_channels_aggregate_bool_exp_count,
-    person_niconico_channels_aggregate_order_by,
-    person_niconico_channels_arr_rel_insert_input,
-    person_niconico_channels_bool_exp,
-    person_niconico_channels_insert_input,
-    person_niconico_channels_max_order_by,
-    person_niconico_channels_min_order_by,
-    person_niconico_channels_on_conflict,
-    person_niconico_channels_order_by,
-    person_niconico_channels_pk_columns_input,
-    person_niconico_channels_set_input,
-    person_niconico_channels_stream_cursor_input,
-    person_niconico_channels_stream_cursor_value_input,
-    person_niconico_channels_updates,
-    person_niconico_communities_aggregate_bool_exp,
-    person_niconico_communities_aggregate_bool_exp_count,
-    person_niconico_communities_aggregate_order_by,
-    person_niconico_communities_arr_rel_insert_input,
-    person_niconico_communities_bool_exp,
-    person_niconico_communities_insert_input,
-    person_niconico_communities_max_order_by,
-    person_niconico_communities_min_order_by,
-    person_niconico_communities_on_conflict,
-    person_niconico_communities_order_by,
-    person_niconico_communities_pk_columns_input,
-    person_niconico_communities_set_input,
-    person_niconico_communities_stream_cursor_input,
-    person_niconico_communities_stream_cursor_value_input,
-    person_niconico_communities_updates,
-    person_niconico_plus_channels_aggregate_bool_exp,
-    person_niconico_plus_channels_aggregate_bool_exp_count,
-    person_niconico_plus_channels_aggregate_order_by,
-    person_niconico_plus_channels_arr_rel_insert_input,
-    person_niconico_plus_channels_bool_exp,
-    person_niconico_plus_channels_insert_input,
-    person_niconico_plus_channels_max_order_by,
-    person_niconico_plus_channels_min_order_by,
-    person_niconico_plus_channels_on_conflict,
-    person_niconico_plus_channels_order_by,
-    person_niconico_plus_channels_pk_columns_input,
-    person_niconico_plus_channels_set_input,
-    person_niconico_plus_channels_stream_cursor_input,
-    person_niconico_plus_channels_stream_cursor_value_input,
-    person_niconico_plus_channels_updates,
-    person_twitter_accounts_aggregate_bool_exp,
-    person_twitter_accounts_aggregate_bool_exp_count,
-    person_twitter_accounts_aggregate_order_by,
-    person_twitter_accounts_arr_rel_insert_input,
-    person_twitter_accounts_bool_exp,
-    person_twitter_accounts_insert_input,
-    person_twitter_accounts_max_order_by,
-    person_twitter_accounts_min_order_by,
-    person_twitter_accounts_on_conflict,
-    person_twitter_accounts_order_by,
-    person_twitter_accounts_pk_columns_input,
-    person_twitter_accounts_set_input,
-    person_twitter_accounts_stream_cursor_input,
-    person_twitter_accounts_stream_cursor_value_input,
-    person_twitter_accounts_updates,
-    person_youtube_channels_aggregate_bool_exp,
-    person_youtube_channels_aggregate_bool_exp_count,
-    person_youtube_channels_aggregate_order_by,
-    person_youtube_channels_arr_rel_insert_input,
-    person_youtube_channels_bool_exp,
-    person_youtube_channels_insert_input,
-    person_youtube_channels_max_order_by,
-    person_youtube_channels_min_order_by,
-    person_youtube_channels_on_conflict,
-    person_youtube_channels_order_by,
-    person_youtube_channels_pk_columns_input,
-    person_youtube_channels_set_input,
-    person_youtube_channels_stream_cursor_input,
-    person_youtube_channels_stream_cursor_value_input,
-    person_youtube_channels_updates,
-    persons_bool_exp,
-    persons_insert_input,
-    persons_obj_rel_insert_input,
-    persons_on_conflict,
-    persons_order_by,
-    persons_pk_columns_input,
-    persons_set_input,
-    persons_stream_cursor_input,
-    persons_stream_cursor_value_input,
-    persons_updates,
-    program_amongus_maps_aggregate_bool_exp,
-    program_amongus_maps_aggregate_bool_exp_count,
-    program_amongus_maps_aggregate_order_by,
-    program_amongus_maps_arr_rel_insert_input,
-    program_amongus_maps_bool_exp,
-    program_amongus_maps_insert_input,
-    program_amongus_maps_max_order_by,
-    program_amongus_maps_min_order_by,
-    program_amongus_maps_on_conflict,
-    program_amongus_maps_order_by,
-    program_amongus_maps_pk_columns_input,
-    program_amongus_maps_set_input,
-    program_amongus_maps_stream_cursor_input,
-    program_amongus_maps_stream_cursor_value_input,
-    program_amongus_maps_updates,
-    program_amongus_mods_aggregate_bool_exp,
-    program_amongus_mods_aggregate_bool_exp_count,
-    program_amongus_mods_aggregate_order_by,
-    program_amongus_mods_arr_rel_insert_input,
-    program_amongus_mods_bool_exp,
-    program_amongus_mods_insert_input,
-    program_amongus_mods_max_order_by,
-    program_amongus_mods_min_order_by,
-    program_amongus_mods_on_conflict,
-    program_amongus_mods_order_by,
-    program_amongus_mods_pk_columns_input,
-    program_amongus_mods_set_input,
-    program_amongus_mods_stream_cursor_input,
-    program_amongus_mods_stream_cursor_value_input,
-    program_amongus_mods_updates,
-    program_amongus_vanilla_versions_aggregate_bool_exp,
-    program_amongus_vanilla_versions_aggregate_bool_exp_count,
-    program_amongus_vanilla_versions_aggregate_order_by,
-    program_amongus_vanilla_versions_arr_rel_insert_input,
-    program_amongus_vanilla_versions_bool_exp,
-    program_amongus_vanilla_versions_insert_input,
-    program_amongus_vanilla_versions_max_order_by,
-    program_amongus_vanilla_versions_min_order_by,
-    program_amongus_vanilla_versions_on_conflict,
-    program_amongus_vanilla_versions_order_by,
-    program_amongus_vanilla_versions_pk_columns_input,
-    program_amongus_vanilla_versions_set_input,
-    program_amongus_vanilla_versions_stream_cursor_input,
-    program_amongus_vanilla_versions_stream_cursor_value_input,
-    program_amongus_vanilla_versions_updates,
-    program_live_archives_aggregate_bool_exp,
-    program_live_archives_aggregate_bool_exp_count,
-    program_live_archives_aggregate_order_by,
-    program_live_archives_arr_rel_insert_input,
-    program_live_archives_bool_exp,
-    program_live_archives_insert_input,
-    program_live_archives_max_order_by,
-    program_live_archives_min_order_by,
-    program_live_archives_on_conflict,
-    program_live_archives_order_by,
-    program_live_archives_pk_columns_input,
-    program_live_archives_set_input,
-    program_live_archives_stream_cursor_input,
-    program_live_archives_stream_cursor_value_input,
-    program_live_archives_updates,
-    program_niconico_videos_aggregate_bool_exp,
-    program_niconico_videos_aggregate_bool_exp_count,
-    program_niconico_videos_aggregate_order_by,
-    program_niconico_videos_arr_rel_insert_input,
-    program_niconico_videos_bool_exp,
-    program_niconico_videos_insert_input,
-    program_niconico_videos_max_order_by,
-    program_niconico_videos_min_order_by,
-    program_niconico_videos_on_conflict,
-    program_niconico_videos_order_by,
-    program_niconico_videos_pk_columns_input,
-    program_niconico_videos_set_input,
-    program_niconico_videos_stream_cursor_input,
-    program_niconico_videos_stream_cursor_value_input,
-    program_niconico_videos_updates,
-    program_persons_aggregate_bool_exp,
-    program_persons_aggregate_bool_exp_bool_and,
-    program_persons_aggregate_bool_exp_bool_or,
-    program_persons_aggregate_bool_exp_count,
-    program_persons_aggregate_order_by,
-    program_persons_arr_rel_insert_input,
-    program_persons_bool_exp,
-    program_persons_insert_input,
-    program_persons_max_order_by,
-    program_persons_min_order_by,
-    program_persons_on_conflict,
-    program_persons_order_by,
-    program_persons_pk_columns_input,
-    program_persons_set_input,
-    program_persons_stream_cursor_input,
-    program_persons_stream_cursor_value_input,
-    program_persons_updates,
-    program_projects_aggregate_bool_exp,
-    program_projects_aggregate_bool_exp_count,
-    program_projects_aggregate_order_by,
-    program_projects_arr_rel_insert_input,
-    program_projects_bool_exp,
-    program_projects_insert_input,
-    program_projects_max_order_by,
-    program_projects_min_order_by,
-    program_projects_on_conflict,
-    program_projects_order_by,
-    program_projects_pk_columns_input,
-    program_projects_set_input,
-    program_projects_stream_cursor_input,
-    program_projects_stream_cursor_value_input,
-    program_projects_updates,
-    program_twitter_announcements_aggregate_bool_exp,
-    program_twitter_announcements_aggregate_bool_exp_count,
-    program_twitter_announcements_aggregate_order_by,
-    program_twitter_announcements_arr_rel_insert_input,
-    program_twitter_announcements_bool_exp,
-    program_twitter_announcements_insert_input,
-    program_twitter_announcements_max_order_by,
-    program_twitter_announcements_min_order_by,
-    program_twitter_announcements_on_conflict,
-    program_twitter_announcements_order_by,
-    program_twitter_announcements_pk_columns_input,
-    program_twitter_announcements_set_input,
-    program_twitter_announcements_stream_cursor_input,
-    program_twitter_announcements_stream_cursor_value_input,
-    program_twitter_announcements_updates,
-    programs_bool_exp,
-    programs_insert_input,
-    programs_obj_rel_insert_input,
-    programs_on_conflict,
-    programs_order_by,
-    programs_pk_columns_input,
-    programs_set_input,
-    programs_stream_cursor_input,
-    programs_stream_cursor_value_input,
-    programs_updates,
-    project_niconico_videos_aggregate_bool_exp,
-    project_niconico_videos_aggregate_bool_exp_count,
-    project_niconico_videos_aggregate_order_by,
-    project_niconico_videos_arr_rel_insert_input,
-    project_niconico_videos_bool_exp,
-    project_niconico_videos_insert_input,
-    project_niconico_videos_max_order_by,
-    project_niconico_videos_min_order_by,
-    project_niconico_videos_on_conflict,
-    project_niconico_videos_order_by,
-    project_niconico_videos_pk_columns_input,
-    project_niconico_videos_set_input,
-    project_niconico_videos_stream_cursor_input,
-    project_niconico_videos_stream_cursor_value_input,
-    project_niconico_videos_updates,
-    projects_bool_exp,
-    projects_insert_input,
-    projects_obj_rel_insert_input,
-    projects_on_conflict,
-    projects_order_by,
-    projects_pk_columns_input,
-    projects_set_input,
-    projects_stream_cursor_input,
-    projects_stream_cursor_value_input,
-    projects_updates,
-    timestamptz_comparison_exp,
-    twitter_accounts_bool_exp,
-    twitter_accounts_insert_input,
-    twitter_accounts_obj_rel_insert_input,
-    twitter_accounts_on_conflict,
-    twitter_accounts_order_by,
-    twitter_accounts_pk_columns_input,
-    twitter_accounts_set_input,
-    twitter_accounts_stream_cursor_input,
-    twitter_accounts_stream_cursor_value_input,
-    twitter_accounts_updates,
-    twitter_tweet_images_aggregate_bool_exp,
-    twitter_tweet_images_aggregate_bool_exp_count,
-    twitter_tweet_images_aggregate_order_by,
-    twitter_tweet_images_arr_rel_insert_input,
-    twitter_tweet_images_avg_order_by,
-    twitter_tweet_images_bool_exp,
-    twitter_tweet_images_inc_input,
-    twitter_tweet_images_insert_input,
-    twitter_tweet_images_max_order_by,
-    twitter_tweet_images_min_order_by,
-    twitter_tweet_images_obj_rel_insert_input,
-    twitter_tweet_images_on_conflict,
-    twitter_tweet_images_order_by,
-    twitter_tweet_images_pk_columns_input,
-    twitter_tweet_images_set_input,
-    twitter_tweet_images_stddev_order_by,
-    twitter_tweet_images_stddev_pop_order_by,
-    twitter_tweet_images_stddev_samp_order_by,
-    twitter_tweet_images_stream_cursor_input,
-    twitter_tweet_images_stream_cursor_value_input,
-    twitter_tweet_images_sum_order_by,
-    twitter_tweet_images_updates,
-    twitter_tweet_images_var_pop_order_by,
-    twitter_tweet_images_var_samp_order_by,
-    twitter_tweet_images_variance_order_by,
-    twitter_tweets_bool_exp,
-    twitter_tweets_insert_input,
-    twitter_tweets_obj_rel_insert_input,
-    twitter_tweets_on_conflict,
-    twitter_tweets_order_by,
-    twitter_tweets_pk_columns_input,
-    twitter_tweets_set_input,
-    twitter_tweets_stream_cursor_input,
-    twitter_tweets_stream_cursor_value_input,
-    twitter_tweets_updates,
-    uuid_comparison_exp,
-    youtube_channels_bool_exp,
-    youtube_channels_insert_input,
-    youtube_channels_obj_rel_insert_input,
-    youtube_channels_on_conflict,
-    youtube_channels_order_by,
-    youtube_channels_pk_columns_input,
-    youtube_channels_set_input,
-    youtube_channels_stream_cursor_input,
-    youtube_channels_stream_cursor_value_input,
-    youtube_channels_updates,
-    youtube_lives_aggregate_bool_exp,
-    youtube_lives_aggregate_bool_exp_count,
-    youtube_lives_aggregate_order_by,
-    youtube_lives_arr_rel_insert_input,
-    youtube_lives_bool_exp,
-    youtube_lives_insert_input,
-    youtube_lives_max_order_by,
-    youtube_lives_min_order_by,
-    youtube_lives_obj_rel_insert_input,
-    youtube_lives_on_conflict,
-    youtube_lives_order_by,
-    youtube_lives_pk_columns_input,
-    youtube_lives_set_input,
-    youtube_lives_stream_cursor_input,
-    youtube_lives_stream_cursor_value_input,
-    youtube_lives_updates,
-    youtube_videos_bool_exp,
-    youtube_videos_insert_input,
-    youtube_videos_obj_rel_insert_input,
-    youtube_videos_on_conflict,
-    youtube_videos_order_by,
-    youtube_videos_pk_columns_input,
-    youtube_videos_set_input,
-    youtube_videos_stream_cursor_input,
-    youtube_videos_stream_cursor_value_input,
-    youtube_videos_updates,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List
 
+if TYPE_CHECKING:
+    from .async_base_client import AsyncBaseClient, GraphQLBatchResult, GraphQLOperation
+    from .base_model import BaseModel, Upload
+    from .client import Client
+    from .create_game import CreateGame, CreateGameGame
+    from .create_program import CreateProgram, CreateProgramProgram
+    from .create_program_niconico_video import (
+        CreateProgramNiconicoVideo,
+        CreateProgramNiconicoVideoProgramNiconicoVideo,
+    )
+    from .create_program_person import (
+        CreateProgramPerson,
+        CreateProgramPersonProgramPerson,
+    )
+    from .create_program_twitter_announcement_with_tweet import (
+        CreateProgramTwitterAnnouncementWithTweet,
+        CreateProgramTwitterAnnouncementWithTweetProgramTwitterAnnouncement,
+    )
+    from .create_program_twitter_announcement_with_tweet_image import (
+        CreateProgramTwitterAnnouncementWithTweetImage,
+        CreateProgramTwitterAnnouncementWithTweetImageProgramTwitterAnnouncement,
+        CreateProgramTwitterAnnouncementWithTweetImageTwitterTweet,
+    )
+    from .create_program_youtube_live_live_archive import (
+        CreateProgramYoutubeLiveLiveArchive,
+        CreateProgramYoutubeLiveLiveArchiveProgramLiveArchive,
+    )
+    from .create_program_youtube_live_live_archives import (
+        CreateProgramYoutubeLiveLiveArchives,
+        CreateProgramYoutubeLiveLiveArchivesInsertProgramLiveArchives,
+        CreateProgramYoutubeLiveLiveArchivesInsertProgramLiveArchivesReturning,
+        CreateProgramYoutubeLiveLiveArchivesInsertProgramLiveArchivesReturningYoutubeLive,
+    )
+    from .create_program_youtube_video_live_archive import (
+        CreateProgramYoutubeVideoLiveArchive,
+        CreateProgramYoutubeVideoLiveArchiveProgramLiveArchive,
+    )
+    from .enums import (
+        amongus_maps_constraint,
+        amongus_maps_select_column,
+        amongus_maps_select_column_amongus_maps_aggregate_bool_exp_bool_and_arguments_columns,
+        amongus_maps_select_column_amongus_maps_aggregate_bool_exp_bool_or_arguments_columns,
+        amongus_maps_update_column,
+        amongus_match_player_result_roles_constraint,
+        amongus_match_player_result_roles_select_column,
+        amongus_match_player_result_roles_update_column,
+        amongus_match_players_constraint,
+        amongus_match_players_select_column,
+        amongus_match_players_update_column,
+        amongus_matches_constraint,
+        amongus_matches_select_column,
+        amongus_matches_select_column_amongus_matches_aggregate_bool_exp_bool_and_arguments_columns,
+        amongus_matches_select_column_amongus_matches_aggregate_bool_exp_bool_or_arguments_columns,
+        amongus_matches_update_column,
+        amongus_mod_versions_constraint,
+        amongus_mod_versions_select_column,
+        amongus_mod_versions_update_column,
+        amongus_mods_constraint,
+        amongus_mods_update_column,
+        amongus_roles_constraint,
+        amongus_roles_select_column,
+        amongus_roles_select_column_amongus_roles_aggregate_bool_exp_bool_and_arguments_columns,
+        amongus_roles_select_column_amongus_roles_aggregate_bool_exp_bool_or_arguments_columns,
+        amongus_roles_update_column,
+        amongus_vanilla_versions_constraint,
+        amongus_vanilla_versions_update_column,
+        amongusvr_maps_constraint,
+        amongusvr_maps_update_column,
+        amongusvr_match_players_constraint,
+        amongusvr_match_players_select_column,
+        amongusvr_match_players_update_column,
+        amongusvr_matches_constraint,
+        amongusvr_matches_select_column,
+        amongusvr_matches_select_column_amongusvr_matches_aggregate_bool_exp_bool_and_arguments_columns,
+        amongusvr_matches_select_column_amongusvr_matches_aggregate_bool_exp_bool_or_arguments_columns,
+        amongusvr_matches_update_column,
+        fallguys_custom_round_twitter_announcements_constraint,
+        fallguys_custom_round_twitter_announcements_select_column,
+        fallguys_custom_round_twitter_announcements_select_column_fallguys_custom_round_twitter_announcements_aggregate_bool_exp_bool_and_arguments_columns,
+        fallguys_custom_round_twitter_announcements_select_column_fallguys_custom_round_twitter_announcements_aggregate_bool_exp_bool_or_arguments_columns,
+        fallguys_custom_round_twitter_announcements_update_column,
+        fallguys_custom_rounds_constraint,
+        fallguys_custom_rounds_select_column,
+        fallguys_custom_rounds_update_column,
+        fallguys_match_rounds_constraint,
+        fallguys_match_rounds_select_column,
+        fallguys_match_rounds_select_column_fallguys_match_rounds_aggregate_bool_exp_bool_and_arguments_columns,
+        fallguys_match_rounds_select_column_fallguys_match_rounds_aggregate_bool_exp_bool_or_arguments_columns,
+        fallguys_match_rounds_update_column,
+        fallguys_matches_constraint,
+        fallguys_matches_select_column,
+        fallguys_matches_select_column_fallguys_matches_aggregate_bool_exp_bool_and_arguments_columns,
+        fallguys_matches_select_column_fallguys_matches_aggregate_bool_exp_bool_or_arguments_columns,
+        fallguys_matches_update_column,
+        fallguys_rounds_constraint,
+        fallguys_rounds_update_column,
+        fediverse_accounts_constraint,
+        fediverse_accounts_update_column,
+        games_constraint,
+        games_update_column,
+        mariokart8deluxe_battle_courses_constraint,
+        mariokart8deluxe_battle_courses_update_column,
+        mariokart8deluxe_battle_match_players_constraint,
+        mariokart8deluxe_battle_match_players_select_column,
+        mariokart8deluxe_battle_match_players_update_column,
+        mariokart8deluxe_battle_matches_constraint,
+        mariokart8deluxe_battle_matches_select_column,
+        mariokart8deluxe_battle_matches_select_column_mariokart8deluxe_battle_matches_aggregate_bool_exp_bool_and_arguments_columns,
+        mariokart8deluxe_battle_matches_select_column_mariokart8deluxe_battle_matches_aggregate_bool_exp_bool_or_arguments_columns,
+        mariokart8deluxe_battle_matches_update_column,
+        mariokart8deluxe_battle_rules_constraint,
+        mariokart8deluxe_battle_rules_update_column,
+        mariokart8deluxe_consoles_constraint,
+        mariokart8deluxe_consoles_update_column,
+        mariokart8deluxe_courses_constraint,
+        mariokart8deluxe_courses_select_column,
+        mariokart8deluxe_courses_update_column,
+        mariokart8deluxe_cups_constraint,
+        mariokart8deluxe_cups_update_column,
+        mariokart8deluxe_race_players_constraint,
+        mariokart8deluxe_race_players_select_column,
+        mariokart8deluxe_race_players_update_column,
+        mariokart8deluxe_race_rules_constraint,
+        mariokart8deluxe_race_rules_update_column,
+        mariokart8deluxe_races_constraint,
+        mariokart8deluxe_races_select_column,
+        mariokart8deluxe_races_select_column_mariokart8deluxe_races_aggregate_bool_exp_bool_and_arguments_columns,
+        mariokart8deluxe_races_select_column_mariokart8deluxe_races_aggregate_bool_exp_bool_or_arguments_columns,
+        mariokart8deluxe_races_update_column,
+        niconico_accounts_constraint,
+        niconico_accounts_update_column,
+        niconico_channels_constraint,
+        niconico_channels_update_column,
+        niconico_communities_constraint,
+        niconico_communities_update_column,
+        niconico_plus_channels_constraint,
+        niconico_plus_channels_update_column,
+        niconico_videos_constraint,
+        niconico_videos_update_column,
+        person_fediverse_accounts_constraint,
+        person_fediverse_accounts_select_column,
+        person_fediverse_accounts_update_column,
+        person_niconico_accounts_constraint,
+        person_niconico_accounts_select_column,
+        person_niconico_accounts_update_column,
+        person_niconico_channels_constraint,
+        person_niconico_channels_select_column,
+        person_niconico_channels_update_column,
+        person_niconico_communities_constraint,
+        person_niconico_communities_select_column,
+        person_niconico_communities_update_column,
+        person_niconico_plus_channels_constraint,
+        person_niconico_plus_channels_select_column,
+        person_niconico_plus_channels_update_column,
+        person_twitter_accounts_constraint,
+        person_twitter_accounts_select_column,
+        person_twitter_accounts_update_column,
+        person_youtube_channels_constraint,
+        person_youtube_channels_select_column,
+        person_youtube_channels_update_column,
+        persons_constraint,
+        persons_update_column,
+        program_amongus_maps_constraint,
+        program_amongus_maps_select_column,
+        program_amongus_maps_update_column,
+        program_amongus_mods_constraint,
+        program_amongus_mods_select_column,
+        program_amongus_mods_update_column,
+        program_amongus_vanilla_versions_constraint,
+        program_amongus_vanilla_versions_select_column,
+        program_amongus_vanilla_versions_update_column,
+        program_live_archives_constraint,
+        program_live_archives_select_column,
+        program_live_archives_update_column,
+        program_niconico_videos_constraint,
+        program_niconico_videos_select_column,
+        program_niconico_videos_update_column,
+        program_persons_constraint,
+        program_persons_select_column,
+        program_persons_select_column_program_persons_aggregate_bool_exp_bool_and_arguments_columns,
+        program_persons_select_column_program_persons_aggregate_bool_exp_bool_or_arguments_columns,
+        program_persons_update_column,
+        program_projects_constraint,
+        program_projects_select_column,
+        program_projects_update_column,
+        program_twitter_announcements_constraint,
+        program_twitter_announcements_select_column,
+        program_twitter_announcements_update_column,
+        programs_constraint,
+        programs_update_column,
+        project_niconico_videos_constraint,
+        project_niconico_videos_select_column,
+        project_niconico_videos_update_column,
+        projects_constraint,
+        projects_update_column,
+        twitter_accounts_constraint,
+        twitter_accounts_update_column,
+        twitter_tweet_images_constraint,
+        twitter_tweet_images_select_column,
+        twitter_tweet_images_update_column,
+        twitter_tweets_constraint,
+        twitter_tweets_update_column,
+        youtube_channels_constraint,
+        youtube_channels_update_column,
+        youtube_lives_constraint,
+        youtube_lives_select_column,
+        youtube_lives_update_column,
+        youtube_videos_constraint,
+        youtube_videos_update_column,
+    )
+    from .exceptions import (
+        GraphQLClientError,
+        GraphQLClientGraphQLError,
+        GraphQLClientGraphQLMultiError,
+        GraphQLClientHttpError,
+        GraphQLClientInvalidResponseError,
+    )
+    from .games_stream import GamesStream, GamesStreamGameList
+    from .get_person_account_index import (
+        GetPersonAccountIndex,
+        GetPersonAccountIndexPersonNiconicoAccountList,
+        GetPersonAccountIndexPersonNiconicoAccountListNiconicoAccount,
+        GetPersonAccountIndexPersonTwitterAccountList,
+        GetPersonAccountIndexPersonYoutubeChannelList,
+        GetPersonAccountIndexPersonYoutubeChannelListYoutubeChannel,
+    )
+    from .get_program_project_list_by_project_id import (
+        GetProgramProjectListByProjectId,
+        GetProgramProjectListByProjectIdProject,
+        GetProgramProjectListByProjectIdProjectProgramProjectList,
+        GetProgramProjectListByProjectIdProjectProgramProjectListProgram,
+    )
+    from .get_reference_data import (
+        GetReferenceData,
+        GetReferenceDataGameList,
+        GetReferenceDataPersonList,
+        GetReferenceDataProjectList,
+        GetReferenceDataTwitterAccountList,
+    )
+    from .get_twitter_account_by_screen_name import (
+        GetTwitterAccountByScreenName,
+        GetTwitterAccountByScreenNameTwitterAccountList,
+    )
+    from .get_twitter_tweet_by_remote_tweet_id import (
+        GetTwitterTweetByRemoteTweetId,
+        GetTwitterTweetByRemoteTweetIdTwitterTweetList,
+    )
+    from .input_types import (
+        Boolean_comparison_exp,
+        Int_comparison_exp,
+        String_comparison_exp,
+        amongus_maps_aggregate_bool_exp,
+        amongus_maps_aggregate_bool_exp_bool_and,
+        amongus_maps_aggregate_bool_exp_bool_or,
+        amongus_maps_aggregate_bool_exp_count,
+        amongus_maps_arr_rel_insert_input,
+        amongus_maps_bool_exp,
+        amongus_maps_insert_input,
+        amongus_maps_obj_rel_insert_input,
+        amongus_maps_on_conflict,
+        amongus_match_player_result_roles_aggregate_bool_exp,
+        amongus_match_player_result_roles_aggregate_bool_exp_count,
+        amongus_match_player_result_roles_arr_rel_insert_input,
+        amongus_match_player_result_roles_bool_exp,
+        amongus_match_player_result_roles_insert_input,
+        amongus_match_player_result_roles_on_conflict,
+        amongus_match_players_aggregate_bool_exp,
+        amongus_match_players_aggregate_bool_exp_count,
+        amongus_match_players_arr_rel_insert_input,
+        amongus_match_players_bool_exp,
+        amongus_match_players_insert_input,
+        amongus_match_players_on_conflict,
+        amongus_matches_aggregate_bool_exp,
+        amongus_matches_aggregate_bool_exp_bool_and,
+        amongus_matches_aggregate_bool_exp_bool_or,
+        amongus_matches_aggregate_bool_exp_count,
+        amongus_matches_arr_rel_insert_input,
+        amongus_matches_bool_exp,
+        amongus_matches_insert_input,
+        amongus_matches_obj_rel_insert_input,
+        amongus_matches_on_conflict,
+        amongus_mod_versions_aggregate_bool_exp,
+        amongus_mod_versions_aggregate_bool_exp_count,
+        amongus_mod_versions_arr_rel_insert_input,
+        amongus_mod_versions_bool_exp,
+        amongus_mod_versions_insert_input,
+        amongus_mod_versions_obj_rel_insert_input,
+        amongus_mod_versions_on_conflict,
+        amongus_mods_bool_exp,
+        amongus_mods_insert_input,
+        amongus_mods_obj_rel_insert_input,
+        amongus_mods_on_conflict,
+        amongus_roles_aggregate_bool_exp,
+        amongus_roles_aggregate_bool_exp_bool_and,
+        amongus_roles_aggregate_bool_exp_bool_or,
+        amongus_roles_aggregate_bool_exp_count,
+        amongus_roles_arr_rel_insert_input,
+        amongus_roles_bool_exp,
+        amongus_roles_insert_input,
+        amongus_roles_on_conflict,
+        amongus_vanilla_versions_bool_exp,
+        amongus_vanilla_versions_insert_input,
+        amongus_vanilla_versions_obj_rel_insert_input,
+        amongus_vanilla_versions_on_conflict,
+        amongusvr_maps_bool_exp,
+        amongusvr_maps_insert_input,
+        amongusvr_maps_obj_rel_insert_input,
+        amongusvr_maps_on_conflict,
+        amongusvr_match_players_aggregate_bool_exp,
+        amongusvr_match_players_aggregate_bool_exp_count,
+        amongusvr_match_players_arr_rel_insert_input,
+        amongusvr_match_players_bool_exp,
+        amongusvr_match_players_insert_input,
+        amongusvr_match_players_on_conflict,
+        amongusvr_matches_aggregate_bool_exp,
+        amongusvr_matches_aggregate_bool_exp_bool_and,
+        amongusvr_matches_aggregate_bool_exp_bool_or,
+        amongusvr_matches_aggregate_bool_exp_count,
+        amongusvr_matches_arr_rel_insert_input,
+        amongusvr_matches_bool_exp,
+        amongusvr_matches_insert_input,
+        amongusvr_matches_obj_rel_insert_input,
+        amongusvr_matches_on_conflict,
+        fallguys_custom_round_twitter_announcements_aggregate_bool_exp,
+        fallguys_custom_round_twitter_announcements_aggregate_bool_exp_bool_and,
+        fallguys_custom_round_twitter_announcements_aggregate_bool_exp_bool_or,
+        fallguys_custom_round_twitter_announcements_aggregate_bool_exp_count,
+        fallguys_custom_round_twitter_announcements_arr_rel_insert_input,
+        fallguys_custom_round_twitter_announcements_bool_exp,
+        fallguys_custom_round_twitter_announcements_insert_input,
+        fallguys_custom_round_twitter_announcements_on_conflict,
+        fallguys_custom_rounds_aggregate_bool_exp,
+        fallguys_custom_rounds_aggregate_bool_exp_count,
+        fallguys_custom_rounds_arr_rel_insert_input,
+        fallguys_custom_rounds_bool_exp,
+        fallguys_custom_rounds_insert_input,
+        fallguys_custom_rounds_obj_rel_insert_input,
+        fallguys_custom_rounds_on_conflict,
+        fallguys_match_rounds_aggregate_bool_exp,
+        fallguys_match_rounds_aggregate_bool_exp_bool_and,
+        fallguys_match_rounds_aggregate_bool_exp_bool_or,
+        fallguys_match_rounds_aggregate_bool_exp_count,
+        fallguys_match_rounds_arr_rel_insert_input,
+        fallguys_match_rounds_bool_exp,
+        fallguys_match_rounds_insert_input,
+        fallguys_match_rounds_on_conflict,
+        fallguys_matches_aggregate_bool_exp,
+        fallguys_matches_aggregate_bool_exp_bool_and,
+        fallguys_matches_aggregate_bool_exp_bool_or,
+        fallguys_matches_aggregate_bool_exp_count,
+        fallguys_matches_arr_rel_insert_input,
+        fallguys_matches_bool_exp,
+        fallguys_matches_insert_input,
+        fallguys_matches_obj_rel_insert_input,
+        fallguys_matches_on_conflict,
+        fallguys_rounds_bool_exp,
+        fallguys_rounds_insert_input,
+        fallguys_rounds_obj_rel_insert_input,
+        fallguys_rounds_on_conflict,
+        fediverse_accounts_bool_exp,
+        fediverse_accounts_insert_input,
+        fediverse_accounts_obj_rel_insert_input,
+        fediverse_accounts_on_conflict,
+        games_bool_exp,
+        games_insert_input,
+        games_obj_rel_insert_input,
+        games_on_conflict,
+        mariokart8deluxe_battle_courses_bool_exp,
+        mariokart8deluxe_battle_courses_insert_input,
+        mariokart8deluxe_battle_courses_obj_rel_insert_input,
+        mariokart8deluxe_battle_courses_on_conflict,
+        mariokart8deluxe_battle_match_players_aggregate_bool_exp,
+        mariokart8deluxe_battle_match_players_aggregate_bool_exp_count,
+        mariokart8deluxe_battle_match_players_arr_rel_insert_input,
+        mariokart8deluxe_battle_match_players_bool_exp,
+        mariokart8deluxe_battle_match_players_insert_input,
+        mariokart8deluxe_battle_match_players_on_conflict,
+        mariokart8deluxe_battle_matches_aggregate_bool_exp,
+        mariokart8deluxe_battle_matches_aggregate_bool_exp_bool_and,
+        mariokart8deluxe_battle_matches_aggregate_bool_exp_bool_or,
+        mariokart8deluxe_battle_matches_aggregate_bool_exp_count,
+        mariokart8deluxe_battle_matches_arr_rel_insert_input,
+        mariokart8deluxe_battle_matches_bool_exp,
+        mariokart8deluxe_battle_matches_insert_input,
+        mariokart8deluxe_battle_matches_obj_rel_insert_input,
+        mariokart8deluxe_battle_matches_on_conflict,
+        mariokart8deluxe_battle_rules_bool_exp,
+        mariokart8deluxe_battle_rules_insert_input,
+        mariokart8deluxe_battle_rules_obj_rel_insert_input,
+        mariokart8deluxe_battle_rules_on_conflict,
+        mariokart8deluxe_consoles_bool_exp,
+        mariokart8deluxe_consoles_insert_input,
+        mariokart8deluxe_consoles_obj_rel_insert_input,
+        mariokart8deluxe_consoles_on_conflict,
+        mariokart8deluxe_courses_aggregate_bool_exp,
+        mariokart8deluxe_courses_aggregate_bool_exp_count,
+        mariokart8deluxe_courses_arr_rel_insert_input,
+        mariokart8deluxe_courses_bool_exp,
+        mariokart8deluxe_courses_insert_input,
+        mariokart8deluxe_courses_obj_rel_insert_input,
+        mariokart8deluxe_courses_on_conflict,
+        mariokart8deluxe_cups_bool_exp,
+        mariokart8deluxe_cups_insert_input,
+        mariokart8deluxe_cups_obj_rel_insert_input,
+        mariokart8deluxe_cups_on_conflict,
+        mariokart8deluxe_race_players_aggregate_bool_exp,
+        mariokart8deluxe_race_players_aggregate_bool_exp_count,
+        mariokart8deluxe_race_players_arr_rel_insert_input,
+        mariokart8deluxe_race_players_bool_exp,
+        mariokart8deluxe_race_players_insert_input,
+        mariokart8deluxe_race_players_on_conflict,
+        mariokart8deluxe_race_rules_bool_exp,
+        mariokart8deluxe_race_rules_insert_input,
+        mariokart8deluxe_race_rules_obj_rel_insert_input,
+        mariokart8deluxe_race_rules_on_conflict,
+        mariokart8deluxe_races_aggregate_bool_exp,
+        mariokart8deluxe_races_aggregate_bool_exp_bool_and,
+        mariokart8deluxe_races_aggregate_bool_exp_bool_or,
+        mariokart8deluxe_races_aggregate_bool_exp_count,
+        mariokart8deluxe_races_arr_rel_insert_input,
+        mariokart8deluxe_races_bool_exp,
+        mariokart8deluxe_races_insert_input,
+        mariokart8deluxe_races_obj_rel_insert_input,
+        mariokart8deluxe_races_on_conflict,
+        niconico_accounts_bool_exp,
+        niconico_accounts_insert_input,
+        niconico_accounts_obj_rel_insert_input,
+        niconico_accounts_on_conflict,
+        niconico_channels_bool_exp,
+        niconico_channels_insert_input,
+        niconico_channels_obj_rel_insert_input,
+        niconico_channels_on_conflict,
+        niconico_communities_bool_exp,
+        niconico_communities_insert_input,
+        niconico_communities_obj_rel_insert_input,
+        niconico_communities_on_conflict,
+        niconico_plus_channels_bool_exp,
+        niconico_plus_channels_insert_input,
+        niconico_plus_channels_obj_rel_insert_input,
+        niconico_plus_channels_on_conflict,
+        niconico_videos_bool_exp,
+        niconico_videos_insert_input,
+        niconico_videos_obj_rel_insert_input,
+        niconico_videos_on_conflict,
+        person_fediverse_accounts_aggregate_bool_exp,
+        person_fediverse_accounts_aggregate_bool_exp_count,
+        person_fediverse_accounts_arr_rel_insert_input,
+        person_fediverse_accounts_bool_exp,
+        person_fediverse_accounts_insert_input,
+        person_fediverse_accounts_on_conflict,
+        person_niconico_accounts_aggregate_bool_exp,
+        person_niconico_accounts_aggregate_bool_exp_count,
+        person_niconico_accounts_arr_rel_insert_input,
+        person_niconico_accounts_bool_exp,
+        person_niconico_accounts_insert_input,
+        person_niconico_accounts_on_conflict,
+        person_niconico_channels_aggregate_bool_exp,
+        person_niconico_channels_aggregate_bool_exp_count,
+        person_niconico_channels_arr_rel_insert_input,
+        person_niconico_channels_bool_exp,
+        person_niconico_channels_insert_input,
+        person_niconico_channels_on_conflict,
+        person_niconico_communities_aggregate_bool_exp,
+        person_niconico_communities_aggregate_bool_exp_count,
+        person_niconico_communities_arr_rel_insert_input,
+        person_niconico_communities_bool_exp,
+        person_niconico_communities_insert_input,
+        person_niconico_communities_on_conflict,
+        person_niconico_plus_channels_aggregate_bool_exp,
+        person_niconico_plus_channels_aggregate_bool_exp_count,
+        person_niconico_plus_channels_arr_rel_insert_input,
+        person_niconico_plus_channels_bool_exp,
+        person_niconico_plus_channels_insert_input,
+        person_niconico_plus_channels_on_conflict,
+        person_twitter_accounts_aggregate_bool_exp,
+        person_twitter_accounts_aggregate_bool_exp_count,
+        person_twitter_accounts_arr_rel_insert_input,
+        person_twitter_accounts_bool_exp,
+        person_twitter_accounts_insert_input,
+        person_twitter_accounts_on_conflict,
+        person_youtube_channels_aggregate_bool_exp,
+        person_youtube_channels_aggregate_bool_exp_count,
+        person_youtube_channels_arr_rel_insert_input,
+        person_youtube_channels_bool_exp,
+        person_youtube_channels_insert_input,
+        person_youtube_channels_on_conflict,
+        persons_bool_exp,
+        persons_insert_input,
+        persons_obj_rel_insert_input,
+        persons_on_conflict,
+        program_amongus_maps_aggregate_bool_exp,
+        program_amongus_maps_aggregate_bool_exp_count,
+        program_amongus_maps_arr_rel_insert_input,
+        program_amongus_maps_bool_exp,
+        program_amongus_maps_insert_input,
+        program_amongus_maps_on_conflict,
+        program_amongus_mods_aggregate_bool_exp,
+        program_amongus_mods_aggregate_bool_exp_count,
+        program_amongus_mods_arr_rel_insert_input,
+        program_amongus_mods_bool_exp,
+        program_amongus_mods_insert_input,
+        program_amongus_mods_on_conflict,
+        program_amongus_vanilla_versions_aggregate_bool_exp,
+        program_amongus_vanilla_versions_aggregate_bool_exp_count,
+        program_amongus_vanilla_versions_arr_rel_insert_input,
+        program_amongus_vanilla_versions_bool_exp,
+        program_amongus_vanilla_versions_insert_input,
+        program_amongus_vanilla_versions_on_conflict,
+        program_live_archives_aggregate_bool_exp,
+        program_live_archives_aggregate_bool_exp_count,
+        program_live_archives_arr_rel_insert_input,
+        program_live_archives_bool_exp,
+        program_live_archives_insert_input,
+        program_live_archives_on_conflict,
+        program_niconico_videos_aggregate_bool_exp,
+        program_niconico_videos_aggregate_bool_exp_count,
+        program_niconico_videos_arr_rel_insert_input,
+        program_niconico_videos_bool_exp,
+        program_niconico_videos_insert_input,
+        program_niconico_videos_on_conflict,
+        program_persons_aggregate_bool_exp,
+        program_persons_aggregate_bool_exp_bool_and,
+        program_persons_aggregate_bool_exp_bool_or,
+        program_persons_aggregate_bool_exp_count,
+        program_persons_arr_rel_insert_input,
+        program_persons_bool_exp,
+        program_persons_insert_input,
+        program_persons_on_conflict,
+        program_projects_aggregate_bool_exp,
+        program_projects_aggregate_bool_exp_count,
+        program_projects_arr_rel_insert_input,
+        program_projects_bool_exp,
+        program_projects_insert_input,
+        program_projects_on_conflict,
+        program_twitter_announcements_aggregate_bool_exp,
+        program_twitter_announcements_aggregate_bool_exp_count,
+        program_twitter_announcements_arr_rel_insert_input,
+        program_twitter_announcements_bool_exp,
+        program_twitter_announcements_insert_input,
+        program_twitter_announcements_on_conflict,
+        programs_bool_exp,
+        programs_insert_input,
+        programs_obj_rel_insert_input,
+        programs_on_conflict,
+        project_niconico_videos_aggregate_bool_exp,
+        project_niconico_videos_aggregate_bool_exp_count,
+        project_niconico_videos_arr_rel_insert_input,
+        project_niconico_videos_bool_exp,
+        project_niconico_videos_insert_input,
+        project_niconico_videos_on_conflict,
+        projects_bool_exp,
+        projects_insert_input,
+        projects_obj_rel_insert_input,
+        projects_on_conflict,
+        timestamptz_comparison_exp,
+        twitter_accounts_bool_exp,
+        twitter_accounts_insert_input,
+        twitter_accounts_obj_rel_insert_input,
+        twitter_accounts_on_conflict,
+        twitter_tweet_images_aggregate_bool_exp,
+        twitter_tweet_images_aggregate_bool_exp_count,
+        twitter_tweet_images_arr_rel_insert_input,
+        twitter_tweet_images_bool_exp,
+        twitter_tweet_images_insert_input,
+        twitter_tweet_images_obj_rel_insert_input,
+        twitter_tweet_images_on_conflict,
+        twitter_tweets_bool_exp,
+        twitter_tweets_insert_input,
+        twitter_tweets_obj_rel_insert_input,
+        twitter_tweets_on_conflict,
+        uuid_comparison_exp,
+        youtube_channels_bool_exp,
+        youtube_channels_insert_input,
+        youtube_channels_obj_rel_insert_input,
+        youtube_channels_on_conflict,
+        youtube_lives_aggregate_bool_exp,
+        youtube_lives_aggregate_bool_exp_count,
+        youtube_lives_arr_rel_insert_input,
+        youtube_lives_bool_exp,
+        youtube_lives_insert_input,
+        youtube_lives_obj_rel_insert_input,
+        youtube_lives_on_conflict,
+        youtube_videos_bool_exp,
+        youtube_videos_insert_input,
+        youtube_videos_obj_rel_insert_input,
+        youtube_videos_on_conflict,
+    )
+    from .persons_stream import PersonsStream, PersonsStreamPersonList
+    from .program_projects_stream import (
+        ProgramProjectsStream,
+        ProgramProjectsStreamProgramProjectList,
+        ProgramProjectsStreamProgramProjectListProgram,
+    )
+    from .programs_stream import (
+        ProgramsStream,
+        ProgramsStreamProgramList,
+        ProgramsStreamProgramListProgramProjectList,
+    )
+    from .projects_stream import ProjectsStream, ProjectsStreamProjectList
+    from .twitter_accounts_stream import (
+        TwitterAccountsStream,
+        TwitterAccountsStreamTwitterAccountList,
+    )
+_LAZY_IMPORTS: Dict[str, str] = {
+    "AsyncBaseClient": "async_base_client",
+    "BaseModel": "base_model",
+    "Boolean_comparison_exp": "input_types",
+    "Client": "client",
+    "CreateGame": "create_game",
+    "CreateGameGame": "create_game",
+    "CreateProgram": "create_program",
+    "CreateProgramNiconicoVideo": "create_program_niconico_video",
+    "CreateProgramNiconicoVideoProgramNiconicoVideo": "create_program_niconico_video",
+    "CreateProgramPerson": "create_program_person",
+    "CreateProgramPersonProgramPerson": "create_program_person",
+    "CreateProgramProgram": "create_program",
+    "CreateProgramTwitterAnnouncementWithTweet": "create_program_twitter_announcement_with_tweet",
+    "CreateProgramTwitterAnnouncementWithTweetImage": "create_program_twitter_announcement_with_tweet_image",
+    "CreateProgramTwitterAnnouncementWithTweetImageProgramTwitterAnnouncement": "create_program_twitter_announcement_with_tweet_image",
+    "CreateProgramTwitterAnnouncementWithTweetImageTwitterTweet": "create_program_twitter_announcement_with_tweet_image",
+    "CreateProgramTwitterAnnouncementWithTweetProgramTwitterAnnouncement": "create_program_twitter_announcement_with_tweet",
+    "CreateProgramYoutubeLiveLiveArchive": "create_program_youtube_live_live_archive",
+    "CreateProgramYoutubeLiveLiveArchiveProgramLiveArchive": "create_program_youtube_live_live_archive",
+    "CreateProgramYoutubeLiveLiveArchives": "create_program_youtube_live_live_archives",
+    "CreateProgramYoutubeLiveLiveArchivesInsertProgramLiveArchives": "create_program_youtube_live_live_archives",
+    "CreateProgramYoutubeLiveLiveArchivesInsertProgramLiveArchivesReturning": "create_program_youtube_live_live_archives",
+    "CreateProgramYoutubeLiveLiveArchivesInsertProgramLiveArchivesReturningYoutubeLive": "create_program_youtube_live_live_archives",
+    "CreateProgramYoutubeVideoLiveArchive": "create_program_youtube_video_live_archive",
+    "CreateProgramYoutubeVideoLiveArchiveProgramLiveArchive": "create_program_youtube_video_live_archive",
+    "GamesStream": "games_stream",
+    "GamesStreamGameList": "games_stream",
+    "GetPersonAccountIndex": "get_person_account_index",
+    "GetPersonAccountIndexPersonNiconicoAccountList": "get_person_account_index",
+    "GetPersonAccountIndexPersonNiconicoAccountListNiconicoAccount": "get_person_account_index",
+    "GetPersonAccountIndexPersonTwitterAccountList": "get_person_account_index",
+    "GetPersonAccountIndexPersonYoutubeChannelList": "get_person_account_index",
+    "GetPersonAccountIndexPersonYoutubeChannelListYoutubeChannel": "get_person_account_index",
+    "GetProgramProjectListByProjectId": "get_program_project_list_by_project_id",
+    "GetProgramProjectListByProjectIdProject": "get_program_project_list_by_project_id",
+    "GetProgramProjectListByProjectIdProjectProgramProjectList": "get_program_project_list_by_project_id",
+    "GetProgramProjectListByProjectIdProjectProgramProjectListProgram": "get_program_project_list_by_project_id",
+    "GetReferenceData": "get_reference_data",
+    "GetReferenceDataGameList": "get_reference_data",
+    "GetReferenceDataPersonList": "get_reference_data",
+    "GetReferenceDataProjectList": "get_reference_data",
+    "GetReferenceDataTwitterAccountList": "get_reference_data",
+    "GetTwitterAccountByScreenName": "get_twitter_account_by_screen_name",
+    "GetTwitterAccountByScreenNameTwitterAccountList": "get_twitter_account_by_screen_name",
+    "GetTwitterTweetByRemoteTweetId": "get_twitter_tweet_by_remote_tweet_id",
+    "GetTwitterTweetByRemoteTweetIdTwitterTweetList": "get_twitter_tweet_by_remote_tweet_id",
+    "GraphQLBatchResult": "async_base_client",
+    "GraphQLClientError": "exceptions",
+    "GraphQLClientGraphQLError": "exceptions",
+    "GraphQLClientGraphQLMultiError": "exceptions",
+    "GraphQLClientHttpError": "exceptions",
+    "GraphQLClientInvalidResponseError": "exceptions",
+    "GraphQLOperation": "async_base_client",
+    "Int_comparison_exp": "input_types",
+    "PersonsStream": "persons_stream",
+    "PersonsStreamPersonList": "persons_stream",
+    "ProgramProjectsStream": "program_projects_stream",
+    "ProgramProjectsStreamProgramProjectList": "program_projects_stream",
+    "ProgramProjectsStreamProgramProjectListProgram": "program_projects_stream",
+    "ProgramsStream": "programs_stream",
+    "ProgramsStreamProgramList": "programs_stream",
+    "ProgramsStreamProgramListProgramProjectList": "programs_stream",
+    "ProjectsStream": "projects_stream",
+    "ProjectsStreamProjectList": "projects_stream",
+    "String_comparison_exp": "input_types",
+    "TwitterAccountsStream": "twitter_accounts_stream",
+    "TwitterAccountsStreamTwitterAccountList": "twitter_accounts_stream",
+    "Upload": "base_model",
+    "amongus_maps_aggregate_bool_exp": "input_types",
+    "amongus_maps_aggregate_bool_exp_bool_and": "input_types",
+    "amongus_maps_aggregate_bool_exp_bool_or": "input_types",
+    "amongus_maps_aggregate_bool_exp_count": "input_types",
+    "amongus_maps_arr_rel_insert_input": "input_types",
+    "amongus_maps_bool_exp": "input_types",
+    "amongus_maps_constraint": "enums",
+    "amongus_maps_insert_input": "input_types",
+    "amongus_maps_obj_rel_insert_input": "input_types",
+    "amongus_maps_on_conflict": "input_types",
+    "amongus_maps_select_column": "enums",
+    "amongus_maps_select_column_amongus_maps_aggregate_bool_exp_bool_and_arguments_columns": "enums",
+    "amongus_maps_select_column_amongus_maps_aggregate_bool_exp_bool_or_arguments_columns": "enums",
+    "amongus_maps_update_column": "enums",
+    "amongus_match_player_result_roles_aggregate_bool_exp": "input_types",
+    "amongus_match_player_result_roles_aggregate_bool_exp_count": "input_types",
+    "amongus_match_player_result_roles_arr_rel_insert_input": "input_types",
+    "amongus_match_player_result_roles_bool_exp": "input_types",
+    "amongus_match_player_result_roles_constraint": "enums",
+    "amongus_match_player_result_roles_insert_input": "input_types",
+    "amongus_match_player_result_roles_on_conflict": "input_types",
+    "amongus_match_player_result_roles_select_column": "enums",
+    "amongus_match_player_result_roles_update_column": "enums",
+    "amongus_match_players_aggregate_bool_exp": "input_types",
+    "amongus_match_players_aggregate_bool_exp_count": "input_types",
+    "amongus_match_players_arr_rel_insert_input": "input_types",
+    "amongus_match_players_bool_exp": "input_types",
+    "amongus_match_players_constraint": "enums",
+    "amongus_match_players_insert_input": "input_types",
+    "amongus_match_players_on_conflict": "input_types",
+    "amongus_match_players_select_column": "enums",
+    "amongus_match_players_update_column": "enums",
+    "amongus_matches_aggregate_bool_exp": "input_types",
+    "amongus_matches_aggregate_bool_exp_bool_and": "input_types",
+    "amongus_matches_aggregate_bool_exp_bool_or": "input_types",
+    "amongus_matches_aggregate_bool_exp_count": "input_types",
+    "amongus_matches_arr_rel_insert_input": "input_types",
+    "amongus_matches_bool_exp": "input_types",
+    "amongus_matches_constraint": "enums",
+    "amongus_matches_insert_input": "input_types",
+    "amongus_matches_obj_rel_insert_input": "input_types",
+    "amongus_matches_on_conflict": "input_types",
+    "amongus_matches_select_column": "enums",
+    "amongus_matches_select_column_amongus_matches_aggregate_bool_exp_bool_and_arguments_columns": "enums",
+    "amongus_matches_select_column_amongus_matches_aggregate_bool_exp_bool_or_arguments_columns": "enums",
+    "amongus_matches_update_column": "enums",
+    "amongus_mod_versions_aggregate_bool_exp": "input_types",
+    "amongus_mod_versions_aggregate_bool_exp_count": "input_types",
+    "amongus_mod_versions_arr_rel_insert_input": "input_types",
+    "amongus_mod_versions_bool_exp": "input_types",
+    "amongus_mod_versions_constraint": "enums",
+    "amongus_mod_versions_insert_input": "input_types",
+    "amongus_mod_versions_obj_rel_insert_input": "input_types",
+    "amongus_mod_versions_on_conflict": "input_types",
+    "amongus_mod_versions_select_column": "enums",
+    "amongus_mod_versions_update_column": "enums",
+    "amongus_mods_bool_exp": "input_types",
+    "amongus_mods_constraint": "enums",
+    "amongus_mods_insert_input": "input_types",
+    "amongus_mods_obj_rel_insert_input": "input_types",
+    "amongus_mods_on_conflict": "input_types",
+    "amongus_mods_update_column": "enums",
+    "amongus_roles_aggregate_bool_exp": "input_types",
+    "amongus_roles_aggregate_bool_exp_bool_and": "input_types",
+    "amongus_roles_aggregate_bool_exp_bool_or": "input_types",
+    "amongus_roles_aggregate_bool_exp_count": "input_types",
+    "amongus_roles_arr_rel_insert_input": "input_types",
+    "amongus_roles_bool_exp": "input_types",
+    "amongus_roles_constraint": "enums",
+    "amongus_roles_insert_input": "input_types",
+    "amongus_roles_on_conflict": "input_types",
+    "amongus_roles_select_column": "enums",
+    "amongus_roles_select_column_amongus_roles_aggregate_bool_exp_bool_and_arguments_columns": "enums",
+    "amongus_roles_select_column_amongus_roles_aggregate_bool_exp_bool_or_arguments_columns": "enums",
+    "amongus_roles_update_column": "enums",
+    "amongus_vanilla_versions_bool_exp": "input_types",
+    "amongus_vanilla_versions_constraint": "enums",
+    "amongus_vanilla_versions_insert_input": "input_types",
+    "amongus_vanilla_versions_obj_rel_insert_input": "input_types",
+    "amongus_vanilla_versions_on_conflict": "input_types",
+    "amongus_vanilla_versions_update_column": "enums",
+    "amongusvr_maps_bool_exp": "input_types",
+    "amongusvr_maps_constraint": "enums",
+    "amongusvr_maps_insert_input": "input_types",
+    "amongusvr_maps_obj_rel_insert_input": "input_types",
+    "amongusvr_maps_on_conflict": "input_types",
+    "amongusvr_maps_update_column": "enums",
+    "amongusvr_match_players_aggregate_bool_exp": "input_types",
+    "amongusvr_match_players_aggregate_bool_exp_count": "input_types",
+    "amongusvr_match_players_arr_rel_insert_input": "input_types",
+    "amongusvr_match_players_bool_exp": "input_types",
+    "amongusvr_match_players_constraint": "enums",
+    "amongusvr_match_players_insert_input": "input_types",
+    "amongusvr_match_players_on_conflict": "input_types",
+    "amongusvr_match_players_select_column": "enums",
+    "amongusvr_match_players_update_column": "enums",
+    "amongusvr_matches_aggregate_bool_exp": "input_types",
+    "amongusvr_matches_aggregate_bool_exp_bool_and": "input_types",
+    "amongusvr_matches_aggregate_bool_exp_bool_or": "input_types",
+    "amongusvr_matches_aggregate_bool_exp_count": "input_types",
+    "amongusvr_matches_arr_rel_insert_input": "input_types",
+    "amongusvr_matches_bool_exp": "input_types",
+    "amongusvr_matches_constraint": "enums",
+    "amongusvr_matches_insert_input": "input_types",
+    "amongusvr_matches_obj_rel_insert_input": "input_types",
+    "amongusvr_matches_on_conflict": "input_types",
+    "amongusvr_matches_select_column": "enums",
+    "amongusvr_matches_select_column_amongusvr_matches_aggregate_bool_exp_bool_and_arguments_columns": "enums",
+    "amongusvr_matches_select_column_amongusvr_matches_aggregate_bool_exp_bool_or_arguments_columns": "enums",
+    "amongusvr_matches_update_column": "enums",
+    "fallguys_custom_round_twitter_announcements_aggregate_bool_exp": "input_types",
+    "fallguys_custom_round_twitter_announcements_aggregate_bool_exp_bool_and": "input_types",
+    "fallguys_custom_round_twitter_announcements_aggregate_bool_exp_bool_or": "input_types",
+    "fallguys_custom_round_twitter_announcements_aggregate_bool_exp_count": "input_types",
+    "fallguys_custom_round_twitter_announcements_arr_rel_insert_input": "input_types",
+    "fallguys_custom_round_twitter_announcements_bool_exp": "input_types",
+    "fallguys_custom_round_twitter_announcements_constraint": "enums",
+    "fallguys_custom_round_twitter_announcements_insert_input": "input_types",
+    "fallguys_custom_round_twitter_announcements_on_conflict": "input_types",
+    "fallguys_custom_round_twitter_announcements_select_column": "enums",
+    "fallguys_custom_round_twitter_announcements_select_column_fallguys_custom_round_twitter_announcements_aggregate_bool_exp_bool_and_arguments_columns": "enums",
+    "fallguys_custom_round_twitter_announcements_select_column_fallguys_custom_round_twitter_announcements_aggregate_bool_exp_bool_or_arguments_columns": "enums",
+    "fallguys_custom_round_twitter_announcements_update_column": "enums",
+    "fallguys_custom_rounds_aggregate_bool_exp": "input_types",
+    "fallguys_custom_rounds_aggregate_bool_exp_count": "input_types",
+    "fallguys_custom_rounds_arr_rel_insert_input": "input_types",
+    "fallguys_custom_rounds_bool_exp": "input_types",
+    "fallguys_custom_rounds_constraint": "enums",
+    "fallguys_custom_rounds_insert_input": "input_types",
+    "fallguys_custom_rounds_obj_rel_insert_input": "input_types",
+    "fallguys_custom_rounds_on_conflict": "input_types",
+    "fallguys_custom_rounds_select_column": "enums",
+    "fallguys_custom_rounds_update_column": "enums",
+    "fallguys_match_rounds_aggregate_bool_exp": "input_types",
+    "fallguys_match_rounds_aggregate_bool_exp_bool_and": "input_types",
+    "fallguys_match_rounds_aggregate_bool_exp_bool_or": "input_types",
+    "fallguys_match_rounds_aggregate_bool_exp_count": "input_types",
+    "fallguys_match_rounds_arr_rel_insert_input": "input_types",
+    "fallguys_match_rounds_bool_exp": "input_types",
+    "fallguys_match_rounds_constraint": "enums",
+    "fallguys_match_rounds_insert_input": "input_types",
+    "fallguys_match_rounds_on_conflict": "input_types",
+    "fallguys_match_rounds_select_column": "enums",
+    "fallguys_match_rounds_select_column_fallguys_match_rounds_aggregate_bool_exp_bool_and_arguments_columns": "enums",
+    "fallguys_match_rounds_select_column_fallguys_match_rounds_aggregate_bool_exp_bool_or_arguments_columns": "enums",
+    "fallguys_match_rounds_update_column": "enums",
+    "fallguys_matches_aggregate_bool_exp": "input_types",
+    "fallguys_matches_aggregate_bool_exp_bool_and": "input_types",
+    "fallguys_matches_aggregate_bool_exp_bool_or": "input_types",
+    "fallguys_matches_aggregate_bool_exp_count": "input_types",
+    "fallguys_matches_arr_rel_insert_input": "input_types",
+    "fallguys_matches_bool_exp": "input_types",
+    "fallguys_matches_constraint": "enums",
+    "fallguys_matches_insert_input": "input_types",
+    "fallguys_matches_obj_rel_insert_input": "input_types",
+    "fallguys_matches_on_conflict": "input_types",
+    "fallguys_matches_select_column": "enums",
+    "fallguys_matches_select_column_fallguys_matches_aggregate_bool_exp_bool_and_arguments_columns": "enums",
+    "fallguys_matches_select_column_fallguys_matches_aggregate_bool_exp_bool_or_arguments_columns": "enums",
+    "fallguys_matches_update_column": "enums",
+    "fallguys_rounds_bool_exp": "input_types",
+    "fallguys_rounds_constraint": "enums",
+    "fallguys_rounds_insert_input": "input_types",
+    "fallguys_rounds_obj_rel_insert_input": "input_types",
+    "fallguys_rounds_on_conflict": "input_types",
+    "fallguys_rounds_update_column": "enums",
+    "fediverse_accounts_bool_exp": "input_types",
+    "fediverse_accounts_constraint": "enums",
+    "fediverse_accounts_insert_input": "input_types",
+    "fediverse_accounts_obj_rel_insert_input": "input_types",
+    "fediverse_accounts_on_conflict": "input_types",
+    "fediverse_accounts_update_column": "enums",
+    "games_bool_exp": "input_types",
+    "games_constraint": "enums",
+    "games_insert_input": "input_types",
+    "games_obj_rel_insert_input": "input_types",
+    "games_on_conflict": "input_types",
+    "games_update_column": "enums",
+    "mariokart8deluxe_battle_courses_bool_exp": "input_types",
+    "mariokart8deluxe_battle_courses_constraint": "enums",
+    "mariokart8deluxe_battle_courses_insert_input": "input_types",
+    "mariokart8deluxe_battle_courses_obj_rel_insert_input": "input_types",
+    "mariokart8deluxe_battle_courses_on_conflict": "input_types",
+    "mariokart8deluxe_battle_courses_update_column": "enums",
+    "mariokart8deluxe_battle_match_players_aggregate_bool_exp": "input_types",
+    "mariokart8deluxe_battle_match_players_aggregate_bool_exp_count": "input_types",
+    "mariokart8deluxe_battle_match_players_arr_rel_insert_input": "input_types",
+    "mariokart8deluxe_battle_match_players_bool_exp": "input_types",
+    "mariokart8deluxe_battle_match_players_constraint": "enums",
+    "mariokart8deluxe_battle_match_players_insert_input": "input_types",
+    "mariokart8deluxe_battle_match_players_on_conflict": "input_types",
+    "mariokart8deluxe_battle_match_players_select_column": "enums",
+    "mariokart8deluxe_battle_match_players_update_column": "enums",
+    "mariokart8deluxe_battle_matches_aggregate_bool_exp": "input_types",
+    "mariokart8deluxe_battle_matches_aggregate_bool_exp_bool_and": "input_types",
+    "mariokart8deluxe_battle_matches_aggregate_bool_exp_bool_or": "input_types",
+    "mariokart8deluxe_battle_matches_aggregate_bool_exp_count": "input_types",
+    "mariokart8deluxe_battle_matches_arr_rel_insert_input": "input_types",
+    "mariokart8deluxe_battle_matches_bool_exp": "input_types",
+    "mariokart8deluxe_battle_matches_constraint": "enums",
+    "mariokart8deluxe_battle_matches_insert_input": "input_types",
+    "mariokart8deluxe_battle_matches_obj_rel_insert_input": "input_types",
+    "mariokart8deluxe_battle_matches_on_conflict": "input_types",
+    "mariokart8deluxe_battle_matches_select_column": "enums",
+    "mariokart8deluxe_battle_matches_select_column_mariokart8deluxe_battle_matches_aggregate_bool_exp_bool_and_arguments_columns": "enums",
+    "mariokart8deluxe_battle_matches_select_column_mariokart8deluxe_battle_matches_aggregate_bool_exp_bool_or_arguments_columns": "enums",
+    "mariokart8deluxe_battle_matches_update_column": "enums",
+    "mariokart8deluxe_battle_rules_bool_exp": "input_types",
+    "mariokart8deluxe_battle_rules_constraint": "enums",
+    "mariokart8deluxe_battle_rules_insert_input": "input_types",
+    "mariokart8deluxe_battle_rules_obj_rel_insert_input": "input_types",
+    "mariokart8deluxe_battle_rules_on_conflict": "input_types",
+    "mariokart8deluxe_battle_rules_update_column": "enums",
+    "mariokart8deluxe_consoles_bool_exp": "input_types",
+    "mariokart8deluxe_consoles_constraint": "enums",
+    "mariokart8deluxe_consoles_insert_input": "input_types",
+    "mariokart8deluxe_consoles_obj_rel_insert_input": "input_types",
+    "mariokart8deluxe_consoles_on_conflict": "input_types",
+    "mariokart8deluxe_consoles_update_column": "enums",
+    "mariokart8deluxe_courses_aggregate_bool_exp": "input_types",
+    "mariokart8deluxe_courses_aggregate_bool_exp_count": "input_types",
+    "mariokart8deluxe_courses_arr_rel_insert_input": "input_types",
+    "mariokart8deluxe_courses_bool_exp": "input_types",
+    "mariokart8deluxe_courses_constraint": "enums",
+    "mariokart8deluxe_courses_insert_input": "input_types",
+    "mariokart8deluxe_courses_obj_rel_insert_input": "input_types",
+    "mariokart8deluxe_courses_on_conflict": "input_types",
+    "mariokart8deluxe_courses_select_column": "enums",
+    "mariokart8deluxe_courses_update_column": "enums",
+    "mariokart8deluxe_cups_bool_exp": "input_types",
+    "mariokart8deluxe_cups_constraint": "enums",
+    "mariokart8deluxe_cups_insert_input": "input_types",
+    "mariokart8deluxe_cups_obj_rel_insert_input": "input_types",
+    "mariokart8deluxe_cups_on_conflict": "input_types",
+    "mariokart8deluxe_cups_update_column": "enums",
+    "mariokart8deluxe_race_players_aggregate_bool_exp": "input_types",
+    "mariokart8deluxe_race_players_aggregate_bool_exp_count": "input_types",
+    "mariokart8deluxe_race_players_arr_rel_insert_input": "input_types",
+    "mariokart8deluxe_race_players_bool_exp": "input_types",
+    "mariokart8deluxe_race_players_constraint": "enums",
+    "mariokart8deluxe_race_players_insert_input": "input_types",
+    "mariokart8deluxe_race_players_on_conflict": "input_types",
+    "mariokart8deluxe_race_players_select_column": "enums",
+    "mariokart8deluxe_race_players_update_column": "enums",
+    "mariokart8deluxe_race_rules_bool_exp": "input_types",
+    "mariokart8deluxe_race_rules_constraint": "enums",
+    "mariokart8deluxe_race_rules_insert_input": "input_types",
+    "mariokart8deluxe_race_rules_obj_rel_insert_input": "input_types",
+    "mariokart8deluxe_race_rules_on_conflict": "input_types",
+    "mariokart8deluxe_race_rules_update_column": "enums",
+    "mariokart8deluxe_races_aggregate_bool_exp": "input_types",
+    "mariokart8deluxe_races_aggregate_bool_exp_bool_and": "input_types",
+    "mariokart8deluxe_races_aggregate_bool_exp_bool_or": "input_types",
+    "mariokart8deluxe_races_aggregate_bool_exp_count": "input_types",
+    "mariokart8deluxe_races_arr_rel_insert_input": "input_types",
+    "mariokart8deluxe_races_bool_exp": "input_types",
+    "mariokart8deluxe_races_constraint": "enums",
+    "mariokart8deluxe_races_insert_input": "input_types",
+    "mariokart8deluxe_races_obj_rel_insert_input": "input_types",
+    "mariokart8deluxe_races_on_conflict": "input_types",
+    "mariokart8deluxe_races_select_column": "enums",
+    "mariokart8deluxe_races_select_column_mariokart8deluxe_races_aggregate_bool_exp_bool_and_arguments_columns": "enums",
+    "mariokart8deluxe_races_select_column_mariokart8deluxe_races_aggregate_bool_exp_bool_or_arguments_columns": "enums",
+    "mariokart8deluxe_races_update_column": "enums",
+    "niconico_accounts_bool_exp": "input_types",
+    "niconico_accounts_constraint": "enums",
+    "niconico_accounts_insert_input": "input_types",
+    "niconico_accounts_obj_rel_insert_input": "input_types",
+    "niconico_accounts_on_conflict": "input_types",
+    "niconico_accounts_update_column": "enums",
+    "niconico_channels_bool_exp": "input_types",
+    "niconico_channels_constraint": "enums",
+    "niconico_channels_insert_input": "input_types",
+    "niconico_channels_obj_rel_insert_input": "input_types",
+    "niconico_channels_on_conflict": "input_types",
+    "niconico_channels_update_column": "enums",
+    "niconico_communities_bool_exp": "input_types",
+    "niconico_communities_constraint": "enums",
+    "niconico_communities_insert_input": "input_types",
+    "niconico_communities_obj_rel_insert_input": "input_types",
+    "niconico_communities_on_conflict": "input_types",
+    "niconico_communities_update_column": "enums",
+    "niconico_plus_channels_bool_exp": "input_types",
+    "niconico_plus_channels_constraint": "enums",
+    "niconico_plus_channels_insert_input": "input_types",
+    "niconico_plus_channels_obj_rel_insert_input": "input_types",
+    "niconico_plus_channels_on_conflict": "input_types",
+    "niconico_plus_channels_update_column": "enums",
+    "niconico_videos_bool_exp": "input_types",
+    "niconico_videos_constraint": "enums",
+    "niconico_videos_insert_input": "input_types",
+    "niconico_videos_obj_rel_insert_input": "input_types",
+    "niconico_videos_on_conflict": "input_types",
+    "niconico_videos_update_column": "enums",
+    "person_fediverse_accounts_aggregate_bool_exp": "input_types",
+    "person_fediverse_accounts_aggregate_bool_exp_count": "input_types",
+    "person_fediverse_accounts_arr_rel_insert_input": "input_types",
+    "person_fediverse_accounts_bool_exp": "input_types",
+    "person_fediverse_accounts_constraint": "enums",
+    "person_fediverse_accounts_insert_input": "input_types",
+    "person_fediverse_accounts_on_conflict": "input_types",
+    "person_fediverse_accounts_select_column": "enums",
+    "person_fediverse_accounts_update_column": "enums",
+    "person_niconico_accounts_aggregate_bool_exp": "input_types",
+    "person_niconico_accounts_aggregate_bool_exp_count": "input_types",
+    "person_niconico_accounts_arr_rel_insert_input": "input_types",
+    "person_niconico_accounts_bool_exp": "input_types",
+    "person_niconico_accounts_constraint": "enums",
+    "person_niconico_accounts_insert_input": "input_types",
+    "person_niconico_accounts_on_conflict": "input_types",
+    "person_niconico_accounts_select_column": "enums",
+    "person_niconico_accounts_update_column": "enums",
+    "person_niconico_channels_aggregate_bool_exp": "input_types",
+    "person_niconico_channels_aggregate_bool_exp_count": "input_types",
+    "person_niconico_channels_arr_rel_insert_input": "input_types",
+    "person_niconico_channels_bool_exp": "input_types",
+    "person_niconico_channels_constraint": "enums",
+    "person_niconico_channels_insert_input": "input_types",
+    "person_niconico_channels_on_conflict": "input_types",
+    "person_niconico_channels_select_column": "enums",
+    "person_niconico_channels_update_column": "enums",
+    "person_niconico_communities_aggregate_bool_exp": "input_types",
+    "person_niconico_communities_aggregate_bool_exp_count": "input_types",
+    "person_niconico_communities_arr_rel_insert_input": "input_types",
+    "person_niconico_communities_bool_exp": "input_types",
+    "person_niconico_communities_constraint": "enums",
+    "person_niconico_communities_insert_input": "input_types",
+    "person_niconico_communities_on_conflict": "input_types",
+    "person_niconico_communities_select_column": "enums",
+    "person_niconico_communities_update_column": "enums",
+    "person_niconico_plus_channels_aggregate_bool_exp": "input_types",
+    "person_niconico_plus_channels_aggregate_bool_exp_count": "input_types",
+    "person_niconico_plus_channels_arr_rel_insert_input": "input_types",
+    "person_niconico_plus_channels_bool_exp": "input_types",
+    "person_niconico_plus_channels_constraint": "enums",
+    "person_niconico_plus_channels_insert_input": "input_types",
+    "person_niconico_plus_channels_on_conflict": "input_types",
+    "person_niconico_plus_channels_select_column": "enums",
+    "person_niconico_plus_channels_update_column": "enums",
+    "person_twitter_accounts_aggregate_bool_exp": "input_types",
+    "person_twitter_accounts_aggregate_bool_exp_count": "input_types",
+    "person_twitter_accounts_arr_rel_insert_input": "input_types",
+    "person_twitter_accounts_bool_exp": "input_types",
+    "person_twitter_accounts_constraint": "enums",
+    "person_twitter_accounts_insert_input": "input_types",
+    "person_twitter_accounts_on_conflict": "input_types",
+    "person_twitter_accounts_select_column": "enums",
+    "person_twitter_accounts_update_column": "enums",
+    "person_youtube_channels_aggregate_bool_exp": "input_types",
+    "person_youtube_channels_aggregate_bool_exp_count": "input_types",
+    "person_youtube_channels_arr_rel_insert_input": "input_types",
+    "person_youtube_channels_bool_exp": "input_types",
+    "person_youtube_channels_constraint": "enums",
+    "person_youtube_channels_insert_input": "input_types",
+    "person_youtube_channels_on_conflict": "input_types",
+    "person_youtube_channels_select_column": "enums",
+    "person_youtube_channels_update_column": "enums",
+    "persons_bool_exp": "input_types",
+    "persons_constraint": "enums",
+    "persons_insert_input": "input_types",
+    "persons_obj_rel_insert_input": "input_types",
+    "persons_on_conflict": "input_types",
+    "persons_update_column": "enums",
+    "program_amongus_maps_aggregate_bool_exp": "input_types",
+    "program_amongus_maps_aggregate_bool_exp_count": "input_types",
+    "program_amongus_maps_arr_rel_insert_input": "input_types",
+    "program_amongus_maps_bool_exp": "input_types",
+    "program_amongus_maps_constraint": "enums",
+    "program_amongus_maps_insert_input": "input_types",
+    "program_amongus_maps_on_conflict": "input_types",
+    "program_amongus_maps_select_column": "enums",
+    "program_amongus_maps_update_column": "enums",
+    "program_amongus_mods_aggregate_bool_exp": "input_types",
+    "program_amongus_mods_aggregate_bool_exp_count": "input_types",
+    "program_amongus_mods_arr_rel_insert_input": "input_types",
+    "program_amongus_mods_bool_exp": "input_types",
+    "program_amongus_mods_constraint": "enums",
+    "program_amongus_mods_insert_input": "input_types",
+    "program_amongus_mods_on_conflict": "input_types",
+    "program_amongus_mods_select_column": "enums",
+    "program_amongus_mods_update_column": "enums",
+    "program_amongus_vanilla_versions_aggregate_bool_exp": "input_types",
+    "program_amongus_vanilla_versions_aggregate_bool_exp_count": "input_types",
+    "program_amongus_vanilla_versions_arr_rel_insert_input": "input_types",
+    "program_amongus_vanilla_versions_bool_exp": "input_types",
+    "program_amongus_vanilla_versions_constraint": "enums",
+    "program_amongus_vanilla_versions_insert_input": "input_types",
+    "program_amongus_vanilla_versions_on_conflict": "input_types",
+    "program_amongus_vanilla_versions_select_column": "enums",
+    "program_amongus_vanilla_versions_update_column": "enums",
+    "program_live_archives_aggregate_bool_exp": "input_types",
+    "program_live_archives_aggregate_bool_exp_count": "input_types",
+    "program_live_archives_arr_rel_insert_input": "input_types",
+    "program_live_archives_bool_exp": "input_types",
+    "program_live_archives_constraint": "enums",
+    "program_live_archives_insert_input": "input_types",
+    "program_live_archives_on_conflict": "input_types",
+    "program_live_archives_select_column": "enums",
+    "program_live_archives_update_column": "enums",
+    "program_niconico_videos_aggregate_bool_exp": "input_types",
+    "program_niconico_videos_aggregate_bool_exp_count": "input_types",
+    "program_niconico_videos_arr_rel_insert_input": "input_types",
+    "program_niconico_videos_bool_exp": "input_types",
+    "program_niconico_videos_constraint": "enums",
+    "program_niconico_videos_insert_input": "input_types",
+    "program_niconico_videos_on_conflict": "input_types",
+    "program_niconico_videos_select_column": "enums",
+    "program_niconico_videos_update_column": "enums",
+    "program_persons_aggregate_bool_exp": "input_types",
+    "program_persons_aggregate_bool_exp_bool_and": "input_types",
+    "program_persons_aggregate_bool_exp_bool_or": "input_types",
+    "program_persons_aggregate_bool_exp_count": "input_types",
+    "program_persons_arr_rel_insert_input": "input_types",
+    "program_persons_bool_exp": "input_types",
+    "program_persons_constraint": "enums",
+    "program_persons_insert_input": "input_types",
+    "program_persons_on_conflict": "input_types",
+    "program_persons_select_column": "enums",
+    "program_persons_select_column_program_persons_aggregate_bool_exp_bool_and_arguments_columns": "enums",
+    "program_persons_select_column_program_persons_aggregate_bool_exp_bool_or_arguments_columns": "enums",
+    "program_persons_update_column": "enums",
+    "program_projects_aggregate_bool_exp": "input_types",
+    "program_projects_aggregate_bool_exp_count": "input_types",
+    "program_projects_arr_rel_insert_input": "input_types",
+    "program_projects_bool_exp": "input_types",
+    "program_projects_constraint": "enums",
+    "program_projects_insert_input": "input_types",
+    "program_projects_on_conflict": "input_types",
+    "program_projects_select_column": "enums",
+    "program_projects_update_column": "enums",
+    "program_twitter_announcements_aggregate_bool_exp": "input_types",
+    "program_twitter_announcements_aggregate_bool_exp_count": "input_types",
+    "program_twitter_announcements_arr_rel_insert_input": "input_types",
+    "program_twitter_announcements_bool_exp": "input_types",
+    "program_twitter_announcements_constraint": "enums",
+    "program_twitter_announcements_insert_input": "input_types",
+    "program_twitter_announcements_on_conflict": "input_types",
+    "program_twitter_announcements_select_column": "enums",
+    "program_twitter_announcements_update_column": "enums",
+    "programs_bool_exp": "input_types",
+    "programs_constraint": "enums",
+    "programs_insert_input": "input_types",
+    "programs_obj_rel_insert_input": "input_types",
+    "programs_on_conflict": "input_types",
+    "programs_update_column": "enums",
+    "project_niconico_videos_aggregate_bool_exp": "input_types",
+    "project_niconico_videos_aggregate_bool_exp_count": "input_types",
+    "project_niconico_videos_arr_rel_insert_input": "input_types",
+    "project_niconico_videos_bool_exp": "input_types",
+    "project_niconico_videos_constraint": "enums",
+    "project_niconico_videos_insert_input": "input_types",
+    "project_niconico_videos_on_conflict": "input_types",
+    "project_niconico_videos_select_column": "enums",
+    "project_niconico_videos_update_column": "enums",
+    "projects_bool_exp": "input_types",
+    "projects_constraint": "enums",
+    "projects_insert_input": "input_types",
+    "projects_obj_rel_insert_input": "input_types",
+    "projects_on_conflict": "input_types",
+    "projects_update_column": "enums",
+    "timestamptz_comparison_exp": "input_types",
+    "twitter_accounts_bool_exp": "input_types",
+    "twitter_accounts_constraint": "enums",
+    "twitter_accounts_insert_input": "input_types",
+    "twitter_accounts_obj_rel_insert_input": "input_types",
+    "twitter_accounts_on_conflict": "input_types",
+    "twitter_accounts_update_column": "enums",
+    "twitter_tweet_images_aggregate_bool_exp": "input_types",
+    "twitter_tweet_images_aggregate_bool_exp_count": "input_types",
+    "twitter_tweet_images_arr_rel_insert_input": "input_types",
+    "twitter_tweet_images_bool_exp": "input_types",
+    "twitter_tweet_images_constraint": "enums",
+    "twitter_tweet_images_insert_input": "input_types",
+    "twitter_tweet_images_obj_rel_insert_input": "input_types",
+    "twitter_tweet_images_on_conflict": "input_types",
+    "twitter_tweet_images_select_column": "enums",
+    "twitter_tweet_images_update_column": "enums",
+    "twitter_tweets_bool_exp": "input_types",
+    "twitter_tweets_constraint": "enums",
+    "twitter_tweets_insert_input": "input_types",
+    "twitter_tweets_obj_rel_insert_input": "input_types",
+    "twitter_tweets_on_conflict": "input_types",
+    "twitter_tweets_update_column": "enums",
+    "uuid_comparison_exp": "input_types",
+    "youtube_channels_bool_exp": "input_types",
+    "youtube_channels_constraint": "enums",
+    "youtube_channels_insert_input": "input_types",
+    "youtube_channels_obj_rel_insert_input": "input_types",
+    "youtube_channels_on_conflict": "input_types",
+    "youtube_channels_update_column": "enums",
+    "youtube_lives_aggregate_bool_exp": "input_types",
+    "youtube_lives_aggregate_bool_exp_count": "input_types",
+    "youtube_lives_arr_rel_insert_input": "input_types",
+    "youtube_lives_bool_exp": "input_types",
+    "youtube_lives_constraint": "enums",
+    "youtube_lives_insert_input": "input_types",
+    "youtube_lives_obj_rel_insert_input": "input_types",
+    "youtube_lives_on_conflict": "input_types",
+    "youtube_lives_select_column": "enums",
+    "youtube_lives_update_column": "enums",
+    "youtube_videos_bool_exp": "input_types",
+    "youtube_videos_constraint": "enums",
+    "youtube_videos_insert_input": "input_types",
+    "youtube_videos_obj_rel_insert_input": "input_types",
+    "youtube_videos_on_conflict": "input_types",
+    "youtube_videos_update_column": "enums",
+}
 __all__ = [
-    "BaseClient",
+    "AsyncBaseClient",
     "BaseModel",
     "Boolean_comparison_exp",
     "Client",
@@ -1186,1137 +1195,579 @@ __all__ = [
     "CreateProgramPerson",
     "CreateProgramPersonProgramPerson",
     "CreateProgramProgram",
-    "CreateProgramTwitterAnnouncement",
-    "CreateProgramTwitterAnnouncementProgramTwitterAnnouncement",
+    "CreateProgramTwitterAnnouncementWithTweet",
+    "CreateProgramTwitterAnnouncementWithTweetImage",
+    "CreateProgramTwitterAnnouncementWithTweetImageProgramTwitterAnnouncement",
+    "CreateProgramTwitterAnnouncementWithTweetImageTwitterTweet",
+    "CreateProgramTwitterAnnouncementWithTweetProgramTwitterAnnouncement",
     "CreateProgramYoutubeLiveLiveArchive",
     "CreateProgramYoutubeLiveLiveArchiveProgramLiveArchive",
+    "CreateProgramYoutubeLiveLiveArchives",
+    "CreateProgramYoutubeLiveLiveArchivesInsertProgramLiveArchives",
+    "CreateProgramYoutubeLiveLiveArchivesInsertProgramLiveArchivesReturning",
+    "CreateProgramYoutubeLiveLiveArchivesInsertProgramLiveArchivesReturningYoutubeLive",
     "CreateProgramYoutubeVideoLiveArchive",
     "CreateProgramYoutubeVideoLiveArchiveProgramLiveArchive",
-    "CreateTwitterTweet",
-    "CreateTwitterTweetImage",
-    "CreateTwitterTweetImageTwitterTweetImage",
-    "CreateTwitterTweetTwitterTweet",
-    "GetCreateProgramInitialData",
-    "GetCreateProgramInitialDataGameList",
-    "GetCreateProgramInitialDataProjectList",
-    "GetCreateProgramNiconicoVideoInitialData",
-    "GetCreateProgramNiconicoVideoInitialDataPersonList",
-    "GetCreateProgramNiconicoVideoInitialDataProjectList",
-    "GetCreateProgramPersonInitialData",
-    "GetCreateProgramPersonInitialDataPersonList",
-    "GetCreateProgramPersonInitialDataProjectList",
-    "GetCreateProgramTwitterAnnouncementInitialData",
-    "GetCreateProgramTwitterAnnouncementInitialDataPersonList",
-    "GetCreateProgramTwitterAnnouncementInitialDataProjectList",
-    "GetCreateProgramTwitterAnnouncementInitialDataTwitterAccountList",
-    "GetCreateProgramYoutubeLiveLiveArchiveInitialData",
-    "GetCreateProgramYoutubeLiveLiveArchiveInitialDataPersonList",
-    "GetCreateProgramYoutubeLiveLiveArchiveInitialDataProjectList",
-    "GetCreateProgramYoutubeVideoLiveArchiveInitialData",
-    "GetCreateProgramYoutubeVideoLiveArchiveInitialDataPersonList",
-    "GetCreateProgramYoutubeVideoLiveArchiveInitialDataProjectList",
+    "GamesStream",
+    "GamesStreamGameList",
+    "GetPersonAccountIndex",
+    "GetPersonAccountIndexPersonNiconicoAccountList",
+    "GetPersonAccountIndexPersonNiconicoAccountListNiconicoAccount",
+    "GetPersonAccountIndexPersonTwitterAccountList",
+    "GetPersonAccountIndexPersonYoutubeChannelList",
+    "GetPersonAccountIndexPersonYoutubeChannelListYoutubeChannel",
     "GetProgramProjectListByProjectId",
     "GetProgramProjectListByProjectIdProject",
     "GetProgramProjectListByProjectIdProjectProgramProjectList",
     "GetProgramProjectListByProjectIdProjectProgramProjectListProgram",
+    "GetReferenceData",
+    "GetReferenceDataGameList",
+    "GetReferenceDataPersonList",
+    "GetReferenceDataProjectList",
+    "GetReferenceDataTwitterAccountList",
     "GetTwitterAccountByScreenName",
     "GetTwitterAccountByScreenNameTwitterAccountList",
+    "GetTwitterTweetByRemoteTweetId",
+    "GetTwitterTweetByRemoteTweetIdTwitterTweetList",
+    "GraphQLBatchResult",
     "GraphQLClientError",
     "GraphQLClientGraphQLError",
     "GraphQLClientGraphQLMultiError",
     "GraphQLClientHttpError",
     "GraphQLClientInvalidResponseError",
+    "GraphQLOperation",
     "Int_comparison_exp",
+    "PersonsStream",
+    "PersonsStreamPersonList",
+    "ProgramProjectsStream",
+    "ProgramProjectsStreamProgramProjectList",
+    "ProgramProjectsStreamProgramProjectListProgram",
+    "ProgramsStream",
+    "ProgramsStreamProgramList",
+    "ProgramsStreamProgramListProgramProjectList",
+    "ProjectsStream",
+    "ProjectsStreamProjectList",
     "String_comparison_exp",
+    "TwitterAccountsStream",
+    "TwitterAccountsStreamTwitterAccountList",
     "Upload",
     "amongus_maps_aggregate_bool_exp",
     "amongus_maps_aggregate_bool_exp_bool_and",
     "amongus_maps_aggregate_bool_exp_bool_or",
     "amongus_maps_aggregate_bool_exp_count",
-    "amongus_maps_aggregate_order_by",
     "amongus_maps_arr_rel_insert_input",
     "amongus_maps_bool_exp",
     "amongus_maps_constraint",
     "amongus_maps_insert_input",
-    "amongus_maps_max_order_by",
-    "amongus_maps_min_order_by",
     "amongus_maps_obj_rel_insert_input",
     "amongus_maps_on_conflict",
-    "amongus_maps_order_by",
-    "amongus_maps_pk_columns_input",
     "amongus_maps_select_column",
     "amongus_maps_select_column_amongus_maps_aggregate_bool_exp_bool_and_arguments_columns",
     "amongus_maps_select_column_amongus_maps_aggregate_bool_exp_bool_or_arguments_columns",
-    "amongus_maps_set_input",
-    "amongus_maps_stream_cursor_input",
-    "amongus_maps_stream_cursor_value_input",
     "amongus_maps_update_column",
-    "amongus_maps_updates",
-    "amongus_match_mods_bool_exp",
-    "amongus_match_mods_constraint",
-    "amongus_match_mods_insert_input",
-    "amongus_match_mods_on_conflict",
-    "amongus_match_mods_order_by",
-    "amongus_match_mods_pk_columns_input",
-    "amongus_match_mods_select_column",
-    "amongus_match_mods_set_input",
-    "amongus_match_mods_stream_cursor_input",
-    "amongus_match_mods_stream_cursor_value_input",
-    "amongus_match_mods_update_column",
-    "amongus_match_mods_updates",
     "amongus_match_player_result_roles_aggregate_bool_exp",
     "amongus_match_player_result_roles_aggregate_bool_exp_count",
-    "amongus_match_player_result_roles_aggregate_order_by",
     "amongus_match_player_result_roles_arr_rel_insert_input",
-    "amongus_match_player_result_roles_avg_order_by",
     "amongus_match_player_result_roles_bool_exp",
     "amongus_match_player_result_roles_constraint",
-    "amongus_match_player_result_roles_inc_input",
     "amongus_match_player_result_roles_insert_input",
-    "amongus_match_player_result_roles_max_order_by",
-    "amongus_match_player_result_roles_min_order_by",
     "amongus_match_player_result_roles_on_conflict",
-    "amongus_match_player_result_roles_order_by",
-    "amongus_match_player_result_roles_pk_columns_input",
     "amongus_match_player_result_roles_select_column",
-    "amongus_match_player_result_roles_set_input",
-    "amongus_match_player_result_roles_stddev_order_by",
-    "amongus_match_player_result_roles_stddev_pop_order_by",
-    "amongus_match_player_result_roles_stddev_samp_order_by",
-    "amongus_match_player_result_roles_stream_cursor_input",
-    "amongus_match_player_result_roles_stream_cursor_value_input",
-    "amongus_match_player_result_roles_sum_order_by",
     "amongus_match_player_result_roles_update_column",
-    "amongus_match_player_result_roles_updates",
-    "amongus_match_player_result_roles_var_pop_order_by",
-    "amongus_match_player_result_roles_var_samp_order_by",
-    "amongus_match_player_result_roles_variance_order_by",
     "amongus_match_players_aggregate_bool_exp",
     "amongus_match_players_aggregate_bool_exp_count",
-    "amongus_match_players_aggregate_order_by",
     "amongus_match_players_arr_rel_insert_input",
     "amongus_match_players_bool_exp",
     "amongus_match_players_constraint",
     "amongus_match_players_insert_input",
-    "amongus_match_players_max_order_by",
-    "amongus_match_players_min_order_by",
     "amongus_match_players_on_conflict",
-    "amongus_match_players_order_by",
-    "amongus_match_players_pk_columns_input",
     "amongus_match_players_select_column",
-    "amongus_match_players_set_input",
-    "amongus_match_players_stream_cursor_input",
-    "amongus_match_players_stream_cursor_value_input",
     "amongus_match_players_update_column",
-    "amongus_match_players_updates",
     "amongus_matches_aggregate_bool_exp",
     "amongus_matches_aggregate_bool_exp_bool_and",
     "amongus_matches_aggregate_bool_exp_bool_or",
     "amongus_matches_aggregate_bool_exp_count",
-    "amongus_matches_aggregate_order_by",
     "amongus_matches_arr_rel_insert_input",
-    "amongus_matches_avg_order_by",
     "amongus_matches_bool_exp",
     "amongus_matches_constraint",
-    "amongus_matches_inc_input",
     "amongus_matches_insert_input",
-    "amongus_matches_max_order_by",
-    "amongus_matches_min_order_by",
     "amongus_matches_obj_rel_insert_input",
     "amongus_matches_on_conflict",
-    "amongus_matches_order_by",
-    "amongus_matches_pk_columns_input",
     "amongus_matches_select_column",
     "amongus_matches_select_column_amongus_matches_aggregate_bool_exp_bool_and_arguments_columns",
     "amongus_matches_select_column_amongus_matches_aggregate_bool_exp_bool_or_arguments_columns",
-    "amongus_matches_set_input",
-    "amongus_matches_stddev_order_by",
-    "amongus_matches_stddev_pop_order_by",
-    "amongus_matches_stddev_samp_order_by",
-    "amongus_matches_stream_cursor_input",
-    "amongus_matches_stream_cursor_value_input",
-    "amongus_matches_sum_order_by",
     "amongus_matches_update_column",
-    "amongus_matches_updates",
-    "amongus_matches_var_pop_order_by",
-    "amongus_matches_var_samp_order_by",
-    "amongus_matches_variance_order_by",
     "amongus_mod_versions_aggregate_bool_exp",
     "amongus_mod_versions_aggregate_bool_exp_count",
-    "amongus_mod_versions_aggregate_order_by",
     "amongus_mod_versions_arr_rel_insert_input",
     "amongus_mod_versions_bool_exp",
     "amongus_mod_versions_constraint",
     "amongus_mod_versions_insert_input",
-    "amongus_mod_versions_max_order_by",
-    "amongus_mod_versions_min_order_by",
     "amongus_mod_versions_obj_rel_insert_input",
     "amongus_mod_versions_on_conflict",
-    "amongus_mod_versions_order_by",
-    "amongus_mod_versions_pk_columns_input",
     "amongus_mod_versions_select_column",
-    "amongus_mod_versions_set_input",
-    "amongus_mod_versions_stream_cursor_input",
-    "amongus_mod_versions_stream_cursor_value_input",
     "amongus_mod_versions_update_column",
-    "amongus_mod_versions_updates",
     "amongus_mods_bool_exp",
     "amongus_mods_constraint",
     "amongus_mods_insert_input",
     "amongus_mods_obj_rel_insert_input",
     "amongus_mods_on_conflict",
-    "amongus_mods_order_by",
-    "amongus_mods_pk_columns_input",
-    "amongus_mods_select_column",
-    "amongus_mods_set_input",
-    "amongus_mods_stream_cursor_input",
-    "amongus_mods_stream_cursor_value_input",
     "amongus_mods_update_column",
-    "amongus_mods_updates",
     "amongus_roles_aggregate_bool_exp",
     "amongus_roles_aggregate_bool_exp_bool_and",
     "amongus_roles_aggregate_bool_exp_bool_or",
     "amongus_roles_aggregate_bool_exp_count",
-    "amongus_roles_aggregate_order_by",
     "amongus_roles_arr_rel_insert_input",
-    "amongus_roles_avg_order_by",
     "amongus_roles_bool_exp",
     "amongus_roles_constraint",
-    "amongus_roles_inc_input",
     "amongus_roles_insert_input",
-    "amongus_roles_max_order_by",
-    "amongus_roles_min_order_by",
     "amongus_roles_on_conflict",
-    "amongus_roles_order_by",
-    "amongus_roles_pk_columns_input",
     "amongus_roles_select_column",
     "amongus_roles_select_column_amongus_roles_aggregate_bool_exp_bool_and_arguments_columns",
     "amongus_roles_select_column_amongus_roles_aggregate_bool_exp_bool_or_arguments_columns",
-    "amongus_roles_set_input",
-    "amongus_roles_stddev_order_by",
-    "amongus_roles_stddev_pop_order_by",
-    "amongus_roles_stddev_samp_order_by",
-    "amongus_roles_stream_cursor_input",
-    "amongus_roles_stream_cursor_value_input",
-    "amongus_roles_sum_order_by",
     "amongus_roles_update_column",
-    "amongus_roles_updates",
-    "amongus_roles_var_pop_order_by",
-    "amongus_roles_var_samp_order_by",
-    "amongus_roles_variance_order_by",
     "amongus_vanilla_versions_bool_exp",
     "amongus_vanilla_versions_constraint",
     "amongus_vanilla_versions_insert_input",
     "amongus_vanilla_versions_obj_rel_insert_input",
     "amongus_vanilla_versions_on_conflict",
-    "amongus_vanilla_versions_order_by",
-    "amongus_vanilla_versions_pk_columns_input",
-    "amongus_vanilla_versions_select_column",
-    "amongus_vanilla_versions_set_input",
-    "amongus_vanilla_versions_stream_cursor_input",
-    "amongus_vanilla_versions_stream_cursor_value_input",
     "amongus_vanilla_versions_update_column",
-    "amongus_vanilla_versions_updates",
     "amongusvr_maps_bool_exp",
     "amongusvr_maps_constraint",
     "amongusvr_maps_insert_input",
     "amongusvr_maps_obj_rel_insert_input",
     "amongusvr_maps_on_conflict",
-    "amongusvr_maps_order_by",
-    "amongusvr_maps_pk_columns_input",
-    "amongusvr_maps_select_column",
-    "amongusvr_maps_set_input",
-    "amongusvr_maps_stream_cursor_input",
-    "amongusvr_maps_stream_cursor_value_input",
     "amongusvr_maps_update_column",
-    "amongusvr_maps_updates",
     "amongusvr_match_players_aggregate_bool_exp",
     "amongusvr_match_players_aggregate_bool_exp_count",
-    "amongusvr_match_players_aggregate_order_by",
     "amongusvr_match_players_arr_rel_insert_input",
     "amongusvr_match_players_bool_exp",
     "amongusvr_match_players_constraint",
     "amongusvr_match_players_insert_input",
-    "amongusvr_match_players_max_order_by",
-    "amongusvr_match_players_min_order_by",
     "amongusvr_match_players_on_conflict",
-    "amongusvr_match_players_order_by",
-    "amongusvr_match_players_pk_columns_input",
     "amongusvr_match_players_select_column",
-    "amongusvr_match_players_set_input",
-    "amongusvr_match_players_stream_cursor_input",
-    "amongusvr_match_players_stream_cursor_value_input",
     "amongusvr_match_players_update_column",
-    "amongusvr_match_players_updates",
     "amongusvr_matches_aggregate_bool_exp",
     "amongusvr_matches_aggregate_bool_exp_bool_and",
     "amongusvr_matches_aggregate_bool_exp_bool_or",
     "amongusvr_matches_aggregate_bool_exp_count",
-    "amongusvr_matches_aggregate_order_by",
     "amongusvr_matches_arr_rel_insert_input",
-    "amongusvr_matches_avg_order_by",
     "amongusvr_matches_bool_exp",
     "amongusvr_matches_constraint",
-    "amongusvr_matches_inc_input",
     "amongusvr_matches_insert_input",
-    "amongusvr_matches_max_order_by",
-    "amongusvr_matches_min_order_by",
     "amongusvr_matches_obj_rel_insert_input",
     "amongusvr_matches_on_conflict",
-    "amongusvr_matches_order_by",
-    "amongusvr_matches_pk_columns_input",
     "amongusvr_matches_select_column",
     "amongusvr_matches_select_column_amongusvr_matches_aggregate_bool_exp_bool_and_arguments_columns",
     "amongusvr_matches_select_column_amongusvr_matches_aggregate_bool_exp_bool_or_arguments_columns",
-    "amongusvr_matches_set_input",
-    "amongusvr_matches_stddev_order_by",
-    "amongusvr_matches_stddev_pop_order_by",
-    "amongusvr_matches_stddev_samp_order_by",
-    "amongusvr_matches_stream_cursor_input",
-    "amongusvr_matches_stream_cursor_value_input",
-    "amongusvr_matches_sum_order_by",
     "amongusvr_matches_update_column",
-    "amongusvr_matches_updates",
-    "amongusvr_matches_var_pop_order_by",
-    "amongusvr_matches_var_samp_order_by",
-    "amongusvr_matches_variance_order_by",
-    "cursor_ordering",
     "fallguys_custom_round_twitter_announcements_aggregate_bool_exp",
     "fallguys_custom_round_twitter_announcements_aggregate_bool_exp_bool_and",
     "fallguys_custom_round_twitter_announcements_aggregate_bool_exp_bool_or",
     "fallguys_custom_round_twitter_announcements_aggregate_bool_exp_count",
-    "fallguys_custom_round_twitter_announcements_aggregate_order_by",
     "fallguys_custom_round_twitter_announcements_arr_rel_insert_input",
     "fallguys_custom_round_twitter_announcements_bool_exp",
     "fallguys_custom_round_twitter_announcements_constraint",
     "fallguys_custom_round_twitter_announcements_insert_input",
-    "fallguys_custom_round_twitter_announcements_max_order_by",
-    "fallguys_custom_round_twitter_announcements_min_order_by",
     "fallguys_custom_round_twitter_announcements_on_conflict",
-    "fallguys_custom_round_twitter_announcements_order_by",
-    "fallguys_custom_round_twitter_announcements_pk_columns_input",
     "fallguys_custom_round_twitter_announcements_select_column",
     "fallguys_custom_round_twitter_announcements_select_column_fallguys_custom_round_twitter_announcements_aggregate_bool_exp_bool_and_arguments_columns",
     "fallguys_custom_round_twitter_announcements_select_column_fallguys_custom_round_twitter_announcements_aggregate_bool_exp_bool_or_arguments_columns",
-    "fallguys_custom_round_twitter_announcements_set_input",
-    "fallguys_custom_round_twitter_announcements_stream_cursor_input",
-    "fallguys_custom_round_twitter_announcements_stream_cursor_value_input",
     "fallguys_custom_round_twitter_announcements_update_column",
-    "fallguys_custom_round_twitter_announcements_updates",
     "fallguys_custom_rounds_aggregate_bool_exp",
     "fallguys_custom_rounds_aggregate_bool_exp_count",
-    "fallguys_custom_rounds_aggregate_order_by",
     "fallguys_custom_rounds_arr_rel_insert_input",
     "fallguys_custom_rounds_bool_exp",
     "fallguys_custom_rounds_constraint",
     "fallguys_custom_rounds_insert_input",
-    "fallguys_custom_rounds_max_order_by",
-    "fallguys_custom_rounds_min_order_by",
     "fallguys_custom_rounds_obj_rel_insert_input",
     "fallguys_custom_rounds_on_conflict",
-    "fallguys_custom_rounds_order_by",
-    "fallguys_custom_rounds_pk_columns_input",
     "fallguys_custom_rounds_select_column",
-    "fallguys_custom_rounds_set_input",
-    "fallguys_custom_rounds_stream_cursor_input",
-    "fallguys_custom_rounds_stream_cursor_value_input",
     "fallguys_custom_rounds_update_column",
-    "fallguys_custom_rounds_updates",
     "fallguys_match_rounds_aggregate_bool_exp",
     "fallguys_match_rounds_aggregate_bool_exp_bool_and",
     "fallguys_match_rounds_aggregate_bool_exp_bool_or",
     "fallguys_match_rounds_aggregate_bool_exp_count",
-    "fallguys_match_rounds_aggregate_order_by",
     "fallguys_match_rounds_arr_rel_insert_input",
-    "fallguys_match_rounds_avg_order_by",
     "fallguys_match_rounds_bool_exp",
     "fallguys_match_rounds_constraint",
-    "fallguys_match_rounds_inc_input",
     "fallguys_match_rounds_insert_input",
-    "fallguys_match_rounds_max_order_by",
-    "fallguys_match_rounds_min_order_by",
     "fallguys_match_rounds_on_conflict",
-    "fallguys_match_rounds_order_by",
-    "fallguys_match_rounds_pk_columns_input",
     "fallguys_match_rounds_select_column",
     "fallguys_match_rounds_select_column_fallguys_match_rounds_aggregate_bool_exp_bool_and_arguments_columns",
     "fallguys_match_rounds_select_column_fallguys_match_rounds_aggregate_bool_exp_bool_or_arguments_columns",
-    "fallguys_match_rounds_set_input",
-    "fallguys_match_rounds_stddev_order_by",
-    "fallguys_match_rounds_stddev_pop_order_by",
-    "fallguys_match_rounds_stddev_samp_order_by",
-    "fallguys_match_rounds_stream_cursor_input",
-    "fallguys_match_rounds_stream_cursor_value_input",
-    "fallguys_match_rounds_sum_order_by",
     "fallguys_match_rounds_update_column",
-    "fallguys_match_rounds_updates",
-    "fallguys_match_rounds_var_pop_order_by",
-    "fallguys_match_rounds_var_samp_order_by",
-    "fallguys_match_rounds_variance_order_by",
     "fallguys_matches_aggregate_bool_exp",
     "fallguys_matches_aggregate_bool_exp_bool_and",
     "fallguys_matches_aggregate_bool_exp_bool_or",
     "fallguys_matches_aggregate_bool_exp_count",
-    "fallguys_matches_aggregate_order_by",
     "fallguys_matches_arr_rel_insert_input",
-    "fallguys_matches_avg_order_by",
     "fallguys_matches_bool_exp",
     "fallguys_matches_constraint",
-    "fallguys_matches_inc_input",
     "fallguys_matches_insert_input",
-    "fallguys_matches_max_order_by",
-    "fallguys_matches_min_order_by",
     "fallguys_matches_obj_rel_insert_input",
     "fallguys_matches_on_conflict",
-    "fallguys_matches_order_by",
-    "fallguys_matches_pk_columns_input",
     "fallguys_matches_select_column",
     "fallguys_matches_select_column_fallguys_matches_aggregate_bool_exp_bool_and_arguments_columns",
     "fallguys_matches_select_column_fallguys_matches_aggregate_bool_exp_bool_or_arguments_columns",
-    "fallguys_matches_set_input",
-    "fallguys_matches_stddev_order_by",
-    "fallguys_matches_stddev_pop_order_by",
-    "fallguys_matches_stddev_samp_order_by",
-    "fallguys_matches_stream_cursor_input",
-    "fallguys_matches_stream_cursor_value_input",
-    "fallguys_matches_sum_order_by",
     "fallguys_matches_update_column",
-    "fallguys_matches_updates",
-    "fallguys_matches_var_pop_order_by",
-    "fallguys_matches_var_samp_order_by",
-    "fallguys_matches_variance_order_by",
     "fallguys_rounds_bool_exp",
     "fallguys_rounds_constraint",
     "fallguys_rounds_insert_input",
     "fallguys_rounds_obj_rel_insert_input",
     "fallguys_rounds_on_conflict",
-    "fallguys_rounds_order_by",
-    "fallguys_rounds_pk_columns_input",
-    "fallguys_rounds_select_column",
-    "fallguys_rounds_set_input",
-    "fallguys_rounds_stream_cursor_input",
-    "fallguys_rounds_stream_cursor_value_input",
     "fallguys_rounds_update_column",
-    "fallguys_rounds_updates",
     "fediverse_accounts_bool_exp",
     "fediverse_accounts_constraint",
     "fediverse_accounts_insert_input",
     "fediverse_accounts_obj_rel_insert_input",
     "fediverse_accounts_on_conflict",
-    "fediverse_accounts_order_by",
-    "fediverse_accounts_pk_columns_input",
-    "fediverse_accounts_select_column",
-    "fediverse_accounts_set_input",
-    "fediverse_accounts_stream_cursor_input",
-    "fediverse_accounts_stream_cursor_value_input",
     "fediverse_accounts_update_column",
-    "fediverse_accounts_updates",
     "games_bool_exp",
     "games_constraint",
     "games_insert_input",
     "games_obj_rel_insert_input",
     "games_on_conflict",
-    "games_order_by",
-    "games_pk_columns_input",
-    "games_select_column",
-    "games_set_input",
-    "games_stream_cursor_input",
-    "games_stream_cursor_value_input",
     "games_update_column",
-    "games_updates",
     "mariokart8deluxe_battle_courses_bool_exp",
     "mariokart8deluxe_battle_courses_constraint",
-    "mariokart8deluxe_battle_courses_inc_input",
     "mariokart8deluxe_battle_courses_insert_input",
     "mariokart8deluxe_battle_courses_obj_rel_insert_input",
     "mariokart8deluxe_battle_courses_on_conflict",
-    "mariokart8deluxe_battle_courses_order_by",
-    "mariokart8deluxe_battle_courses_pk_columns_input",
-    "mariokart8deluxe_battle_courses_select_column",
-    "mariokart8deluxe_battle_courses_set_input",
-    "mariokart8deluxe_battle_courses_stream_cursor_input",
-    "mariokart8deluxe_battle_courses_stream_cursor_value_input",
     "mariokart8deluxe_battle_courses_update_column",
-    "mariokart8deluxe_battle_courses_updates",
     "mariokart8deluxe_battle_match_players_aggregate_bool_exp",
     "mariokart8deluxe_battle_match_players_aggregate_bool_exp_count",
-    "mariokart8deluxe_battle_match_players_aggregate_order_by",
     "mariokart8deluxe_battle_match_players_arr_rel_insert_input",
     "mariokart8deluxe_battle_match_players_bool_exp",
     "mariokart8deluxe_battle_match_players_constraint",
     "mariokart8deluxe_battle_match_players_insert_input",
-    "mariokart8deluxe_battle_match_players_max_order_by",
-    "mariokart8deluxe_battle_match_players_min_order_by",
     "mariokart8deluxe_battle_match_players_on_conflict",
-    "mariokart8deluxe_battle_match_players_order_by",
-    "mariokart8deluxe_battle_match_players_pk_columns_input",
     "mariokart8deluxe_battle_match_players_select_column",
-    "mariokart8deluxe_battle_match_players_set_input",
-    "mariokart8deluxe_battle_match_players_stream_cursor_input",
-    "mariokart8deluxe_battle_match_players_stream_cursor_value_input",
     "mariokart8deluxe_battle_match_players_update_column",
-    "mariokart8deluxe_battle_match_players_updates",
     "mariokart8deluxe_battle_matches_aggregate_bool_exp",
     "mariokart8deluxe_battle_matches_aggregate_bool_exp_bool_and",
     "mariokart8deluxe_battle_matches_aggregate_bool_exp_bool_or",
     "mariokart8deluxe_battle_matches_aggregate_bool_exp_count",
-    "mariokart8deluxe_battle_matches_aggregate_order_by",
     "mariokart8deluxe_battle_matches_arr_rel_insert_input",
-    "mariokart8deluxe_battle_matches_avg_order_by",
     "mariokart8deluxe_battle_matches_bool_exp",
     "mariokart8deluxe_battle_matches_constraint",
-    "mariokart8deluxe_battle_matches_inc_input",
     "mariokart8deluxe_battle_matches_insert_input",
-    "mariokart8deluxe_battle_matches_max_order_by",
-    "mariokart8deluxe_battle_matches_min_order_by",
     "mariokart8deluxe_battle_matches_obj_rel_insert_input",
     "mariokart8deluxe_battle_matches_on_conflict",
-    "mariokart8deluxe_battle_matches_order_by",
-    "mariokart8deluxe_battle_matches_pk_columns_input",
     "mariokart8deluxe_battle_matches_select_column",
     "mariokart8deluxe_battle_matches_select_column_mariokart8deluxe_battle_matches_aggregate_bool_exp_bool_and_arguments_columns",
     "mariokart8deluxe_battle_matches_select_column_mariokart8deluxe_battle_matches_aggregate_bool_exp_bool_or_arguments_columns",
-    "mariokart8deluxe_battle_matches_set_input",
-    "mariokart8deluxe_battle_matches_stddev_order_by",
-    "mariokart8deluxe_battle_matches_stddev_pop_order_by",
-    "mariokart8deluxe_battle_matches_stddev_samp_order_by",
-    "mariokart8deluxe_battle_matches_stream_cursor_input",
-    "mariokart8deluxe_battle_matches_stream_cursor_value_input",
-    "mariokart8deluxe_battle_matches_sum_order_by",
     "mariokart8deluxe_battle_matches_update_column",
-    "mariokart8deluxe_battle_matches_updates",
-    "mariokart8deluxe_battle_matches_var_pop_order_by",
-    "mariokart8deluxe_battle_matches_var_samp_order_by",
-    "mariokart8deluxe_battle_matches_variance_order_by",
     "mariokart8deluxe_battle_rules_bool_exp",
     "mariokart8deluxe_battle_rules_constraint",
-    "mariokart8deluxe_battle_rules_inc_input",
     "mariokart8deluxe_battle_rules_insert_input",
     "mariokart8deluxe_battle_rules_obj_rel_insert_input",
     "mariokart8deluxe_battle_rules_on_conflict",
-    "mariokart8deluxe_battle_rules_order_by",
-    "mariokart8deluxe_battle_rules_pk_columns_input",
-    "mariokart8deluxe_battle_rules_select_column",
-    "mariokart8deluxe_battle_rules_set_input",
-    "mariokart8deluxe_battle_rules_stream_cursor_input",
-    "mariokart8deluxe_battle_rules_stream_cursor_value_input",
     "mariokart8deluxe_battle_rules_update_column",
-    "mariokart8deluxe_battle_rules_updates",
     "mariokart8deluxe_consoles_bool_exp",
     "mariokart8deluxe_consoles_constraint",
     "mariokart8deluxe_consoles_insert_input",
     "mariokart8deluxe_consoles_obj_rel_insert_input",
     "mariokart8deluxe_consoles_on_conflict",
-    "mariokart8deluxe_consoles_order_by",
-    "mariokart8deluxe_consoles_pk_columns_input",
-    "mariokart8deluxe_consoles_select_column",
-    "mariokart8deluxe_consoles_set_input",
-    "mariokart8deluxe_consoles_stream_cursor_input",
-    "mariokart8deluxe_consoles_stream_cursor_value_input",
     "mariokart8deluxe_consoles_update_column",
-    "mariokart8deluxe_consoles_updates",
     "mariokart8deluxe_courses_aggregate_bool_exp",
     "mariokart8deluxe_courses_aggregate_bool_exp_count",
-    "mariokart8deluxe_courses_aggregate_order_by",
     "mariokart8deluxe_courses_arr_rel_insert_input",
-    "mariokart8deluxe_courses_avg_order_by",
     "mariokart8deluxe_courses_bool_exp",
     "mariokart8deluxe_courses_constraint",
-    "mariokart8deluxe_courses_inc_input",
     "mariokart8deluxe_courses_insert_input",
-    "mariokart8deluxe_courses_max_order_by",
-    "mariokart8deluxe_courses_min_order_by",
     "mariokart8deluxe_courses_obj_rel_insert_input",
     "mariokart8deluxe_courses_on_conflict",
-    "mariokart8deluxe_courses_order_by",
-    "mariokart8deluxe_courses_pk_columns_input",
     "mariokart8deluxe_courses_select_column",
-    "mariokart8deluxe_courses_set_input",
-    "mariokart8deluxe_courses_stddev_order_by",
-    "mariokart8deluxe_courses_stddev_pop_order_by",
-    "mariokart8deluxe_courses_stddev_samp_order_by",
-    "mariokart8deluxe_courses_stream_cursor_input",
-    "mariokart8deluxe_courses_stream_cursor_value_input",
-    "mariokart8deluxe_courses_sum_order_by",
     "mariokart8deluxe_courses_update_column",
-    "mariokart8deluxe_courses_updates",
-    "mariokart8deluxe_courses_var_pop_order_by",
-    "mariokart8deluxe_courses_var_samp_order_by",
-    "mariokart8deluxe_courses_variance_order_by",
     "mariokart8deluxe_cups_bool_exp",
     "mariokart8deluxe_cups_constraint",
-    "mariokart8deluxe_cups_inc_input",
     "mariokart8deluxe_cups_insert_input",
     "mariokart8deluxe_cups_obj_rel_insert_input",
     "mariokart8deluxe_cups_on_conflict",
-    "mariokart8deluxe_cups_order_by",
-    "mariokart8deluxe_cups_pk_columns_input",
-    "mariokart8deluxe_cups_select_column",
-    "mariokart8deluxe_cups_set_input",
-    "mariokart8deluxe_cups_stream_cursor_input",
-    "mariokart8deluxe_cups_stream_cursor_value_input",
     "mariokart8deluxe_cups_update_column",
-    "mariokart8deluxe_cups_updates",
     "mariokart8deluxe_race_players_aggregate_bool_exp",
     "mariokart8deluxe_race_players_aggregate_bool_exp_count",
-    "mariokart8deluxe_race_players_aggregate_order_by",
     "mariokart8deluxe_race_players_arr_rel_insert_input",
     "mariokart8deluxe_race_players_bool_exp",
     "mariokart8deluxe_race_players_constraint",
     "mariokart8deluxe_race_players_insert_input",
-    "mariokart8deluxe_race_players_max_order_by",
-    "mariokart8deluxe_race_players_min_order_by",
     "mariokart8deluxe_race_players_on_conflict",
-    "mariokart8deluxe_race_players_order_by",
-    "mariokart8deluxe_race_players_pk_columns_input",
     "mariokart8deluxe_race_players_select_column",
-    "mariokart8deluxe_race_players_set_input",
-    "mariokart8deluxe_race_players_stream_cursor_input",
-    "mariokart8deluxe_race_players_stream_cursor_value_input",
     "mariokart8deluxe_race_players_update_column",
-    "mariokart8deluxe_race_players_updates",
     "mariokart8deluxe_race_rules_bool_exp",
     "mariokart8deluxe_race_rules_constraint",
-    "mariokart8deluxe_race_rules_inc_input",
     "mariokart8deluxe_race_rules_insert_input",
     "mariokart8deluxe_race_rules_obj_rel_insert_input",
     "mariokart8deluxe_race_rules_on_conflict",
-    "mariokart8deluxe_race_rules_order_by",
-    "mariokart8deluxe_race_rules_pk_columns_input",
-    "mariokart8deluxe_race_rules_select_column",
-    "mariokart8deluxe_race_rules_set_input",
-    "mariokart8deluxe_race_rules_stream_cursor_input",
-    "mariokart8deluxe_race_rules_stream_cursor_value_input",
     "mariokart8deluxe_race_rules_update_column",
-    "mariokart8deluxe_race_rules_updates",
     "mariokart8deluxe_races_aggregate_bool_exp",
     "mariokart8deluxe_races_aggregate_bool_exp_bool_and",
     "mariokart8deluxe_races_aggregate_bool_exp_bool_or",
     "mariokart8deluxe_races_aggregate_bool_exp_count",
-    "mariokart8deluxe_races_aggregate_order_by",
     "mariokart8deluxe_races_arr_rel_insert_input",
-    "mariokart8deluxe_races_avg_order_by",
     "mariokart8deluxe_races_bool_exp",
     "mariokart8deluxe_races_constraint",
-    "mariokart8deluxe_races_inc_input",
     "mariokart8deluxe_races_insert_input",
-    "mariokart8deluxe_races_max_order_by",
-    "mariokart8deluxe_races_min_order_by",
     "mariokart8deluxe_races_obj_rel_insert_input",
     "mariokart8deluxe_races_on_conflict",
-    "mariokart8deluxe_races_order_by",
-    "mariokart8deluxe_races_pk_columns_input",
     "mariokart8deluxe_races_select_column",
     "mariokart8deluxe_races_select_column_mariokart8deluxe_races_aggregate_bool_exp_bool_and_arguments_columns",
     "mariokart8deluxe_races_select_column_mariokart8deluxe_races_aggregate_bool_exp_bool_or_arguments_columns",
-    "mariokart8deluxe_races_set_input",
-    "mariokart8deluxe_races_stddev_order_by",
-    "mariokart8deluxe_races_stddev_pop_order_by",
-    "mariokart8deluxe_races_stddev_samp_order_by",
-    "mariokart8deluxe_races_stream_cursor_input",
-    "mariokart8deluxe_races_stream_cursor_value_input",
-    "mariokart8deluxe_races_sum_order_by",
     "mariokart8deluxe_races_update_column",
-    "mariokart8deluxe_races_updates",
-    "mariokart8deluxe_races_var_pop_order_by",
-    "mariokart8deluxe_races_var_samp_order_by",
-    "mariokart8deluxe_races_variance_order_by",
     "niconico_accounts_bool_exp",
     "niconico_accounts_constraint",
     "niconico_accounts_insert_input",
     "niconico_accounts_obj_rel_insert_input",
     "niconico_accounts_on_conflict",
-    "niconico_accounts_order_by",
-    "niconico_accounts_pk_columns_input",
-    "niconico_accounts_select_column",
-    "niconico_accounts_set_input",
-    "niconico_accounts_stream_cursor_input",
-    "niconico_accounts_stream_cursor_value_input",
     "niconico_accounts_update_column",
-    "niconico_accounts_updates",
     "niconico_channels_bool_exp",
     "niconico_channels_constraint",
     "niconico_channels_insert_input",
     "niconico_channels_obj_rel_insert_input",
     "niconico_channels_on_conflict",
-    "niconico_channels_order_by",
-    "niconico_channels_pk_columns_input",
-    "niconico_channels_select_column",
-    "niconico_channels_set_input",
-    "niconico_channels_stream_cursor_input",
-    "niconico_channels_stream_cursor_value_input",
     "niconico_channels_update_column",
-    "niconico_channels_updates",
     "niconico_communities_bool_exp",
     "niconico_communities_constraint",
     "niconico_communities_insert_input",
     "niconico_communities_obj_rel_insert_input",
     "niconico_communities_on_conflict",
-    "niconico_communities_order_by",
-    "niconico_communities_pk_columns_input",
-    "niconico_communities_select_column",
-    "niconico_communities_set_input",
-    "niconico_communities_stream_cursor_input",
-    "niconico_communities_stream_cursor_value_input",
     "niconico_communities_update_column",
-    "niconico_communities_updates",
     "niconico_plus_channels_bool_exp",
     "niconico_plus_channels_constraint",
     "niconico_plus_channels_insert_input",
     "niconico_plus_channels_obj_rel_insert_input",
     "niconico_plus_channels_on_conflict",
-    "niconico_plus_channels_order_by",
-    "niconico_plus_channels_pk_columns_input",
-    "niconico_plus_channels_select_column",
-    "niconico_plus_channels_set_input",
-    "niconico_plus_channels_stream_cursor_input",
-    "niconico_plus_channels_stream_cursor_value_input",
     "niconico_plus_channels_update_column",
-    "niconico_plus_channels_updates",
     "niconico_videos_bool_exp",
     "niconico_videos_constraint",
     "niconico_videos_insert_input",
     "niconico_videos_obj_rel_insert_input",
     "niconico_videos_on_conflict",
-    "niconico_videos_order_by",
-    "niconico_videos_pk_columns_input",
-    "niconico_videos_select_column",
-    "niconico_videos_set_input",
-    "niconico_videos_stream_cursor_input",
-    "niconico_videos_stream_cursor_value_input",
     "niconico_videos_update_column",
-    "niconico_videos_updates",
-    "order_by",
     "person_fediverse_accounts_aggregate_bool_exp",
     "person_fediverse_accounts_aggregate_bool_exp_count",
-    "person_fediverse_accounts_aggregate_order_by",
     "person_fediverse_accounts_arr_rel_insert_input",
     "person_fediverse_accounts_bool_exp",
     "person_fediverse_accounts_constraint",
     "person_fediverse_accounts_insert_input",
-    "person_fediverse_accounts_max_order_by",
-    "person_fediverse_accounts_min_order_by",
     "person_fediverse_accounts_on_conflict",
-    "person_fediverse_accounts_order_by",
-    "person_fediverse_accounts_pk_columns_input",
     "person_fediverse_accounts_select_column",
-    "person_fediverse_accounts_set_input",
-    "person_fediverse_accounts_stream_cursor_input",
-    "person_fediverse_accounts_stream_cursor_value_input",
     "person_fediverse_accounts_update_column",
-    "person_fediverse_accounts_updates",
     "person_niconico_accounts_aggregate_bool_exp",
     "person_niconico_accounts_aggregate_bool_exp_count",
-    "person_niconico_accounts_aggregate_order_by",
     "person_niconico_accounts_arr_rel_insert_input",
     "person_niconico_accounts_bool_exp",
     "person_niconico_accounts_constraint",
     "person_niconico_accounts_insert_input",
-    "person_niconico_accounts_max_order_by",
-    "person_niconico_accounts_min_order_by",
     "person_niconico_accounts_on_conflict",
-    "person_niconico_accounts_order_by",
-    "person_niconico_accounts_pk_columns_input",
     "person_niconico_accounts_select_column",
-    "person_niconico_accounts_set_input",
-    "person_niconico_accounts_stream_cursor_input",
-    "person_niconico_accounts_stream_cursor_value_input",
     "person_niconico_accounts_update_column",
-    "person_niconico_accounts_updates",
     "person_niconico_channels_aggregate_bool_exp",
     "person_niconico_channels_aggregate_bool_exp_count",
-    "person_niconico_channels_aggregate_order_by",
     "person_niconico_channels_arr_rel_insert_input",
     "person_niconico_channels_bool_exp",
     "person_niconico_channels_constraint",
     "person_niconico_channels_insert_input",
-    "person_niconico_channels_max_order_by",
-    "person_niconico_channels_min_order_by",
     "person_niconico_channels_on_conflict",
-    "person_niconico_channels_order_by",
-    "person_niconico_channels_pk_columns_input",
     "person_niconico_channels_select_column",
-    "person_niconico_channels_set_input",
-    "person_niconico_channels_stream_cursor_input",
-    "person_niconico_channels_stream_cursor_value_input",
     "person_niconico_channels_update_column",
-    "person_niconico_channels_updates",
     "person_niconico_communities_aggregate_bool_exp",
     "person_niconico_communities_aggregate_bool_exp_count",
-    "person_niconico_communities_aggregate_order_by",
     "person_niconico_communities_arr_rel_insert_input",
     "person_niconico_communities_bool_exp",
     "person_niconico_communities_constraint",
     "person_niconico_communities_insert_input",
-    "person_niconico_communities_max_order_by",
-    "person_niconico_communities_min_order_by",
     "person_niconico_communities_on_conflict",
-    "person_niconico_communities_order_by",
-    "person_niconico_communities_pk_columns_input",
     "person_niconico_communities_select_column",
-    "person_niconico_communities_set_input",
-    "person_niconico_communities_stream_cursor_input",
-    "person_niconico_communities_stream_cursor_value_input",
     "person_niconico_communities_update_column",
-    "person_niconico_communities_updates",
     "person_niconico_plus_channels_aggregate_bool_exp",
     "person_niconico_plus_channels_aggregate_bool_exp_count",
-    "person_niconico_plus_channels_aggregate_order_by",
     "person_niconico_plus_channels_arr_rel_insert_input",
     "person_niconico_plus_channels_bool_exp",
     "person_niconico_plus_channels_constraint",
     "person_niconico_plus_channels_insert_input",
-    "person_niconico_plus_channels_max_order_by",
-    "person_niconico_plus_channels_min_order_by",
     "person_niconico_plus_channels_on_conflict",
-    "person_niconico_plus_channels_order_by",
-    "person_niconico_plus_channels_pk_columns_input",
     "person_niconico_plus_channels_select_column",
-    "person_niconico_plus_channels_set_input",
-    "person_niconico_plus_channels_stream_cursor_input",
-    "person_niconico_plus_channels_stream_cursor_value_input",
     "person_niconico_plus_channels_update_column",
-    "person_niconico_plus_channels_updates",
     "person_twitter_accounts_aggregate_bool_exp",
     "person_twitter_accounts_aggregate_bool_exp_count",
-    "person_twitter_accounts_aggregate_order_by",
     "person_twitter_accounts_arr_rel_insert_input",
     "person_twitter_accounts_bool_exp",
     "person_twitter_accounts_constraint",
     "person_twitter_accounts_insert_input",
-    "person_twitter_accounts_max_order_by",
-    "person_twitter_accounts_min_order_by",
     "person_twitter_accounts_on_conflict",
-    "person_twitter_accounts_order_by",
-    "person_twitter_accounts_pk_columns_input",
     "person_twitter_accounts_select_column",
-    "person_twitter_accounts_set_input",
-    "person_twitter_accounts_stream_cursor_input",
-    "person_twitter_accounts_stream_cursor_value_input",
     "person_twitter_accounts_update_column",
-    "person_twitter_accounts_updates",
     "person_youtube_channels_aggregate_bool_exp",
     "person_youtube_channels_aggregate_bool_exp_count",
-    "person_youtube_channels_aggregate_order_by",
     "person_youtube_channels_arr_rel_insert_input",
     "person_youtube_channels_bool_exp",
     "person_youtube_channels_constraint",
     "person_youtube_channels_insert_input",
-    "person_youtube_channels_max_order_by",
-    "person_youtube_channels_min_order_by",
     "person_youtube_channels_on_conflict",
-    "person_youtube_channels_order_by",
-    "person_youtube_channels_pk_columns_input",
     "person_youtube_channels_select_column",
-    "person_youtube_channels_set_input",
-    "person_youtube_channels_stream_cursor_input",
-    "person_youtube_channels_stream_cursor_value_input",
     "person_youtube_channels_update_column",
-    "person_youtube_channels_updates",
     "persons_bool_exp",
     "persons_constraint",
     "persons_insert_input",
     "persons_obj_rel_insert_input",
     "persons_on_conflict",
-    "persons_order_by",
-    "persons_pk_columns_input",
-    "persons_select_column",
-    "persons_set_input",
-    "persons_stream_cursor_input",
-    "persons_stream_cursor_value_input",
     "persons_update_column",
-    "persons_updates",
     "program_amongus_maps_aggregate_bool_exp",
     "program_amongus_maps_aggregate_bool_exp_count",
-    "program_amongus_maps_aggregate_order_by",
     "program_amongus_maps_arr_rel_insert_input",
     "program_amongus_maps_bool_exp",
     "program_amongus_maps_constraint",
     "program_amongus_maps_insert_input",
-    "program_amongus_maps_max_order_by",
-    "program_amongus_maps_min_order_by",
     "program_amongus_maps_on_conflict",
-    "program_amongus_maps_order_by",
-    "program_amongus_maps_pk_columns_input",
     "program_amongus_maps_select_column",
-    "program_amongus_maps_set_input",
-    "program_amongus_maps_stream_cursor_input",
-    "program_amongus_maps_stream_cursor_value_input",
     "program_amongus_maps_update_column",
-    "program_amongus_maps_updates",
     "program_amongus_mods_aggregate_bool_exp",
     "program_amongus_mods_aggregate_bool_exp_count",
-    "program_amongus_mods_aggregate_order_by",
     "program_amongus_mods_arr_rel_insert_input",
     "program_amongus_mods_bool_exp",
     "program_amongus_mods_constraint",
     "program_amongus_mods_insert_input",
-    "program_amongus_mods_max_order_by",
-    "program_amongus_mods_min_order_by",
     "program_amongus_mods_on_conflict",
-    "program_amongus_mods_order_by",
-    "program_amongus_mods_pk_columns_input",
     "program_amongus_mods_select_column",
-    "program_amongus_mods_set_input",
-    "program_amongus_mods_stream_cursor_input",
-    "program_amongus_mods_stream_cursor_value_input",
     "program_amongus_mods_update_column",
-    "program_amongus_mods_updates",
     "program_amongus_vanilla_versions_aggregate_bool_exp",
     "program_amongus_vanilla_versions_aggregate_bool_exp_count",
-    "program_amongus_vanilla_versions_aggregate_order_by",
     "program_amongus_vanilla_versions_arr_rel_insert_input",
     "program_amongus_vanilla_versions_bool_exp",
     "program_amongus_vanilla_versions_constraint",
     "program_amongus_vanilla_versions_insert_input",
-    "program_amongus_vanilla_versions_max_order_by",
-    "program_amongus_vanilla_versions_min_order_by",
     "program_amongus_vanilla_versions_on_conflict",
-    "program_amongus_vanilla_versions_order_by",
-    "program_amongus_vanilla_versions_pk_columns_input",
     "program_amongus_vanilla_versions_select_column",
-    "program_amongus_vanilla_versions_set_input",
-    "program_amongus_vanilla_versions_stream_cursor_input",
-    "program_amongus_vanilla_versions_stream_cursor_value_input",
     "program_amongus_vanilla_versions_update_column",
-    "program_amongus_vanilla_versions_updates",
     "program_live_archives_aggregate_bool_exp",
     "program_live_archives_aggregate_bool_exp_count",
-    "program_live_archives_aggregate_order_by",
     "program_live_archives_arr_rel_insert_input",
     "program_live_archives_bool_exp",
     "program_live_archives_constraint",
     "program_live_archives_insert_input",
-    "program_live_archives_max_order_by",
-    "program_live_archives_min_order_by",
     "program_live_archives_on_conflict",
-    "program_live_archives_order_by",
-    "program_live_archives_pk_columns_input",
     "program_live_archives_select_column",
-    "program_live_archives_set_input",
-    "program_live_archives_stream_cursor_input",
-    "program_live_archives_stream_cursor_value_input",
     "program_live_archives_update_column",
-    "program_live_archives_updates",
     "program_niconico_videos_aggregate_bool_exp",
     "program_niconico_videos_aggregate_bool_exp_count",
-    "program_niconico_videos_aggregate_order_by",
     "program_niconico_videos_arr_rel_insert_input",
     "program_niconico_videos_bool_exp",
     "program_niconico_videos_constraint",
     "program_niconico_videos_insert_input",
-    "program_niconico_videos_max_order_by",
-    "program_niconico_videos_min_order_by",
     "program_niconico_videos_on_conflict",
-    "program_niconico_videos_order_by",
-    "program_niconico_videos_pk_columns_input",
     "program_niconico_videos_select_column",
-    "program_niconico_videos_set_input",
-    "program_niconico_videos_stream_cursor_input",
-    "program_niconico_videos_stream_cursor_value_input",
     "program_niconico_videos_update_column",
-    "program_niconico_videos_updates",
     "program_persons_aggregate_bool_exp",
     "program_persons_aggregate_bool_exp_bool_and",
     "program_persons_aggregate_bool_exp_bool_or",
     "program_persons_aggregate_bool_exp_count",
-    "program_persons_aggregate_order_by",
     "program_persons_arr_rel_insert_input",
     "program_persons_bool_exp",
     "program_persons_constraint",
     "program_persons_insert_input",
-    "program_persons_max_order_by",
-    "program_persons_min_order_by",
     "program_persons_on_conflict",
-    "program_persons_order_by",
-    "program_persons_pk_columns_input",
     "program_persons_select_column",
     "program_persons_select_column_program_persons_aggregate_bool_exp_bool_and_arguments_columns",
     "program_persons_select_column_program_persons_aggregate_bool_exp_bool_or_arguments_columns",
-    "program_persons_set_input",
-    "program_persons_stream_cursor_input",
-    "program_persons_stream_cursor_value_input",
     "program_persons_update_column",
-    "program_persons_updates",
     "program_projects_aggregate_bool_exp",
     "program_projects_aggregate_bool_exp_count",
-    "program_projects_aggregate_order_by",
     "program_projects_arr_rel_insert_input",
     "program_projects_bool_exp",
     "program_projects_constraint",
     "program_projects_insert_input",
-    "program_projects_max_order_by",
-    "program_projects_min_order_by",
     "program_projects_on_conflict",
-    "program_projects_order_by",
-    "program_projects_pk_columns_input",
     "program_projects_select_column",
-    "program_projects_set_input",
-    "program_projects_stream_cursor_input",
-    "program_projects_stream_cursor_value_input",
     "program_projects_update_column",
-    "program_projects_updates",
     "program_twitter_announcements_aggregate_bool_exp",
     "program_twitter_announcements_aggregate_bool_exp_count",
-    "program_twitter_announcements_aggregate_order_by",
     "program_twitter_announcements_arr_rel_insert_input",
     "program_twitter_announcements_bool_exp",
     "program_twitter_announcements_constraint",
     "program_twitter_announcements_insert_input",
-    "program_twitter_announcements_max_order_by",
-    "program_twitter_announcements_min_order_by",
     "program_twitter_announcements_on_conflict",
-    "program_twitter_announcements_order_by",
-    "program_twitter_announcements_pk_columns_input",
     "program_twitter_announcements_select_column",
-    "program_twitter_announcements_set_input",
-    "program_twitter_announcements_stream_cursor_input",
-    "program_twitter_announcements_stream_cursor_value_input",
     "program_twitter_announcements_update_column",
-    "program_twitter_announcements_updates",
     "programs_bool_exp",
     "programs_constraint",
     "programs_insert_input",
     "programs_obj_rel_insert_input",
     "programs_on_conflict",
-    "programs_order_by",
-    "programs_pk_columns_input",
-    "programs_select_column",
-    "programs_set_input",
-    "programs_stream_cursor_input",
-    "programs_stream_cursor_value_input",
     "programs_update_column",
-    "programs_updates",
     "project_niconico_videos_aggregate_bool_exp",
     "project_niconico_videos_aggregate_bool_exp_count",
-    "project_niconico_videos_aggregate_order_by",
     "project_niconico_videos_arr_rel_insert_input",
     "project_niconico_videos_bool_exp",
     "project_niconico_videos_constraint",
     "project_niconico_videos_insert_input",
-    "project_niconico_videos_max_order_by",
-    "project_niconico_videos_min_order_by",
     "project_niconico_videos_on_conflict",
-    "project_niconico_videos_order_by",
-    "project_niconico_videos_pk_columns_input",
     "project_niconico_videos_select_column",
-    "project_niconico_videos_set_input",
-    "project_niconico_videos_stream_cursor_input",
-    "project_niconico_videos_stream_cursor_value_input",
     "project_niconico_videos_update_column",
-    "project_niconico_videos_updates",
     "projects_bool_exp",
     "projects_constraint",
     "projects_insert_input",
     "projects_obj_rel_insert_input",
     "projects_on_conflict",
-    "projects_order_by",
-    "projects_pk_columns_input",
-    "projects_select_column",
-    "projects_set_input",
-    "projects_stream_cursor_input",
-    "projects_stream_cursor_value_input",
     "projects_update_column",
-    "projects_updates",
     "timestamptz_comparison_exp",
     "twitter_accounts_bool_exp",
     "twitter_accounts_constraint",
     "twitter_accounts_insert_input",
     "twitter_accounts_obj_rel_insert_input",
     "twitter_accounts_on_conflict",
-    "twitter_accounts_order_by",
-    "twitter_accounts_pk_columns_input",
-    "twitter_accounts_select_column",
-    "twitter_accounts_set_input",
-    "twitter_accounts_stream_cursor_input",
-    "twitter_accounts_stream_cursor_value_input",
     "twitter_accounts_update_column",
-    "twitter_accounts_updates",
     "twitter_tweet_images_aggregate_bool_exp",
     "twitter_tweet_images_aggregate_bool_exp_count",
-    "twitter_tweet_images_aggregate_order_by",
     "twitter_tweet_images_arr_rel_insert_input",
-    "twitter_tweet_images_avg_order_by",
     "twitter_tweet_images_bool_exp",
     "twitter_tweet_images_constraint",
-    "twitter_tweet_images_inc_input",
     "twitter_tweet_images_insert_input",
-    "twitter_tweet_images_max_order_by",
-    "twitter_tweet_images_min_order_by",
     "twitter_tweet_images_obj_rel_insert_input",
     "twitter_tweet_images_on_conflict",
-    "twitter_tweet_images_order_by",
-    "twitter_tweet_images_pk_columns_input",
     "twitter_tweet_images_select_column",
-    "twitter_tweet_images_set_input",
-    "twitter_tweet_images_stddev_order_by",
-    "twitter_tweet_images_stddev_pop_order_by",
-    "twitter_tweet_images_stddev_samp_order_by",
-    "twitter_tweet_images_stream_cursor_input",
-    "twitter_tweet_images_stream_cursor_value_input",
-    "twitter_tweet_images_sum_order_by",
     "twitter_tweet_images_update_column",
-    "twitter_tweet_images_updates",
-    "twitter_tweet_images_var_pop_order_by",
-    "twitter_tweet_images_var_samp_order_by",
-    "twitter_tweet_images_variance_order_by",
     "twitter_tweets_bool_exp",
     "twitter_tweets_constraint",
     "twitter_tweets_insert_input",
     "twitter_tweets_obj_rel_insert_input",
     "twitter_tweets_on_conflict",
-    "twitter_tweets_order_by",
-    "twitter_tweets_pk_columns_input",
-    "twitter_tweets_select_column",
-    "twitter_tweets_set_input",
-    "twitter_tweets_stream_cursor_input",
-    "twitter_tweets_stream_cursor_value_input",
     "twitter_tweets_update_column",
-    "twitter_tweets_updates",
     "uuid_comparison_exp",
     "youtube_channels_bool_exp",
     "youtube_channels_constraint",
     "youtube_channels_insert_input",
     "youtube_channels_obj_rel_insert_input",
     "youtube_channels_on_conflict",
-    "youtube_channels_order_by",
-    "youtube_channels_pk_columns_input",
-    "youtube_channels_select_column",
-    "youtube_channels_set_input",
-    "youtube_channels_stream_cursor_input",
-    "youtube_channels_stream_cursor_value_input",
     "youtube_channels_update_column",
-    "youtube_channels_updates",
     "youtube_lives_aggregate_bool_exp",
     "youtube_lives_aggregate_bool_exp_count",
-    "youtube_lives_aggregate_order_by",
     "youtube_lives_arr_rel_insert_input",
     "youtube_lives_bool_exp",
     "youtube_lives_constraint",
     "youtube_lives_insert_input",
-    "youtube_lives_max_order_by",
-    "youtube_lives_min_order_by",
     "youtube_lives_obj_rel_insert_input",
     "youtube_lives_on_conflict",
-    "youtube_lives_order_by",
-    "youtube_lives_pk_columns_input",
     "youtube_lives_select_column",
-    "youtube_lives_set_input",
-    "youtube_lives_stream_cursor_input",
-    "youtube_lives_stream_cursor_value_input",
     "youtube_lives_update_column",
-    "youtube_lives_updates",
     "youtube_videos_bool_exp",
     "youtube_videos_constraint",
     "youtube_videos_insert_input",
     "youtube_videos_obj_rel_insert_input",
     "youtube_videos_on_conflict",
-    "youtube_videos_order_by",
-    "youtube_videos_pk_columns_input",
-    "youtube_videos_select_column",
-    "youtube_videos_set_input",
-    "youtube_videos_stream_cursor_input",
-    "youtube_videos_stream_cursor_value_input",
     "youtube_videos_update_column",
-    "youtube_videos_updates",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return __all__
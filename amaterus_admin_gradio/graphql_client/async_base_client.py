@@ -0,0 +1,769 @@
+# Generated by ariadne-codegen
+
+import enum
+import json
+import re
+from functools import lru_cache
+from typing import (
+    IO,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Sequence,
+    TYPE_CHECKING,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
+from uuid import uuid4
+
+import httpx
+import orjson
+from pydantic import BaseModel, ValidationError
+from pydantic_core import to_jsonable_python
+
+from ..utility.single_flight import SingleFlight
+from .base_model import UNSET, Upload
+from .exceptions import (
+    GraphQLClientError,
+    GraphQLClientGraphQLMultiError,
+    GraphQLClientHttpError,
+    GraphQLClientInvalidMessageFormat,
+    GraphQLClientInvalidResponseError,
+)
+
+if TYPE_CHECKING:
+    from graphql import FragmentDefinitionNode
+
+try:
+    from websockets.client import (  # type: ignore[import-not-found,unused-ignore]
+        WebSocketClientProtocol,
+        connect as ws_connect,
+    )
+    from websockets.typing import (  # type: ignore[import-not-found,unused-ignore]
+        Data,
+        Origin,
+        Subprotocol,
+    )
+except ImportError:
+    from contextlib import asynccontextmanager
+
+    @asynccontextmanager  # type: ignore
+    async def ws_connect(*args, **kwargs):  # pylint: disable=unused-argument
+        raise NotImplementedError("Subscriptions require 'websockets' package.")
+        yield  # pylint: disable=unreachable
+
+    WebSocketClientProtocol = Any  # type: ignore[misc,assignment,unused-ignore]
+    Data = Any  # type: ignore[misc,assignment,unused-ignore]
+    Origin = Any  # type: ignore[misc,assignment,unused-ignore]
+
+    def Subprotocol(*args, **kwargs):  # type: ignore # pylint: disable=invalid-name
+        raise NotImplementedError("Subscriptions require 'websockets' package.")
+
+
+Self = TypeVar("Self", bound="AsyncBaseClient")
+ResultT = TypeVar("ResultT", bound=BaseModel)
+
+GRAPHQL_TRANSPORT_WS = "graphql-transport-ws"
+
+
+@lru_cache(maxsize=256)
+def is_query_operation(query: str, operation_name: Optional[str]) -> bool:
+    # Without parsing the document (graphql-core is imported lazily)
+    if operation_name is None:
+        return query.lstrip().startswith(("{", "query"))
+
+    match = re.search(
+        rf"\b(query|mutation|subscription)\s+{re.escape(operation_name)}\b",
+        query,
+    )
+    return match is not None and match.group(1) == "query"
+
+
+class GraphQLTransportWSMessageType(str, enum.Enum):
+    CONNECTION_INIT = "connection_init"
+    CONNECTION_ACK = "connection_ack"
+    PING = "ping"
+    PONG = "pong"
+    SUBSCRIBE = "subscribe"
+    NEXT = "next"
+    ERROR = "error"
+    COMPLETE = "complete"
+
+
+class GraphQLResponse(BaseModel, Generic[ResultT]):
+    data: Optional[ResultT] = None
+    errors: Optional[List[Dict[str, Any]]] = None
+
+
+class GraphQLOperation(Generic[ResultT]):
+    def __init__(
+        self,
+        query: str,
+        operation_name: str,
+        variables: Dict[str, Any],
+        result_type: Type[ResultT],
+    ) -> None:
+        self.query = query
+        self.operation_name = operation_name
+        self.variables = variables
+        self.result_type = result_type
+
+    def parse_data(self, data: Dict[str, Any]) -> ResultT:
+        return self.result_type.model_validate(data)
+
+
+class GraphQLBatchResult:
+    def __init__(
+        self,
+        response: httpx.Response,
+        operations: Sequence[GraphQLOperation[Any]],
+        data_list: List[Optional[Dict[str, Any]]],
+        errors_list: List[List[Dict[str, Any]]],
+    ) -> None:
+        self.response = response
+        self.operations = operations
+        self.data_list = data_list
+        self.errors_list = errors_list
+
+    def _get_index(self, operation: GraphQLOperation[Any]) -> int:
+        for index, batched_operation in enumerate(self.operations):
+            if batched_operation is operation:
+                return index
+        raise ValueError("The operation is not a part of this batch")
+
+    def get_errors(
+        self, operation: GraphQLOperation[Any]
+    ) -> Optional[GraphQLClientGraphQLMultiError]:
+        index = self._get_index(operation)
+        errors = self.errors_list[index]
+        if not errors:
+            return None
+        return GraphQLClientGraphQLMultiError.from_errors_dicts(
+            errors_dicts=errors, data=self.data_list[index]
+        )
+
+    def get(self, operation: GraphQLOperation[ResultT]) -> ResultT:
+        errors = self.get_errors(operation)
+        if errors is not None:
+            raise errors
+
+        data = self.data_list[self._get_index(operation)]
+        if data is None:
+            raise GraphQLClientInvalidResponseError(response=self.response)
+
+        return operation.parse_data(data)
+
+
+class AsyncBaseClient:
+    def __init__(
+        self,
+        url: str = "",
+        headers: Optional[Dict[str, str]] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+        ws_url: str = "",
+        ws_headers: Optional[Dict[str, Any]] = None,
+        ws_origin: Optional[str] = None,
+        ws_connection_init_payload: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self.url = url
+        self.headers = headers
+        self.http_client = (
+            http_client if http_client else httpx.AsyncClient(headers=headers)
+        )
+
+        self.ws_url = ws_url
+        self.ws_headers = ws_headers or {}
+        self.ws_origin = Origin(ws_origin) if ws_origin else None
+        self.ws_connection_init_payload = ws_connection_init_payload
+
+        # Concurrent identical queries share one request and its response
+        self.single_flight: SingleFlight[httpx.Response] = SingleFlight()
+
+    async def __aenter__(self: Self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: object,
+        exc_val: object,
+        exc_tb: object,
+    ) -> None:
+        await self.http_client.aclose()
+
+    async def execute(
+        self,
+        query: str,
+        operation_name: Optional[str] = None,
+        variables: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        processed_variables, files, files_map = self._process_variables(variables)
+
+        if files and files_map:
+            return await self._execute_multipart(
+                query=query,
+                operation_name=operation_name,
+                variables=processed_variables,
+                files=files,
+                files_map=files_map,
+                **kwargs,
+            )
+
+        # Requests with their own options (e.g. headers) are not shared
+        if not kwargs and is_query_operation(query, operation_name):
+            key = (
+                query,
+                operation_name,
+                orjson.dumps(
+                    processed_variables,
+                    default=to_jsonable_python,
+                    option=orjson.OPT_SORT_KEYS,
+                ),
+            )
+            return await self.single_flight.do_async(
+                key,
+                lambda: self._execute_json(
+                    query=query,
+                    operation_name=operation_name,
+                    variables=processed_variables,
+                ),
+            )
+
+        return await self._execute_json(
+            query=query,
+            operation_name=operation_name,
+            variables=processed_variables,
+            **kwargs,
+        )
+
+    async def execute_batch(
+        self,
+        operations: Sequence[GraphQLOperation[Any]],
+        merge: bool = False,
+        **kwargs: Any,
+    ) -> GraphQLBatchResult:
+        # Send several operations in one HTTP request, either as a JSON array
+        # (Hasura batching) or merged into one multi-root operation
+        processed_variables_list: List[Dict[str, Any]] = []
+        for operation in operations:
+            processed_variables, files, _ = self._process_variables(operation.variables)
+            if files:
+                raise GraphQLClientError("File uploads cannot be batched.")
+            processed_variables_list.append(processed_variables)
+
+        if merge:
+            return await self._execute_batch_merged(
+                operations=operations,
+                processed_variables_list=processed_variables_list,
+                **kwargs,
+            )
+
+        response = await self._post_json(
+            payload=[
+                {
+                    "query": operation.query,
+                    "operationName": operation.operation_name,
+                    "variables": processed_variables,
+                }
+                for operation, processed_variables in zip(
+                    operations, processed_variables_list
+                )
+            ],
+            **kwargs,
+        )
+        response_json = self._get_response_json(response)
+        if not isinstance(response_json, list) or len(response_json) != len(operations):
+            raise GraphQLClientInvalidResponseError(response=response)
+
+        data_list: List[Optional[Dict[str, Any]]] = []
+        errors_list: List[List[Dict[str, Any]]] = []
+        for item in response_json:
+            if not isinstance(item, dict) or (
+                "data" not in item and "errors" not in item
+            ):
+                raise GraphQLClientInvalidResponseError(response=response)
+            data_list.append(item.get("data"))
+            errors_list.append(item.get("errors") or [])
+
+        return GraphQLBatchResult(
+            response=response,
+            operations=operations,
+            data_list=data_list,
+            errors_list=errors_list,
+        )
+
+    async def _execute_batch_merged(
+        self,
+        operations: Sequence[GraphQLOperation[Any]],
+        processed_variables_list: List[Dict[str, Any]],
+        **kwargs: Any,
+    ) -> GraphQLBatchResult:
+        # Variables and root fields of the i-th operation are prefixed with
+        # "b{i}_" so that the operations do not collide in one document.
+        # graphql-core is imported here to keep it out of the startup path.
+        from graphql import (
+            DocumentNode,
+            FieldNode,
+            FragmentDefinitionNode,
+            NameNode,
+            OperationDefinitionNode,
+            OperationType,
+            SelectionSetNode,
+            VariableDefinitionNode,
+            VariableNode,
+            Visitor,
+            parse,
+            print_ast,
+            visit,
+        )
+
+        class VariablePrefixer(Visitor):
+            def __init__(self, prefix: str) -> None:
+                super().__init__()
+                self.prefix = prefix
+
+            def enter_variable(self, node: VariableNode, *_args: Any) -> VariableNode:
+                return VariableNode(name=NameNode(value=self.prefix + node.name.value))
+
+        operation_type: Optional[OperationType] = None
+        operation_names: List[str] = []
+        variable_definitions: List[VariableDefinitionNode] = []
+        selections: List[FieldNode] = []
+        fragments: Dict[str, FragmentDefinitionNode] = {}
+        variables: Dict[str, Any] = {}
+
+        for index, (operation, processed_variables) in enumerate(
+            zip(operations, processed_variables_list)
+        ):
+            prefix = f"b{index}_"
+            document = parse(operation.query)
+            for definition in document.definitions:
+                if isinstance(definition, FragmentDefinitionNode):
+                    self._add_merged_fragment(fragments, definition)
+                    continue
+
+                if (
+                    not isinstance(definition, OperationDefinitionNode)
+                    or definition.name is None
+                    or definition.name.value != operation.operation_name
+                ):
+                    continue
+
+                if definition.operation == OperationType.SUBSCRIPTION or (
+                    operation_type is not None
+                    and definition.operation != operation_type
+                ):
+                    raise GraphQLClientError(
+                        "Only operations of the same type can be merged."
+                    )
+                operation_type = definition.operation
+                operation_names.append(definition.name.value)
+
+                prefixed = cast(
+                    OperationDefinitionNode,
+                    visit(definition, VariablePrefixer(prefix=prefix)),
+                )
+                variable_definitions.extend(prefixed.variable_definitions)
+                for selection in prefixed.selection_set.selections:
+                    if not isinstance(selection, FieldNode):
+                        raise GraphQLClientError(
+                            "Only root fields can be merged, not fragments."
+                        )
+                    response_key = (selection.alias or selection.name).value
+                    selections.append(
+                        FieldNode(
+                            alias=NameNode(value=prefix + response_key),
+                            name=selection.name,
+                            arguments=selection.arguments,
+                            directives=selection.directives,
+                            selection_set=selection.selection_set,
+                        )
+                    )
+
+            variables.update(
+                {prefix + name: value for name, value in processed_variables.items()}
+            )
+
+        if operation_type is None or len(operation_names) != len(operations):
+            raise GraphQLClientError("Operation definition not found.")
+
+        merged_operation_name = "Batch__" + "__".join(operation_names)
+        merged_operation = OperationDefinitionNode(
+            operation=operation_type,
+            name=NameNode(value=merged_operation_name),
+            variable_definitions=tuple(variable_definitions),
+            directives=(),
+            selection_set=SelectionSetNode(selections=tuple(selections)),
+        )
+        merged_document = DocumentNode(
+            definitions=(merged_operation, *fragments.values())
+        )
+
+        response = await self._execute_json(
+            query=print_ast(merged_document),
+            operation_name=merged_operation_name,
+            variables=variables,
+            **kwargs,
+        )
+        response_json = self._get_response_json(response)
+        if (not isinstance(response_json, dict)) or (
+            "data" not in response_json and "errors" not in response_json
+        ):
+            raise GraphQLClientInvalidResponseError(response=response)
+
+        data = response_json.get("data")
+        errors = response_json.get("errors") or []
+
+        data_list: List[Optional[Dict[str, Any]]] = []
+        errors_list: List[List[Dict[str, Any]]] = []
+        for index in range(len(operations)):
+            prefix = f"b{index}_"
+            data_list.append(
+                {
+                    key[len(prefix) :]: value
+                    for key, value in data.items()
+                    if key.startswith(prefix)
+                }
+                if data is not None
+                else None
+            )
+
+            operation_errors: List[Dict[str, Any]] = []
+            for error in errors:
+                path = error.get("path")
+                if not path or not isinstance(path[0], str):
+                    # Not tied to a root field, so it applies to every operation
+                    operation_errors.append(error)
+                elif path[0].startswith(prefix):
+                    operation_errors.append(
+                        {**error, "path": [path[0][len(prefix) :], *path[1:]]}
+                    )
+            errors_list.append(operation_errors)
+
+        return GraphQLBatchResult(
+            response=response,
+            operations=operations,
+            data_list=data_list,
+            errors_list=errors_list,
+        )
+
+    def _add_merged_fragment(
+        self,
+        fragments: Dict[str, "FragmentDefinitionNode"],
+        fragment: "FragmentDefinitionNode",
+    ) -> None:
+        from graphql import Visitor, print_ast, visit
+
+        name = fragment.name.value
+        existing_fragment = fragments.get(name)
+        if existing_fragment is not None:
+            if print_ast(existing_fragment) != print_ast(fragment):
+                raise GraphQLClientError(f"Conflicting fragment: {name}")
+            return
+
+        class VariableFinder(Visitor):
+            def enter_variable(self, *_args: Any) -> None:
+                raise GraphQLClientError(
+                    f"Fragment using variables cannot be merged: {name}"
+                )
+
+        visit(fragment, VariableFinder())
+        fragments[name] = fragment
+
+    def _get_response_json(self, response: httpx.Response) -> Any:
+        if not response.is_success:
+            raise GraphQLClientHttpError(
+                status_code=response.status_code, response=response
+            )
+
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError as exc:
+            raise GraphQLClientInvalidResponseError(response=response) from exc
+
+    def parse_response(
+        self, response: httpx.Response, result_type: Type[ResultT]
+    ) -> ResultT:
+        # Validate the result models straight from the response bytes
+        # instead of building an intermediate dict first
+        if not response.is_success:
+            raise GraphQLClientHttpError(
+                status_code=response.status_code, response=response
+            )
+
+        try:
+            graphql_response = GraphQLResponse[result_type].model_validate_json(  # type: ignore[valid-type]
+                response.content
+            )
+        except ValidationError:
+            # Invalid JSON, or partial data along with errors
+            return result_type.model_validate(self.get_data(response))
+
+        if graphql_response.errors:
+            return result_type.model_validate(self.get_data(response))
+
+        if graphql_response.data is None:
+            raise GraphQLClientInvalidResponseError(response=response)
+
+        return graphql_response.data
+
+    def get_data(self, response: httpx.Response) -> Dict[str, Any]:
+        response_json = self._get_response_json(response)
+
+        if (not isinstance(response_json, dict)) or (
+            "data" not in response_json and "errors" not in response_json
+        ):
+            raise GraphQLClientInvalidResponseError(response=response)
+
+        data = response_json.get("data")
+        errors = response_json.get("errors")
+
+        if errors:
+            raise GraphQLClientGraphQLMultiError.from_errors_dicts(
+                errors_dicts=errors, data=data
+            )
+
+        return cast(Dict[str, Any], data)
+
+    async def execute_ws(
+        self,
+        query: str,
+        operation_name: Optional[str] = None,
+        variables: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        # Called once the server has accepted the connection
+        on_connection_ack: Optional[Callable[[], None]] = kwargs.pop(
+            "on_connection_ack", None
+        )
+
+        headers = self.ws_headers.copy()
+        headers.update(kwargs.get("extra_headers", {}))
+
+        merged_kwargs: Dict[str, Any] = {"origin": self.ws_origin}
+        merged_kwargs.update(kwargs)
+        merged_kwargs["extra_headers"] = headers
+
+        operation_id = str(uuid4())
+        async with ws_connect(
+            self.ws_url,
+            subprotocols=[Subprotocol(GRAPHQL_TRANSPORT_WS)],
+            **merged_kwargs,
+        ) as websocket:
+            await self._send_connection_init(websocket)
+            # wait for connection_ack from server
+            await self._handle_ws_message(
+                await websocket.recv(),
+                websocket,
+                expected_type=GraphQLTransportWSMessageType.CONNECTION_ACK,
+            )
+            if on_connection_ack is not None:
+                on_connection_ack()
+            await self._send_subscribe(
+                websocket,
+                operation_id=operation_id,
+                query=query,
+                operation_name=operation_name,
+                variables=variables,
+            )
+
+            async for message in websocket:
+                data = await self._handle_ws_message(message, websocket)
+                if data:
+                    yield data
+
+    def _process_variables(
+        self, variables: Optional[Dict[str, Any]]
+    ) -> Tuple[
+        Dict[str, Any], Dict[str, Tuple[str, IO[bytes], str]], Dict[str, List[str]]
+    ]:
+        if not variables:
+            return {}, {}, {}
+
+        serializable_variables = self._convert_dict_to_json_serializable(variables)
+        return self._get_files_from_variables(serializable_variables)
+
+    def _convert_dict_to_json_serializable(
+        self, dict_: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        return {
+            key: self._convert_value(value)
+            for key, value in dict_.items()
+            if value is not UNSET
+        }
+
+    def _convert_value(self, value: Any) -> Any:
+        if isinstance(value, BaseModel):
+            return value.model_dump(by_alias=True, exclude_unset=True)
+        if isinstance(value, list):
+            return [self._convert_value(item) for item in value]
+        return value
+
+    def _get_files_from_variables(
+        self, variables: Dict[str, Any]
+    ) -> Tuple[
+        Dict[str, Any], Dict[str, Tuple[str, IO[bytes], str]], Dict[str, List[str]]
+    ]:
+        files_map: Dict[str, List[str]] = {}
+        files_list: List[Upload] = []
+
+        def separate_files(path: str, obj: Any) -> Any:
+            if isinstance(obj, list):
+                nulled_list = []
+                for index, value in enumerate(obj):
+                    value = separate_files(f"{path}.{index}", value)
+                    nulled_list.append(value)
+                return nulled_list
+
+            if isinstance(obj, dict):
+                nulled_dict = {}
+                for key, value in obj.items():
+                    value = separate_files(f"{path}.{key}", value)
+                    nulled_dict[key] = value
+                return nulled_dict
+
+            if isinstance(obj, Upload):
+                if obj in files_list:
+                    file_index = files_list.index(obj)
+                    files_map[str(file_index)].append(path)
+                else:
+                    file_index = len(files_list)
+                    files_list.append(obj)
+                    files_map[str(file_index)] = [path]
+                return None
+
+            return obj
+
+        nulled_variables = separate_files("variables", variables)
+        files: Dict[str, Tuple[str, IO[bytes], str]] = {
+            str(i): (file_.filename, cast(IO[bytes], file_.content), file_.content_type)
+            for i, file_ in enumerate(files_list)
+        }
+        return nulled_variables, files, files_map
+
+    async def _execute_multipart(
+        self,
+        query: str,
+        operation_name: Optional[str],
+        variables: Dict[str, Any],
+        files: Dict[str, Tuple[str, IO[bytes], str]],
+        files_map: Dict[str, List[str]],
+        **kwargs: Any,
+    ) -> httpx.Response:
+        data = {
+            "operations": json.dumps(
+                {
+                    "query": query,
+                    "operationName": operation_name,
+                    "variables": variables,
+                },
+                default=to_jsonable_python,
+            ),
+            "map": json.dumps(files_map, default=to_jsonable_python),
+        }
+
+        return await self.http_client.post(
+            url=self.url, data=data, files=files, **kwargs
+        )
+
+    async def _execute_json(
+        self,
+        query: str,
+        operation_name: Optional[str],
+        variables: Dict[str, Any],
+        **kwargs: Any,
+    ) -> httpx.Response:
+        return await self._post_json(
+            payload={
+                "query": query,
+                "operationName": operation_name,
+                "variables": variables,
+            },
+            **kwargs,
+        )
+
+    async def _post_json(self, payload: Any, **kwargs: Any) -> httpx.Response:
+        headers: Dict[str, str] = {"Content-Type": "application/json"}
+        headers.update(kwargs.get("headers", {}))
+
+        merged_kwargs: Dict[str, Any] = kwargs.copy()
+        merged_kwargs["headers"] = headers
+
+        return await self.http_client.post(
+            url=self.url,
+            content=orjson.dumps(payload, default=to_jsonable_python),
+            **merged_kwargs,
+        )
+
+    async def _send_connection_init(self, websocket: WebSocketClientProtocol) -> None:
+        payload: Dict[str, Any] = {
+            "type": GraphQLTransportWSMessageType.CONNECTION_INIT.value
+        }
+        if self.ws_connection_init_payload:
+            payload["payload"] = self.ws_connection_init_payload
+        await websocket.send(json.dumps(payload))
+
+    async def _send_subscribe(
+        self,
+        websocket: WebSocketClientProtocol,
+        operation_id: str,
+        query: str,
+        operation_name: Optional[str] = None,
+        variables: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        payload: Dict[str, Any] = {
+            "id": operation_id,
+            "type": GraphQLTransportWSMessageType.SUBSCRIBE.value,
+            "payload": {"query": query, "operationName": operation_name},
+        }
+        if variables:
+            payload["payload"]["variables"] = self._convert_dict_to_json_serializable(
+                variables
+            )
+        await websocket.send(json.dumps(payload))
+
+    async def _handle_ws_message(
+        self,
+        message: Data,
+        websocket: WebSocketClientProtocol,
+        expected_type: Optional[GraphQLTransportWSMessageType] = None,
+    ) -> Optional[Dict[str, Any]]:
+        try:
+            message_dict = json.loads(message)
+        except json.JSONDecodeError as exc:
+            raise GraphQLClientInvalidMessageFormat(message=message) from exc
+
+        type_ = message_dict.get("type")
+        payload = message_dict.get("payload", {})
+
+        if not type_ or type_ not in {t.value for t in GraphQLTransportWSMessageType}:
+            raise GraphQLClientInvalidMessageFormat(message=message)
+
+        if expected_type and expected_type != type_:
+            raise GraphQLClientInvalidMessageFormat(
+                f"Invalid message received. Expected: {expected_type.value}"
+            )
+
+        if type_ == GraphQLTransportWSMessageType.NEXT:
+            if "data" not in payload:
+                raise GraphQLClientInvalidMessageFormat(message=message)
+            return cast(Dict[str, Any], payload["data"])
+
+        if type_ == GraphQLTransportWSMessageType.COMPLETE:
+            await websocket.close()
+        elif type_ == GraphQLTransportWSMessageType.PING:
+            await websocket.send(
+                json.dumps({"type": GraphQLTransportWSMessageType.PONG.value})
+            )
+        elif type_ == GraphQLTransportWSMessageType.ERROR:
+            raise GraphQLClientGraphQLMultiError.from_errors_dicts(
+                errors_dicts=payload, data=message_dict
+            )
+
+        return None
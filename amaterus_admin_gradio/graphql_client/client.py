@@ -1,47 +1,49 @@
 # Generated by ariadne-codegen
 # Source: queries/
 
-from typing import Any, Dict, Optional, Union
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
 
-from .base_client import BaseClient
+from .async_base_client import AsyncBaseClient, GraphQLOperation
 from .base_model import UNSET, UnsetType
 from .create_game import CreateGame
 from .create_program import CreateProgram
 from .create_program_niconico_video import CreateProgramNiconicoVideo
 from .create_program_person import CreateProgramPerson
-from .create_program_twitter_announcement import CreateProgramTwitterAnnouncement
+from .create_program_twitter_announcement_with_tweet import (
+    CreateProgramTwitterAnnouncementWithTweet,
+)
+from .create_program_twitter_announcement_with_tweet_image import (
+    CreateProgramTwitterAnnouncementWithTweetImage,
+)
 from .create_program_youtube_live_live_archive import (
     CreateProgramYoutubeLiveLiveArchive,
 )
+from .create_program_youtube_live_live_archives import (
+    CreateProgramYoutubeLiveLiveArchives,
+)
 from .create_program_youtube_video_live_archive import (
     CreateProgramYoutubeVideoLiveArchive,
 )
-from .create_twitter_tweet import CreateTwitterTweet
-from .create_twitter_tweet_image import CreateTwitterTweetImage
-from .get_create_program_initial_data import GetCreateProgramInitialData
-from .get_create_program_niconico_video_initial_data import (
-    GetCreateProgramNiconicoVideoInitialData,
-)
-from .get_create_program_person_initial_data import GetCreateProgramPersonInitialData
-from .get_create_program_twitter_announcement_initial_data import (
-    GetCreateProgramTwitterAnnouncementInitialData,
-)
-from .get_create_program_youtube_live_live_archive_initial_data import (
-    GetCreateProgramYoutubeLiveLiveArchiveInitialData,
-)
-from .get_create_program_youtube_video_live_archive_initial_data import (
-    GetCreateProgramYoutubeVideoLiveArchiveInitialData,
-)
+from .games_stream import GamesStream
+from .get_person_account_index import GetPersonAccountIndex
 from .get_program_project_list_by_project_id import GetProgramProjectListByProjectId
+from .get_reference_data import GetReferenceData
 from .get_twitter_account_by_screen_name import GetTwitterAccountByScreenName
+from .get_twitter_tweet_by_remote_tweet_id import GetTwitterTweetByRemoteTweetId
+from .input_types import program_live_archives_insert_input
+from .persons_stream import PersonsStream
+from .program_projects_stream import ProgramProjectsStream
+from .programs_stream import ProgramsStream
+from .projects_stream import ProjectsStream
+from .twitter_accounts_stream import TwitterAccountsStream
 
 
 def gql(q: str) -> str:
     return q
 
 
-class Client(BaseClient):
-    def create_game(
+class Client(AsyncBaseClient):
+    async def create_game(
         self,
         name: str,
         steam_url: Union[Optional[str], UnsetType] = UNSET,
@@ -74,13 +76,51 @@ class Client(BaseClient):
             "apple_app_store_url": apple_app_store_url,
             "website_url": website_url,
         }
-        response = self.execute(
+        response = await self.execute(
             query=query, operation_name="CreateGame", variables=variables, **kwargs
         )
-        data = self.get_data(response)
-        return CreateGame.model_validate(data)
+        return self.parse_response(response=response, result_type=CreateGame)
+
+    def create_game_operation(
+        self,
+        name: str,
+        steam_url: Union[Optional[str], UnsetType] = UNSET,
+        epic_games_url: Union[Optional[str], UnsetType] = UNSET,
+        nintendo_switch_url: Union[Optional[str], UnsetType] = UNSET,
+        playstation_url: Union[Optional[str], UnsetType] = UNSET,
+        google_play_store_url: Union[Optional[str], UnsetType] = UNSET,
+        apple_app_store_url: Union[Optional[str], UnsetType] = UNSET,
+        website_url: Union[Optional[str], UnsetType] = UNSET,
+    ) -> GraphQLOperation[CreateGame]:
+        query = gql(
+            """
+            mutation CreateGame($name: String!, $steam_url: String, $epic_games_url: String, $nintendo_switch_url: String, $playstation_url: String, $google_play_store_url: String, $apple_app_store_url: String, $website_url: String) {
+              game: insert_games_one(
+                object: {name: $name, steam_url: $steam_url, epic_games_url: $epic_games_url, nintendo_switch_url: $nintendo_switch_url, playstation_url: $playstation_url, google_play_store_url: $google_play_store_url, apple_app_store_url: $apple_app_store_url, website_url: $website_url}
+              ) {
+                id
+              }
+            }
+            """
+        )
+        variables: Dict[str, object] = {
+            "name": name,
+            "steam_url": steam_url,
+            "epic_games_url": epic_games_url,
+            "nintendo_switch_url": nintendo_switch_url,
+            "playstation_url": playstation_url,
+            "google_play_store_url": google_play_store_url,
+            "apple_app_store_url": apple_app_store_url,
+            "website_url": website_url,
+        }
+        return GraphQLOperation(
+            query=query,
+            operation_name="CreateGame",
+            variables=variables,
+            result_type=CreateGame,
+        )
 
-    def create_program(
+    async def create_program(
         self,
         project_id: Any,
         title: str,
@@ -96,6 +136,9 @@ class Client(BaseClient):
                 object: {game_id: $game_id, title: $title, start_time: $start_time, end_time: $end_time, program_projects: {data: {project_id: $project_id}}}
               ) {
                 id
+                title
+                start_time
+                end_time
               }
             }
             """
@@ -107,13 +150,48 @@ class Client(BaseClient):
             "start_time": start_time,
             "end_time": end_time,
         }
-        response = self.execute(
+        response = await self.execute(
             query=query, operation_name="CreateProgram", variables=variables, **kwargs
         )
-        data = self.get_data(response)
-        return CreateProgram.model_validate(data)
+        return self.parse_response(response=response, result_type=CreateProgram)
+
+    def create_program_operation(
+        self,
+        project_id: Any,
+        title: str,
+        game_id: Union[Optional[Any], UnsetType] = UNSET,
+        start_time: Union[Optional[Any], UnsetType] = UNSET,
+        end_time: Union[Optional[Any], UnsetType] = UNSET,
+    ) -> GraphQLOperation[CreateProgram]:
+        query = gql(
+            """
+            mutation CreateProgram($project_id: uuid!, $game_id: uuid, $title: String!, $start_time: timestamptz, $end_time: timestamptz) {
+              program: insert_programs_one(
+                object: {game_id: $game_id, title: $title, start_time: $start_time, end_time: $end_time, program_projects: {data: {project_id: $project_id}}}
+              ) {
+                id
+                title
+                start_time
+                end_time
+              }
+            }
+            """
+        )
+        variables: Dict[str, object] = {
+            "project_id": project_id,
+            "game_id": game_id,
+            "title": title,
+            "start_time": start_time,
+            "end_time": end_time,
+        }
+        return GraphQLOperation(
+            query=query,
+            operation_name="CreateProgram",
+            variables=variables,
+            result_type=CreateProgram,
+        )
 
-    def create_program_niconico_video(
+    async def create_program_niconico_video(
         self,
         project_id: Any,
         program_id: Any,
@@ -148,16 +226,58 @@ class Client(BaseClient):
             "remoteNiconicoAccountId": remote_niconico_account_id,
             "niconicoAccountName": niconico_account_name,
         }
-        response = self.execute(
+        response = await self.execute(
             query=query,
             operation_name="CreateProgramNiconicoVideo",
             variables=variables,
             **kwargs
         )
-        data = self.get_data(response)
-        return CreateProgramNiconicoVideo.model_validate(data)
+        return self.parse_response(
+            response=response, result_type=CreateProgramNiconicoVideo
+        )
+
+    def create_program_niconico_video_operation(
+        self,
+        project_id: Any,
+        program_id: Any,
+        person_id: Any,
+        remote_niconico_content_id: str,
+        title: str,
+        start_time: Any,
+        thumbnail_url: str,
+        remote_niconico_account_id: str,
+        niconico_account_name: str,
+    ) -> GraphQLOperation[CreateProgramNiconicoVideo]:
+        query = gql(
+            """
+            mutation CreateProgramNiconicoVideo($projectId: uuid!, $programId: uuid!, $personId: uuid!, $remoteNiconicoContentId: String!, $title: String!, $startTime: timestamptz!, $thumbnailUrl: String!, $remoteNiconicoAccountId: String!, $niconicoAccountName: String!) {
+              program_niconico_video: insert_program_niconico_videos_one(
+                object: {program_id: $programId, person_id: $personId, niconico_video: {data: {remote_niconico_content_id: $remoteNiconicoContentId, title: $title, start_time: $startTime, thumbnail_url: $thumbnailUrl, niconico_account: {data: {remote_niconico_account_id: $remoteNiconicoAccountId, name: $niconicoAccountName}, on_conflict: {constraint: niconico_accounts_remote_niconico_account_id_key, update_columns: [name]}}, project_niconico_videos: {data: {project_id: $projectId}, on_conflict: {constraint: project_niconico_videos_project_id_niconico_video_id_key, update_columns: [project_id, niconico_video_id]}}}, on_conflict: {constraint: niconico_videos_remote_niconico_content_id_key, update_columns: [title, start_time, thumbnail_url]}}}
+              ) {
+                id
+              }
+            }
+            """
+        )
+        variables: Dict[str, object] = {
+            "projectId": project_id,
+            "programId": program_id,
+            "personId": person_id,
+            "remoteNiconicoContentId": remote_niconico_content_id,
+            "title": title,
+            "startTime": start_time,
+            "thumbnailUrl": thumbnail_url,
+            "remoteNiconicoAccountId": remote_niconico_account_id,
+            "niconicoAccountName": niconico_account_name,
+        }
+        return GraphQLOperation(
+            query=query,
+            operation_name="CreateProgramNiconicoVideo",
+            variables=variables,
+            result_type=CreateProgramNiconicoVideo,
+        )
 
-    def create_program_person(
+    async def create_program_person(
         self,
         program_id: Any,
         person_id: Any,
@@ -181,28 +301,26 @@ class Client(BaseClient):
             "person_id": person_id,
             "is_absent": is_absent,
         }
-        response = self.execute(
+        response = await self.execute(
             query=query,
             operation_name="CreateProgramPerson",
             variables=variables,
             **kwargs
         )
-        data = self.get_data(response)
-        return CreateProgramPerson.model_validate(data)
+        return self.parse_response(response=response, result_type=CreateProgramPerson)
 
-    def create_program_twitter_announcement(
+    def create_program_person_operation(
         self,
         program_id: Any,
         person_id: Any,
-        twitter_tweet_id: Any,
-        twitter_tweet_image_id: Union[Optional[Any], UnsetType] = UNSET,
-        **kwargs: Any
-    ) -> CreateProgramTwitterAnnouncement:
+        is_absent: Union[Optional[bool], UnsetType] = UNSET,
+    ) -> GraphQLOperation[CreateProgramPerson]:
         query = gql(
             """
-            mutation CreateProgramTwitterAnnouncement($programId: uuid!, $personId: uuid!, $twitterTweetId: uuid!, $twitterTweetImageId: uuid) {
-              program_twitter_announcement: insert_program_twitter_announcements_one(
-                object: {program_id: $programId, person_id: $personId, twitter_tweet_id: $twitterTweetId, twitter_tweet_image_id: $twitterTweetImageId}
+            mutation CreateProgramPerson($program_id: uuid!, $person_id: uuid!, $is_absent: Boolean) {
+              program_person: insert_program_persons_one(
+                object: {program_id: $program_id, person_id: $person_id, is_absent: $is_absent}
+                on_conflict: {constraint: program_persons_program_id_person_id_key, update_columns: [is_absent]}
               ) {
                 id
               }
@@ -210,39 +328,35 @@ class Client(BaseClient):
             """
         )
         variables: Dict[str, object] = {
-            "programId": program_id,
-            "personId": person_id,
-            "twitterTweetId": twitter_tweet_id,
-            "twitterTweetImageId": twitter_tweet_image_id,
+            "program_id": program_id,
+            "person_id": person_id,
+            "is_absent": is_absent,
         }
-        response = self.execute(
+        return GraphQLOperation(
             query=query,
-            operation_name="CreateProgramTwitterAnnouncement",
+            operation_name="CreateProgramPerson",
             variables=variables,
-            **kwargs
+            result_type=CreateProgramPerson,
         )
-        data = self.get_data(response)
-        return CreateProgramTwitterAnnouncement.model_validate(data)
 
-    def create_program_youtube_live_live_archive(
+    async def create_program_twitter_announcement_with_tweet(
         self,
         program_id: Any,
         person_id: Any,
-        remote_youtube_video_id: str,
-        title: str,
-        remote_youtube_channel_id: str,
-        youtube_channel_name: str,
-        start_time: Union[Optional[Any], UnsetType] = UNSET,
-        end_time: Union[Optional[Any], UnsetType] = UNSET,
+        remote_tweet_id: str,
+        twitter_account_id: Any,
+        tweet_time: Any,
+        tweet_embed_html: str,
         **kwargs: Any
-    ) -> CreateProgramYoutubeLiveLiveArchive:
+    ) -> CreateProgramTwitterAnnouncementWithTweet:
         query = gql(
             """
-            mutation CreateProgramYoutubeLiveLiveArchive($programId: uuid!, $personId: uuid!, $startTime: timestamptz, $endTime: timestamptz, $remoteYoutubeVideoId: String!, $title: String!, $remoteYoutubeChannelId: String!, $youtubeChannelName: String!) {
-              program_live_archive: insert_program_live_archives_one(
-                object: {program_id: $programId, person_id: $personId, start_time: $startTime, end_time: $endTime, youtube_live: {data: {remote_youtube_video_id: $remoteYoutubeVideoId, title: $title, start_time: $startTime, end_time: $endTime, youtube_channel: {data: {remote_youtube_channel_id: $remoteYoutubeChannelId, name: $youtubeChannelName}, on_conflict: {constraint: youtube_channels_youtube_channel_id_key, update_columns: [name]}}}, on_conflict: {constraint: youtube_lives_remote_youtube_video_id_key, update_columns: [title, start_time, end_time]}}}
+            mutation CreateProgramTwitterAnnouncementWithTweet($programId: uuid!, $personId: uuid!, $remoteTweetId: String!, $twitterAccountId: uuid!, $tweetTime: timestamptz!, $tweetEmbedHtml: String!) {
+              program_twitter_announcement: insert_program_twitter_announcements_one(
+                object: {program_id: $programId, person_id: $personId, twitter_tweet: {data: {remote_tweet_id: $remoteTweetId, tweet_time: $tweetTime, tweet_embed_html: $tweetEmbedHtml, twitter_account_id: $twitterAccountId}, on_conflict: {constraint: twitter_tweets_remote_tweet_id_key, update_columns: [tweet_time, tweet_embed_html]}}}
               ) {
                 id
+                twitter_tweet_id
               }
             }
             """
@@ -250,43 +364,38 @@ class Client(BaseClient):
         variables: Dict[str, object] = {
             "programId": program_id,
             "personId": person_id,
-            "startTime": start_time,
-            "endTime": end_time,
-            "remoteYoutubeVideoId": remote_youtube_video_id,
-            "title": title,
-            "remoteYoutubeChannelId": remote_youtube_channel_id,
-            "youtubeChannelName": youtube_channel_name,
+            "remoteTweetId": remote_tweet_id,
+            "twitterAccountId": twitter_account_id,
+            "tweetTime": tweet_time,
+            "tweetEmbedHtml": tweet_embed_html,
         }
-        response = self.execute(
+        response = await self.execute(
             query=query,
-            operation_name="CreateProgramYoutubeLiveLiveArchive",
+            operation_name="CreateProgramTwitterAnnouncementWithTweet",
             variables=variables,
             **kwargs
         )
-        data = self.get_data(response)
-        return CreateProgramYoutubeLiveLiveArchive.model_validate(data)
+        return self.parse_response(
+            response=response, result_type=CreateProgramTwitterAnnouncementWithTweet
+        )
 
-    def create_program_youtube_video_live_archive(
+    def create_program_twitter_announcement_with_tweet_operation(
         self,
         program_id: Any,
         person_id: Any,
-        post_time: Any,
-        start_time: Any,
-        end_time: Any,
-        remote_youtube_video_id: str,
-        title: str,
-        is_premiere: bool,
-        remote_youtube_channel_id: str,
-        youtube_channel_name: str,
-        **kwargs: Any
-    ) -> CreateProgramYoutubeVideoLiveArchive:
+        remote_tweet_id: str,
+        twitter_account_id: Any,
+        tweet_time: Any,
+        tweet_embed_html: str,
+    ) -> GraphQLOperation[CreateProgramTwitterAnnouncementWithTweet]:
         query = gql(
             """
-            mutation CreateProgramYoutubeVideoLiveArchive($programId: uuid!, $personId: uuid!, $postTime: timestamptz!, $startTime: timestamptz!, $endTime: timestamptz!, $remoteYoutubeVideoId: String!, $title: String!, $isPremiere: Boolean!, $remoteYoutubeChannelId: String!, $youtubeChannelName: String!) {
-              program_live_archive: insert_program_live_archives_one(
-                object: {program_id: $programId, person_id: $personId, start_time: $startTime, end_time: $endTime, youtube_video: {data: {remote_youtube_video_id: $remoteYoutubeVideoId, title: $title, post_time: $postTime, is_premiere: $isPremiere, youtube_channel: {data: {remote_youtube_channel_id: $remoteYoutubeChannelId, name: $youtubeChannelName}, on_conflict: {constraint: youtube_channels_youtube_channel_id_key, update_columns: [name]}}}, on_conflict: {constraint: youtube_videos_remote_youtube_video_id_key, update_columns: [title, post_time, is_premiere]}}}
+            mutation CreateProgramTwitterAnnouncementWithTweet($programId: uuid!, $personId: uuid!, $remoteTweetId: String!, $twitterAccountId: uuid!, $tweetTime: timestamptz!, $tweetEmbedHtml: String!) {
+              program_twitter_announcement: insert_program_twitter_announcements_one(
+                object: {program_id: $programId, person_id: $personId, twitter_tweet: {data: {remote_tweet_id: $remoteTweetId, tweet_time: $tweetTime, tweet_embed_html: $tweetEmbedHtml, twitter_account_id: $twitterAccountId}, on_conflict: {constraint: twitter_tweets_remote_tweet_id_key, update_columns: [tweet_time, tweet_embed_html]}}}
               ) {
                 id
+                twitter_tweet_id
               }
             }
             """
@@ -294,211 +403,499 @@ class Client(BaseClient):
         variables: Dict[str, object] = {
             "programId": program_id,
             "personId": person_id,
-            "postTime": post_time,
-            "startTime": start_time,
-            "endTime": end_time,
-            "remoteYoutubeVideoId": remote_youtube_video_id,
-            "title": title,
-            "isPremiere": is_premiere,
-            "remoteYoutubeChannelId": remote_youtube_channel_id,
-            "youtubeChannelName": youtube_channel_name,
+            "remoteTweetId": remote_tweet_id,
+            "twitterAccountId": twitter_account_id,
+            "tweetTime": tweet_time,
+            "tweetEmbedHtml": tweet_embed_html,
         }
-        response = self.execute(
+        return GraphQLOperation(
             query=query,
-            operation_name="CreateProgramYoutubeVideoLiveArchive",
+            operation_name="CreateProgramTwitterAnnouncementWithTweet",
             variables=variables,
-            **kwargs
+            result_type=CreateProgramTwitterAnnouncementWithTweet,
         )
-        data = self.get_data(response)
-        return CreateProgramYoutubeVideoLiveArchive.model_validate(data)
 
-    def create_twitter_tweet(
+    async def create_program_twitter_announcement_with_tweet_image(
         self,
+        program_id: Any,
+        person_id: Any,
+        twitter_tweet_id: Any,
         remote_tweet_id: str,
         twitter_account_id: Any,
         tweet_time: Any,
         tweet_embed_html: str,
+        twitter_tweet_image_index: int,
+        twitter_tweet_image_url: str,
         **kwargs: Any
-    ) -> CreateTwitterTweet:
+    ) -> CreateProgramTwitterAnnouncementWithTweetImage:
         query = gql(
             """
-            mutation CreateTwitterTweet($remoteTweetId: String!, $twitterAccountId: uuid!, $tweetTime: timestamptz!, $tweetEmbedHtml: String!) {
+            mutation CreateProgramTwitterAnnouncementWithTweetImage($programId: uuid!, $personId: uuid!, $twitterTweetId: uuid!, $remoteTweetId: String!, $twitterAccountId: uuid!, $tweetTime: timestamptz!, $tweetEmbedHtml: String!, $twitterTweetImageIndex: Int!, $twitterTweetImageUrl: String!) {
               twitter_tweet: insert_twitter_tweets_one(
-                object: {remote_tweet_id: $remoteTweetId, tweet_time: $tweetTime, tweet_embed_html: $tweetEmbedHtml, twitter_account_id: $twitterAccountId}
+                object: {id: $twitterTweetId, remote_tweet_id: $remoteTweetId, tweet_time: $tweetTime, tweet_embed_html: $tweetEmbedHtml, twitter_account_id: $twitterAccountId}
                 on_conflict: {constraint: twitter_tweets_remote_tweet_id_key, update_columns: [tweet_time, tweet_embed_html]}
               ) {
                 id
               }
+              program_twitter_announcement: insert_program_twitter_announcements_one(
+                object: {program_id: $programId, person_id: $personId, twitter_tweet_id: $twitterTweetId, twitter_tweet_image: {data: {twitter_tweet_id: $twitterTweetId, index: $twitterTweetImageIndex, url: $twitterTweetImageUrl}, on_conflict: {constraint: twitter_tweet_images_tweet_id_index_key, update_columns: [index, url]}}}
+              ) {
+                id
+                twitter_tweet_id
+                twitter_tweet_image_id
+              }
             }
             """
         )
         variables: Dict[str, object] = {
+            "programId": program_id,
+            "personId": person_id,
+            "twitterTweetId": twitter_tweet_id,
             "remoteTweetId": remote_tweet_id,
             "twitterAccountId": twitter_account_id,
             "tweetTime": tweet_time,
             "tweetEmbedHtml": tweet_embed_html,
+            "twitterTweetImageIndex": twitter_tweet_image_index,
+            "twitterTweetImageUrl": twitter_tweet_image_url,
         }
-        response = self.execute(
+        response = await self.execute(
             query=query,
-            operation_name="CreateTwitterTweet",
+            operation_name="CreateProgramTwitterAnnouncementWithTweetImage",
             variables=variables,
             **kwargs
         )
-        data = self.get_data(response)
-        return CreateTwitterTweet.model_validate(data)
+        return self.parse_response(
+            response=response,
+            result_type=CreateProgramTwitterAnnouncementWithTweetImage,
+        )
 
-    def create_twitter_tweet_image(
+    def create_program_twitter_announcement_with_tweet_image_operation(
         self,
+        program_id: Any,
+        person_id: Any,
         twitter_tweet_id: Any,
+        remote_tweet_id: str,
+        twitter_account_id: Any,
+        tweet_time: Any,
+        tweet_embed_html: str,
         twitter_tweet_image_index: int,
         twitter_tweet_image_url: str,
-        **kwargs: Any
-    ) -> CreateTwitterTweetImage:
+    ) -> GraphQLOperation[CreateProgramTwitterAnnouncementWithTweetImage]:
         query = gql(
             """
-            mutation CreateTwitterTweetImage($twitterTweetId: uuid!, $twitterTweetImageIndex: Int!, $twitterTweetImageUrl: String!) {
-              twitter_tweet_image: insert_twitter_tweet_images_one(
-                object: {twitter_tweet_id: $twitterTweetId, index: $twitterTweetImageIndex, url: $twitterTweetImageUrl}
-                on_conflict: {constraint: twitter_tweet_images_tweet_id_index_key, update_columns: [index, url]}
+            mutation CreateProgramTwitterAnnouncementWithTweetImage($programId: uuid!, $personId: uuid!, $twitterTweetId: uuid!, $remoteTweetId: String!, $twitterAccountId: uuid!, $tweetTime: timestamptz!, $tweetEmbedHtml: String!, $twitterTweetImageIndex: Int!, $twitterTweetImageUrl: String!) {
+              twitter_tweet: insert_twitter_tweets_one(
+                object: {id: $twitterTweetId, remote_tweet_id: $remoteTweetId, tweet_time: $tweetTime, tweet_embed_html: $tweetEmbedHtml, twitter_account_id: $twitterAccountId}
+                on_conflict: {constraint: twitter_tweets_remote_tweet_id_key, update_columns: [tweet_time, tweet_embed_html]}
+              ) {
+                id
+              }
+              program_twitter_announcement: insert_program_twitter_announcements_one(
+                object: {program_id: $programId, person_id: $personId, twitter_tweet_id: $twitterTweetId, twitter_tweet_image: {data: {twitter_tweet_id: $twitterTweetId, index: $twitterTweetImageIndex, url: $twitterTweetImageUrl}, on_conflict: {constraint: twitter_tweet_images_tweet_id_index_key, update_columns: [index, url]}}}
               ) {
                 id
+                twitter_tweet_id
+                twitter_tweet_image_id
               }
             }
             """
         )
         variables: Dict[str, object] = {
+            "programId": program_id,
+            "personId": person_id,
             "twitterTweetId": twitter_tweet_id,
+            "remoteTweetId": remote_tweet_id,
+            "twitterAccountId": twitter_account_id,
+            "tweetTime": tweet_time,
+            "tweetEmbedHtml": tweet_embed_html,
             "twitterTweetImageIndex": twitter_tweet_image_index,
             "twitterTweetImageUrl": twitter_tweet_image_url,
         }
-        response = self.execute(
+        return GraphQLOperation(
             query=query,
-            operation_name="CreateTwitterTweetImage",
+            operation_name="CreateProgramTwitterAnnouncementWithTweetImage",
             variables=variables,
-            **kwargs
+            result_type=CreateProgramTwitterAnnouncementWithTweetImage,
         )
-        data = self.get_data(response)
-        return CreateTwitterTweetImage.model_validate(data)
 
-    def get_create_program_niconico_video_initial_data(
-        self, **kwargs: Any
-    ) -> GetCreateProgramNiconicoVideoInitialData:
+    async def create_program_youtube_live_live_archive(
+        self,
+        program_id: Any,
+        person_id: Any,
+        remote_youtube_video_id: str,
+        title: str,
+        remote_youtube_channel_id: str,
+        youtube_channel_name: str,
+        start_time: Union[Optional[Any], UnsetType] = UNSET,
+        end_time: Union[Optional[Any], UnsetType] = UNSET,
+        **kwargs: Any
+    ) -> CreateProgramYoutubeLiveLiveArchive:
         query = gql(
             """
-            query GetCreateProgramNiconicoVideoInitialData {
-              project_list: projects {
-                id
-                name
-              }
-              person_list: persons {
+            mutation CreateProgramYoutubeLiveLiveArchive($programId: uuid!, $personId: uuid!, $startTime: timestamptz, $endTime: timestamptz, $remoteYoutubeVideoId: String!, $title: String!, $remoteYoutubeChannelId: String!, $youtubeChannelName: String!) {
+              program_live_archive: insert_program_live_archives_one(
+                object: {program_id: $programId, person_id: $personId, start_time: $startTime, end_time: $endTime, youtube_live: {data: {remote_youtube_video_id: $remoteYoutubeVideoId, title: $title, start_time: $startTime, end_time: $endTime, youtube_channel: {data: {remote_youtube_channel_id: $remoteYoutubeChannelId, name: $youtubeChannelName}, on_conflict: {constraint: youtube_channels_youtube_channel_id_key, update_columns: [name]}}}, on_conflict: {constraint: youtube_lives_remote_youtube_video_id_key, update_columns: [title, start_time, end_time]}}}
+              ) {
                 id
-                name
               }
             }
             """
         )
-        variables: Dict[str, object] = {}
-        response = self.execute(
+        variables: Dict[str, object] = {
+            "programId": program_id,
+            "personId": person_id,
+            "startTime": start_time,
+            "endTime": end_time,
+            "remoteYoutubeVideoId": remote_youtube_video_id,
+            "title": title,
+            "remoteYoutubeChannelId": remote_youtube_channel_id,
+            "youtubeChannelName": youtube_channel_name,
+        }
+        response = await self.execute(
             query=query,
-            operation_name="GetCreateProgramNiconicoVideoInitialData",
+            operation_name="CreateProgramYoutubeLiveLiveArchive",
             variables=variables,
             **kwargs
         )
-        data = self.get_data(response)
-        return GetCreateProgramNiconicoVideoInitialData.model_validate(data)
+        return self.parse_response(
+            response=response, result_type=CreateProgramYoutubeLiveLiveArchive
+        )
 
-    def get_create_program_person_initial_data(
-        self, **kwargs: Any
-    ) -> GetCreateProgramPersonInitialData:
-        query = gql(
-            """
-            query GetCreateProgramPersonInitialData {
-              project_list: projects {
-                id
-                name
+    def create_program_youtube_live_live_archive_operation(
+        self,
+        program_id: Any,
+        person_id: Any,
+        remote_youtube_video_id: str,
+        title: str,
+        remote_youtube_channel_id: str,
+        youtube_channel_name: str,
+        start_time: Union[Optional[Any], UnsetType] = UNSET,
+        end_time: Union[Optional[Any], UnsetType] = UNSET,
+    ) -> GraphQLOperation[CreateProgramYoutubeLiveLiveArchive]:
+        query = gql(
+            """
+            mutation CreateProgramYoutubeLiveLiveArchive($programId: uuid!, $personId: uuid!, $startTime: timestamptz, $endTime: timestamptz, $remoteYoutubeVideoId: String!, $title: String!, $remoteYoutubeChannelId: String!, $youtubeChannelName: String!) {
+              program_live_archive: insert_program_live_archives_one(
+                object: {program_id: $programId, person_id: $personId, start_time: $startTime, end_time: $endTime, youtube_live: {data: {remote_youtube_video_id: $remoteYoutubeVideoId, title: $title, start_time: $startTime, end_time: $endTime, youtube_channel: {data: {remote_youtube_channel_id: $remoteYoutubeChannelId, name: $youtubeChannelName}, on_conflict: {constraint: youtube_channels_youtube_channel_id_key, update_columns: [name]}}}, on_conflict: {constraint: youtube_lives_remote_youtube_video_id_key, update_columns: [title, start_time, end_time]}}}
+              ) {
+                id
               }
-              person_list: persons {
+            }
+            """
+        )
+        variables: Dict[str, object] = {
+            "programId": program_id,
+            "personId": person_id,
+            "startTime": start_time,
+            "endTime": end_time,
+            "remoteYoutubeVideoId": remote_youtube_video_id,
+            "title": title,
+            "remoteYoutubeChannelId": remote_youtube_channel_id,
+            "youtubeChannelName": youtube_channel_name,
+        }
+        return GraphQLOperation(
+            query=query,
+            operation_name="CreateProgramYoutubeLiveLiveArchive",
+            variables=variables,
+            result_type=CreateProgramYoutubeLiveLiveArchive,
+        )
+
+    async def create_program_youtube_live_live_archives(
+        self, objects: List[program_live_archives_insert_input], **kwargs: Any
+    ) -> CreateProgramYoutubeLiveLiveArchives:
+        query = gql(
+            """
+            mutation CreateProgramYoutubeLiveLiveArchives($objects: [program_live_archives_insert_input!]!) {
+              insert_program_live_archives(objects: $objects) {
+                returning {
+                  id
+                  program_id
+                  person_id
+                  youtube_live {
+                    remote_youtube_video_id
+                  }
+                }
+              }
+            }
+            """
+        )
+        variables: Dict[str, object] = {"objects": objects}
+        response = await self.execute(
+            query=query,
+            operation_name="CreateProgramYoutubeLiveLiveArchives",
+            variables=variables,
+            **kwargs
+        )
+        return self.parse_response(
+            response=response, result_type=CreateProgramYoutubeLiveLiveArchives
+        )
+
+    def create_program_youtube_live_live_archives_operation(
+        self, objects: List[program_live_archives_insert_input]
+    ) -> GraphQLOperation[CreateProgramYoutubeLiveLiveArchives]:
+        query = gql(
+            """
+            mutation CreateProgramYoutubeLiveLiveArchives($objects: [program_live_archives_insert_input!]!) {
+              insert_program_live_archives(objects: $objects) {
+                returning {
+                  id
+                  program_id
+                  person_id
+                  youtube_live {
+                    remote_youtube_video_id
+                  }
+                }
+              }
+            }
+            """
+        )
+        variables: Dict[str, object] = {"objects": objects}
+        return GraphQLOperation(
+            query=query,
+            operation_name="CreateProgramYoutubeLiveLiveArchives",
+            variables=variables,
+            result_type=CreateProgramYoutubeLiveLiveArchives,
+        )
+
+    async def create_program_youtube_video_live_archive(
+        self,
+        program_id: Any,
+        person_id: Any,
+        post_time: Any,
+        start_time: Any,
+        end_time: Any,
+        remote_youtube_video_id: str,
+        title: str,
+        is_premiere: bool,
+        remote_youtube_channel_id: str,
+        youtube_channel_name: str,
+        **kwargs: Any
+    ) -> CreateProgramYoutubeVideoLiveArchive:
+        query = gql(
+            """
+            mutation CreateProgramYoutubeVideoLiveArchive($programId: uuid!, $personId: uuid!, $postTime: timestamptz!, $startTime: timestamptz!, $endTime: timestamptz!, $remoteYoutubeVideoId: String!, $title: String!, $isPremiere: Boolean!, $remoteYoutubeChannelId: String!, $youtubeChannelName: String!) {
+              program_live_archive: insert_program_live_archives_one(
+                object: {program_id: $programId, person_id: $personId, start_time: $startTime, end_time: $endTime, youtube_video: {data: {remote_youtube_video_id: $remoteYoutubeVideoId, title: $title, post_time: $postTime, is_premiere: $isPremiere, youtube_channel: {data: {remote_youtube_channel_id: $remoteYoutubeChannelId, name: $youtubeChannelName}, on_conflict: {constraint: youtube_channels_youtube_channel_id_key, update_columns: [name]}}}, on_conflict: {constraint: youtube_videos_remote_youtube_video_id_key, update_columns: [title, post_time, is_premiere]}}}
+              ) {
                 id
-                name
               }
             }
             """
         )
-        variables: Dict[str, object] = {}
-        response = self.execute(
+        variables: Dict[str, object] = {
+            "programId": program_id,
+            "personId": person_id,
+            "postTime": post_time,
+            "startTime": start_time,
+            "endTime": end_time,
+            "remoteYoutubeVideoId": remote_youtube_video_id,
+            "title": title,
+            "isPremiere": is_premiere,
+            "remoteYoutubeChannelId": remote_youtube_channel_id,
+            "youtubeChannelName": youtube_channel_name,
+        }
+        response = await self.execute(
             query=query,
-            operation_name="GetCreateProgramPersonInitialData",
+            operation_name="CreateProgramYoutubeVideoLiveArchive",
             variables=variables,
             **kwargs
         )
-        data = self.get_data(response)
-        return GetCreateProgramPersonInitialData.model_validate(data)
+        return self.parse_response(
+            response=response, result_type=CreateProgramYoutubeVideoLiveArchive
+        )
 
-    def get_create_program_initial_data(
-        self, **kwargs: Any
-    ) -> GetCreateProgramInitialData:
+    def create_program_youtube_video_live_archive_operation(
+        self,
+        program_id: Any,
+        person_id: Any,
+        post_time: Any,
+        start_time: Any,
+        end_time: Any,
+        remote_youtube_video_id: str,
+        title: str,
+        is_premiere: bool,
+        remote_youtube_channel_id: str,
+        youtube_channel_name: str,
+    ) -> GraphQLOperation[CreateProgramYoutubeVideoLiveArchive]:
         query = gql(
             """
-            query GetCreateProgramInitialData {
-              project_list: projects {
+            mutation CreateProgramYoutubeVideoLiveArchive($programId: uuid!, $personId: uuid!, $postTime: timestamptz!, $startTime: timestamptz!, $endTime: timestamptz!, $remoteYoutubeVideoId: String!, $title: String!, $isPremiere: Boolean!, $remoteYoutubeChannelId: String!, $youtubeChannelName: String!) {
+              program_live_archive: insert_program_live_archives_one(
+                object: {program_id: $programId, person_id: $personId, start_time: $startTime, end_time: $endTime, youtube_video: {data: {remote_youtube_video_id: $remoteYoutubeVideoId, title: $title, post_time: $postTime, is_premiere: $isPremiere, youtube_channel: {data: {remote_youtube_channel_id: $remoteYoutubeChannelId, name: $youtubeChannelName}, on_conflict: {constraint: youtube_channels_youtube_channel_id_key, update_columns: [name]}}}, on_conflict: {constraint: youtube_videos_remote_youtube_video_id_key, update_columns: [title, post_time, is_premiere]}}}
+              ) {
                 id
-                name
               }
-              game_list: games {
+            }
+            """
+        )
+        variables: Dict[str, object] = {
+            "programId": program_id,
+            "personId": person_id,
+            "postTime": post_time,
+            "startTime": start_time,
+            "endTime": end_time,
+            "remoteYoutubeVideoId": remote_youtube_video_id,
+            "title": title,
+            "isPremiere": is_premiere,
+            "remoteYoutubeChannelId": remote_youtube_channel_id,
+            "youtubeChannelName": youtube_channel_name,
+        }
+        return GraphQLOperation(
+            query=query,
+            operation_name="CreateProgramYoutubeVideoLiveArchive",
+            variables=variables,
+            result_type=CreateProgramYoutubeVideoLiveArchive,
+        )
+
+    async def games_stream(
+        self, updated_at: Any, **kwargs: Any
+    ) -> AsyncIterator[GamesStream]:
+        query = gql(
+            """
+            subscription GamesStream($updatedAt: timestamptz!) {
+              game_list: games_stream(
+                batch_size: 100
+                cursor: {initial_value: {updated_at: $updatedAt}, ordering: ASC}
+              ) {
                 id
                 name
+                updated_at
+              }
+            }
+            """
+        )
+        variables: Dict[str, object] = {"updatedAt": updated_at}
+        async for data in self.execute_ws(
+            query=query, operation_name="GamesStream", variables=variables, **kwargs
+        ):
+            yield GamesStream.model_validate(data)
+
+    async def get_person_account_index(self, **kwargs: Any) -> GetPersonAccountIndex:
+        query = gql(
+            """
+            query GetPersonAccountIndex {
+              person_youtube_channel_list: person_youtube_channels {
+                person_id
+                youtube_channel {
+                  remote_youtube_channel_id
+                }
+              }
+              person_niconico_account_list: person_niconico_accounts {
+                person_id
+                niconico_account {
+                  remote_niconico_account_id
+                }
+              }
+              person_twitter_account_list: person_twitter_accounts {
+                person_id
+                twitter_account_id
               }
             }
             """
         )
         variables: Dict[str, object] = {}
-        response = self.execute(
+        response = await self.execute(
             query=query,
-            operation_name="GetCreateProgramInitialData",
+            operation_name="GetPersonAccountIndex",
             variables=variables,
             **kwargs
         )
-        data = self.get_data(response)
-        return GetCreateProgramInitialData.model_validate(data)
+        return self.parse_response(response=response, result_type=GetPersonAccountIndex)
 
-    def get_create_program_twitter_announcement_initial_data(
-        self, **kwargs: Any
-    ) -> GetCreateProgramTwitterAnnouncementInitialData:
+    def get_person_account_index_operation(
+        self,
+    ) -> GraphQLOperation[GetPersonAccountIndex]:
         query = gql(
             """
-            query GetCreateProgramTwitterAnnouncementInitialData {
-              project_list: projects {
-                id
-                name
+            query GetPersonAccountIndex {
+              person_youtube_channel_list: person_youtube_channels {
+                person_id
+                youtube_channel {
+                  remote_youtube_channel_id
+                }
               }
-              person_list: persons {
-                id
-                name
+              person_niconico_account_list: person_niconico_accounts {
+                person_id
+                niconico_account {
+                  remote_niconico_account_id
+                }
               }
-              twitter_account_list: twitter_accounts {
-                id
-                twitter_screen_name
-                name
+              person_twitter_account_list: person_twitter_accounts {
+                person_id
+                twitter_account_id
               }
             }
             """
         )
         variables: Dict[str, object] = {}
-        response = self.execute(
+        return GraphQLOperation(
+            query=query,
+            operation_name="GetPersonAccountIndex",
+            variables=variables,
+            result_type=GetPersonAccountIndex,
+        )
+
+    async def get_program_project_list_by_project_id(
+        self, project_id: Any, **kwargs: Any
+    ) -> GetProgramProjectListByProjectId:
+        query = gql(
+            """
+            query GetProgramProjectListByProjectId($projectId: uuid!) {
+              project: projects_by_pk(id: $projectId) {
+                program_project_list: program_projects(order_by: {program: {start_time: desc}}) {
+                  program {
+                    id
+                    title
+                    start_time
+                    end_time
+                  }
+                }
+              }
+            }
+            """
+        )
+        variables: Dict[str, object] = {"projectId": project_id}
+        response = await self.execute(
             query=query,
-            operation_name="GetCreateProgramTwitterAnnouncementInitialData",
+            operation_name="GetProgramProjectListByProjectId",
             variables=variables,
             **kwargs
         )
-        data = self.get_data(response)
-        return GetCreateProgramTwitterAnnouncementInitialData.model_validate(data)
+        return self.parse_response(
+            response=response, result_type=GetProgramProjectListByProjectId
+        )
+
+    def get_program_project_list_by_project_id_operation(
+        self, project_id: Any
+    ) -> GraphQLOperation[GetProgramProjectListByProjectId]:
+        query = gql(
+            """
+            query GetProgramProjectListByProjectId($projectId: uuid!) {
+              project: projects_by_pk(id: $projectId) {
+                program_project_list: program_projects(order_by: {program: {start_time: desc}}) {
+                  program {
+                    id
+                    title
+                    start_time
+                    end_time
+                  }
+                }
+              }
+            }
+            """
+        )
+        variables: Dict[str, object] = {"projectId": project_id}
+        return GraphQLOperation(
+            query=query,
+            operation_name="GetProgramProjectListByProjectId",
+            variables=variables,
+            result_type=GetProgramProjectListByProjectId,
+        )
 
-    def get_create_program_youtube_live_live_archive_initial_data(
-        self, **kwargs: Any
-    ) -> GetCreateProgramYoutubeLiveLiveArchiveInitialData:
+    async def get_reference_data(self, **kwargs: Any) -> GetReferenceData:
         query = gql(
             """
-            query GetCreateProgramYoutubeLiveLiveArchiveInitialData {
+            query GetReferenceData {
               project_list: projects {
                 id
                 name
@@ -507,25 +904,31 @@ class Client(BaseClient):
                 id
                 name
               }
+              game_list: games {
+                id
+                name
+              }
+              twitter_account_list: twitter_accounts {
+                id
+                twitter_screen_name
+                name
+              }
             }
             """
         )
         variables: Dict[str, object] = {}
-        response = self.execute(
+        response = await self.execute(
             query=query,
-            operation_name="GetCreateProgramYoutubeLiveLiveArchiveInitialData",
+            operation_name="GetReferenceData",
             variables=variables,
             **kwargs
         )
-        data = self.get_data(response)
-        return GetCreateProgramYoutubeLiveLiveArchiveInitialData.model_validate(data)
+        return self.parse_response(response=response, result_type=GetReferenceData)
 
-    def get_create_program_youtube_video_live_archive_initial_data(
-        self, **kwargs: Any
-    ) -> GetCreateProgramYoutubeVideoLiveArchiveInitialData:
+    def get_reference_data_operation(self) -> GraphQLOperation[GetReferenceData]:
         query = gql(
             """
-            query GetCreateProgramYoutubeVideoLiveArchiveInitialData {
+            query GetReferenceData {
               project_list: projects {
                 id
                 name
@@ -534,49 +937,56 @@ class Client(BaseClient):
                 id
                 name
               }
+              game_list: games {
+                id
+                name
+              }
+              twitter_account_list: twitter_accounts {
+                id
+                twitter_screen_name
+                name
+              }
             }
             """
         )
         variables: Dict[str, object] = {}
-        response = self.execute(
+        return GraphQLOperation(
             query=query,
-            operation_name="GetCreateProgramYoutubeVideoLiveArchiveInitialData",
+            operation_name="GetReferenceData",
             variables=variables,
-            **kwargs
+            result_type=GetReferenceData,
         )
-        data = self.get_data(response)
-        return GetCreateProgramYoutubeVideoLiveArchiveInitialData.model_validate(data)
 
-    def get_program_project_list_by_project_id(
-        self, project_id: Any, **kwargs: Any
-    ) -> GetProgramProjectListByProjectId:
+    async def get_twitter_account_by_screen_name(
+        self, twitter_screen_name: str, **kwargs: Any
+    ) -> GetTwitterAccountByScreenName:
         query = gql(
             """
-            query GetProgramProjectListByProjectId($projectId: uuid!) {
-              project: projects_by_pk(id: $projectId) {
-                program_project_list: program_projects(order_by: {program: {start_time: desc}}) {
-                  program {
-                    id
-                    title
-                  }
-                }
+            query GetTwitterAccountByScreenName($twitterScreenName: String!) {
+              twitter_account_list: twitter_accounts(
+                where: {twitter_screen_name: {_eq: $twitterScreenName}}
+                order_by: {name: asc}
+                limit: 1
+              ) {
+                id
               }
             }
             """
         )
-        variables: Dict[str, object] = {"projectId": project_id}
-        response = self.execute(
+        variables: Dict[str, object] = {"twitterScreenName": twitter_screen_name}
+        response = await self.execute(
             query=query,
-            operation_name="GetProgramProjectListByProjectId",
+            operation_name="GetTwitterAccountByScreenName",
             variables=variables,
             **kwargs
         )
-        data = self.get_data(response)
-        return GetProgramProjectListByProjectId.model_validate(data)
+        return self.parse_response(
+            response=response, result_type=GetTwitterAccountByScreenName
+        )
 
-    def get_twitter_account_by_screen_name(
-        self, twitter_screen_name: str, **kwargs: Any
-    ) -> GetTwitterAccountByScreenName:
+    def get_twitter_account_by_screen_name_operation(
+        self, twitter_screen_name: str
+    ) -> GraphQLOperation[GetTwitterAccountByScreenName]:
         query = gql(
             """
             query GetTwitterAccountByScreenName($twitterScreenName: String!) {
@@ -591,11 +1001,190 @@ class Client(BaseClient):
             """
         )
         variables: Dict[str, object] = {"twitterScreenName": twitter_screen_name}
-        response = self.execute(
+        return GraphQLOperation(
             query=query,
             operation_name="GetTwitterAccountByScreenName",
             variables=variables,
+            result_type=GetTwitterAccountByScreenName,
+        )
+
+    async def get_twitter_tweet_by_remote_tweet_id(
+        self, remote_tweet_id: str, **kwargs: Any
+    ) -> GetTwitterTweetByRemoteTweetId:
+        query = gql(
+            """
+            query GetTwitterTweetByRemoteTweetId($remoteTweetId: String!) {
+              twitter_tweet_list: twitter_tweets(
+                where: {remote_tweet_id: {_eq: $remoteTweetId}}
+                limit: 1
+              ) {
+                id
+              }
+            }
+            """
+        )
+        variables: Dict[str, object] = {"remoteTweetId": remote_tweet_id}
+        response = await self.execute(
+            query=query,
+            operation_name="GetTwitterTweetByRemoteTweetId",
+            variables=variables,
             **kwargs
         )
-        data = self.get_data(response)
-        return GetTwitterAccountByScreenName.model_validate(data)
+        return self.parse_response(
+            response=response, result_type=GetTwitterTweetByRemoteTweetId
+        )
+
+    def get_twitter_tweet_by_remote_tweet_id_operation(
+        self, remote_tweet_id: str
+    ) -> GraphQLOperation[GetTwitterTweetByRemoteTweetId]:
+        query = gql(
+            """
+            query GetTwitterTweetByRemoteTweetId($remoteTweetId: String!) {
+              twitter_tweet_list: twitter_tweets(
+                where: {remote_tweet_id: {_eq: $remoteTweetId}}
+                limit: 1
+              ) {
+                id
+              }
+            }
+            """
+        )
+        variables: Dict[str, object] = {"remoteTweetId": remote_tweet_id}
+        return GraphQLOperation(
+            query=query,
+            operation_name="GetTwitterTweetByRemoteTweetId",
+            variables=variables,
+            result_type=GetTwitterTweetByRemoteTweetId,
+        )
+
+    async def persons_stream(
+        self, updated_at: Any, **kwargs: Any
+    ) -> AsyncIterator[PersonsStream]:
+        query = gql(
+            """
+            subscription PersonsStream($updatedAt: timestamptz!) {
+              person_list: persons_stream(
+                batch_size: 100
+                cursor: {initial_value: {updated_at: $updatedAt}, ordering: ASC}
+              ) {
+                id
+                name
+                updated_at
+              }
+            }
+            """
+        )
+        variables: Dict[str, object] = {"updatedAt": updated_at}
+        async for data in self.execute_ws(
+            query=query, operation_name="PersonsStream", variables=variables, **kwargs
+        ):
+            yield PersonsStream.model_validate(data)
+
+    async def program_projects_stream(
+        self, updated_at: Any, **kwargs: Any
+    ) -> AsyncIterator[ProgramProjectsStream]:
+        query = gql(
+            """
+            subscription ProgramProjectsStream($updatedAt: timestamptz!) {
+              program_project_list: program_projects_stream(
+                batch_size: 100
+                cursor: {initial_value: {updated_at: $updatedAt}, ordering: ASC}
+              ) {
+                project_id
+                updated_at
+                program {
+                  id
+                  title
+                  start_time
+                  end_time
+                }
+              }
+            }
+            """
+        )
+        variables: Dict[str, object] = {"updatedAt": updated_at}
+        async for data in self.execute_ws(
+            query=query,
+            operation_name="ProgramProjectsStream",
+            variables=variables,
+            **kwargs
+        ):
+            yield ProgramProjectsStream.model_validate(data)
+
+    async def programs_stream(
+        self, updated_at: Any, **kwargs: Any
+    ) -> AsyncIterator[ProgramsStream]:
+        query = gql(
+            """
+            subscription ProgramsStream($updatedAt: timestamptz!) {
+              program_list: programs_stream(
+                batch_size: 100
+                cursor: {initial_value: {updated_at: $updatedAt}, ordering: ASC}
+              ) {
+                id
+                title
+                start_time
+                end_time
+                updated_at
+                program_project_list: program_projects {
+                  project_id
+                }
+              }
+            }
+            """
+        )
+        variables: Dict[str, object] = {"updatedAt": updated_at}
+        async for data in self.execute_ws(
+            query=query, operation_name="ProgramsStream", variables=variables, **kwargs
+        ):
+            yield ProgramsStream.model_validate(data)
+
+    async def projects_stream(
+        self, updated_at: Any, **kwargs: Any
+    ) -> AsyncIterator[ProjectsStream]:
+        query = gql(
+            """
+            subscription ProjectsStream($updatedAt: timestamptz!) {
+              project_list: projects_stream(
+                batch_size: 100
+                cursor: {initial_value: {updated_at: $updatedAt}, ordering: ASC}
+              ) {
+                id
+                name
+                updated_at
+              }
+            }
+            """
+        )
+        variables: Dict[str, object] = {"updatedAt": updated_at}
+        async for data in self.execute_ws(
+            query=query, operation_name="ProjectsStream", variables=variables, **kwargs
+        ):
+            yield ProjectsStream.model_validate(data)
+
+    async def twitter_accounts_stream(
+        self, updated_at: Any, **kwargs: Any
+    ) -> AsyncIterator[TwitterAccountsStream]:
+        query = gql(
+            """
+            subscription TwitterAccountsStream($updatedAt: timestamptz!) {
+              twitter_account_list: twitter_accounts_stream(
+                batch_size: 100
+                cursor: {initial_value: {updated_at: $updatedAt}, ordering: ASC}
+              ) {
+                id
+                twitter_screen_name
+                name
+                updated_at
+              }
+            }
+            """
+        )
+        variables: Dict[str, object] = {"updatedAt": updated_at}
+        async for data in self.execute_ws(
+            query=query,
+            operation_name="TwitterAccountsStream",
+            variables=variables,
+            **kwargs
+        ):
+            yield TwitterAccountsStream.model_validate(data)
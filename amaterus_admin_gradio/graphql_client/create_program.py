@@ -12,6 +12,9 @@ class CreateProgram(BaseModel):
 
 class CreateProgramProgram(BaseModel):
     id: Any
+    title: str
+    start_time: Optional[Any]
+    end_time: Optional[Any]
 
 
 CreateProgram.model_rebuild()
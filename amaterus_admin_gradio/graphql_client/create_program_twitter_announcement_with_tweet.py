@@ -0,0 +1,20 @@
+# Generated by ariadne-codegen
+# Source: queries/
+
+from typing import Any, Optional
+
+from .base_model import BaseModel
+
+
+class CreateProgramTwitterAnnouncementWithTweet(BaseModel):
+    program_twitter_announcement: Optional[
+        "CreateProgramTwitterAnnouncementWithTweetProgramTwitterAnnouncement"
+    ]
+
+
+class CreateProgramTwitterAnnouncementWithTweetProgramTwitterAnnouncement(BaseModel):
+    id: Any
+    twitter_tweet_id: Any
+
+
+CreateProgramTwitterAnnouncementWithTweet.model_rebuild()
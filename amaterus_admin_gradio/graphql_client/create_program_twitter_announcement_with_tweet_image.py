@@ -0,0 +1,30 @@
+# Generated by ariadne-codegen
+# Source: queries/
+
+from typing import Any, Optional
+
+from .base_model import BaseModel
+
+
+class CreateProgramTwitterAnnouncementWithTweetImage(BaseModel):
+    twitter_tweet: Optional[
+        "CreateProgramTwitterAnnouncementWithTweetImageTwitterTweet"
+    ]
+    program_twitter_announcement: Optional[
+        "CreateProgramTwitterAnnouncementWithTweetImageProgramTwitterAnnouncement"
+    ]
+
+
+class CreateProgramTwitterAnnouncementWithTweetImageTwitterTweet(BaseModel):
+    id: Any
+
+
+class CreateProgramTwitterAnnouncementWithTweetImageProgramTwitterAnnouncement(
+    BaseModel
+):
+    id: Any
+    twitter_tweet_id: Any
+    twitter_tweet_image_id: Optional[Any]
+
+
+CreateProgramTwitterAnnouncementWithTweetImage.model_rebuild()
@@ -0,0 +1,38 @@
+# Generated by ariadne-codegen
+# Source: queries/
+
+from typing import Any, List, Optional
+
+from .base_model import BaseModel
+
+
+class CreateProgramYoutubeLiveLiveArchives(BaseModel):
+    insert_program_live_archives: Optional[
+        "CreateProgramYoutubeLiveLiveArchivesInsertProgramLiveArchives"
+    ]
+
+
+class CreateProgramYoutubeLiveLiveArchivesInsertProgramLiveArchives(BaseModel):
+    returning: List[
+        "CreateProgramYoutubeLiveLiveArchivesInsertProgramLiveArchivesReturning"
+    ]
+
+
+class CreateProgramYoutubeLiveLiveArchivesInsertProgramLiveArchivesReturning(BaseModel):
+    id: Any
+    program_id: Any
+    person_id: Any
+    youtube_live: Optional[
+        "CreateProgramYoutubeLiveLiveArchivesInsertProgramLiveArchivesReturningYoutubeLive"
+    ]
+
+
+class CreateProgramYoutubeLiveLiveArchivesInsertProgramLiveArchivesReturningYoutubeLive(
+    BaseModel
+):
+    remote_youtube_video_id: str
+
+
+CreateProgramYoutubeLiveLiveArchives.model_rebuild()
+CreateProgramYoutubeLiveLiveArchivesInsertProgramLiveArchives.model_rebuild()
+CreateProgramYoutubeLiveLiveArchivesInsertProgramLiveArchivesReturning.model_rebuild()
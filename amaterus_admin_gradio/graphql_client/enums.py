@@ -38,31 +38,6 @@ class amongus_maps_update_column(str, Enum):
     updated_at = "updated_at"
 
 
-class amongus_match_mods_constraint(str, Enum):
-    amongus_match_mods_amongus_match_id_amongus_mod_id_key = (
-        "amongus_match_mods_amongus_match_id_amongus_mod_id_key"
-    )
-    amongus_match_mods_pkey = "amongus_match_mods_pkey"
-
-
-class amongus_match_mods_select_column(str, Enum):
-    amongus_match_id = "amongus_match_id"
-    amongus_mod_id = "amongus_mod_id"
-    amongus_mod_version_id = "amongus_mod_version_id"
-    created_at = "created_at"
-    id = "id"
-    updated_at = "updated_at"
-
-
-class amongus_match_mods_update_column(str, Enum):
-    amongus_match_id = "amongus_match_id"
-    amongus_mod_id = "amongus_mod_id"
-    amongus_mod_version_id = "amongus_mod_version_id"
-    created_at = "created_at"
-    id = "id"
-    updated_at = "updated_at"
-
-
 class amongus_match_player_result_roles_constraint(str, Enum):
     match_result_player_roles_match_id_person_id_player_role_id_key = (
         "match_result_player_roles_match_id_person_id_player_role_id_key"
@@ -197,14 +172,6 @@ class amongus_mods_constraint(str, Enum):
     mods_pkey = "mods_pkey"
 
 
-class amongus_mods_select_column(str, Enum):
-    created_at = "created_at"
-    github_url = "github_url"
-    id = "id"
-    name = "name"
-    updated_at = "updated_at"
-
-
 class amongus_mods_update_column(str, Enum):
     created_at = "created_at"
     github_url = "github_url"
@@ -256,13 +223,6 @@ class amongus_vanilla_versions_constraint(str, Enum):
     vanilla_versions_version_key = "vanilla_versions_version_key"
 
 
-class amongus_vanilla_versions_select_column(str, Enum):
-    created_at = "created_at"
-    id = "id"
-    updated_at = "updated_at"
-    version = "version"
-
-
 class amongus_vanilla_versions_update_column(str, Enum):
     created_at = "created_at"
     id = "id"
@@ -274,13 +234,6 @@ class amongusvr_maps_constraint(str, Enum):
     amongusvr_maps_pkey = "amongusvr_maps_pkey"
 
 
-class amongusvr_maps_select_column(str, Enum):
-    created_at = "created_at"
-    id = "id"
-    name = "name"
-    updated_at = "updated_at"
-
-
 class amongusvr_maps_update_column(str, Enum):
     created_at = "created_at"
     id = "id"
@@ -357,11 +310,6 @@ class amongusvr_matches_update_column(str, Enum):
     updated_at = "updated_at"
 
 
-class cursor_ordering(str, Enum):
-    ASC = "ASC"
-    DESC = "DESC"
-
-
 class fallguys_custom_round_twitter_announcements_constraint(str, Enum):
     fallguys_custom_round_twitter_announcements_pkey = (
         "fallguys_custom_round_twitter_announcements_pkey"
@@ -514,13 +462,6 @@ class fallguys_rounds_constraint(str, Enum):
     fallguys_rounds_pkey = "fallguys_rounds_pkey"
 
 
-class fallguys_rounds_select_column(str, Enum):
-    created_at = "created_at"
-    id = "id"
-    name = "name"
-    updated_at = "updated_at"
-
-
 class fallguys_rounds_update_column(str, Enum):
     created_at = "created_at"
     id = "id"
@@ -533,14 +474,6 @@ class fediverse_accounts_constraint(str, Enum):
     fediverse_accounts_pkey = "fediverse_accounts_pkey"
 
 
-class fediverse_accounts_select_column(str, Enum):
-    created_at = "created_at"
-    fediverse_acct = "fediverse_acct"
-    id = "id"
-    name = "name"
-    updated_at = "updated_at"
-
-
 class fediverse_accounts_update_column(str, Enum):
     created_at = "created_at"
     fediverse_acct = "fediverse_acct"
@@ -553,20 +486,6 @@ class games_constraint(str, Enum):
     games_pkey = "games_pkey"
 
 
-class games_select_column(str, Enum):
-    apple_app_store_url = "apple_app_store_url"
-    created_at = "created_at"
-    epic_games_url = "epic_games_url"
-    google_play_store_url = "google_play_store_url"
-    id = "id"
-    name = "name"
-    nintendo_switch_url = "nintendo_switch_url"
-    playstation_url = "playstation_url"
-    steam_url = "steam_url"
-    updated_at = "updated_at"
-    website_url = "website_url"
-
-
 class games_update_column(str, Enum):
     apple_app_store_url = "apple_app_store_url"
     created_at = "created_at"
@@ -591,15 +510,6 @@ class mariokart8deluxe_battle_courses_constraint(str, Enum):
     mariokart8deluxe_battle_courses_pkey = "mariokart8deluxe_battle_courses_pkey"
 
 
-class mariokart8deluxe_battle_courses_select_column(str, Enum):
-    created_at = "created_at"
-    id = "id"
-    index = "index"
-    mariokart8deluxe_console_id = "mariokart8deluxe_console_id"
-    name = "name"
-    updated_at = "updated_at"
-
-
 class mariokart8deluxe_battle_courses_update_column(str, Enum):
     created_at = "created_at"
     id = "id"
@@ -690,14 +600,6 @@ class mariokart8deluxe_battle_rules_constraint(str, Enum):
     mariokart8deluxe_battle_rules_pkey = "mariokart8deluxe_battle_rules_pkey"
 
 
-class mariokart8deluxe_battle_rules_select_column(str, Enum):
-    created_at = "created_at"
-    id = "id"
-    index = "index"
-    name = "name"
-    updated_at = "updated_at"
-
-
 class mariokart8deluxe_battle_rules_update_column(str, Enum):
     created_at = "created_at"
     id = "id"
@@ -711,13 +613,6 @@ class mariokart8deluxe_consoles_constraint(str, Enum):
     mariokart8deluxe_consoles_pkey = "mariokart8deluxe_consoles_pkey"
 
 
-class mariokart8deluxe_consoles_select_column(str, Enum):
-    created_at = "created_at"
-    id = "id"
-    name = "name"
-    updated_at = "updated_at"
-
-
 class mariokart8deluxe_consoles_update_column(str, Enum):
     created_at = "created_at"
     id = "id"
@@ -761,14 +656,6 @@ class mariokart8deluxe_cups_constraint(str, Enum):
     mariokart8deluxe_cups_pkey = "mariokart8deluxe_cups_pkey"
 
 
-class mariokart8deluxe_cups_select_column(str, Enum):
-    created_at = "created_at"
-    id = "id"
-    index = "index"
-    name = "name"
-    updated_at = "updated_at"
-
-
 class mariokart8deluxe_cups_update_column(str, Enum):
     created_at = "created_at"
     id = "id"
@@ -811,14 +698,6 @@ class mariokart8deluxe_race_rules_constraint(str, Enum):
     mariokart8deluxe_race_rules_pkey = "mariokart8deluxe_race_rules_pkey"
 
 
-class mariokart8deluxe_race_rules_select_column(str, Enum):
-    created_at = "created_at"
-    id = "id"
-    index = "index"
-    name = "name"
-    updated_at = "updated_at"
-
-
 class mariokart8deluxe_race_rules_update_column(str, Enum):
     created_at = "created_at"
     id = "id"
@@ -879,14 +758,6 @@ class niconico_accounts_constraint(str, Enum):
     )
 
 
-class niconico_accounts_select_column(str, Enum):
-    created_at = "created_at"
-    id = "id"
-    name = "name"
-    remote_niconico_account_id = "remote_niconico_account_id"
-    updated_at = "updated_at"
-
-
 class niconico_accounts_update_column(str, Enum):
     created_at = "created_at"
     id = "id"
@@ -903,15 +774,6 @@ class niconico_channels_constraint(str, Enum):
     niconico_channels_screen_name_key = "niconico_channels_screen_name_key"
 
 
-class niconico_channels_select_column(str, Enum):
-    created_at = "created_at"
-    id = "id"
-    name = "name"
-    remote_niconico_channel_id = "remote_niconico_channel_id"
-    screen_name = "screen_name"
-    updated_at = "updated_at"
-
-
 class niconico_channels_update_column(str, Enum):
     created_at = "created_at"
     id = "id"
@@ -928,14 +790,6 @@ class niconico_communities_constraint(str, Enum):
     )
 
 
-class niconico_communities_select_column(str, Enum):
-    created_at = "created_at"
-    id = "id"
-    name = "name"
-    remote_niconico_community_id = "remote_niconico_community_id"
-    updated_at = "updated_at"
-
-
 class niconico_communities_update_column(str, Enum):
     created_at = "created_at"
     id = "id"
@@ -952,15 +806,6 @@ class niconico_plus_channels_constraint(str, Enum):
     niconico_plus_channels_screen_name_key = "niconico_plus_channels_screen_name_key"
 
 
-class niconico_plus_channels_select_column(str, Enum):
-    created_at = "created_at"
-    id = "id"
-    name = "name"
-    remote_niconico_plus_channel_id = "remote_niconico_plus_channel_id"
-    screen_name = "screen_name"
-    updated_at = "updated_at"
-
-
 class niconico_plus_channels_update_column(str, Enum):
     created_at = "created_at"
     id = "id"
@@ -977,17 +822,6 @@ class niconico_videos_constraint(str, Enum):
     )
 
 
-class niconico_videos_select_column(str, Enum):
-    created_at = "created_at"
-    id = "id"
-    niconico_account_id = "niconico_account_id"
-    remote_niconico_content_id = "remote_niconico_content_id"
-    start_time = "start_time"
-    thumbnail_url = "thumbnail_url"
-    title = "title"
-    updated_at = "updated_at"
-
-
 class niconico_videos_update_column(str, Enum):
     created_at = "created_at"
     id = "id"
@@ -999,15 +833,6 @@ class niconico_videos_update_column(str, Enum):
     updated_at = "updated_at"
 
 
-class order_by(str, Enum):
-    asc = "asc"
-    asc_nulls_first = "asc_nulls_first"
-    asc_nulls_last = "asc_nulls_last"
-    desc = "desc"
-    desc_nulls_first = "desc_nulls_first"
-    desc_nulls_last = "desc_nulls_last"
-
-
 class person_fediverse_accounts_constraint(str, Enum):
     v2_person_fediverse_accounts_person_id_fediverse_account_id_key = (
         "v2_person_fediverse_accounts_person_id_fediverse_account_id_key"
@@ -1173,13 +998,6 @@ class persons_constraint(str, Enum):
     members_pkey = "members_pkey"
 
 
-class persons_select_column(str, Enum):
-    created_at = "created_at"
-    id = "id"
-    name = "name"
-    updated_at = "updated_at"
-
-
 class persons_update_column(str, Enum):
     created_at = "created_at"
     id = "id"
@@ -1414,16 +1232,6 @@ class programs_constraint(str, Enum):
     programs_pkey = "programs_pkey"
 
 
-class programs_select_column(str, Enum):
-    created_at = "created_at"
-    end_time = "end_time"
-    game_id = "game_id"
-    id = "id"
-    start_time = "start_time"
-    title = "title"
-    updated_at = "updated_at"
-
-
 class programs_update_column(str, Enum):
     created_at = "created_at"
     end_time = "end_time"
@@ -1461,14 +1269,6 @@ class projects_constraint(str, Enum):
     communities_pkey = "communities_pkey"
 
 
-class projects_select_column(str, Enum):
-    created_at = "created_at"
-    id = "id"
-    name = "name"
-    start_time = "start_time"
-    updated_at = "updated_at"
-
-
 class projects_update_column(str, Enum):
     created_at = "created_at"
     id = "id"
@@ -1487,15 +1287,6 @@ class twitter_accounts_constraint(str, Enum):
     )
 
 
-class twitter_accounts_select_column(str, Enum):
-    created_at = "created_at"
-    id = "id"
-    name = "name"
-    remote_twitter_user_id = "remote_twitter_user_id"
-    twitter_screen_name = "twitter_screen_name"
-    updated_at = "updated_at"
-
-
 class twitter_accounts_update_column(str, Enum):
     created_at = "created_at"
     id = "id"
@@ -1533,16 +1324,6 @@ class twitter_tweets_constraint(str, Enum):
     twitter_tweets_remote_tweet_id_key = "twitter_tweets_remote_tweet_id_key"
 
 
-class twitter_tweets_select_column(str, Enum):
-    created_at = "created_at"
-    id = "id"
-    remote_tweet_id = "remote_tweet_id"
-    tweet_embed_html = "tweet_embed_html"
-    tweet_time = "tweet_time"
-    twitter_account_id = "twitter_account_id"
-    updated_at = "updated_at"
-
-
 class twitter_tweets_update_column(str, Enum):
     created_at = "created_at"
     id = "id"
@@ -1561,15 +1342,6 @@ class youtube_channels_constraint(str, Enum):
     youtube_channels_youtube_channel_id_key = "youtube_channels_youtube_channel_id_key"
 
 
-class youtube_channels_select_column(str, Enum):
-    created_at = "created_at"
-    id = "id"
-    name = "name"
-    remote_youtube_channel_id = "remote_youtube_channel_id"
-    updated_at = "updated_at"
-    youtube_channel_handle = "youtube_channel_handle"
-
-
 class youtube_channels_update_column(str, Enum):
     created_at = "created_at"
     id = "id"
@@ -1615,17 +1387,6 @@ class youtube_videos_constraint(str, Enum):
     )
 
 
-class youtube_videos_select_column(str, Enum):
-    created_at = "created_at"
-    id = "id"
-    is_premiere = "is_premiere"
-    post_time = "post_time"
-    remote_youtube_video_id = "remote_youtube_video_id"
-    title = "title"
-    updated_at = "updated_at"
-    youtube_channel_id = "youtube_channel_id"
-
-
 class youtube_videos_update_column(str, Enum):
     created_at = "created_at"
     id = "id"
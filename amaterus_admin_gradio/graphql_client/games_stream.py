@@ -0,0 +1,19 @@
+# Generated by ariadne-codegen
+# Source: queries/
+
+from typing import Any, List
+
+from .base_model import BaseModel
+
+
+class GamesStream(BaseModel):
+    game_list: List["GamesStreamGameList"]
+
+
+class GamesStreamGameList(BaseModel):
+    id: Any
+    name: str
+    updated_at: Any
+
+
+GamesStream.model_rebuild()
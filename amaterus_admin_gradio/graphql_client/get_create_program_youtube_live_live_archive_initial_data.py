@@ -1,24 +0,0 @@
-# Generated by ariadne-codegen
-# Source: queries/
-
-from typing import Any, List
-
-from .base_model import BaseModel
-
-
-class GetCreateProgramYoutubeLiveLiveArchiveInitialData(BaseModel):
-    project_list: List["GetCreateProgramYoutubeLiveLiveArchiveInitialDataProjectList"]
-    person_list: List["GetCreateProgramYoutubeLiveLiveArchiveInitialDataPersonList"]
-
-
-class GetCreateProgramYoutubeLiveLiveArchiveInitialDataProjectList(BaseModel):
-    id: Any
-    name: str
-
-
-class GetCreateProgramYoutubeLiveLiveArchiveInitialDataPersonList(BaseModel):
-    id: Any
-    name: str
-
-
-GetCreateProgramYoutubeLiveLiveArchiveInitialData.model_rebuild()
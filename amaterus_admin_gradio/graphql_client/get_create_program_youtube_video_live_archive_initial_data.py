@@ -1,24 +0,0 @@
-# Generated by ariadne-codegen
-# Source: queries/
-
-from typing import Any, List
-
-from .base_model import BaseModel
-
-
-class GetCreateProgramYoutubeVideoLiveArchiveInitialData(BaseModel):
-    project_list: List["GetCreateProgramYoutubeVideoLiveArchiveInitialDataProjectList"]
-    person_list: List["GetCreateProgramYoutubeVideoLiveArchiveInitialDataPersonList"]
-
-
-class GetCreateProgramYoutubeVideoLiveArchiveInitialDataProjectList(BaseModel):
-    id: Any
-    name: str
-
-
-class GetCreateProgramYoutubeVideoLiveArchiveInitialDataPersonList(BaseModel):
-    id: Any
-    name: str
-
-
-GetCreateProgramYoutubeVideoLiveArchiveInitialData.model_rebuild()
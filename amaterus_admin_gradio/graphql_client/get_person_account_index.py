@@ -0,0 +1,40 @@
+# Generated by ariadne-codegen
+# Source: queries/
+
+from typing import Any, List
+
+from .base_model import BaseModel
+
+
+class GetPersonAccountIndex(BaseModel):
+    person_youtube_channel_list: List["GetPersonAccountIndexPersonYoutubeChannelList"]
+    person_niconico_account_list: List["GetPersonAccountIndexPersonNiconicoAccountList"]
+    person_twitter_account_list: List["GetPersonAccountIndexPersonTwitterAccountList"]
+
+
+class GetPersonAccountIndexPersonYoutubeChannelList(BaseModel):
+    person_id: Any
+    youtube_channel: "GetPersonAccountIndexPersonYoutubeChannelListYoutubeChannel"
+
+
+class GetPersonAccountIndexPersonYoutubeChannelListYoutubeChannel(BaseModel):
+    remote_youtube_channel_id: str
+
+
+class GetPersonAccountIndexPersonNiconicoAccountList(BaseModel):
+    person_id: Any
+    niconico_account: "GetPersonAccountIndexPersonNiconicoAccountListNiconicoAccount"
+
+
+class GetPersonAccountIndexPersonNiconicoAccountListNiconicoAccount(BaseModel):
+    remote_niconico_account_id: str
+
+
+class GetPersonAccountIndexPersonTwitterAccountList(BaseModel):
+    person_id: Any
+    twitter_account_id: Any
+
+
+GetPersonAccountIndex.model_rebuild()
+GetPersonAccountIndexPersonYoutubeChannelList.model_rebuild()
+GetPersonAccountIndexPersonNiconicoAccountList.model_rebuild()
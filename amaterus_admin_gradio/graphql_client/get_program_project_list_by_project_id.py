@@ -23,6 +23,8 @@ class GetProgramProjectListByProjectIdProjectProgramProjectList(BaseModel):
 class GetProgramProjectListByProjectIdProjectProgramProjectListProgram(BaseModel):
     id: Any
     title: str
+    start_time: Optional[Any]
+    end_time: Optional[Any]
 
 
 GetProgramProjectListByProjectId.model_rebuild()
@@ -0,0 +1,37 @@
+# Generated by ariadne-codegen
+# Source: queries/
+
+from typing import Any, List
+
+from .base_model import BaseModel
+
+
+class GetReferenceData(BaseModel):
+    project_list: List["GetReferenceDataProjectList"]
+    person_list: List["GetReferenceDataPersonList"]
+    game_list: List["GetReferenceDataGameList"]
+    twitter_account_list: List["GetReferenceDataTwitterAccountList"]
+
+
+class GetReferenceDataProjectList(BaseModel):
+    id: Any
+    name: str
+
+
+class GetReferenceDataPersonList(BaseModel):
+    id: Any
+    name: str
+
+
+class GetReferenceDataGameList(BaseModel):
+    id: Any
+    name: str
+
+
+class GetReferenceDataTwitterAccountList(BaseModel):
+    id: Any
+    twitter_screen_name: str
+    name: str
+
+
+GetReferenceData.model_rebuild()
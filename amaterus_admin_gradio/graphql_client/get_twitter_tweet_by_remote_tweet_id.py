@@ -0,0 +1,17 @@
+# Generated by ariadne-codegen
+# Source: queries/
+
+from typing import Any, List
+
+from .base_model import BaseModel
+
+
+class GetTwitterTweetByRemoteTweetId(BaseModel):
+    twitter_tweet_list: List["GetTwitterTweetByRemoteTweetIdTwitterTweetList"]
+
+
+class GetTwitterTweetByRemoteTweetIdTwitterTweetList(BaseModel):
+    id: Any
+
+
+GetTwitterTweetByRemoteTweetId.model_rebuild()
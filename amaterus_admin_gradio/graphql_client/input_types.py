@@ -12,8 +12,6 @@ from .enums import (
     amongus_maps_select_column_amongus_maps_aggregate_bool_exp_bool_and_arguments_columns,
     amongus_maps_select_column_amongus_maps_aggregate_bool_exp_bool_or_arguments_columns,
     amongus_maps_update_column,
-    amongus_match_mods_constraint,
-    amongus_match_mods_update_column,
     amongus_match_player_result_roles_constraint,
     amongus_match_player_result_roles_select_column,
     amongus_match_player_result_roles_update_column,
@@ -47,7 +45,6 @@ from .enums import (
     amongusvr_matches_select_column_amongusvr_matches_aggregate_bool_exp_bool_and_arguments_columns,
     amongusvr_matches_select_column_amongusvr_matches_aggregate_bool_exp_bool_or_arguments_columns,
     amongusvr_matches_update_column,
-    cursor_ordering,
     fallguys_custom_round_twitter_announcements_constraint,
     fallguys_custom_round_twitter_announcements_select_column,
     fallguys_custom_round_twitter_announcements_select_column_fallguys_custom_round_twitter_announcements_aggregate_bool_exp_bool_and_arguments_columns,
@@ -111,7 +108,6 @@ from .enums import (
     niconico_plus_channels_update_column,
     niconico_videos_constraint,
     niconico_videos_update_column,
-    order_by,
     person_fediverse_accounts_constraint,
     person_fediverse_accounts_select_column,
     person_fediverse_accounts_update_column,
@@ -258,12 +254,6 @@ class amongus_maps_aggregate_bool_exp_count(BaseModel):
     predicate: "Int_comparison_exp"
 
 
-class amongus_maps_aggregate_order_by(BaseModel):
-    count: Optional[order_by] = None
-    max: Optional["amongus_maps_max_order_by"] = None
-    min: Optional["amongus_maps_min_order_by"] = None
-
-
 class amongus_maps_arr_rel_insert_input(BaseModel):
     data: List["amongus_maps_insert_input"]
     on_conflict: Optional["amongus_maps_on_conflict"] = None
@@ -292,22 +282,6 @@ class amongus_maps_insert_input(BaseModel):
     updated_at: Optional[Any] = None
 
 
-class amongus_maps_max_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    mod_id: Optional[order_by] = None
-    name: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class amongus_maps_min_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    mod_id: Optional[order_by] = None
-    name: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
 class amongus_maps_obj_rel_insert_input(BaseModel):
     data: "amongus_maps_insert_input"
     on_conflict: Optional["amongus_maps_on_conflict"] = None
@@ -319,122 +293,6 @@ class amongus_maps_on_conflict(BaseModel):
     where: Optional["amongus_maps_bool_exp"] = None
 
 
-class amongus_maps_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    is_vanilla: Optional[order_by] = None
-    mod: Optional["amongus_mods_order_by"] = None
-    mod_id: Optional[order_by] = None
-    name: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class amongus_maps_pk_columns_input(BaseModel):
-    id: Any
-
-
-class amongus_maps_set_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    is_vanilla: Optional[bool] = None
-    mod_id: Optional[Any] = None
-    name: Optional[str] = None
-    updated_at: Optional[Any] = None
-
-
-class amongus_maps_stream_cursor_input(BaseModel):
-    initial_value: "amongus_maps_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class amongus_maps_stream_cursor_value_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    is_vanilla: Optional[bool] = None
-    mod_id: Optional[Any] = None
-    name: Optional[str] = None
-    updated_at: Optional[Any] = None
-
-
-class amongus_maps_updates(BaseModel):
-    set: Optional["amongus_maps_set_input"] = Field(alias="_set", default=None)
-    where: "amongus_maps_bool_exp"
-
-
-class amongus_match_mods_bool_exp(BaseModel):
-    and_: Optional[List["amongus_match_mods_bool_exp"]] = Field(
-        alias="_and", default=None
-    )
-    not_: Optional["amongus_match_mods_bool_exp"] = Field(alias="_not", default=None)
-    or_: Optional[List["amongus_match_mods_bool_exp"]] = Field(
-        alias="_or", default=None
-    )
-    amongus_match_id: Optional["uuid_comparison_exp"] = None
-    amongus_mod_id: Optional["uuid_comparison_exp"] = None
-    amongus_mod_version_id: Optional["uuid_comparison_exp"] = None
-    created_at: Optional["timestamptz_comparison_exp"] = None
-    id: Optional["uuid_comparison_exp"] = None
-    updated_at: Optional["timestamptz_comparison_exp"] = None
-
-
-class amongus_match_mods_insert_input(BaseModel):
-    amongus_match_id: Optional[Any] = None
-    amongus_mod_id: Optional[Any] = None
-    amongus_mod_version_id: Optional[Any] = None
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class amongus_match_mods_on_conflict(BaseModel):
-    constraint: amongus_match_mods_constraint
-    update_columns: List[amongus_match_mods_update_column] = Field(
-        default_factory=lambda: []
-    )
-    where: Optional["amongus_match_mods_bool_exp"] = None
-
-
-class amongus_match_mods_order_by(BaseModel):
-    amongus_match_id: Optional[order_by] = None
-    amongus_mod_id: Optional[order_by] = None
-    amongus_mod_version_id: Optional[order_by] = None
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class amongus_match_mods_pk_columns_input(BaseModel):
-    id: Any
-
-
-class amongus_match_mods_set_input(BaseModel):
-    amongus_match_id: Optional[Any] = None
-    amongus_mod_id: Optional[Any] = None
-    amongus_mod_version_id: Optional[Any] = None
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class amongus_match_mods_stream_cursor_input(BaseModel):
-    initial_value: "amongus_match_mods_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class amongus_match_mods_stream_cursor_value_input(BaseModel):
-    amongus_match_id: Optional[Any] = None
-    amongus_mod_id: Optional[Any] = None
-    amongus_mod_version_id: Optional[Any] = None
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class amongus_match_mods_updates(BaseModel):
-    set: Optional["amongus_match_mods_set_input"] = Field(alias="_set", default=None)
-    where: "amongus_match_mods_bool_exp"
-
-
 class amongus_match_player_result_roles_aggregate_bool_exp(BaseModel):
     count: Optional["amongus_match_player_result_roles_aggregate_bool_exp_count"] = None
 
@@ -446,31 +304,11 @@ class amongus_match_player_result_roles_aggregate_bool_exp_count(BaseModel):
     predicate: "Int_comparison_exp"
 
 
-class amongus_match_player_result_roles_aggregate_order_by(BaseModel):
-    avg: Optional["amongus_match_player_result_roles_avg_order_by"] = None
-    count: Optional[order_by] = None
-    max: Optional["amongus_match_player_result_roles_max_order_by"] = None
-    min: Optional["amongus_match_player_result_roles_min_order_by"] = None
-    stddev: Optional["amongus_match_player_result_roles_stddev_order_by"] = None
-    stddev_pop: Optional["amongus_match_player_result_roles_stddev_pop_order_by"] = None
-    stddev_samp: Optional["amongus_match_player_result_roles_stddev_samp_order_by"] = (
-        None
-    )
-    sum: Optional["amongus_match_player_result_roles_sum_order_by"] = None
-    var_pop: Optional["amongus_match_player_result_roles_var_pop_order_by"] = None
-    var_samp: Optional["amongus_match_player_result_roles_var_samp_order_by"] = None
-    variance: Optional["amongus_match_player_result_roles_variance_order_by"] = None
-
-
 class amongus_match_player_result_roles_arr_rel_insert_input(BaseModel):
     data: List["amongus_match_player_result_roles_insert_input"]
     on_conflict: Optional["amongus_match_player_result_roles_on_conflict"] = None
 
 
-class amongus_match_player_result_roles_avg_order_by(BaseModel):
-    amongus_role_index: Optional[order_by] = None
-
-
 class amongus_match_player_result_roles_bool_exp(BaseModel):
     and_: Optional[List["amongus_match_player_result_roles_bool_exp"]] = Field(
         alias="_and", default=None
@@ -490,10 +328,6 @@ class amongus_match_player_result_roles_bool_exp(BaseModel):
     updated_at: Optional["timestamptz_comparison_exp"] = None
 
 
-class amongus_match_player_result_roles_inc_input(BaseModel):
-    amongus_role_index: Optional[int] = None
-
-
 class amongus_match_player_result_roles_insert_input(BaseModel):
     amongus_match_id: Optional[Any] = None
     amongus_role_id: Optional[Any] = None
@@ -504,26 +338,6 @@ class amongus_match_player_result_roles_insert_input(BaseModel):
     updated_at: Optional[Any] = None
 
 
-class amongus_match_player_result_roles_max_order_by(BaseModel):
-    amongus_match_id: Optional[order_by] = None
-    amongus_role_id: Optional[order_by] = None
-    amongus_role_index: Optional[order_by] = None
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    person_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class amongus_match_player_result_roles_min_order_by(BaseModel):
-    amongus_match_id: Optional[order_by] = None
-    amongus_role_id: Optional[order_by] = None
-    amongus_role_index: Optional[order_by] = None
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    person_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
 class amongus_match_player_result_roles_on_conflict(BaseModel):
     constraint: amongus_match_player_result_roles_constraint
     update_columns: List[amongus_match_player_result_roles_update_column] = Field(
@@ -532,83 +346,6 @@ class amongus_match_player_result_roles_on_conflict(BaseModel):
     where: Optional["amongus_match_player_result_roles_bool_exp"] = None
 
 
-class amongus_match_player_result_roles_order_by(BaseModel):
-    amongus_match_id: Optional[order_by] = None
-    amongus_role_id: Optional[order_by] = None
-    amongus_role_index: Optional[order_by] = None
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    person_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class amongus_match_player_result_roles_pk_columns_input(BaseModel):
-    id: Any
-
-
-class amongus_match_player_result_roles_set_input(BaseModel):
-    amongus_match_id: Optional[Any] = None
-    amongus_role_id: Optional[Any] = None
-    amongus_role_index: Optional[int] = None
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    person_id: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class amongus_match_player_result_roles_stddev_order_by(BaseModel):
-    amongus_role_index: Optional[order_by] = None
-
-
-class amongus_match_player_result_roles_stddev_pop_order_by(BaseModel):
-    amongus_role_index: Optional[order_by] = None
-
-
-class amongus_match_player_result_roles_stddev_samp_order_by(BaseModel):
-    amongus_role_index: Optional[order_by] = None
-
-
-class amongus_match_player_result_roles_stream_cursor_input(BaseModel):
-    initial_value: "amongus_match_player_result_roles_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class amongus_match_player_result_roles_stream_cursor_value_input(BaseModel):
-    amongus_match_id: Optional[Any] = None
-    amongus_role_id: Optional[Any] = None
-    amongus_role_index: Optional[int] = None
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    person_id: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class amongus_match_player_result_roles_sum_order_by(BaseModel):
-    amongus_role_index: Optional[order_by] = None
-
-
-class amongus_match_player_result_roles_updates(BaseModel):
-    inc: Optional["amongus_match_player_result_roles_inc_input"] = Field(
-        alias="_inc", default=None
-    )
-    set: Optional["amongus_match_player_result_roles_set_input"] = Field(
-        alias="_set", default=None
-    )
-    where: "amongus_match_player_result_roles_bool_exp"
-
-
-class amongus_match_player_result_roles_var_pop_order_by(BaseModel):
-    amongus_role_index: Optional[order_by] = None
-
-
-class amongus_match_player_result_roles_var_samp_order_by(BaseModel):
-    amongus_role_index: Optional[order_by] = None
-
-
-class amongus_match_player_result_roles_variance_order_by(BaseModel):
-    amongus_role_index: Optional[order_by] = None
-
-
 class amongus_match_players_aggregate_bool_exp(BaseModel):
     count: Optional["amongus_match_players_aggregate_bool_exp_count"] = None
 
@@ -620,12 +357,6 @@ class amongus_match_players_aggregate_bool_exp_count(BaseModel):
     predicate: "Int_comparison_exp"
 
 
-class amongus_match_players_aggregate_order_by(BaseModel):
-    count: Optional[order_by] = None
-    max: Optional["amongus_match_players_max_order_by"] = None
-    min: Optional["amongus_match_players_min_order_by"] = None
-
-
 class amongus_match_players_arr_rel_insert_input(BaseModel):
     data: List["amongus_match_players_insert_input"]
     on_conflict: Optional["amongus_match_players_on_conflict"] = None
@@ -660,24 +391,6 @@ class amongus_match_players_insert_input(BaseModel):
     updated_at: Optional[Any] = None
 
 
-class amongus_match_players_max_order_by(BaseModel):
-    amongus_match_id: Optional[order_by] = None
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    nickname: Optional[order_by] = None
-    person_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class amongus_match_players_min_order_by(BaseModel):
-    amongus_match_id: Optional[order_by] = None
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    nickname: Optional[order_by] = None
-    person_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
 class amongus_match_players_on_conflict(BaseModel):
     constraint: amongus_match_players_constraint
     update_columns: List[amongus_match_players_update_column] = Field(
@@ -686,49 +399,6 @@ class amongus_match_players_on_conflict(BaseModel):
     where: Optional["amongus_match_players_bool_exp"] = None
 
 
-class amongus_match_players_order_by(BaseModel):
-    amongus_match: Optional["amongus_matches_order_by"] = None
-    amongus_match_id: Optional[order_by] = None
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    nickname: Optional[order_by] = None
-    person: Optional["persons_order_by"] = None
-    person_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class amongus_match_players_pk_columns_input(BaseModel):
-    id: Any
-
-
-class amongus_match_players_set_input(BaseModel):
-    amongus_match_id: Optional[Any] = None
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    nickname: Optional[str] = None
-    person_id: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class amongus_match_players_stream_cursor_input(BaseModel):
-    initial_value: "amongus_match_players_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class amongus_match_players_stream_cursor_value_input(BaseModel):
-    amongus_match_id: Optional[Any] = None
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    nickname: Optional[str] = None
-    person_id: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class amongus_match_players_updates(BaseModel):
-    set: Optional["amongus_match_players_set_input"] = Field(alias="_set", default=None)
-    where: "amongus_match_players_bool_exp"
-
-
 class amongus_matches_aggregate_bool_exp(BaseModel):
     bool_and: Optional["amongus_matches_aggregate_bool_exp_bool_and"] = None
     bool_or: Optional["amongus_matches_aggregate_bool_exp_bool_or"] = None
@@ -756,29 +426,11 @@ class amongus_matches_aggregate_bool_exp_count(BaseModel):
     predicate: "Int_comparison_exp"
 
 
-class amongus_matches_aggregate_order_by(BaseModel):
-    avg: Optional["amongus_matches_avg_order_by"] = None
-    count: Optional[order_by] = None
-    max: Optional["amongus_matches_max_order_by"] = None
-    min: Optional["amongus_matches_min_order_by"] = None
-    stddev: Optional["amongus_matches_stddev_order_by"] = None
-    stddev_pop: Optional["amongus_matches_stddev_pop_order_by"] = None
-    stddev_samp: Optional["amongus_matches_stddev_samp_order_by"] = None
-    sum: Optional["amongus_matches_sum_order_by"] = None
-    var_pop: Optional["amongus_matches_var_pop_order_by"] = None
-    var_samp: Optional["amongus_matches_var_samp_order_by"] = None
-    variance: Optional["amongus_matches_variance_order_by"] = None
-
-
 class amongus_matches_arr_rel_insert_input(BaseModel):
     data: List["amongus_matches_insert_input"]
     on_conflict: Optional["amongus_matches_on_conflict"] = None
 
 
-class amongus_matches_avg_order_by(BaseModel):
-    index: Optional[order_by] = None
-
-
 class amongus_matches_bool_exp(BaseModel):
     and_: Optional[List["amongus_matches_bool_exp"]] = Field(alias="_and", default=None)
     not_: Optional["amongus_matches_bool_exp"] = Field(alias="_not", default=None)
@@ -803,10 +455,6 @@ class amongus_matches_bool_exp(BaseModel):
     updated_at: Optional["timestamptz_comparison_exp"] = None
 
 
-class amongus_matches_inc_input(BaseModel):
-    index: Optional[int] = None
-
-
 class amongus_matches_insert_input(BaseModel):
     amongus_map: Optional["amongus_maps_obj_rel_insert_input"] = None
     amongus_map_id: Optional[Any] = None
@@ -827,30 +475,6 @@ class amongus_matches_insert_input(BaseModel):
     updated_at: Optional[Any] = None
 
 
-class amongus_matches_max_order_by(BaseModel):
-    amongus_map_id: Optional[order_by] = None
-    amongus_vanilla_version_id: Optional[order_by] = None
-    created_at: Optional[order_by] = None
-    end_time: Optional[order_by] = None
-    id: Optional[order_by] = None
-    index: Optional[order_by] = None
-    program_id: Optional[order_by] = None
-    start_time: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class amongus_matches_min_order_by(BaseModel):
-    amongus_map_id: Optional[order_by] = None
-    amongus_vanilla_version_id: Optional[order_by] = None
-    created_at: Optional[order_by] = None
-    end_time: Optional[order_by] = None
-    id: Optional[order_by] = None
-    index: Optional[order_by] = None
-    program_id: Optional[order_by] = None
-    start_time: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
 class amongus_matches_obj_rel_insert_input(BaseModel):
     data: "amongus_matches_insert_input"
     on_conflict: Optional["amongus_matches_on_conflict"] = None
@@ -864,97 +488,6 @@ class amongus_matches_on_conflict(BaseModel):
     where: Optional["amongus_matches_bool_exp"] = None
 
 
-class amongus_matches_order_by(BaseModel):
-    amongus_map: Optional["amongus_maps_order_by"] = None
-    amongus_map_id: Optional[order_by] = None
-    amongus_match_players_aggregate: Optional[
-        "amongus_match_players_aggregate_order_by"
-    ] = None
-    amongus_vanilla_version: Optional["amongus_vanilla_versions_order_by"] = None
-    amongus_vanilla_version_id: Optional[order_by] = None
-    created_at: Optional[order_by] = None
-    end_time: Optional[order_by] = None
-    id: Optional[order_by] = None
-    index: Optional[order_by] = None
-    is_aborted: Optional[order_by] = None
-    is_vanilla: Optional[order_by] = None
-    program: Optional["programs_order_by"] = None
-    program_id: Optional[order_by] = None
-    start_time: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class amongus_matches_pk_columns_input(BaseModel):
-    id: Any
-
-
-class amongus_matches_set_input(BaseModel):
-    amongus_map_id: Optional[Any] = None
-    amongus_vanilla_version_id: Optional[Any] = None
-    created_at: Optional[Any] = None
-    end_time: Optional[Any] = None
-    id: Optional[Any] = None
-    index: Optional[int] = None
-    is_aborted: Optional[bool] = None
-    is_vanilla: Optional[bool] = None
-    program_id: Optional[Any] = None
-    start_time: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class amongus_matches_stddev_order_by(BaseModel):
-    index: Optional[order_by] = None
-
-
-class amongus_matches_stddev_pop_order_by(BaseModel):
-    index: Optional[order_by] = None
-
-
-class amongus_matches_stddev_samp_order_by(BaseModel):
-    index: Optional[order_by] = None
-
-
-class amongus_matches_stream_cursor_input(BaseModel):
-    initial_value: "amongus_matches_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class amongus_matches_stream_cursor_value_input(BaseModel):
-    amongus_map_id: Optional[Any] = None
-    amongus_vanilla_version_id: Optional[Any] = None
-    created_at: Optional[Any] = None
-    end_time: Optional[Any] = None
-    id: Optional[Any] = None
-    index: Optional[int] = None
-    is_aborted: Optional[bool] = None
-    is_vanilla: Optional[bool] = None
-    program_id: Optional[Any] = None
-    start_time: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class amongus_matches_sum_order_by(BaseModel):
-    index: Optional[order_by] = None
-
-
-class amongus_matches_updates(BaseModel):
-    inc: Optional["amongus_matches_inc_input"] = Field(alias="_inc", default=None)
-    set: Optional["amongus_matches_set_input"] = Field(alias="_set", default=None)
-    where: "amongus_matches_bool_exp"
-
-
-class amongus_matches_var_pop_order_by(BaseModel):
-    index: Optional[order_by] = None
-
-
-class amongus_matches_var_samp_order_by(BaseModel):
-    index: Optional[order_by] = None
-
-
-class amongus_matches_variance_order_by(BaseModel):
-    index: Optional[order_by] = None
-
-
 class amongus_mod_versions_aggregate_bool_exp(BaseModel):
     count: Optional["amongus_mod_versions_aggregate_bool_exp_count"] = None
 
@@ -966,12 +499,6 @@ class amongus_mod_versions_aggregate_bool_exp_count(BaseModel):
     predicate: "Int_comparison_exp"
 
 
-class amongus_mod_versions_aggregate_order_by(BaseModel):
-    count: Optional[order_by] = None
-    max: Optional["amongus_mod_versions_max_order_by"] = None
-    min: Optional["amongus_mod_versions_min_order_by"] = None
-
-
 class amongus_mod_versions_arr_rel_insert_input(BaseModel):
     data: List["amongus_mod_versions_insert_input"]
     on_conflict: Optional["amongus_mod_versions_on_conflict"] = None
@@ -1006,26 +533,6 @@ class amongus_mod_versions_insert_input(BaseModel):
     version: Optional[str] = None
 
 
-class amongus_mod_versions_max_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    github_url: Optional[order_by] = None
-    id: Optional[order_by] = None
-    mod_id: Optional[order_by] = None
-    release_time: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-    version: Optional[order_by] = None
-
-
-class amongus_mod_versions_min_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    github_url: Optional[order_by] = None
-    id: Optional[order_by] = None
-    mod_id: Optional[order_by] = None
-    release_time: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-    version: Optional[order_by] = None
-
-
 class amongus_mod_versions_obj_rel_insert_input(BaseModel):
     data: "amongus_mod_versions_insert_input"
     on_conflict: Optional["amongus_mod_versions_on_conflict"] = None
@@ -1039,51 +546,6 @@ class amongus_mod_versions_on_conflict(BaseModel):
     where: Optional["amongus_mod_versions_bool_exp"] = None
 
 
-class amongus_mod_versions_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    github_url: Optional[order_by] = None
-    id: Optional[order_by] = None
-    mod: Optional["amongus_mods_order_by"] = None
-    mod_id: Optional[order_by] = None
-    release_time: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-    version: Optional[order_by] = None
-
-
-class amongus_mod_versions_pk_columns_input(BaseModel):
-    id: Any
-
-
-class amongus_mod_versions_set_input(BaseModel):
-    created_at: Optional[Any] = None
-    github_url: Optional[str] = None
-    id: Optional[Any] = None
-    mod_id: Optional[Any] = None
-    release_time: Optional[Any] = None
-    updated_at: Optional[Any] = None
-    version: Optional[str] = None
-
-
-class amongus_mod_versions_stream_cursor_input(BaseModel):
-    initial_value: "amongus_mod_versions_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class amongus_mod_versions_stream_cursor_value_input(BaseModel):
-    created_at: Optional[Any] = None
-    github_url: Optional[str] = None
-    id: Optional[Any] = None
-    mod_id: Optional[Any] = None
-    release_time: Optional[Any] = None
-    updated_at: Optional[Any] = None
-    version: Optional[str] = None
-
-
-class amongus_mod_versions_updates(BaseModel):
-    set: Optional["amongus_mod_versions_set_input"] = Field(alias="_set", default=None)
-    where: "amongus_mod_versions_bool_exp"
-
-
 class amongus_mods_bool_exp(BaseModel):
     and_: Optional[List["amongus_mods_bool_exp"]] = Field(alias="_and", default=None)
     not_: Optional["amongus_mods_bool_exp"] = Field(alias="_not", default=None)
@@ -1123,47 +585,6 @@ class amongus_mods_on_conflict(BaseModel):
     where: Optional["amongus_mods_bool_exp"] = None
 
 
-class amongus_mods_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    github_url: Optional[order_by] = None
-    id: Optional[order_by] = None
-    maps_aggregate: Optional["amongus_maps_aggregate_order_by"] = None
-    mod_versions_aggregate: Optional["amongus_mod_versions_aggregate_order_by"] = None
-    name: Optional[order_by] = None
-    player_roles_aggregate: Optional["amongus_roles_aggregate_order_by"] = None
-    updated_at: Optional[order_by] = None
-
-
-class amongus_mods_pk_columns_input(BaseModel):
-    id: Any
-
-
-class amongus_mods_set_input(BaseModel):
-    created_at: Optional[Any] = None
-    github_url: Optional[str] = None
-    id: Optional[Any] = None
-    name: Optional[str] = None
-    updated_at: Optional[Any] = None
-
-
-class amongus_mods_stream_cursor_input(BaseModel):
-    initial_value: "amongus_mods_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class amongus_mods_stream_cursor_value_input(BaseModel):
-    created_at: Optional[Any] = None
-    github_url: Optional[str] = None
-    id: Optional[Any] = None
-    name: Optional[str] = None
-    updated_at: Optional[Any] = None
-
-
-class amongus_mods_updates(BaseModel):
-    set: Optional["amongus_mods_set_input"] = Field(alias="_set", default=None)
-    where: "amongus_mods_bool_exp"
-
-
 class amongus_roles_aggregate_bool_exp(BaseModel):
     bool_and: Optional["amongus_roles_aggregate_bool_exp_bool_and"] = None
     bool_or: Optional["amongus_roles_aggregate_bool_exp_bool_or"] = None
@@ -1191,29 +612,11 @@ class amongus_roles_aggregate_bool_exp_count(BaseModel):
     predicate: "Int_comparison_exp"
 
 
-class amongus_roles_aggregate_order_by(BaseModel):
-    avg: Optional["amongus_roles_avg_order_by"] = None
-    count: Optional[order_by] = None
-    max: Optional["amongus_roles_max_order_by"] = None
-    min: Optional["amongus_roles_min_order_by"] = None
-    stddev: Optional["amongus_roles_stddev_order_by"] = None
-    stddev_pop: Optional["amongus_roles_stddev_pop_order_by"] = None
-    stddev_samp: Optional["amongus_roles_stddev_samp_order_by"] = None
-    sum: Optional["amongus_roles_sum_order_by"] = None
-    var_pop: Optional["amongus_roles_var_pop_order_by"] = None
-    var_samp: Optional["amongus_roles_var_samp_order_by"] = None
-    variance: Optional["amongus_roles_variance_order_by"] = None
-
-
 class amongus_roles_arr_rel_insert_input(BaseModel):
     data: List["amongus_roles_insert_input"]
     on_conflict: Optional["amongus_roles_on_conflict"] = None
 
 
-class amongus_roles_avg_order_by(BaseModel):
-    color_rgb: Optional[order_by] = None
-
-
 class amongus_roles_bool_exp(BaseModel):
     and_: Optional[List["amongus_roles_bool_exp"]] = Field(alias="_and", default=None)
     not_: Optional["amongus_roles_bool_exp"] = Field(alias="_not", default=None)
@@ -1235,10 +638,6 @@ class amongus_roles_bool_exp(BaseModel):
     updated_at: Optional["timestamptz_comparison_exp"] = None
 
 
-class amongus_roles_inc_input(BaseModel):
-    color_rgb: Optional[int] = None
-
-
 class amongus_roles_insert_input(BaseModel):
     color_rgb: Optional[int] = None
     created_at: Optional[Any] = None
@@ -1254,26 +653,6 @@ class amongus_roles_insert_input(BaseModel):
     updated_at: Optional[Any] = None
 
 
-class amongus_roles_max_order_by(BaseModel):
-    color_rgb: Optional[order_by] = None
-    created_at: Optional[order_by] = None
-    document_url: Optional[order_by] = None
-    id: Optional[order_by] = None
-    mod_id: Optional[order_by] = None
-    name: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class amongus_roles_min_order_by(BaseModel):
-    color_rgb: Optional[order_by] = None
-    created_at: Optional[order_by] = None
-    document_url: Optional[order_by] = None
-    id: Optional[order_by] = None
-    mod_id: Optional[order_by] = None
-    name: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
 class amongus_roles_on_conflict(BaseModel):
     constraint: amongus_roles_constraint
     update_columns: List[amongus_roles_update_column] = Field(
@@ -1282,86 +661,6 @@ class amongus_roles_on_conflict(BaseModel):
     where: Optional["amongus_roles_bool_exp"] = None
 
 
-class amongus_roles_order_by(BaseModel):
-    color_rgb: Optional[order_by] = None
-    created_at: Optional[order_by] = None
-    document_url: Optional[order_by] = None
-    id: Optional[order_by] = None
-    is_vanilla: Optional[order_by] = None
-    match_result_player_roles_aggregate: Optional[
-        "amongus_match_player_result_roles_aggregate_order_by"
-    ] = None
-    mod: Optional["amongus_mods_order_by"] = None
-    mod_id: Optional[order_by] = None
-    name: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class amongus_roles_pk_columns_input(BaseModel):
-    id: Any
-
-
-class amongus_roles_set_input(BaseModel):
-    color_rgb: Optional[int] = None
-    created_at: Optional[Any] = None
-    document_url: Optional[str] = None
-    id: Optional[Any] = None
-    is_vanilla: Optional[bool] = None
-    mod_id: Optional[Any] = None
-    name: Optional[str] = None
-    updated_at: Optional[Any] = None
-
-
-class amongus_roles_stddev_order_by(BaseModel):
-    color_rgb: Optional[order_by] = None
-
-
-class amongus_roles_stddev_pop_order_by(BaseModel):
-    color_rgb: Optional[order_by] = None
-
-
-class amongus_roles_stddev_samp_order_by(BaseModel):
-    color_rgb: Optional[order_by] = None
-
-
-class amongus_roles_stream_cursor_input(BaseModel):
-    initial_value: "amongus_roles_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class amongus_roles_stream_cursor_value_input(BaseModel):
-    color_rgb: Optional[int] = None
-    created_at: Optional[Any] = None
-    document_url: Optional[str] = None
-    id: Optional[Any] = None
-    is_vanilla: Optional[bool] = None
-    mod_id: Optional[Any] = None
-    name: Optional[str] = None
-    updated_at: Optional[Any] = None
-
-
-class amongus_roles_sum_order_by(BaseModel):
-    color_rgb: Optional[order_by] = None
-
-
-class amongus_roles_updates(BaseModel):
-    inc: Optional["amongus_roles_inc_input"] = Field(alias="_inc", default=None)
-    set: Optional["amongus_roles_set_input"] = Field(alias="_set", default=None)
-    where: "amongus_roles_bool_exp"
-
-
-class amongus_roles_var_pop_order_by(BaseModel):
-    color_rgb: Optional[order_by] = None
-
-
-class amongus_roles_var_samp_order_by(BaseModel):
-    color_rgb: Optional[order_by] = None
-
-
-class amongus_roles_variance_order_by(BaseModel):
-    color_rgb: Optional[order_by] = None
-
-
 class amongus_vanilla_versions_bool_exp(BaseModel):
     and_: Optional[List["amongus_vanilla_versions_bool_exp"]] = Field(
         alias="_and", default=None
@@ -1398,43 +697,6 @@ class amongus_vanilla_versions_on_conflict(BaseModel):
     where: Optional["amongus_vanilla_versions_bool_exp"] = None
 
 
-class amongus_vanilla_versions_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-    version: Optional[order_by] = None
-
-
-class amongus_vanilla_versions_pk_columns_input(BaseModel):
-    id: Any
-
-
-class amongus_vanilla_versions_set_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    updated_at: Optional[Any] = None
-    version: Optional[str] = None
-
-
-class amongus_vanilla_versions_stream_cursor_input(BaseModel):
-    initial_value: "amongus_vanilla_versions_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class amongus_vanilla_versions_stream_cursor_value_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    updated_at: Optional[Any] = None
-    version: Optional[str] = None
-
-
-class amongus_vanilla_versions_updates(BaseModel):
-    set: Optional["amongus_vanilla_versions_set_input"] = Field(
-        alias="_set", default=None
-    )
-    where: "amongus_vanilla_versions_bool_exp"
-
-
 class amongusvr_maps_bool_exp(BaseModel):
     and_: Optional[List["amongusvr_maps_bool_exp"]] = Field(alias="_and", default=None)
     not_: Optional["amongusvr_maps_bool_exp"] = Field(alias="_not", default=None)
@@ -1465,41 +727,6 @@ class amongusvr_maps_on_conflict(BaseModel):
     where: Optional["amongusvr_maps_bool_exp"] = None
 
 
-class amongusvr_maps_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    name: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class amongusvr_maps_pk_columns_input(BaseModel):
-    id: Any
-
-
-class amongusvr_maps_set_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    name: Optional[str] = None
-    updated_at: Optional[Any] = None
-
-
-class amongusvr_maps_stream_cursor_input(BaseModel):
-    initial_value: "amongusvr_maps_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class amongusvr_maps_stream_cursor_value_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    name: Optional[str] = None
-    updated_at: Optional[Any] = None
-
-
-class amongusvr_maps_updates(BaseModel):
-    set: Optional["amongusvr_maps_set_input"] = Field(alias="_set", default=None)
-    where: "amongusvr_maps_bool_exp"
-
-
 class amongusvr_match_players_aggregate_bool_exp(BaseModel):
     count: Optional["amongusvr_match_players_aggregate_bool_exp_count"] = None
 
@@ -1511,12 +738,6 @@ class amongusvr_match_players_aggregate_bool_exp_count(BaseModel):
     predicate: "Int_comparison_exp"
 
 
-class amongusvr_match_players_aggregate_order_by(BaseModel):
-    count: Optional[order_by] = None
-    max: Optional["amongusvr_match_players_max_order_by"] = None
-    min: Optional["amongusvr_match_players_min_order_by"] = None
-
-
 class amongusvr_match_players_arr_rel_insert_input(BaseModel):
     data: List["amongusvr_match_players_insert_input"]
     on_conflict: Optional["amongusvr_match_players_on_conflict"] = None
@@ -1553,24 +774,6 @@ class amongusvr_match_players_insert_input(BaseModel):
     updated_at: Optional[Any] = None
 
 
-class amongusvr_match_players_max_order_by(BaseModel):
-    amongusvr_match_id: Optional[order_by] = None
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    nickname: Optional[order_by] = None
-    person_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class amongusvr_match_players_min_order_by(BaseModel):
-    amongusvr_match_id: Optional[order_by] = None
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    nickname: Optional[order_by] = None
-    person_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
 class amongusvr_match_players_on_conflict(BaseModel):
     constraint: amongusvr_match_players_constraint
     update_columns: List[amongusvr_match_players_update_column] = Field(
@@ -1579,51 +782,6 @@ class amongusvr_match_players_on_conflict(BaseModel):
     where: Optional["amongusvr_match_players_bool_exp"] = None
 
 
-class amongusvr_match_players_order_by(BaseModel):
-    amongusvr_match: Optional["amongusvr_matches_order_by"] = None
-    amongusvr_match_id: Optional[order_by] = None
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    nickname: Optional[order_by] = None
-    person: Optional["persons_order_by"] = None
-    person_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class amongusvr_match_players_pk_columns_input(BaseModel):
-    id: Any
-
-
-class amongusvr_match_players_set_input(BaseModel):
-    amongusvr_match_id: Optional[Any] = None
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    nickname: Optional[str] = None
-    person_id: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class amongusvr_match_players_stream_cursor_input(BaseModel):
-    initial_value: "amongusvr_match_players_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class amongusvr_match_players_stream_cursor_value_input(BaseModel):
-    amongusvr_match_id: Optional[Any] = None
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    nickname: Optional[str] = None
-    person_id: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class amongusvr_match_players_updates(BaseModel):
-    set: Optional["amongusvr_match_players_set_input"] = Field(
-        alias="_set", default=None
-    )
-    where: "amongusvr_match_players_bool_exp"
-
-
 class amongusvr_matches_aggregate_bool_exp(BaseModel):
     bool_and: Optional["amongusvr_matches_aggregate_bool_exp_bool_and"] = None
     bool_or: Optional["amongusvr_matches_aggregate_bool_exp_bool_or"] = None
@@ -1651,29 +809,11 @@ class amongusvr_matches_aggregate_bool_exp_count(BaseModel):
     predicate: "Int_comparison_exp"
 
 
-class amongusvr_matches_aggregate_order_by(BaseModel):
-    avg: Optional["amongusvr_matches_avg_order_by"] = None
-    count: Optional[order_by] = None
-    max: Optional["amongusvr_matches_max_order_by"] = None
-    min: Optional["amongusvr_matches_min_order_by"] = None
-    stddev: Optional["amongusvr_matches_stddev_order_by"] = None
-    stddev_pop: Optional["amongusvr_matches_stddev_pop_order_by"] = None
-    stddev_samp: Optional["amongusvr_matches_stddev_samp_order_by"] = None
-    sum: Optional["amongusvr_matches_sum_order_by"] = None
-    var_pop: Optional["amongusvr_matches_var_pop_order_by"] = None
-    var_samp: Optional["amongusvr_matches_var_samp_order_by"] = None
-    variance: Optional["amongusvr_matches_variance_order_by"] = None
-
-
 class amongusvr_matches_arr_rel_insert_input(BaseModel):
     data: List["amongusvr_matches_insert_input"]
     on_conflict: Optional["amongusvr_matches_on_conflict"] = None
 
 
-class amongusvr_matches_avg_order_by(BaseModel):
-    index: Optional[order_by] = None
-
-
 class amongusvr_matches_bool_exp(BaseModel):
     and_: Optional[List["amongusvr_matches_bool_exp"]] = Field(
         alias="_and", default=None
@@ -1697,10 +837,6 @@ class amongusvr_matches_bool_exp(BaseModel):
     updated_at: Optional["timestamptz_comparison_exp"] = None
 
 
-class amongusvr_matches_inc_input(BaseModel):
-    index: Optional[int] = None
-
-
 class amongusvr_matches_insert_input(BaseModel):
     amongusvr_map: Optional["amongusvr_maps_obj_rel_insert_input"] = None
     amongusvr_map_id: Optional[Any] = None
@@ -1718,28 +854,6 @@ class amongusvr_matches_insert_input(BaseModel):
     updated_at: Optional[Any] = None
 
 
-class amongusvr_matches_max_order_by(BaseModel):
-    amongusvr_map_id: Optional[order_by] = None
-    created_at: Optional[order_by] = None
-    end_time: Optional[order_by] = None
-    id: Optional[order_by] = None
-    index: Optional[order_by] = None
-    program_id: Optional[order_by] = None
-    start_time: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class amongusvr_matches_min_order_by(BaseModel):
-    amongusvr_map_id: Optional[order_by] = None
-    created_at: Optional[order_by] = None
-    end_time: Optional[order_by] = None
-    id: Optional[order_by] = None
-    index: Optional[order_by] = None
-    program_id: Optional[order_by] = None
-    start_time: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
 class amongusvr_matches_obj_rel_insert_input(BaseModel):
     data: "amongusvr_matches_insert_input"
     on_conflict: Optional["amongusvr_matches_on_conflict"] = None
@@ -1753,90 +867,6 @@ class amongusvr_matches_on_conflict(BaseModel):
     where: Optional["amongusvr_matches_bool_exp"] = None
 
 
-class amongusvr_matches_order_by(BaseModel):
-    amongusvr_map: Optional["amongusvr_maps_order_by"] = None
-    amongusvr_map_id: Optional[order_by] = None
-    amongusvr_match_players_aggregate: Optional[
-        "amongusvr_match_players_aggregate_order_by"
-    ] = None
-    created_at: Optional[order_by] = None
-    end_time: Optional[order_by] = None
-    id: Optional[order_by] = None
-    index: Optional[order_by] = None
-    is_aborted: Optional[order_by] = None
-    program: Optional["programs_order_by"] = None
-    program_id: Optional[order_by] = None
-    start_time: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class amongusvr_matches_pk_columns_input(BaseModel):
-    id: Any
-
-
-class amongusvr_matches_set_input(BaseModel):
-    amongusvr_map_id: Optional[Any] = None
-    created_at: Optional[Any] = None
-    end_time: Optional[Any] = None
-    id: Optional[Any] = None
-    index: Optional[int] = None
-    is_aborted: Optional[bool] = None
-    program_id: Optional[Any] = None
-    start_time: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class amongusvr_matches_stddev_order_by(BaseModel):
-    index: Optional[order_by] = None
-
-
-class amongusvr_matches_stddev_pop_order_by(BaseModel):
-    index: Optional[order_by] = None
-
-
-class amongusvr_matches_stddev_samp_order_by(BaseModel):
-    index: Optional[order_by] = None
-
-
-class amongusvr_matches_stream_cursor_input(BaseModel):
-    initial_value: "amongusvr_matches_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class amongusvr_matches_stream_cursor_value_input(BaseModel):
-    amongusvr_map_id: Optional[Any] = None
-    created_at: Optional[Any] = None
-    end_time: Optional[Any] = None
-    id: Optional[Any] = None
-    index: Optional[int] = None
-    is_aborted: Optional[bool] = None
-    program_id: Optional[Any] = None
-    start_time: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class amongusvr_matches_sum_order_by(BaseModel):
-    index: Optional[order_by] = None
-
-
-class amongusvr_matches_updates(BaseModel):
-    inc: Optional["amongusvr_matches_inc_input"] = Field(alias="_inc", default=None)
-    set: Optional["amongusvr_matches_set_input"] = Field(alias="_set", default=None)
-    where: "amongusvr_matches_bool_exp"
-
-
-class amongusvr_matches_var_pop_order_by(BaseModel):
-    index: Optional[order_by] = None
-
-
-class amongusvr_matches_var_samp_order_by(BaseModel):
-    index: Optional[order_by] = None
-
-
-class amongusvr_matches_variance_order_by(BaseModel):
-    index: Optional[order_by] = None
-
-
 class fallguys_custom_round_twitter_announcements_aggregate_bool_exp(BaseModel):
     bool_and: Optional[
         "fallguys_custom_round_twitter_announcements_aggregate_bool_exp_bool_and"
@@ -1874,12 +904,6 @@ class fallguys_custom_round_twitter_announcements_aggregate_bool_exp_count(BaseM
     predicate: "Int_comparison_exp"
 
 
-class fallguys_custom_round_twitter_announcements_aggregate_order_by(BaseModel):
-    count: Optional[order_by] = None
-    max: Optional["fallguys_custom_round_twitter_announcements_max_order_by"] = None
-    min: Optional["fallguys_custom_round_twitter_announcements_min_order_by"] = None
-
-
 class fallguys_custom_round_twitter_announcements_arr_rel_insert_input(BaseModel):
     data: List["fallguys_custom_round_twitter_announcements_insert_input"]
     on_conflict: Optional["fallguys_custom_round_twitter_announcements_on_conflict"] = (
@@ -1920,22 +944,6 @@ class fallguys_custom_round_twitter_announcements_insert_input(BaseModel):
     updated_at: Optional[Any] = None
 
 
-class fallguys_custom_round_twitter_announcements_max_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    fallguys_custom_round_id: Optional[order_by] = None
-    id: Optional[order_by] = None
-    twitter_tweet_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class fallguys_custom_round_twitter_announcements_min_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    fallguys_custom_round_id: Optional[order_by] = None
-    id: Optional[order_by] = None
-    twitter_tweet_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
 class fallguys_custom_round_twitter_announcements_on_conflict(BaseModel):
     constraint: fallguys_custom_round_twitter_announcements_constraint
     update_columns: List[fallguys_custom_round_twitter_announcements_update_column] = (
@@ -1944,53 +952,6 @@ class fallguys_custom_round_twitter_announcements_on_conflict(BaseModel):
     where: Optional["fallguys_custom_round_twitter_announcements_bool_exp"] = None
 
 
-class fallguys_custom_round_twitter_announcements_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    fallguys_custom_round: Optional["fallguys_custom_rounds_order_by"] = None
-    fallguys_custom_round_id: Optional[order_by] = None
-    id: Optional[order_by] = None
-    is_agent_tweet: Optional[order_by] = None
-    twitter_tweet: Optional["twitter_tweets_order_by"] = None
-    twitter_tweet_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class fallguys_custom_round_twitter_announcements_pk_columns_input(BaseModel):
-    id: Any
-
-
-class fallguys_custom_round_twitter_announcements_set_input(BaseModel):
-    created_at: Optional[Any] = None
-    fallguys_custom_round_id: Optional[Any] = None
-    id: Optional[Any] = None
-    is_agent_tweet: Optional[bool] = None
-    twitter_tweet_id: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class fallguys_custom_round_twitter_announcements_stream_cursor_input(BaseModel):
-    initial_value: (
-        "fallguys_custom_round_twitter_announcements_stream_cursor_value_input"
-    )
-    ordering: Optional[cursor_ordering] = None
-
-
-class fallguys_custom_round_twitter_announcements_stream_cursor_value_input(BaseModel):
-    created_at: Optional[Any] = None
-    fallguys_custom_round_id: Optional[Any] = None
-    id: Optional[Any] = None
-    is_agent_tweet: Optional[bool] = None
-    twitter_tweet_id: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class fallguys_custom_round_twitter_announcements_updates(BaseModel):
-    set: Optional["fallguys_custom_round_twitter_announcements_set_input"] = Field(
-        alias="_set", default=None
-    )
-    where: "fallguys_custom_round_twitter_announcements_bool_exp"
-
-
 class fallguys_custom_rounds_aggregate_bool_exp(BaseModel):
     count: Optional["fallguys_custom_rounds_aggregate_bool_exp_count"] = None
 
@@ -2002,12 +963,6 @@ class fallguys_custom_rounds_aggregate_bool_exp_count(BaseModel):
     predicate: "Int_comparison_exp"
 
 
-class fallguys_custom_rounds_aggregate_order_by(BaseModel):
-    count: Optional[order_by] = None
-    max: Optional["fallguys_custom_rounds_max_order_by"] = None
-    min: Optional["fallguys_custom_rounds_min_order_by"] = None
-
-
 class fallguys_custom_rounds_arr_rel_insert_input(BaseModel):
     data: List["fallguys_custom_rounds_insert_input"]
     on_conflict: Optional["fallguys_custom_rounds_on_conflict"] = None
@@ -2058,26 +1013,6 @@ class fallguys_custom_rounds_insert_input(BaseModel):
     updated_at: Optional[Any] = None
 
 
-class fallguys_custom_rounds_max_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    in_game_creator_name: Optional[order_by] = None
-    name: Optional[order_by] = None
-    person_id: Optional[order_by] = None
-    share_code: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class fallguys_custom_rounds_min_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    in_game_creator_name: Optional[order_by] = None
-    name: Optional[order_by] = None
-    person_id: Optional[order_by] = None
-    share_code: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
 class fallguys_custom_rounds_obj_rel_insert_input(BaseModel):
     data: "fallguys_custom_rounds_insert_input"
     on_conflict: Optional["fallguys_custom_rounds_on_conflict"] = None
@@ -2091,63 +1026,10 @@ class fallguys_custom_rounds_on_conflict(BaseModel):
     where: Optional["fallguys_custom_rounds_bool_exp"] = None
 
 
-class fallguys_custom_rounds_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    fallguys_custom_round_twitter_announcements_aggregate: Optional[
-        "fallguys_custom_round_twitter_announcements_aggregate_order_by"
-    ] = None
-    fallguys_match_rounds_aggregate: Optional[
-        "fallguys_match_rounds_aggregate_order_by"
-    ] = None
-    id: Optional[order_by] = None
-    in_game_creator_name: Optional[order_by] = None
-    name: Optional[order_by] = None
-    person: Optional["persons_order_by"] = None
-    person_id: Optional[order_by] = None
-    share_code: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class fallguys_custom_rounds_pk_columns_input(BaseModel):
-    id: Any
-
-
-class fallguys_custom_rounds_set_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    in_game_creator_name: Optional[str] = None
-    name: Optional[str] = None
-    person_id: Optional[Any] = None
-    share_code: Optional[str] = None
-    updated_at: Optional[Any] = None
-
-
-class fallguys_custom_rounds_stream_cursor_input(BaseModel):
-    initial_value: "fallguys_custom_rounds_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class fallguys_custom_rounds_stream_cursor_value_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    in_game_creator_name: Optional[str] = None
-    name: Optional[str] = None
-    person_id: Optional[Any] = None
-    share_code: Optional[str] = None
-    updated_at: Optional[Any] = None
-
-
-class fallguys_custom_rounds_updates(BaseModel):
-    set: Optional["fallguys_custom_rounds_set_input"] = Field(
-        alias="_set", default=None
-    )
-    where: "fallguys_custom_rounds_bool_exp"
-
-
-class fallguys_match_rounds_aggregate_bool_exp(BaseModel):
-    bool_and: Optional["fallguys_match_rounds_aggregate_bool_exp_bool_and"] = None
-    bool_or: Optional["fallguys_match_rounds_aggregate_bool_exp_bool_or"] = None
-    count: Optional["fallguys_match_rounds_aggregate_bool_exp_count"] = None
+class fallguys_match_rounds_aggregate_bool_exp(BaseModel):
+    bool_and: Optional["fallguys_match_rounds_aggregate_bool_exp_bool_and"] = None
+    bool_or: Optional["fallguys_match_rounds_aggregate_bool_exp_bool_or"] = None
+    count: Optional["fallguys_match_rounds_aggregate_bool_exp_count"] = None
 
 
 class fallguys_match_rounds_aggregate_bool_exp_bool_and(BaseModel):
@@ -2171,29 +1053,11 @@ class fallguys_match_rounds_aggregate_bool_exp_count(BaseModel):
     predicate: "Int_comparison_exp"
 
 
-class fallguys_match_rounds_aggregate_order_by(BaseModel):
-    avg: Optional["fallguys_match_rounds_avg_order_by"] = None
-    count: Optional[order_by] = None
-    max: Optional["fallguys_match_rounds_max_order_by"] = None
-    min: Optional["fallguys_match_rounds_min_order_by"] = None
-    stddev: Optional["fallguys_match_rounds_stddev_order_by"] = None
-    stddev_pop: Optional["fallguys_match_rounds_stddev_pop_order_by"] = None
-    stddev_samp: Optional["fallguys_match_rounds_stddev_samp_order_by"] = None
-    sum: Optional["fallguys_match_rounds_sum_order_by"] = None
-    var_pop: Optional["fallguys_match_rounds_var_pop_order_by"] = None
-    var_samp: Optional["fallguys_match_rounds_var_samp_order_by"] = None
-    variance: Optional["fallguys_match_rounds_variance_order_by"] = None
-
-
 class fallguys_match_rounds_arr_rel_insert_input(BaseModel):
     data: List["fallguys_match_rounds_insert_input"]
     on_conflict: Optional["fallguys_match_rounds_on_conflict"] = None
 
 
-class fallguys_match_rounds_avg_order_by(BaseModel):
-    index: Optional[order_by] = None
-
-
 class fallguys_match_rounds_bool_exp(BaseModel):
     and_: Optional[List["fallguys_match_rounds_bool_exp"]] = Field(
         alias="_and", default=None
@@ -2217,10 +1081,6 @@ class fallguys_match_rounds_bool_exp(BaseModel):
     updated_at: Optional["timestamptz_comparison_exp"] = None
 
 
-class fallguys_match_rounds_inc_input(BaseModel):
-    index: Optional[int] = None
-
-
 class fallguys_match_rounds_insert_input(BaseModel):
     created_at: Optional[Any] = None
     end_time: Optional[Any] = None
@@ -2239,30 +1099,6 @@ class fallguys_match_rounds_insert_input(BaseModel):
     updated_at: Optional[Any] = None
 
 
-class fallguys_match_rounds_max_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    end_time: Optional[order_by] = None
-    fallguys_custom_round_id: Optional[order_by] = None
-    fallguys_match_id: Optional[order_by] = None
-    fallguys_round_id: Optional[order_by] = None
-    id: Optional[order_by] = None
-    index: Optional[order_by] = None
-    start_time: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class fallguys_match_rounds_min_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    end_time: Optional[order_by] = None
-    fallguys_custom_round_id: Optional[order_by] = None
-    fallguys_match_id: Optional[order_by] = None
-    fallguys_round_id: Optional[order_by] = None
-    id: Optional[order_by] = None
-    index: Optional[order_by] = None
-    start_time: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
 class fallguys_match_rounds_on_conflict(BaseModel):
     constraint: fallguys_match_rounds_constraint
     update_columns: List[fallguys_match_rounds_update_column] = Field(
@@ -2271,91 +1107,6 @@ class fallguys_match_rounds_on_conflict(BaseModel):
     where: Optional["fallguys_match_rounds_bool_exp"] = None
 
 
-class fallguys_match_rounds_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    end_time: Optional[order_by] = None
-    fallguys_custom_round: Optional["fallguys_custom_rounds_order_by"] = None
-    fallguys_custom_round_id: Optional[order_by] = None
-    fallguys_match: Optional["fallguys_matches_order_by"] = None
-    fallguys_match_id: Optional[order_by] = None
-    fallguys_round: Optional["fallguys_rounds_order_by"] = None
-    fallguys_round_id: Optional[order_by] = None
-    id: Optional[order_by] = None
-    index: Optional[order_by] = None
-    is_aborted: Optional[order_by] = None
-    start_time: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class fallguys_match_rounds_pk_columns_input(BaseModel):
-    id: Any
-
-
-class fallguys_match_rounds_set_input(BaseModel):
-    created_at: Optional[Any] = None
-    end_time: Optional[Any] = None
-    fallguys_custom_round_id: Optional[Any] = None
-    fallguys_match_id: Optional[Any] = None
-    fallguys_round_id: Optional[Any] = None
-    id: Optional[Any] = None
-    index: Optional[int] = None
-    is_aborted: Optional[bool] = None
-    start_time: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class fallguys_match_rounds_stddev_order_by(BaseModel):
-    index: Optional[order_by] = None
-
-
-class fallguys_match_rounds_stddev_pop_order_by(BaseModel):
-    index: Optional[order_by] = None
-
-
-class fallguys_match_rounds_stddev_samp_order_by(BaseModel):
-    index: Optional[order_by] = None
-
-
-class fallguys_match_rounds_stream_cursor_input(BaseModel):
-    initial_value: "fallguys_match_rounds_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class fallguys_match_rounds_stream_cursor_value_input(BaseModel):
-    created_at: Optional[Any] = None
-    end_time: Optional[Any] = None
-    fallguys_custom_round_id: Optional[Any] = None
-    fallguys_match_id: Optional[Any] = None
-    fallguys_round_id: Optional[Any] = None
-    id: Optional[Any] = None
-    index: Optional[int] = None
-    is_aborted: Optional[bool] = None
-    start_time: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class fallguys_match_rounds_sum_order_by(BaseModel):
-    index: Optional[order_by] = None
-
-
-class fallguys_match_rounds_updates(BaseModel):
-    inc: Optional["fallguys_match_rounds_inc_input"] = Field(alias="_inc", default=None)
-    set: Optional["fallguys_match_rounds_set_input"] = Field(alias="_set", default=None)
-    where: "fallguys_match_rounds_bool_exp"
-
-
-class fallguys_match_rounds_var_pop_order_by(BaseModel):
-    index: Optional[order_by] = None
-
-
-class fallguys_match_rounds_var_samp_order_by(BaseModel):
-    index: Optional[order_by] = None
-
-
-class fallguys_match_rounds_variance_order_by(BaseModel):
-    index: Optional[order_by] = None
-
-
 class fallguys_matches_aggregate_bool_exp(BaseModel):
     bool_and: Optional["fallguys_matches_aggregate_bool_exp_bool_and"] = None
     bool_or: Optional["fallguys_matches_aggregate_bool_exp_bool_or"] = None
@@ -2383,29 +1134,11 @@ class fallguys_matches_aggregate_bool_exp_count(BaseModel):
     predicate: "Int_comparison_exp"
 
 
-class fallguys_matches_aggregate_order_by(BaseModel):
-    avg: Optional["fallguys_matches_avg_order_by"] = None
-    count: Optional[order_by] = None
-    max: Optional["fallguys_matches_max_order_by"] = None
-    min: Optional["fallguys_matches_min_order_by"] = None
-    stddev: Optional["fallguys_matches_stddev_order_by"] = None
-    stddev_pop: Optional["fallguys_matches_stddev_pop_order_by"] = None
-    stddev_samp: Optional["fallguys_matches_stddev_samp_order_by"] = None
-    sum: Optional["fallguys_matches_sum_order_by"] = None
-    var_pop: Optional["fallguys_matches_var_pop_order_by"] = None
-    var_samp: Optional["fallguys_matches_var_samp_order_by"] = None
-    variance: Optional["fallguys_matches_variance_order_by"] = None
-
-
 class fallguys_matches_arr_rel_insert_input(BaseModel):
     data: List["fallguys_matches_insert_input"]
     on_conflict: Optional["fallguys_matches_on_conflict"] = None
 
 
-class fallguys_matches_avg_order_by(BaseModel):
-    index: Optional[order_by] = None
-
-
 class fallguys_matches_bool_exp(BaseModel):
     and_: Optional[List["fallguys_matches_bool_exp"]] = Field(
         alias="_and", default=None
@@ -2427,10 +1160,6 @@ class fallguys_matches_bool_exp(BaseModel):
     updated_at: Optional["timestamptz_comparison_exp"] = None
 
 
-class fallguys_matches_inc_input(BaseModel):
-    index: Optional[int] = None
-
-
 class fallguys_matches_insert_input(BaseModel):
     created_at: Optional[Any] = None
     end_time: Optional[Any] = None
@@ -2444,26 +1173,6 @@ class fallguys_matches_insert_input(BaseModel):
     updated_at: Optional[Any] = None
 
 
-class fallguys_matches_max_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    end_time: Optional[order_by] = None
-    id: Optional[order_by] = None
-    index: Optional[order_by] = None
-    program_id: Optional[order_by] = None
-    start_time: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class fallguys_matches_min_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    end_time: Optional[order_by] = None
-    id: Optional[order_by] = None
-    index: Optional[order_by] = None
-    program_id: Optional[order_by] = None
-    start_time: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
 class fallguys_matches_obj_rel_insert_input(BaseModel):
     data: "fallguys_matches_insert_input"
     on_conflict: Optional["fallguys_matches_on_conflict"] = None
@@ -2477,86 +1186,6 @@ class fallguys_matches_on_conflict(BaseModel):
     where: Optional["fallguys_matches_bool_exp"] = None
 
 
-class fallguys_matches_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    end_time: Optional[order_by] = None
-    fallguys_match_rounds_aggregate: Optional[
-        "fallguys_match_rounds_aggregate_order_by"
-    ] = None
-    id: Optional[order_by] = None
-    index: Optional[order_by] = None
-    is_aborted: Optional[order_by] = None
-    program: Optional["programs_order_by"] = None
-    program_id: Optional[order_by] = None
-    start_time: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class fallguys_matches_pk_columns_input(BaseModel):
-    id: Any
-
-
-class fallguys_matches_set_input(BaseModel):
-    created_at: Optional[Any] = None
-    end_time: Optional[Any] = None
-    id: Optional[Any] = None
-    index: Optional[int] = None
-    is_aborted: Optional[bool] = None
-    program_id: Optional[Any] = None
-    start_time: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class fallguys_matches_stddev_order_by(BaseModel):
-    index: Optional[order_by] = None
-
-
-class fallguys_matches_stddev_pop_order_by(BaseModel):
-    index: Optional[order_by] = None
-
-
-class fallguys_matches_stddev_samp_order_by(BaseModel):
-    index: Optional[order_by] = None
-
-
-class fallguys_matches_stream_cursor_input(BaseModel):
-    initial_value: "fallguys_matches_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class fallguys_matches_stream_cursor_value_input(BaseModel):
-    created_at: Optional[Any] = None
-    end_time: Optional[Any] = None
-    id: Optional[Any] = None
-    index: Optional[int] = None
-    is_aborted: Optional[bool] = None
-    program_id: Optional[Any] = None
-    start_time: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class fallguys_matches_sum_order_by(BaseModel):
-    index: Optional[order_by] = None
-
-
-class fallguys_matches_updates(BaseModel):
-    inc: Optional["fallguys_matches_inc_input"] = Field(alias="_inc", default=None)
-    set: Optional["fallguys_matches_set_input"] = Field(alias="_set", default=None)
-    where: "fallguys_matches_bool_exp"
-
-
-class fallguys_matches_var_pop_order_by(BaseModel):
-    index: Optional[order_by] = None
-
-
-class fallguys_matches_var_samp_order_by(BaseModel):
-    index: Optional[order_by] = None
-
-
-class fallguys_matches_variance_order_by(BaseModel):
-    index: Optional[order_by] = None
-
-
 class fallguys_rounds_bool_exp(BaseModel):
     and_: Optional[List["fallguys_rounds_bool_exp"]] = Field(alias="_and", default=None)
     not_: Optional["fallguys_rounds_bool_exp"] = Field(alias="_not", default=None)
@@ -2592,44 +1221,6 @@ class fallguys_rounds_on_conflict(BaseModel):
     where: Optional["fallguys_rounds_bool_exp"] = None
 
 
-class fallguys_rounds_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    fallguys_match_rounds_aggregate: Optional[
-        "fallguys_match_rounds_aggregate_order_by"
-    ] = None
-    id: Optional[order_by] = None
-    name: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class fallguys_rounds_pk_columns_input(BaseModel):
-    id: Any
-
-
-class fallguys_rounds_set_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    name: Optional[str] = None
-    updated_at: Optional[Any] = None
-
-
-class fallguys_rounds_stream_cursor_input(BaseModel):
-    initial_value: "fallguys_rounds_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class fallguys_rounds_stream_cursor_value_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    name: Optional[str] = None
-    updated_at: Optional[Any] = None
-
-
-class fallguys_rounds_updates(BaseModel):
-    set: Optional["fallguys_rounds_set_input"] = Field(alias="_set", default=None)
-    where: "fallguys_rounds_bool_exp"
-
-
 class fediverse_accounts_bool_exp(BaseModel):
     and_: Optional[List["fediverse_accounts_bool_exp"]] = Field(
         alias="_and", default=None
@@ -2666,44 +1257,6 @@ class fediverse_accounts_on_conflict(BaseModel):
     where: Optional["fediverse_accounts_bool_exp"] = None
 
 
-class fediverse_accounts_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    fediverse_acct: Optional[order_by] = None
-    id: Optional[order_by] = None
-    name: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class fediverse_accounts_pk_columns_input(BaseModel):
-    id: Any
-
-
-class fediverse_accounts_set_input(BaseModel):
-    created_at: Optional[Any] = None
-    fediverse_acct: Optional[str] = None
-    id: Optional[Any] = None
-    name: Optional[str] = None
-    updated_at: Optional[Any] = None
-
-
-class fediverse_accounts_stream_cursor_input(BaseModel):
-    initial_value: "fediverse_accounts_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class fediverse_accounts_stream_cursor_value_input(BaseModel):
-    created_at: Optional[Any] = None
-    fediverse_acct: Optional[str] = None
-    id: Optional[Any] = None
-    name: Optional[str] = None
-    updated_at: Optional[Any] = None
-
-
-class fediverse_accounts_updates(BaseModel):
-    set: Optional["fediverse_accounts_set_input"] = Field(alias="_set", default=None)
-    where: "fediverse_accounts_bool_exp"
-
-
 class games_bool_exp(BaseModel):
     and_: Optional[List["games_bool_exp"]] = Field(alias="_and", default=None)
     not_: Optional["games_bool_exp"] = Field(alias="_not", default=None)
@@ -2746,62 +1299,6 @@ class games_on_conflict(BaseModel):
     where: Optional["games_bool_exp"] = None
 
 
-class games_order_by(BaseModel):
-    apple_app_store_url: Optional[order_by] = None
-    created_at: Optional[order_by] = None
-    epic_games_url: Optional[order_by] = None
-    google_play_store_url: Optional[order_by] = None
-    id: Optional[order_by] = None
-    name: Optional[order_by] = None
-    nintendo_switch_url: Optional[order_by] = None
-    playstation_url: Optional[order_by] = None
-    steam_url: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-    website_url: Optional[order_by] = None
-
-
-class games_pk_columns_input(BaseModel):
-    id: Any
-
-
-class games_set_input(BaseModel):
-    apple_app_store_url: Optional[str] = None
-    created_at: Optional[Any] = None
-    epic_games_url: Optional[str] = None
-    google_play_store_url: Optional[str] = None
-    id: Optional[Any] = None
-    name: Optional[str] = None
-    nintendo_switch_url: Optional[str] = None
-    playstation_url: Optional[str] = None
-    steam_url: Optional[str] = None
-    updated_at: Optional[Any] = None
-    website_url: Optional[str] = None
-
-
-class games_stream_cursor_input(BaseModel):
-    initial_value: "games_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class games_stream_cursor_value_input(BaseModel):
-    apple_app_store_url: Optional[str] = None
-    created_at: Optional[Any] = None
-    epic_games_url: Optional[str] = None
-    google_play_store_url: Optional[str] = None
-    id: Optional[Any] = None
-    name: Optional[str] = None
-    nintendo_switch_url: Optional[str] = None
-    playstation_url: Optional[str] = None
-    steam_url: Optional[str] = None
-    updated_at: Optional[Any] = None
-    website_url: Optional[str] = None
-
-
-class games_updates(BaseModel):
-    set: Optional["games_set_input"] = Field(alias="_set", default=None)
-    where: "games_bool_exp"
-
-
 class mariokart8deluxe_battle_courses_bool_exp(BaseModel):
     and_: Optional[List["mariokart8deluxe_battle_courses_bool_exp"]] = Field(
         alias="_and", default=None
@@ -2831,10 +1328,6 @@ class mariokart8deluxe_battle_courses_bool_exp(BaseModel):
     updated_at: Optional["timestamptz_comparison_exp"] = None
 
 
-class mariokart8deluxe_battle_courses_inc_input(BaseModel):
-    index: Optional[int] = None
-
-
 class mariokart8deluxe_battle_courses_insert_input(BaseModel):
     created_at: Optional[Any] = None
     id: Optional[Any] = None
@@ -2865,64 +1358,6 @@ class mariokart8deluxe_battle_courses_on_conflict(BaseModel):
     where: Optional["mariokart8deluxe_battle_courses_bool_exp"] = None
 
 
-class mariokart8deluxe_battle_courses_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    index: Optional[order_by] = None
-    mariokart_8_deluxe_battle_matches_aggregate: Optional[
-        "mariokart8deluxe_battle_matches_aggregate_order_by"
-    ] = Field(alias="mariokart8deluxe_battle_matches_aggregate", default=None)
-    mariokart_8_deluxe_console: Optional["mariokart8deluxe_consoles_order_by"] = Field(
-        alias="mariokart8deluxe_console", default=None
-    )
-    mariokart_8_deluxe_console_id: Optional[order_by] = Field(
-        alias="mariokart8deluxe_console_id", default=None
-    )
-    name: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class mariokart8deluxe_battle_courses_pk_columns_input(BaseModel):
-    id: Any
-
-
-class mariokart8deluxe_battle_courses_set_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    index: Optional[int] = None
-    mariokart_8_deluxe_console_id: Optional[Any] = Field(
-        alias="mariokart8deluxe_console_id", default=None
-    )
-    name: Optional[str] = None
-    updated_at: Optional[Any] = None
-
-
-class mariokart8deluxe_battle_courses_stream_cursor_input(BaseModel):
-    initial_value: "mariokart8deluxe_battle_courses_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class mariokart8deluxe_battle_courses_stream_cursor_value_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    index: Optional[int] = None
-    mariokart_8_deluxe_console_id: Optional[Any] = Field(
-        alias="mariokart8deluxe_console_id", default=None
-    )
-    name: Optional[str] = None
-    updated_at: Optional[Any] = None
-
-
-class mariokart8deluxe_battle_courses_updates(BaseModel):
-    inc: Optional["mariokart8deluxe_battle_courses_inc_input"] = Field(
-        alias="_inc", default=None
-    )
-    set: Optional["mariokart8deluxe_battle_courses_set_input"] = Field(
-        alias="_set", default=None
-    )
-    where: "mariokart8deluxe_battle_courses_bool_exp"
-
-
 class mariokart8deluxe_battle_match_players_aggregate_bool_exp(BaseModel):
     count: Optional[
         "mariokart8deluxe_battle_match_players_aggregate_bool_exp_count"
@@ -2938,12 +1373,6 @@ class mariokart8deluxe_battle_match_players_aggregate_bool_exp_count(BaseModel):
     predicate: "Int_comparison_exp"
 
 
-class mariokart8deluxe_battle_match_players_aggregate_order_by(BaseModel):
-    count: Optional[order_by] = None
-    max: Optional["mariokart8deluxe_battle_match_players_max_order_by"] = None
-    min: Optional["mariokart8deluxe_battle_match_players_min_order_by"] = None
-
-
 class mariokart8deluxe_battle_match_players_arr_rel_insert_input(BaseModel):
     data: List["mariokart8deluxe_battle_match_players_insert_input"]
     on_conflict: Optional["mariokart8deluxe_battle_match_players_on_conflict"] = None
@@ -2988,28 +1417,6 @@ class mariokart8deluxe_battle_match_players_insert_input(BaseModel):
     updated_at: Optional[Any] = None
 
 
-class mariokart8deluxe_battle_match_players_max_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    mariokart_8_deluxe_battle_match_id: Optional[order_by] = Field(
-        alias="mariokart8deluxe_battle_match_id", default=None
-    )
-    nickname: Optional[order_by] = None
-    person_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class mariokart8deluxe_battle_match_players_min_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    mariokart_8_deluxe_battle_match_id: Optional[order_by] = Field(
-        alias="mariokart8deluxe_battle_match_id", default=None
-    )
-    nickname: Optional[order_by] = None
-    person_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
 class mariokart8deluxe_battle_match_players_on_conflict(BaseModel):
     constraint: mariokart8deluxe_battle_match_players_constraint
     update_columns: List[mariokart8deluxe_battle_match_players_update_column] = Field(
@@ -3018,59 +1425,6 @@ class mariokart8deluxe_battle_match_players_on_conflict(BaseModel):
     where: Optional["mariokart8deluxe_battle_match_players_bool_exp"] = None
 
 
-class mariokart8deluxe_battle_match_players_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    mariokart_8_deluxe_battle_match: Optional[
-        "mariokart8deluxe_battle_matches_order_by"
-    ] = Field(alias="mariokart8deluxe_battle_match", default=None)
-    mariokart_8_deluxe_battle_match_id: Optional[order_by] = Field(
-        alias="mariokart8deluxe_battle_match_id", default=None
-    )
-    nickname: Optional[order_by] = None
-    person: Optional["persons_order_by"] = None
-    person_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class mariokart8deluxe_battle_match_players_pk_columns_input(BaseModel):
-    id: Any
-
-
-class mariokart8deluxe_battle_match_players_set_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    mariokart_8_deluxe_battle_match_id: Optional[Any] = Field(
-        alias="mariokart8deluxe_battle_match_id", default=None
-    )
-    nickname: Optional[str] = None
-    person_id: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class mariokart8deluxe_battle_match_players_stream_cursor_input(BaseModel):
-    initial_value: "mariokart8deluxe_battle_match_players_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class mariokart8deluxe_battle_match_players_stream_cursor_value_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    mariokart_8_deluxe_battle_match_id: Optional[Any] = Field(
-        alias="mariokart8deluxe_battle_match_id", default=None
-    )
-    nickname: Optional[str] = None
-    person_id: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class mariokart8deluxe_battle_match_players_updates(BaseModel):
-    set: Optional["mariokart8deluxe_battle_match_players_set_input"] = Field(
-        alias="_set", default=None
-    )
-    where: "mariokart8deluxe_battle_match_players_bool_exp"
-
-
 class mariokart8deluxe_battle_matches_aggregate_bool_exp(BaseModel):
     bool_and: Optional[
         "mariokart8deluxe_battle_matches_aggregate_bool_exp_bool_and"
@@ -3102,29 +1456,11 @@ class mariokart8deluxe_battle_matches_aggregate_bool_exp_count(BaseModel):
     predicate: "Int_comparison_exp"
 
 
-class mariokart8deluxe_battle_matches_aggregate_order_by(BaseModel):
-    avg: Optional["mariokart8deluxe_battle_matches_avg_order_by"] = None
-    count: Optional[order_by] = None
-    max: Optional["mariokart8deluxe_battle_matches_max_order_by"] = None
-    min: Optional["mariokart8deluxe_battle_matches_min_order_by"] = None
-    stddev: Optional["mariokart8deluxe_battle_matches_stddev_order_by"] = None
-    stddev_pop: Optional["mariokart8deluxe_battle_matches_stddev_pop_order_by"] = None
-    stddev_samp: Optional["mariokart8deluxe_battle_matches_stddev_samp_order_by"] = None
-    sum: Optional["mariokart8deluxe_battle_matches_sum_order_by"] = None
-    var_pop: Optional["mariokart8deluxe_battle_matches_var_pop_order_by"] = None
-    var_samp: Optional["mariokart8deluxe_battle_matches_var_samp_order_by"] = None
-    variance: Optional["mariokart8deluxe_battle_matches_variance_order_by"] = None
-
-
 class mariokart8deluxe_battle_matches_arr_rel_insert_input(BaseModel):
     data: List["mariokart8deluxe_battle_matches_insert_input"]
     on_conflict: Optional["mariokart8deluxe_battle_matches_on_conflict"] = None
 
 
-class mariokart8deluxe_battle_matches_avg_order_by(BaseModel):
-    index: Optional[order_by] = None
-
-
 class mariokart8deluxe_battle_matches_bool_exp(BaseModel):
     and_: Optional[List["mariokart8deluxe_battle_matches_bool_exp"]] = Field(
         alias="_and", default=None
@@ -3164,10 +1500,6 @@ class mariokart8deluxe_battle_matches_bool_exp(BaseModel):
     updated_at: Optional["timestamptz_comparison_exp"] = None
 
 
-class mariokart8deluxe_battle_matches_inc_input(BaseModel):
-    index: Optional[int] = None
-
-
 class mariokart8deluxe_battle_matches_insert_input(BaseModel):
     created_at: Optional[Any] = None
     end_time: Optional[Any] = None
@@ -3195,38 +1527,6 @@ class mariokart8deluxe_battle_matches_insert_input(BaseModel):
     updated_at: Optional[Any] = None
 
 
-class mariokart8deluxe_battle_matches_max_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    end_time: Optional[order_by] = None
-    id: Optional[order_by] = None
-    index: Optional[order_by] = None
-    mariokart_8_deluxe_battle_course_id: Optional[order_by] = Field(
-        alias="mariokart8deluxe_battle_course_id", default=None
-    )
-    mariokart_8_deluxe_battle_rule_id: Optional[order_by] = Field(
-        alias="mariokart8deluxe_battle_rule_id", default=None
-    )
-    program_id: Optional[order_by] = None
-    start_time: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class mariokart8deluxe_battle_matches_min_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    end_time: Optional[order_by] = None
-    id: Optional[order_by] = None
-    index: Optional[order_by] = None
-    mariokart_8_deluxe_battle_course_id: Optional[order_by] = Field(
-        alias="mariokart8deluxe_battle_course_id", default=None
-    )
-    mariokart_8_deluxe_battle_rule_id: Optional[order_by] = Field(
-        alias="mariokart8deluxe_battle_rule_id", default=None
-    )
-    program_id: Optional[order_by] = None
-    start_time: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
 class mariokart8deluxe_battle_matches_obj_rel_insert_input(BaseModel):
     data: "mariokart8deluxe_battle_matches_insert_input"
     on_conflict: Optional["mariokart8deluxe_battle_matches_on_conflict"] = None
@@ -3240,114 +1540,6 @@ class mariokart8deluxe_battle_matches_on_conflict(BaseModel):
     where: Optional["mariokart8deluxe_battle_matches_bool_exp"] = None
 
 
-class mariokart8deluxe_battle_matches_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    end_time: Optional[order_by] = None
-    id: Optional[order_by] = None
-    index: Optional[order_by] = None
-    is_aborted: Optional[order_by] = None
-    mariokart_8_deluxe_battle_course: Optional[
-        "mariokart8deluxe_battle_courses_order_by"
-    ] = Field(alias="mariokart8deluxe_battle_course", default=None)
-    mariokart_8_deluxe_battle_course_id: Optional[order_by] = Field(
-        alias="mariokart8deluxe_battle_course_id", default=None
-    )
-    mariokart_8_deluxe_battle_match_players_aggregate: Optional[
-        "mariokart8deluxe_battle_match_players_aggregate_order_by"
-    ] = Field(alias="mariokart8deluxe_battle_match_players_aggregate", default=None)
-    mariokart_8_deluxe_battle_rule: Optional[
-        "mariokart8deluxe_battle_rules_order_by"
-    ] = Field(alias="mariokart8deluxe_battle_rule", default=None)
-    mariokart_8_deluxe_battle_rule_id: Optional[order_by] = Field(
-        alias="mariokart8deluxe_battle_rule_id", default=None
-    )
-    program: Optional["programs_order_by"] = None
-    program_id: Optional[order_by] = None
-    start_time: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class mariokart8deluxe_battle_matches_pk_columns_input(BaseModel):
-    id: Any
-
-
-class mariokart8deluxe_battle_matches_set_input(BaseModel):
-    created_at: Optional[Any] = None
-    end_time: Optional[Any] = None
-    id: Optional[Any] = None
-    index: Optional[int] = None
-    is_aborted: Optional[bool] = None
-    mariokart_8_deluxe_battle_course_id: Optional[Any] = Field(
-        alias="mariokart8deluxe_battle_course_id", default=None
-    )
-    mariokart_8_deluxe_battle_rule_id: Optional[Any] = Field(
-        alias="mariokart8deluxe_battle_rule_id", default=None
-    )
-    program_id: Optional[Any] = None
-    start_time: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class mariokart8deluxe_battle_matches_stddev_order_by(BaseModel):
-    index: Optional[order_by] = None
-
-
-class mariokart8deluxe_battle_matches_stddev_pop_order_by(BaseModel):
-    index: Optional[order_by] = None
-
-
-class mariokart8deluxe_battle_matches_stddev_samp_order_by(BaseModel):
-    index: Optional[order_by] = None
-
-
-class mariokart8deluxe_battle_matches_stream_cursor_input(BaseModel):
-    initial_value: "mariokart8deluxe_battle_matches_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class mariokart8deluxe_battle_matches_stream_cursor_value_input(BaseModel):
-    created_at: Optional[Any] = None
-    end_time: Optional[Any] = None
-    id: Optional[Any] = None
-    index: Optional[int] = None
-    is_aborted: Optional[bool] = None
-    mariokart_8_deluxe_battle_course_id: Optional[Any] = Field(
-        alias="mariokart8deluxe_battle_course_id", default=None
-    )
-    mariokart_8_deluxe_battle_rule_id: Optional[Any] = Field(
-        alias="mariokart8deluxe_battle_rule_id", default=None
-    )
-    program_id: Optional[Any] = None
-    start_time: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class mariokart8deluxe_battle_matches_sum_order_by(BaseModel):
-    index: Optional[order_by] = None
-
-
-class mariokart8deluxe_battle_matches_updates(BaseModel):
-    inc: Optional["mariokart8deluxe_battle_matches_inc_input"] = Field(
-        alias="_inc", default=None
-    )
-    set: Optional["mariokart8deluxe_battle_matches_set_input"] = Field(
-        alias="_set", default=None
-    )
-    where: "mariokart8deluxe_battle_matches_bool_exp"
-
-
-class mariokart8deluxe_battle_matches_var_pop_order_by(BaseModel):
-    index: Optional[order_by] = None
-
-
-class mariokart8deluxe_battle_matches_var_samp_order_by(BaseModel):
-    index: Optional[order_by] = None
-
-
-class mariokart8deluxe_battle_matches_variance_order_by(BaseModel):
-    index: Optional[order_by] = None
-
-
 class mariokart8deluxe_battle_rules_bool_exp(BaseModel):
     and_: Optional[List["mariokart8deluxe_battle_rules_bool_exp"]] = Field(
         alias="_and", default=None
@@ -3371,10 +1563,6 @@ class mariokart8deluxe_battle_rules_bool_exp(BaseModel):
     updated_at: Optional["timestamptz_comparison_exp"] = None
 
 
-class mariokart8deluxe_battle_rules_inc_input(BaseModel):
-    index: Optional[int] = None
-
-
 class mariokart8deluxe_battle_rules_insert_input(BaseModel):
     created_at: Optional[Any] = None
     id: Optional[Any] = None
@@ -3399,52 +1587,6 @@ class mariokart8deluxe_battle_rules_on_conflict(BaseModel):
     where: Optional["mariokart8deluxe_battle_rules_bool_exp"] = None
 
 
-class mariokart8deluxe_battle_rules_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    index: Optional[order_by] = None
-    mariokart_8_deluxe_battle_matches_aggregate: Optional[
-        "mariokart8deluxe_battle_matches_aggregate_order_by"
-    ] = Field(alias="mariokart8deluxe_battle_matches_aggregate", default=None)
-    name: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class mariokart8deluxe_battle_rules_pk_columns_input(BaseModel):
-    id: Any
-
-
-class mariokart8deluxe_battle_rules_set_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    index: Optional[int] = None
-    name: Optional[str] = None
-    updated_at: Optional[Any] = None
-
-
-class mariokart8deluxe_battle_rules_stream_cursor_input(BaseModel):
-    initial_value: "mariokart8deluxe_battle_rules_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class mariokart8deluxe_battle_rules_stream_cursor_value_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    index: Optional[int] = None
-    name: Optional[str] = None
-    updated_at: Optional[Any] = None
-
-
-class mariokart8deluxe_battle_rules_updates(BaseModel):
-    inc: Optional["mariokart8deluxe_battle_rules_inc_input"] = Field(
-        alias="_inc", default=None
-    )
-    set: Optional["mariokart8deluxe_battle_rules_set_input"] = Field(
-        alias="_set", default=None
-    )
-    where: "mariokart8deluxe_battle_rules_bool_exp"
-
-
 class mariokart8deluxe_consoles_bool_exp(BaseModel):
     and_: Optional[List["mariokart8deluxe_consoles_bool_exp"]] = Field(
         alias="_and", default=None
@@ -3490,46 +1632,6 @@ class mariokart8deluxe_consoles_on_conflict(BaseModel):
     where: Optional["mariokart8deluxe_consoles_bool_exp"] = None
 
 
-class mariokart8deluxe_consoles_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    mariokart_8_deluxe_courses_aggregate: Optional[
-        "mariokart8deluxe_courses_aggregate_order_by"
-    ] = Field(alias="mariokart8deluxe_courses_aggregate", default=None)
-    name: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class mariokart8deluxe_consoles_pk_columns_input(BaseModel):
-    id: Any
-
-
-class mariokart8deluxe_consoles_set_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    name: Optional[str] = None
-    updated_at: Optional[Any] = None
-
-
-class mariokart8deluxe_consoles_stream_cursor_input(BaseModel):
-    initial_value: "mariokart8deluxe_consoles_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class mariokart8deluxe_consoles_stream_cursor_value_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    name: Optional[str] = None
-    updated_at: Optional[Any] = None
-
-
-class mariokart8deluxe_consoles_updates(BaseModel):
-    set: Optional["mariokart8deluxe_consoles_set_input"] = Field(
-        alias="_set", default=None
-    )
-    where: "mariokart8deluxe_consoles_bool_exp"
-
-
 class mariokart8deluxe_courses_aggregate_bool_exp(BaseModel):
     count: Optional["mariokart8deluxe_courses_aggregate_bool_exp_count"] = None
 
@@ -3541,29 +1643,11 @@ class mariokart8deluxe_courses_aggregate_bool_exp_count(BaseModel):
     predicate: "Int_comparison_exp"
 
 
-class mariokart8deluxe_courses_aggregate_order_by(BaseModel):
-    avg: Optional["mariokart8deluxe_courses_avg_order_by"] = None
-    count: Optional[order_by] = None
-    max: Optional["mariokart8deluxe_courses_max_order_by"] = None
-    min: Optional["mariokart8deluxe_courses_min_order_by"] = None
-    stddev: Optional["mariokart8deluxe_courses_stddev_order_by"] = None
-    stddev_pop: Optional["mariokart8deluxe_courses_stddev_pop_order_by"] = None
-    stddev_samp: Optional["mariokart8deluxe_courses_stddev_samp_order_by"] = None
-    sum: Optional["mariokart8deluxe_courses_sum_order_by"] = None
-    var_pop: Optional["mariokart8deluxe_courses_var_pop_order_by"] = None
-    var_samp: Optional["mariokart8deluxe_courses_var_samp_order_by"] = None
-    variance: Optional["mariokart8deluxe_courses_variance_order_by"] = None
-
-
 class mariokart8deluxe_courses_arr_rel_insert_input(BaseModel):
     data: List["mariokart8deluxe_courses_insert_input"]
     on_conflict: Optional["mariokart8deluxe_courses_on_conflict"] = None
 
 
-class mariokart8deluxe_courses_avg_order_by(BaseModel):
-    in_cup_index: Optional[order_by] = None
-
-
 class mariokart8deluxe_courses_bool_exp(BaseModel):
     and_: Optional[List["mariokart8deluxe_courses_bool_exp"]] = Field(
         alias="_and", default=None
@@ -3599,10 +1683,6 @@ class mariokart8deluxe_courses_bool_exp(BaseModel):
     updated_at: Optional["timestamptz_comparison_exp"] = None
 
 
-class mariokart8deluxe_courses_inc_input(BaseModel):
-    in_cup_index: Optional[int] = None
-
-
 class mariokart8deluxe_courses_insert_input(BaseModel):
     created_at: Optional[Any] = None
     id: Optional[Any] = None
@@ -3626,34 +1706,6 @@ class mariokart8deluxe_courses_insert_input(BaseModel):
     updated_at: Optional[Any] = None
 
 
-class mariokart8deluxe_courses_max_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    in_cup_index: Optional[order_by] = None
-    mariokart_8_deluxe_console_id: Optional[order_by] = Field(
-        alias="mariokart8deluxe_console_id", default=None
-    )
-    mariokart_8_deluxe_cup_id: Optional[order_by] = Field(
-        alias="mariokart8deluxe_cup_id", default=None
-    )
-    name: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class mariokart8deluxe_courses_min_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    in_cup_index: Optional[order_by] = None
-    mariokart_8_deluxe_console_id: Optional[order_by] = Field(
-        alias="mariokart8deluxe_console_id", default=None
-    )
-    mariokart_8_deluxe_cup_id: Optional[order_by] = Field(
-        alias="mariokart8deluxe_cup_id", default=None
-    )
-    name: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
 class mariokart8deluxe_courses_obj_rel_insert_input(BaseModel):
     data: "mariokart8deluxe_courses_insert_input"
     on_conflict: Optional["mariokart8deluxe_courses_on_conflict"] = None
@@ -3667,104 +1719,6 @@ class mariokart8deluxe_courses_on_conflict(BaseModel):
     where: Optional["mariokart8deluxe_courses_bool_exp"] = None
 
 
-class mariokart8deluxe_courses_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    in_cup_index: Optional[order_by] = None
-    mariokart_8_deluxe_console: Optional["mariokart8deluxe_consoles_order_by"] = Field(
-        alias="mariokart8deluxe_console", default=None
-    )
-    mariokart_8_deluxe_console_id: Optional[order_by] = Field(
-        alias="mariokart8deluxe_console_id", default=None
-    )
-    mariokart_8_deluxe_cup: Optional["mariokart8deluxe_cups_order_by"] = Field(
-        alias="mariokart8deluxe_cup", default=None
-    )
-    mariokart_8_deluxe_cup_id: Optional[order_by] = Field(
-        alias="mariokart8deluxe_cup_id", default=None
-    )
-    mariokart_8_deluxe_races_aggregate: Optional[
-        "mariokart8deluxe_races_aggregate_order_by"
-    ] = Field(alias="mariokart8deluxe_races_aggregate", default=None)
-    name: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class mariokart8deluxe_courses_pk_columns_input(BaseModel):
-    id: Any
-
-
-class mariokart8deluxe_courses_set_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    in_cup_index: Optional[int] = None
-    mariokart_8_deluxe_console_id: Optional[Any] = Field(
-        alias="mariokart8deluxe_console_id", default=None
-    )
-    mariokart_8_deluxe_cup_id: Optional[Any] = Field(
-        alias="mariokart8deluxe_cup_id", default=None
-    )
-    name: Optional[str] = None
-    updated_at: Optional[Any] = None
-
-
-class mariokart8deluxe_courses_stddev_order_by(BaseModel):
-    in_cup_index: Optional[order_by] = None
-
-
-class mariokart8deluxe_courses_stddev_pop_order_by(BaseModel):
-    in_cup_index: Optional[order_by] = None
-
-
-class mariokart8deluxe_courses_stddev_samp_order_by(BaseModel):
-    in_cup_index: Optional[order_by] = None
-
-
-class mariokart8deluxe_courses_stream_cursor_input(BaseModel):
-    initial_value: "mariokart8deluxe_courses_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class mariokart8deluxe_courses_stream_cursor_value_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    in_cup_index: Optional[int] = None
-    mariokart_8_deluxe_console_id: Optional[Any] = Field(
-        alias="mariokart8deluxe_console_id", default=None
-    )
-    mariokart_8_deluxe_cup_id: Optional[Any] = Field(
-        alias="mariokart8deluxe_cup_id", default=None
-    )
-    name: Optional[str] = None
-    updated_at: Optional[Any] = None
-
-
-class mariokart8deluxe_courses_sum_order_by(BaseModel):
-    in_cup_index: Optional[order_by] = None
-
-
-class mariokart8deluxe_courses_updates(BaseModel):
-    inc: Optional["mariokart8deluxe_courses_inc_input"] = Field(
-        alias="_inc", default=None
-    )
-    set: Optional["mariokart8deluxe_courses_set_input"] = Field(
-        alias="_set", default=None
-    )
-    where: "mariokart8deluxe_courses_bool_exp"
-
-
-class mariokart8deluxe_courses_var_pop_order_by(BaseModel):
-    in_cup_index: Optional[order_by] = None
-
-
-class mariokart8deluxe_courses_var_samp_order_by(BaseModel):
-    in_cup_index: Optional[order_by] = None
-
-
-class mariokart8deluxe_courses_variance_order_by(BaseModel):
-    in_cup_index: Optional[order_by] = None
-
-
 class mariokart8deluxe_cups_bool_exp(BaseModel):
     and_: Optional[List["mariokart8deluxe_cups_bool_exp"]] = Field(
         alias="_and", default=None
@@ -3786,10 +1740,6 @@ class mariokart8deluxe_cups_bool_exp(BaseModel):
     updated_at: Optional["timestamptz_comparison_exp"] = None
 
 
-class mariokart8deluxe_cups_inc_input(BaseModel):
-    index: Optional[int] = None
-
-
 class mariokart8deluxe_cups_insert_input(BaseModel):
     created_at: Optional[Any] = None
     id: Optional[Any] = None
@@ -3814,48 +1764,6 @@ class mariokart8deluxe_cups_on_conflict(BaseModel):
     where: Optional["mariokart8deluxe_cups_bool_exp"] = None
 
 
-class mariokart8deluxe_cups_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    index: Optional[order_by] = None
-    mariokart_8_deluxe_courses_aggregate: Optional[
-        "mariokart8deluxe_courses_aggregate_order_by"
-    ] = Field(alias="mariokart8deluxe_courses_aggregate", default=None)
-    name: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class mariokart8deluxe_cups_pk_columns_input(BaseModel):
-    id: Any
-
-
-class mariokart8deluxe_cups_set_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    index: Optional[int] = None
-    name: Optional[str] = None
-    updated_at: Optional[Any] = None
-
-
-class mariokart8deluxe_cups_stream_cursor_input(BaseModel):
-    initial_value: "mariokart8deluxe_cups_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class mariokart8deluxe_cups_stream_cursor_value_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    index: Optional[int] = None
-    name: Optional[str] = None
-    updated_at: Optional[Any] = None
-
-
-class mariokart8deluxe_cups_updates(BaseModel):
-    inc: Optional["mariokart8deluxe_cups_inc_input"] = Field(alias="_inc", default=None)
-    set: Optional["mariokart8deluxe_cups_set_input"] = Field(alias="_set", default=None)
-    where: "mariokart8deluxe_cups_bool_exp"
-
-
 class mariokart8deluxe_race_players_aggregate_bool_exp(BaseModel):
     count: Optional["mariokart8deluxe_race_players_aggregate_bool_exp_count"] = None
 
@@ -3867,12 +1775,6 @@ class mariokart8deluxe_race_players_aggregate_bool_exp_count(BaseModel):
     predicate: "Int_comparison_exp"
 
 
-class mariokart8deluxe_race_players_aggregate_order_by(BaseModel):
-    count: Optional[order_by] = None
-    max: Optional["mariokart8deluxe_race_players_max_order_by"] = None
-    min: Optional["mariokart8deluxe_race_players_min_order_by"] = None
-
-
 class mariokart8deluxe_race_players_arr_rel_insert_input(BaseModel):
     data: List["mariokart8deluxe_race_players_insert_input"]
     on_conflict: Optional["mariokart8deluxe_race_players_on_conflict"] = None
@@ -3917,28 +1819,6 @@ class mariokart8deluxe_race_players_insert_input(BaseModel):
     updated_at: Optional[Any] = None
 
 
-class mariokart8deluxe_race_players_max_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    mariokart_8_deluxe_race_id: Optional[order_by] = Field(
-        alias="mariokart8deluxe_race_id", default=None
-    )
-    nickname: Optional[order_by] = None
-    person_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class mariokart8deluxe_race_players_min_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    mariokart_8_deluxe_race_id: Optional[order_by] = Field(
-        alias="mariokart8deluxe_race_id", default=None
-    )
-    nickname: Optional[order_by] = None
-    person_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
 class mariokart8deluxe_race_players_on_conflict(BaseModel):
     constraint: mariokart8deluxe_race_players_constraint
     update_columns: List[mariokart8deluxe_race_players_update_column] = Field(
@@ -3947,59 +1827,6 @@ class mariokart8deluxe_race_players_on_conflict(BaseModel):
     where: Optional["mariokart8deluxe_race_players_bool_exp"] = None
 
 
-class mariokart8deluxe_race_players_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    mariokart_8_deluxe_race: Optional["mariokart8deluxe_races_order_by"] = Field(
-        alias="mariokart8deluxe_race", default=None
-    )
-    mariokart_8_deluxe_race_id: Optional[order_by] = Field(
-        alias="mariokart8deluxe_race_id", default=None
-    )
-    nickname: Optional[order_by] = None
-    person: Optional["persons_order_by"] = None
-    person_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class mariokart8deluxe_race_players_pk_columns_input(BaseModel):
-    id: Any
-
-
-class mariokart8deluxe_race_players_set_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    mariokart_8_deluxe_race_id: Optional[Any] = Field(
-        alias="mariokart8deluxe_race_id", default=None
-    )
-    nickname: Optional[str] = None
-    person_id: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class mariokart8deluxe_race_players_stream_cursor_input(BaseModel):
-    initial_value: "mariokart8deluxe_race_players_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class mariokart8deluxe_race_players_stream_cursor_value_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    mariokart_8_deluxe_race_id: Optional[Any] = Field(
-        alias="mariokart8deluxe_race_id", default=None
-    )
-    nickname: Optional[str] = None
-    person_id: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class mariokart8deluxe_race_players_updates(BaseModel):
-    set: Optional["mariokart8deluxe_race_players_set_input"] = Field(
-        alias="_set", default=None
-    )
-    where: "mariokart8deluxe_race_players_bool_exp"
-
-
 class mariokart8deluxe_race_rules_bool_exp(BaseModel):
     and_: Optional[List["mariokart8deluxe_race_rules_bool_exp"]] = Field(
         alias="_and", default=None
@@ -4017,10 +1844,6 @@ class mariokart8deluxe_race_rules_bool_exp(BaseModel):
     updated_at: Optional["timestamptz_comparison_exp"] = None
 
 
-class mariokart8deluxe_race_rules_inc_input(BaseModel):
-    index: Optional[int] = None
-
-
 class mariokart8deluxe_race_rules_insert_input(BaseModel):
     created_at: Optional[Any] = None
     id: Optional[Any] = None
@@ -4042,49 +1865,6 @@ class mariokart8deluxe_race_rules_on_conflict(BaseModel):
     where: Optional["mariokart8deluxe_race_rules_bool_exp"] = None
 
 
-class mariokart8deluxe_race_rules_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    index: Optional[order_by] = None
-    name: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class mariokart8deluxe_race_rules_pk_columns_input(BaseModel):
-    id: Any
-
-
-class mariokart8deluxe_race_rules_set_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    index: Optional[int] = None
-    name: Optional[str] = None
-    updated_at: Optional[Any] = None
-
-
-class mariokart8deluxe_race_rules_stream_cursor_input(BaseModel):
-    initial_value: "mariokart8deluxe_race_rules_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class mariokart8deluxe_race_rules_stream_cursor_value_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    index: Optional[int] = None
-    name: Optional[str] = None
-    updated_at: Optional[Any] = None
-
-
-class mariokart8deluxe_race_rules_updates(BaseModel):
-    inc: Optional["mariokart8deluxe_race_rules_inc_input"] = Field(
-        alias="_inc", default=None
-    )
-    set: Optional["mariokart8deluxe_race_rules_set_input"] = Field(
-        alias="_set", default=None
-    )
-    where: "mariokart8deluxe_race_rules_bool_exp"
-
-
 class mariokart8deluxe_races_aggregate_bool_exp(BaseModel):
     bool_and: Optional["mariokart8deluxe_races_aggregate_bool_exp_bool_and"] = None
     bool_or: Optional["mariokart8deluxe_races_aggregate_bool_exp_bool_or"] = None
@@ -4112,29 +1892,11 @@ class mariokart8deluxe_races_aggregate_bool_exp_count(BaseModel):
     predicate: "Int_comparison_exp"
 
 
-class mariokart8deluxe_races_aggregate_order_by(BaseModel):
-    avg: Optional["mariokart8deluxe_races_avg_order_by"] = None
-    count: Optional[order_by] = None
-    max: Optional["mariokart8deluxe_races_max_order_by"] = None
-    min: Optional["mariokart8deluxe_races_min_order_by"] = None
-    stddev: Optional["mariokart8deluxe_races_stddev_order_by"] = None
-    stddev_pop: Optional["mariokart8deluxe_races_stddev_pop_order_by"] = None
-    stddev_samp: Optional["mariokart8deluxe_races_stddev_samp_order_by"] = None
-    sum: Optional["mariokart8deluxe_races_sum_order_by"] = None
-    var_pop: Optional["mariokart8deluxe_races_var_pop_order_by"] = None
-    var_samp: Optional["mariokart8deluxe_races_var_samp_order_by"] = None
-    variance: Optional["mariokart8deluxe_races_variance_order_by"] = None
-
-
 class mariokart8deluxe_races_arr_rel_insert_input(BaseModel):
     data: List["mariokart8deluxe_races_insert_input"]
     on_conflict: Optional["mariokart8deluxe_races_on_conflict"] = None
 
 
-class mariokart8deluxe_races_avg_order_by(BaseModel):
-    index: Optional[order_by] = None
-
-
 class mariokart8deluxe_races_bool_exp(BaseModel):
     and_: Optional[List["mariokart8deluxe_races_bool_exp"]] = Field(
         alias="_and", default=None
@@ -4149,213 +1911,69 @@ class mariokart8deluxe_races_bool_exp(BaseModel):
     end_time: Optional["timestamptz_comparison_exp"] = None
     id: Optional["uuid_comparison_exp"] = None
     index: Optional["Int_comparison_exp"] = None
-    is_aborted: Optional["Boolean_comparison_exp"] = None
-    mariokart_8_deluxe_course: Optional["mariokart8deluxe_courses_bool_exp"] = Field(
-        alias="mariokart8deluxe_course", default=None
-    )
-    mariokart_8_deluxe_course_id: Optional["uuid_comparison_exp"] = Field(
-        alias="mariokart8deluxe_course_id", default=None
-    )
-    mariokart_8_deluxe_race_players: Optional[
-        "mariokart8deluxe_race_players_bool_exp"
-    ] = Field(alias="mariokart8deluxe_race_players", default=None)
-    mariokart_8_deluxe_race_players_aggregate: Optional[
-        "mariokart8deluxe_race_players_aggregate_bool_exp"
-    ] = Field(alias="mariokart8deluxe_race_players_aggregate", default=None)
-    mariokart_8_deluxe_race_rule: Optional["mariokart8deluxe_race_rules_bool_exp"] = (
-        Field(alias="mariokart8deluxe_race_rule", default=None)
-    )
-    mariokart_8_deluxe_race_rule_id: Optional["uuid_comparison_exp"] = Field(
-        alias="mariokart8deluxe_race_rule_id", default=None
-    )
-    program: Optional["programs_bool_exp"] = None
-    program_id: Optional["uuid_comparison_exp"] = None
-    start_time: Optional["timestamptz_comparison_exp"] = None
-    updated_at: Optional["timestamptz_comparison_exp"] = None
-
-
-class mariokart8deluxe_races_inc_input(BaseModel):
-    index: Optional[int] = None
-
-
-class mariokart8deluxe_races_insert_input(BaseModel):
-    created_at: Optional[Any] = None
-    end_time: Optional[Any] = None
-    id: Optional[Any] = None
-    index: Optional[int] = None
-    is_aborted: Optional[bool] = None
-    mariokart_8_deluxe_course: Optional[
-        "mariokart8deluxe_courses_obj_rel_insert_input"
-    ] = Field(alias="mariokart8deluxe_course", default=None)
-    mariokart_8_deluxe_course_id: Optional[Any] = Field(
-        alias="mariokart8deluxe_course_id", default=None
-    )
-    mariokart_8_deluxe_race_players: Optional[
-        "mariokart8deluxe_race_players_arr_rel_insert_input"
-    ] = Field(alias="mariokart8deluxe_race_players", default=None)
-    mariokart_8_deluxe_race_rule: Optional[
-        "mariokart8deluxe_race_rules_obj_rel_insert_input"
-    ] = Field(alias="mariokart8deluxe_race_rule", default=None)
-    mariokart_8_deluxe_race_rule_id: Optional[Any] = Field(
-        alias="mariokart8deluxe_race_rule_id", default=None
-    )
-    program: Optional["programs_obj_rel_insert_input"] = None
-    program_id: Optional[Any] = None
-    start_time: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class mariokart8deluxe_races_max_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    end_time: Optional[order_by] = None
-    id: Optional[order_by] = None
-    index: Optional[order_by] = None
-    mariokart_8_deluxe_course_id: Optional[order_by] = Field(
-        alias="mariokart8deluxe_course_id", default=None
-    )
-    mariokart_8_deluxe_race_rule_id: Optional[order_by] = Field(
-        alias="mariokart8deluxe_race_rule_id", default=None
-    )
-    program_id: Optional[order_by] = None
-    start_time: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class mariokart8deluxe_races_min_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    end_time: Optional[order_by] = None
-    id: Optional[order_by] = None
-    index: Optional[order_by] = None
-    mariokart_8_deluxe_course_id: Optional[order_by] = Field(
-        alias="mariokart8deluxe_course_id", default=None
-    )
-    mariokart_8_deluxe_race_rule_id: Optional[order_by] = Field(
-        alias="mariokart8deluxe_race_rule_id", default=None
-    )
-    program_id: Optional[order_by] = None
-    start_time: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class mariokart8deluxe_races_obj_rel_insert_input(BaseModel):
-    data: "mariokart8deluxe_races_insert_input"
-    on_conflict: Optional["mariokart8deluxe_races_on_conflict"] = None
-
-
-class mariokart8deluxe_races_on_conflict(BaseModel):
-    constraint: mariokart8deluxe_races_constraint
-    update_columns: List[mariokart8deluxe_races_update_column] = Field(
-        default_factory=lambda: []
-    )
-    where: Optional["mariokart8deluxe_races_bool_exp"] = None
-
-
-class mariokart8deluxe_races_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    end_time: Optional[order_by] = None
-    id: Optional[order_by] = None
-    index: Optional[order_by] = None
-    is_aborted: Optional[order_by] = None
-    mariokart_8_deluxe_course: Optional["mariokart8deluxe_courses_order_by"] = Field(
+    is_aborted: Optional["Boolean_comparison_exp"] = None
+    mariokart_8_deluxe_course: Optional["mariokart8deluxe_courses_bool_exp"] = Field(
         alias="mariokart8deluxe_course", default=None
     )
-    mariokart_8_deluxe_course_id: Optional[order_by] = Field(
+    mariokart_8_deluxe_course_id: Optional["uuid_comparison_exp"] = Field(
         alias="mariokart8deluxe_course_id", default=None
     )
+    mariokart_8_deluxe_race_players: Optional[
+        "mariokart8deluxe_race_players_bool_exp"
+    ] = Field(alias="mariokart8deluxe_race_players", default=None)
     mariokart_8_deluxe_race_players_aggregate: Optional[
-        "mariokart8deluxe_race_players_aggregate_order_by"
+        "mariokart8deluxe_race_players_aggregate_bool_exp"
     ] = Field(alias="mariokart8deluxe_race_players_aggregate", default=None)
-    mariokart_8_deluxe_race_rule: Optional["mariokart8deluxe_race_rules_order_by"] = (
+    mariokart_8_deluxe_race_rule: Optional["mariokart8deluxe_race_rules_bool_exp"] = (
         Field(alias="mariokart8deluxe_race_rule", default=None)
     )
-    mariokart_8_deluxe_race_rule_id: Optional[order_by] = Field(
-        alias="mariokart8deluxe_race_rule_id", default=None
-    )
-    program: Optional["programs_order_by"] = None
-    program_id: Optional[order_by] = None
-    start_time: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class mariokart8deluxe_races_pk_columns_input(BaseModel):
-    id: Any
-
-
-class mariokart8deluxe_races_set_input(BaseModel):
-    created_at: Optional[Any] = None
-    end_time: Optional[Any] = None
-    id: Optional[Any] = None
-    index: Optional[int] = None
-    is_aborted: Optional[bool] = None
-    mariokart_8_deluxe_course_id: Optional[Any] = Field(
-        alias="mariokart8deluxe_course_id", default=None
-    )
-    mariokart_8_deluxe_race_rule_id: Optional[Any] = Field(
+    mariokart_8_deluxe_race_rule_id: Optional["uuid_comparison_exp"] = Field(
         alias="mariokart8deluxe_race_rule_id", default=None
     )
-    program_id: Optional[Any] = None
-    start_time: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class mariokart8deluxe_races_stddev_order_by(BaseModel):
-    index: Optional[order_by] = None
-
-
-class mariokart8deluxe_races_stddev_pop_order_by(BaseModel):
-    index: Optional[order_by] = None
-
-
-class mariokart8deluxe_races_stddev_samp_order_by(BaseModel):
-    index: Optional[order_by] = None
-
-
-class mariokart8deluxe_races_stream_cursor_input(BaseModel):
-    initial_value: "mariokart8deluxe_races_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
+    program: Optional["programs_bool_exp"] = None
+    program_id: Optional["uuid_comparison_exp"] = None
+    start_time: Optional["timestamptz_comparison_exp"] = None
+    updated_at: Optional["timestamptz_comparison_exp"] = None
 
 
-class mariokart8deluxe_races_stream_cursor_value_input(BaseModel):
+class mariokart8deluxe_races_insert_input(BaseModel):
     created_at: Optional[Any] = None
     end_time: Optional[Any] = None
     id: Optional[Any] = None
     index: Optional[int] = None
     is_aborted: Optional[bool] = None
+    mariokart_8_deluxe_course: Optional[
+        "mariokart8deluxe_courses_obj_rel_insert_input"
+    ] = Field(alias="mariokart8deluxe_course", default=None)
     mariokart_8_deluxe_course_id: Optional[Any] = Field(
         alias="mariokart8deluxe_course_id", default=None
     )
+    mariokart_8_deluxe_race_players: Optional[
+        "mariokart8deluxe_race_players_arr_rel_insert_input"
+    ] = Field(alias="mariokart8deluxe_race_players", default=None)
+    mariokart_8_deluxe_race_rule: Optional[
+        "mariokart8deluxe_race_rules_obj_rel_insert_input"
+    ] = Field(alias="mariokart8deluxe_race_rule", default=None)
     mariokart_8_deluxe_race_rule_id: Optional[Any] = Field(
         alias="mariokart8deluxe_race_rule_id", default=None
     )
+    program: Optional["programs_obj_rel_insert_input"] = None
     program_id: Optional[Any] = None
     start_time: Optional[Any] = None
     updated_at: Optional[Any] = None
 
 
-class mariokart8deluxe_races_sum_order_by(BaseModel):
-    index: Optional[order_by] = None
+class mariokart8deluxe_races_obj_rel_insert_input(BaseModel):
+    data: "mariokart8deluxe_races_insert_input"
+    on_conflict: Optional["mariokart8deluxe_races_on_conflict"] = None
 
 
-class mariokart8deluxe_races_updates(BaseModel):
-    inc: Optional["mariokart8deluxe_races_inc_input"] = Field(
-        alias="_inc", default=None
-    )
-    set: Optional["mariokart8deluxe_races_set_input"] = Field(
-        alias="_set", default=None
+class mariokart8deluxe_races_on_conflict(BaseModel):
+    constraint: mariokart8deluxe_races_constraint
+    update_columns: List[mariokart8deluxe_races_update_column] = Field(
+        default_factory=lambda: []
     )
-    where: "mariokart8deluxe_races_bool_exp"
-
-
-class mariokart8deluxe_races_var_pop_order_by(BaseModel):
-    index: Optional[order_by] = None
-
-
-class mariokart8deluxe_races_var_samp_order_by(BaseModel):
-    index: Optional[order_by] = None
-
-
-class mariokart8deluxe_races_variance_order_by(BaseModel):
-    index: Optional[order_by] = None
+    where: Optional["mariokart8deluxe_races_bool_exp"] = None
 
 
 class niconico_accounts_bool_exp(BaseModel):
@@ -4392,44 +2010,6 @@ class niconico_accounts_on_conflict(BaseModel):
     where: Optional["niconico_accounts_bool_exp"] = None
 
 
-class niconico_accounts_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    name: Optional[order_by] = None
-    remote_niconico_account_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class niconico_accounts_pk_columns_input(BaseModel):
-    id: Any
-
-
-class niconico_accounts_set_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    name: Optional[str] = None
-    remote_niconico_account_id: Optional[str] = None
-    updated_at: Optional[Any] = None
-
-
-class niconico_accounts_stream_cursor_input(BaseModel):
-    initial_value: "niconico_accounts_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class niconico_accounts_stream_cursor_value_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    name: Optional[str] = None
-    remote_niconico_account_id: Optional[str] = None
-    updated_at: Optional[Any] = None
-
-
-class niconico_accounts_updates(BaseModel):
-    set: Optional["niconico_accounts_set_input"] = Field(alias="_set", default=None)
-    where: "niconico_accounts_bool_exp"
-
-
 class niconico_channels_bool_exp(BaseModel):
     and_: Optional[List["niconico_channels_bool_exp"]] = Field(
         alias="_and", default=None
@@ -4473,50 +2053,6 @@ class niconico_channels_on_conflict(BaseModel):
     where: Optional["niconico_channels_bool_exp"] = None
 
 
-class niconico_channels_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    name: Optional[order_by] = None
-    person_niconico_channels_aggregate: Optional[
-        "person_niconico_channels_aggregate_order_by"
-    ] = None
-    remote_niconico_channel_id: Optional[order_by] = None
-    screen_name: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class niconico_channels_pk_columns_input(BaseModel):
-    id: Any
-
-
-class niconico_channels_set_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    name: Optional[str] = None
-    remote_niconico_channel_id: Optional[str] = None
-    screen_name: Optional[str] = None
-    updated_at: Optional[Any] = None
-
-
-class niconico_channels_stream_cursor_input(BaseModel):
-    initial_value: "niconico_channels_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class niconico_channels_stream_cursor_value_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    name: Optional[str] = None
-    remote_niconico_channel_id: Optional[str] = None
-    screen_name: Optional[str] = None
-    updated_at: Optional[Any] = None
-
-
-class niconico_channels_updates(BaseModel):
-    set: Optional["niconico_channels_set_input"] = Field(alias="_set", default=None)
-    where: "niconico_channels_bool_exp"
-
-
 class niconico_communities_bool_exp(BaseModel):
     and_: Optional[List["niconico_communities_bool_exp"]] = Field(
         alias="_and", default=None
@@ -4553,44 +2089,6 @@ class niconico_communities_on_conflict(BaseModel):
     where: Optional["niconico_communities_bool_exp"] = None
 
 
-class niconico_communities_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    name: Optional[order_by] = None
-    remote_niconico_community_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class niconico_communities_pk_columns_input(BaseModel):
-    id: Any
-
-
-class niconico_communities_set_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    name: Optional[str] = None
-    remote_niconico_community_id: Optional[str] = None
-    updated_at: Optional[Any] = None
-
-
-class niconico_communities_stream_cursor_input(BaseModel):
-    initial_value: "niconico_communities_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class niconico_communities_stream_cursor_value_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    name: Optional[str] = None
-    remote_niconico_community_id: Optional[str] = None
-    updated_at: Optional[Any] = None
-
-
-class niconico_communities_updates(BaseModel):
-    set: Optional["niconico_communities_set_input"] = Field(alias="_set", default=None)
-    where: "niconico_communities_bool_exp"
-
-
 class niconico_plus_channels_bool_exp(BaseModel):
     and_: Optional[List["niconico_plus_channels_bool_exp"]] = Field(
         alias="_and", default=None
@@ -4640,52 +2138,6 @@ class niconico_plus_channels_on_conflict(BaseModel):
     where: Optional["niconico_plus_channels_bool_exp"] = None
 
 
-class niconico_plus_channels_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    name: Optional[order_by] = None
-    person_niconico_plus_channels_aggregate: Optional[
-        "person_niconico_plus_channels_aggregate_order_by"
-    ] = None
-    remote_niconico_plus_channel_id: Optional[order_by] = None
-    screen_name: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class niconico_plus_channels_pk_columns_input(BaseModel):
-    id: Any
-
-
-class niconico_plus_channels_set_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    name: Optional[str] = None
-    remote_niconico_plus_channel_id: Optional[str] = None
-    screen_name: Optional[str] = None
-    updated_at: Optional[Any] = None
-
-
-class niconico_plus_channels_stream_cursor_input(BaseModel):
-    initial_value: "niconico_plus_channels_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class niconico_plus_channels_stream_cursor_value_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    name: Optional[str] = None
-    remote_niconico_plus_channel_id: Optional[str] = None
-    screen_name: Optional[str] = None
-    updated_at: Optional[Any] = None
-
-
-class niconico_plus_channels_updates(BaseModel):
-    set: Optional["niconico_plus_channels_set_input"] = Field(
-        alias="_set", default=None
-    )
-    where: "niconico_plus_channels_bool_exp"
-
-
 class niconico_videos_bool_exp(BaseModel):
     and_: Optional[List["niconico_videos_bool_exp"]] = Field(alias="_and", default=None)
     not_: Optional["niconico_videos_bool_exp"] = Field(alias="_not", default=None)
@@ -4740,60 +2192,6 @@ class niconico_videos_on_conflict(BaseModel):
     where: Optional["niconico_videos_bool_exp"] = None
 
 
-class niconico_videos_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    niconico_account: Optional["niconico_accounts_order_by"] = None
-    niconico_account_id: Optional[order_by] = None
-    program_niconico_videos_aggregate: Optional[
-        "program_niconico_videos_aggregate_order_by"
-    ] = None
-    project_niconico_videos_aggregate: Optional[
-        "project_niconico_videos_aggregate_order_by"
-    ] = None
-    remote_niconico_content_id: Optional[order_by] = None
-    start_time: Optional[order_by] = None
-    thumbnail_url: Optional[order_by] = None
-    title: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class niconico_videos_pk_columns_input(BaseModel):
-    id: Any
-
-
-class niconico_videos_set_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    niconico_account_id: Optional[Any] = None
-    remote_niconico_content_id: Optional[str] = None
-    start_time: Optional[Any] = None
-    thumbnail_url: Optional[str] = None
-    title: Optional[str] = None
-    updated_at: Optional[Any] = None
-
-
-class niconico_videos_stream_cursor_input(BaseModel):
-    initial_value: "niconico_videos_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class niconico_videos_stream_cursor_value_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    niconico_account_id: Optional[Any] = None
-    remote_niconico_content_id: Optional[str] = None
-    start_time: Optional[Any] = None
-    thumbnail_url: Optional[str] = None
-    title: Optional[str] = None
-    updated_at: Optional[Any] = None
-
-
-class niconico_videos_updates(BaseModel):
-    set: Optional["niconico_videos_set_input"] = Field(alias="_set", default=None)
-    where: "niconico_videos_bool_exp"
-
-
 class person_fediverse_accounts_aggregate_bool_exp(BaseModel):
     count: Optional["person_fediverse_accounts_aggregate_bool_exp_count"] = None
 
@@ -4805,12 +2203,6 @@ class person_fediverse_accounts_aggregate_bool_exp_count(BaseModel):
     predicate: "Int_comparison_exp"
 
 
-class person_fediverse_accounts_aggregate_order_by(BaseModel):
-    count: Optional[order_by] = None
-    max: Optional["person_fediverse_accounts_max_order_by"] = None
-    min: Optional["person_fediverse_accounts_min_order_by"] = None
-
-
 class person_fediverse_accounts_arr_rel_insert_input(BaseModel):
     data: List["person_fediverse_accounts_insert_input"]
     on_conflict: Optional["person_fediverse_accounts_on_conflict"] = None
@@ -4845,22 +2237,6 @@ class person_fediverse_accounts_insert_input(BaseModel):
     updated_at: Optional[Any] = None
 
 
-class person_fediverse_accounts_max_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    fediverse_account_id: Optional[order_by] = None
-    id: Optional[order_by] = None
-    person_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class person_fediverse_accounts_min_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    fediverse_account_id: Optional[order_by] = None
-    id: Optional[order_by] = None
-    person_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
 class person_fediverse_accounts_on_conflict(BaseModel):
     constraint: person_fediverse_accounts_constraint
     update_columns: List[person_fediverse_accounts_update_column] = Field(
@@ -4869,48 +2245,6 @@ class person_fediverse_accounts_on_conflict(BaseModel):
     where: Optional["person_fediverse_accounts_bool_exp"] = None
 
 
-class person_fediverse_accounts_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    fediverse_account: Optional["fediverse_accounts_order_by"] = None
-    fediverse_account_id: Optional[order_by] = None
-    id: Optional[order_by] = None
-    person: Optional["persons_order_by"] = None
-    person_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class person_fediverse_accounts_pk_columns_input(BaseModel):
-    id: Any
-
-
-class person_fediverse_accounts_set_input(BaseModel):
-    created_at: Optional[Any] = None
-    fediverse_account_id: Optional[Any] = None
-    id: Optional[Any] = None
-    person_id: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class person_fediverse_accounts_stream_cursor_input(BaseModel):
-    initial_value: "person_fediverse_accounts_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class person_fediverse_accounts_stream_cursor_value_input(BaseModel):
-    created_at: Optional[Any] = None
-    fediverse_account_id: Optional[Any] = None
-    id: Optional[Any] = None
-    person_id: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class person_fediverse_accounts_updates(BaseModel):
-    set: Optional["person_fediverse_accounts_set_input"] = Field(
-        alias="_set", default=None
-    )
-    where: "person_fediverse_accounts_bool_exp"
-
-
 class person_niconico_accounts_aggregate_bool_exp(BaseModel):
     count: Optional["person_niconico_accounts_aggregate_bool_exp_count"] = None
 
@@ -4922,12 +2256,6 @@ class person_niconico_accounts_aggregate_bool_exp_count(BaseModel):
     predicate: "Int_comparison_exp"
 
 
-class person_niconico_accounts_aggregate_order_by(BaseModel):
-    count: Optional[order_by] = None
-    max: Optional["person_niconico_accounts_max_order_by"] = None
-    min: Optional["person_niconico_accounts_min_order_by"] = None
-
-
 class person_niconico_accounts_arr_rel_insert_input(BaseModel):
     data: List["person_niconico_accounts_insert_input"]
     on_conflict: Optional["person_niconico_accounts_on_conflict"] = None
@@ -4962,70 +2290,12 @@ class person_niconico_accounts_insert_input(BaseModel):
     updated_at: Optional[Any] = None
 
 
-class person_niconico_accounts_max_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    niconico_account_id: Optional[order_by] = None
-    person_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class person_niconico_accounts_min_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    niconico_account_id: Optional[order_by] = None
-    person_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
 class person_niconico_accounts_on_conflict(BaseModel):
-    constraint: person_niconico_accounts_constraint
-    update_columns: List[person_niconico_accounts_update_column] = Field(
-        default_factory=lambda: []
-    )
-    where: Optional["person_niconico_accounts_bool_exp"] = None
-
-
-class person_niconico_accounts_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    niconico_account: Optional["niconico_accounts_order_by"] = None
-    niconico_account_id: Optional[order_by] = None
-    person: Optional["persons_order_by"] = None
-    person_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class person_niconico_accounts_pk_columns_input(BaseModel):
-    id: Any
-
-
-class person_niconico_accounts_set_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    niconico_account_id: Optional[Any] = None
-    person_id: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class person_niconico_accounts_stream_cursor_input(BaseModel):
-    initial_value: "person_niconico_accounts_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class person_niconico_accounts_stream_cursor_value_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    niconico_account_id: Optional[Any] = None
-    person_id: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class person_niconico_accounts_updates(BaseModel):
-    set: Optional["person_niconico_accounts_set_input"] = Field(
-        alias="_set", default=None
+    constraint: person_niconico_accounts_constraint
+    update_columns: List[person_niconico_accounts_update_column] = Field(
+        default_factory=lambda: []
     )
-    where: "person_niconico_accounts_bool_exp"
+    where: Optional["person_niconico_accounts_bool_exp"] = None
 
 
 class person_niconico_channels_aggregate_bool_exp(BaseModel):
@@ -5039,12 +2309,6 @@ class person_niconico_channels_aggregate_bool_exp_count(BaseModel):
     predicate: "Int_comparison_exp"
 
 
-class person_niconico_channels_aggregate_order_by(BaseModel):
-    count: Optional[order_by] = None
-    max: Optional["person_niconico_channels_max_order_by"] = None
-    min: Optional["person_niconico_channels_min_order_by"] = None
-
-
 class person_niconico_channels_arr_rel_insert_input(BaseModel):
     data: List["person_niconico_channels_insert_input"]
     on_conflict: Optional["person_niconico_channels_on_conflict"] = None
@@ -5079,22 +2343,6 @@ class person_niconico_channels_insert_input(BaseModel):
     updated_at: Optional[Any] = None
 
 
-class person_niconico_channels_max_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    niconico_channel_id: Optional[order_by] = None
-    person_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class person_niconico_channels_min_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    niconico_channel_id: Optional[order_by] = None
-    person_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
 class person_niconico_channels_on_conflict(BaseModel):
     constraint: person_niconico_channels_constraint
     update_columns: List[person_niconico_channels_update_column] = Field(
@@ -5103,48 +2351,6 @@ class person_niconico_channels_on_conflict(BaseModel):
     where: Optional["person_niconico_channels_bool_exp"] = None
 
 
-class person_niconico_channels_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    niconico_channel: Optional["niconico_channels_order_by"] = None
-    niconico_channel_id: Optional[order_by] = None
-    person: Optional["persons_order_by"] = None
-    person_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class person_niconico_channels_pk_columns_input(BaseModel):
-    id: Any
-
-
-class person_niconico_channels_set_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    niconico_channel_id: Optional[Any] = None
-    person_id: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class person_niconico_channels_stream_cursor_input(BaseModel):
-    initial_value: "person_niconico_channels_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class person_niconico_channels_stream_cursor_value_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    niconico_channel_id: Optional[Any] = None
-    person_id: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class person_niconico_channels_updates(BaseModel):
-    set: Optional["person_niconico_channels_set_input"] = Field(
-        alias="_set", default=None
-    )
-    where: "person_niconico_channels_bool_exp"
-
-
 class person_niconico_communities_aggregate_bool_exp(BaseModel):
     count: Optional["person_niconico_communities_aggregate_bool_exp_count"] = None
 
@@ -5156,12 +2362,6 @@ class person_niconico_communities_aggregate_bool_exp_count(BaseModel):
     predicate: "Int_comparison_exp"
 
 
-class person_niconico_communities_aggregate_order_by(BaseModel):
-    count: Optional[order_by] = None
-    max: Optional["person_niconico_communities_max_order_by"] = None
-    min: Optional["person_niconico_communities_min_order_by"] = None
-
-
 class person_niconico_communities_arr_rel_insert_input(BaseModel):
     data: List["person_niconico_communities_insert_input"]
     on_conflict: Optional["person_niconico_communities_on_conflict"] = None
@@ -5196,22 +2396,6 @@ class person_niconico_communities_insert_input(BaseModel):
     updated_at: Optional[Any] = None
 
 
-class person_niconico_communities_max_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    niconico_community_id: Optional[order_by] = None
-    person_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class person_niconico_communities_min_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    niconico_community_id: Optional[order_by] = None
-    person_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
 class person_niconico_communities_on_conflict(BaseModel):
     constraint: person_niconico_communities_constraint
     update_columns: List[person_niconico_communities_update_column] = Field(
@@ -5220,48 +2404,6 @@ class person_niconico_communities_on_conflict(BaseModel):
     where: Optional["person_niconico_communities_bool_exp"] = None
 
 
-class person_niconico_communities_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    niconico_community: Optional["niconico_communities_order_by"] = None
-    niconico_community_id: Optional[order_by] = None
-    person: Optional["persons_order_by"] = None
-    person_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class person_niconico_communities_pk_columns_input(BaseModel):
-    id: Any
-
-
-class person_niconico_communities_set_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    niconico_community_id: Optional[Any] = None
-    person_id: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class person_niconico_communities_stream_cursor_input(BaseModel):
-    initial_value: "person_niconico_communities_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class person_niconico_communities_stream_cursor_value_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    niconico_community_id: Optional[Any] = None
-    person_id: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class person_niconico_communities_updates(BaseModel):
-    set: Optional["person_niconico_communities_set_input"] = Field(
-        alias="_set", default=None
-    )
-    where: "person_niconico_communities_bool_exp"
-
-
 class person_niconico_plus_channels_aggregate_bool_exp(BaseModel):
     count: Optional["person_niconico_plus_channels_aggregate_bool_exp_count"] = None
 
@@ -5273,12 +2415,6 @@ class person_niconico_plus_channels_aggregate_bool_exp_count(BaseModel):
     predicate: "Int_comparison_exp"
 
 
-class person_niconico_plus_channels_aggregate_order_by(BaseModel):
-    count: Optional[order_by] = None
-    max: Optional["person_niconico_plus_channels_max_order_by"] = None
-    min: Optional["person_niconico_plus_channels_min_order_by"] = None
-
-
 class person_niconico_plus_channels_arr_rel_insert_input(BaseModel):
     data: List["person_niconico_plus_channels_insert_input"]
     on_conflict: Optional["person_niconico_plus_channels_on_conflict"] = None
@@ -5315,22 +2451,6 @@ class person_niconico_plus_channels_insert_input(BaseModel):
     updated_at: Optional[Any] = None
 
 
-class person_niconico_plus_channels_max_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    niconico_plus_channel_id: Optional[order_by] = None
-    person_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class person_niconico_plus_channels_min_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    niconico_plus_channel_id: Optional[order_by] = None
-    person_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
 class person_niconico_plus_channels_on_conflict(BaseModel):
     constraint: person_niconico_plus_channels_constraint
     update_columns: List[person_niconico_plus_channels_update_column] = Field(
@@ -5339,48 +2459,6 @@ class person_niconico_plus_channels_on_conflict(BaseModel):
     where: Optional["person_niconico_plus_channels_bool_exp"] = None
 
 
-class person_niconico_plus_channels_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    niconico_plus_channel: Optional["niconico_plus_channels_order_by"] = None
-    niconico_plus_channel_id: Optional[order_by] = None
-    person: Optional["persons_order_by"] = None
-    person_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class person_niconico_plus_channels_pk_columns_input(BaseModel):
-    id: Any
-
-
-class person_niconico_plus_channels_set_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    niconico_plus_channel_id: Optional[Any] = None
-    person_id: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class person_niconico_plus_channels_stream_cursor_input(BaseModel):
-    initial_value: "person_niconico_plus_channels_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class person_niconico_plus_channels_stream_cursor_value_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    niconico_plus_channel_id: Optional[Any] = None
-    person_id: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class person_niconico_plus_channels_updates(BaseModel):
-    set: Optional["person_niconico_plus_channels_set_input"] = Field(
-        alias="_set", default=None
-    )
-    where: "person_niconico_plus_channels_bool_exp"
-
-
 class person_twitter_accounts_aggregate_bool_exp(BaseModel):
     count: Optional["person_twitter_accounts_aggregate_bool_exp_count"] = None
 
@@ -5392,12 +2470,6 @@ class person_twitter_accounts_aggregate_bool_exp_count(BaseModel):
     predicate: "Int_comparison_exp"
 
 
-class person_twitter_accounts_aggregate_order_by(BaseModel):
-    count: Optional[order_by] = None
-    max: Optional["person_twitter_accounts_max_order_by"] = None
-    min: Optional["person_twitter_accounts_min_order_by"] = None
-
-
 class person_twitter_accounts_arr_rel_insert_input(BaseModel):
     data: List["person_twitter_accounts_insert_input"]
     on_conflict: Optional["person_twitter_accounts_on_conflict"] = None
@@ -5432,22 +2504,6 @@ class person_twitter_accounts_insert_input(BaseModel):
     updated_at: Optional[Any] = None
 
 
-class person_twitter_accounts_max_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    person_id: Optional[order_by] = None
-    twitter_account_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class person_twitter_accounts_min_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    person_id: Optional[order_by] = None
-    twitter_account_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
 class person_twitter_accounts_on_conflict(BaseModel):
     constraint: person_twitter_accounts_constraint
     update_columns: List[person_twitter_accounts_update_column] = Field(
@@ -5456,48 +2512,6 @@ class person_twitter_accounts_on_conflict(BaseModel):
     where: Optional["person_twitter_accounts_bool_exp"] = None
 
 
-class person_twitter_accounts_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    person: Optional["persons_order_by"] = None
-    person_id: Optional[order_by] = None
-    twitter_account: Optional["twitter_accounts_order_by"] = None
-    twitter_account_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class person_twitter_accounts_pk_columns_input(BaseModel):
-    id: Any
-
-
-class person_twitter_accounts_set_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    person_id: Optional[Any] = None
-    twitter_account_id: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class person_twitter_accounts_stream_cursor_input(BaseModel):
-    initial_value: "person_twitter_accounts_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class person_twitter_accounts_stream_cursor_value_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    person_id: Optional[Any] = None
-    twitter_account_id: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class person_twitter_accounts_updates(BaseModel):
-    set: Optional["person_twitter_accounts_set_input"] = Field(
-        alias="_set", default=None
-    )
-    where: "person_twitter_accounts_bool_exp"
-
-
 class person_youtube_channels_aggregate_bool_exp(BaseModel):
     count: Optional["person_youtube_channels_aggregate_bool_exp_count"] = None
 
@@ -5509,12 +2523,6 @@ class person_youtube_channels_aggregate_bool_exp_count(BaseModel):
     predicate: "Int_comparison_exp"
 
 
-class person_youtube_channels_aggregate_order_by(BaseModel):
-    count: Optional[order_by] = None
-    max: Optional["person_youtube_channels_max_order_by"] = None
-    min: Optional["person_youtube_channels_min_order_by"] = None
-
-
 class person_youtube_channels_arr_rel_insert_input(BaseModel):
     data: List["person_youtube_channels_insert_input"]
     on_conflict: Optional["person_youtube_channels_on_conflict"] = None
@@ -5549,22 +2557,6 @@ class person_youtube_channels_insert_input(BaseModel):
     youtube_channel_id: Optional[Any] = None
 
 
-class person_youtube_channels_max_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    person_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-    youtube_channel_id: Optional[order_by] = None
-
-
-class person_youtube_channels_min_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    person_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-    youtube_channel_id: Optional[order_by] = None
-
-
 class person_youtube_channels_on_conflict(BaseModel):
     constraint: person_youtube_channels_constraint
     update_columns: List[person_youtube_channels_update_column] = Field(
@@ -5573,48 +2565,6 @@ class person_youtube_channels_on_conflict(BaseModel):
     where: Optional["person_youtube_channels_bool_exp"] = None
 
 
-class person_youtube_channels_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    person: Optional["persons_order_by"] = None
-    person_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-    youtube_channel: Optional["youtube_channels_order_by"] = None
-    youtube_channel_id: Optional[order_by] = None
-
-
-class person_youtube_channels_pk_columns_input(BaseModel):
-    id: Any
-
-
-class person_youtube_channels_set_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    person_id: Optional[Any] = None
-    updated_at: Optional[Any] = None
-    youtube_channel_id: Optional[Any] = None
-
-
-class person_youtube_channels_stream_cursor_input(BaseModel):
-    initial_value: "person_youtube_channels_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class person_youtube_channels_stream_cursor_value_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    person_id: Optional[Any] = None
-    updated_at: Optional[Any] = None
-    youtube_channel_id: Optional[Any] = None
-
-
-class person_youtube_channels_updates(BaseModel):
-    set: Optional["person_youtube_channels_set_input"] = Field(
-        alias="_set", default=None
-    )
-    where: "person_youtube_channels_bool_exp"
-
-
 class persons_bool_exp(BaseModel):
     and_: Optional[List["persons_bool_exp"]] = Field(alias="_and", default=None)
     not_: Optional["persons_bool_exp"] = Field(alias="_not", default=None)
@@ -5704,66 +2654,6 @@ class persons_on_conflict(BaseModel):
     where: Optional["persons_bool_exp"] = None
 
 
-class persons_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    fallguys_custom_rounds_aggregate: Optional[
-        "fallguys_custom_rounds_aggregate_order_by"
-    ] = None
-    id: Optional[order_by] = None
-    name: Optional[order_by] = None
-    person_fediverse_accounts_aggregate: Optional[
-        "person_fediverse_accounts_aggregate_order_by"
-    ] = None
-    person_niconico_accounts_aggregate: Optional[
-        "person_niconico_accounts_aggregate_order_by"
-    ] = None
-    person_niconico_channels_aggregate: Optional[
-        "person_niconico_channels_aggregate_order_by"
-    ] = None
-    person_niconico_communities_aggregate: Optional[
-        "person_niconico_communities_aggregate_order_by"
-    ] = None
-    person_niconico_plus_channels_aggregate: Optional[
-        "person_niconico_plus_channels_aggregate_order_by"
-    ] = None
-    person_twitter_accounts_aggregate: Optional[
-        "person_twitter_accounts_aggregate_order_by"
-    ] = None
-    person_youtube_channels_aggregate: Optional[
-        "person_youtube_channels_aggregate_order_by"
-    ] = None
-    program_persons_aggregate: Optional["program_persons_aggregate_order_by"] = None
-    updated_at: Optional[order_by] = None
-
-
-class persons_pk_columns_input(BaseModel):
-    id: Any
-
-
-class persons_set_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    name: Optional[str] = None
-    updated_at: Optional[Any] = None
-
-
-class persons_stream_cursor_input(BaseModel):
-    initial_value: "persons_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class persons_stream_cursor_value_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    name: Optional[str] = None
-    updated_at: Optional[Any] = None
-
-
-class persons_updates(BaseModel):
-    set: Optional["persons_set_input"] = Field(alias="_set", default=None)
-    where: "persons_bool_exp"
-
-
 class program_amongus_maps_aggregate_bool_exp(BaseModel):
     count: Optional["program_amongus_maps_aggregate_bool_exp_count"] = None
 
@@ -5775,12 +2665,6 @@ class program_amongus_maps_aggregate_bool_exp_count(BaseModel):
     predicate: "Int_comparison_exp"
 
 
-class program_amongus_maps_aggregate_order_by(BaseModel):
-    count: Optional[order_by] = None
-    max: Optional["program_amongus_maps_max_order_by"] = None
-    min: Optional["program_amongus_maps_min_order_by"] = None
-
-
 class program_amongus_maps_arr_rel_insert_input(BaseModel):
     data: List["program_amongus_maps_insert_input"]
     on_conflict: Optional["program_amongus_maps_on_conflict"] = None
@@ -5813,22 +2697,6 @@ class program_amongus_maps_insert_input(BaseModel):
     updated_at: Optional[Any] = None
 
 
-class program_amongus_maps_max_order_by(BaseModel):
-    amongus_map_id: Optional[order_by] = None
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    program_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class program_amongus_maps_min_order_by(BaseModel):
-    amongus_map_id: Optional[order_by] = None
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    program_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
 class program_amongus_maps_on_conflict(BaseModel):
     constraint: program_amongus_maps_constraint
     update_columns: List[program_amongus_maps_update_column] = Field(
@@ -5837,46 +2705,6 @@ class program_amongus_maps_on_conflict(BaseModel):
     where: Optional["program_amongus_maps_bool_exp"] = None
 
 
-class program_amongus_maps_order_by(BaseModel):
-    amongus_map: Optional["amongus_maps_order_by"] = None
-    amongus_map_id: Optional[order_by] = None
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    program: Optional["programs_order_by"] = None
-    program_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class program_amongus_maps_pk_columns_input(BaseModel):
-    id: Any
-
-
-class program_amongus_maps_set_input(BaseModel):
-    amongus_map_id: Optional[Any] = None
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    program_id: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class program_amongus_maps_stream_cursor_input(BaseModel):
-    initial_value: "program_amongus_maps_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class program_amongus_maps_stream_cursor_value_input(BaseModel):
-    amongus_map_id: Optional[Any] = None
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    program_id: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class program_amongus_maps_updates(BaseModel):
-    set: Optional["program_amongus_maps_set_input"] = Field(alias="_set", default=None)
-    where: "program_amongus_maps_bool_exp"
-
-
 class program_amongus_mods_aggregate_bool_exp(BaseModel):
     count: Optional["program_amongus_mods_aggregate_bool_exp_count"] = None
 
@@ -5888,12 +2716,6 @@ class program_amongus_mods_aggregate_bool_exp_count(BaseModel):
     predicate: "Int_comparison_exp"
 
 
-class program_amongus_mods_aggregate_order_by(BaseModel):
-    count: Optional[order_by] = None
-    max: Optional["program_amongus_mods_max_order_by"] = None
-    min: Optional["program_amongus_mods_min_order_by"] = None
-
-
 class program_amongus_mods_arr_rel_insert_input(BaseModel):
     data: List["program_amongus_mods_insert_input"]
     on_conflict: Optional["program_amongus_mods_on_conflict"] = None
@@ -5913,91 +2735,29 @@ class program_amongus_mods_bool_exp(BaseModel):
     amongus_mod_version_id: Optional["uuid_comparison_exp"] = None
     created_at: Optional["timestamptz_comparison_exp"] = None
     id: Optional["uuid_comparison_exp"] = None
-    program: Optional["programs_bool_exp"] = None
-    program_id: Optional["uuid_comparison_exp"] = None
-    updated_at: Optional["timestamptz_comparison_exp"] = None
-
-
-class program_amongus_mods_insert_input(BaseModel):
-    amongus_mod: Optional["amongus_mods_obj_rel_insert_input"] = None
-    amongus_mod_id: Optional[Any] = None
-    amongus_mod_version: Optional["amongus_mod_versions_obj_rel_insert_input"] = None
-    amongus_mod_version_id: Optional[Any] = None
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    program: Optional["programs_obj_rel_insert_input"] = None
-    program_id: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class program_amongus_mods_max_order_by(BaseModel):
-    amongus_mod_id: Optional[order_by] = None
-    amongus_mod_version_id: Optional[order_by] = None
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    program_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class program_amongus_mods_min_order_by(BaseModel):
-    amongus_mod_id: Optional[order_by] = None
-    amongus_mod_version_id: Optional[order_by] = None
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    program_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class program_amongus_mods_on_conflict(BaseModel):
-    constraint: program_amongus_mods_constraint
-    update_columns: List[program_amongus_mods_update_column] = Field(
-        default_factory=lambda: []
-    )
-    where: Optional["program_amongus_mods_bool_exp"] = None
-
-
-class program_amongus_mods_order_by(BaseModel):
-    amongus_mod: Optional["amongus_mods_order_by"] = None
-    amongus_mod_id: Optional[order_by] = None
-    amongus_mod_version: Optional["amongus_mod_versions_order_by"] = None
-    amongus_mod_version_id: Optional[order_by] = None
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    program: Optional["programs_order_by"] = None
-    program_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class program_amongus_mods_pk_columns_input(BaseModel):
-    id: Any
-
-
-class program_amongus_mods_set_input(BaseModel):
-    amongus_mod_id: Optional[Any] = None
-    amongus_mod_version_id: Optional[Any] = None
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    program_id: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class program_amongus_mods_stream_cursor_input(BaseModel):
-    initial_value: "program_amongus_mods_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
+    program: Optional["programs_bool_exp"] = None
+    program_id: Optional["uuid_comparison_exp"] = None
+    updated_at: Optional["timestamptz_comparison_exp"] = None
 
 
-class program_amongus_mods_stream_cursor_value_input(BaseModel):
+class program_amongus_mods_insert_input(BaseModel):
+    amongus_mod: Optional["amongus_mods_obj_rel_insert_input"] = None
     amongus_mod_id: Optional[Any] = None
+    amongus_mod_version: Optional["amongus_mod_versions_obj_rel_insert_input"] = None
     amongus_mod_version_id: Optional[Any] = None
     created_at: Optional[Any] = None
     id: Optional[Any] = None
+    program: Optional["programs_obj_rel_insert_input"] = None
     program_id: Optional[Any] = None
     updated_at: Optional[Any] = None
 
 
-class program_amongus_mods_updates(BaseModel):
-    set: Optional["program_amongus_mods_set_input"] = Field(alias="_set", default=None)
-    where: "program_amongus_mods_bool_exp"
+class program_amongus_mods_on_conflict(BaseModel):
+    constraint: program_amongus_mods_constraint
+    update_columns: List[program_amongus_mods_update_column] = Field(
+        default_factory=lambda: []
+    )
+    where: Optional["program_amongus_mods_bool_exp"] = None
 
 
 class program_amongus_vanilla_versions_aggregate_bool_exp(BaseModel):
@@ -6011,12 +2771,6 @@ class program_amongus_vanilla_versions_aggregate_bool_exp_count(BaseModel):
     predicate: "Int_comparison_exp"
 
 
-class program_amongus_vanilla_versions_aggregate_order_by(BaseModel):
-    count: Optional[order_by] = None
-    max: Optional["program_amongus_vanilla_versions_max_order_by"] = None
-    min: Optional["program_amongus_vanilla_versions_min_order_by"] = None
-
-
 class program_amongus_vanilla_versions_arr_rel_insert_input(BaseModel):
     data: List["program_amongus_vanilla_versions_insert_input"]
     on_conflict: Optional["program_amongus_vanilla_versions_on_conflict"] = None
@@ -6053,22 +2807,6 @@ class program_amongus_vanilla_versions_insert_input(BaseModel):
     updated_at: Optional[Any] = None
 
 
-class program_amongus_vanilla_versions_max_order_by(BaseModel):
-    amongus_vanilla_version_id: Optional[order_by] = None
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    program_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class program_amongus_vanilla_versions_min_order_by(BaseModel):
-    amongus_vanilla_version_id: Optional[order_by] = None
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    program_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
 class program_amongus_vanilla_versions_on_conflict(BaseModel):
     constraint: program_amongus_vanilla_versions_constraint
     update_columns: List[program_amongus_vanilla_versions_update_column] = Field(
@@ -6077,48 +2815,6 @@ class program_amongus_vanilla_versions_on_conflict(BaseModel):
     where: Optional["program_amongus_vanilla_versions_bool_exp"] = None
 
 
-class program_amongus_vanilla_versions_order_by(BaseModel):
-    amongus_vanilla_version: Optional["amongus_vanilla_versions_order_by"] = None
-    amongus_vanilla_version_id: Optional[order_by] = None
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    program: Optional["programs_order_by"] = None
-    program_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class program_amongus_vanilla_versions_pk_columns_input(BaseModel):
-    id: Any
-
-
-class program_amongus_vanilla_versions_set_input(BaseModel):
-    amongus_vanilla_version_id: Optional[Any] = None
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    program_id: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class program_amongus_vanilla_versions_stream_cursor_input(BaseModel):
-    initial_value: "program_amongus_vanilla_versions_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class program_amongus_vanilla_versions_stream_cursor_value_input(BaseModel):
-    amongus_vanilla_version_id: Optional[Any] = None
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    program_id: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class program_amongus_vanilla_versions_updates(BaseModel):
-    set: Optional["program_amongus_vanilla_versions_set_input"] = Field(
-        alias="_set", default=None
-    )
-    where: "program_amongus_vanilla_versions_bool_exp"
-
-
 class program_live_archives_aggregate_bool_exp(BaseModel):
     count: Optional["program_live_archives_aggregate_bool_exp_count"] = None
 
@@ -6130,12 +2826,6 @@ class program_live_archives_aggregate_bool_exp_count(BaseModel):
     predicate: "Int_comparison_exp"
 
 
-class program_live_archives_aggregate_order_by(BaseModel):
-    count: Optional[order_by] = None
-    max: Optional["program_live_archives_max_order_by"] = None
-    min: Optional["program_live_archives_min_order_by"] = None
-
-
 class program_live_archives_arr_rel_insert_input(BaseModel):
     data: List["program_live_archives_insert_input"]
     on_conflict: Optional["program_live_archives_on_conflict"] = None
@@ -6180,30 +2870,6 @@ class program_live_archives_insert_input(BaseModel):
     youtube_video_id: Optional[Any] = None
 
 
-class program_live_archives_max_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    end_time: Optional[order_by] = None
-    id: Optional[order_by] = None
-    person_id: Optional[order_by] = None
-    program_id: Optional[order_by] = None
-    start_time: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-    youtube_live_id: Optional[order_by] = None
-    youtube_video_id: Optional[order_by] = None
-
-
-class program_live_archives_min_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    end_time: Optional[order_by] = None
-    id: Optional[order_by] = None
-    person_id: Optional[order_by] = None
-    program_id: Optional[order_by] = None
-    start_time: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-    youtube_live_id: Optional[order_by] = None
-    youtube_video_id: Optional[order_by] = None
-
-
 class program_live_archives_on_conflict(BaseModel):
     constraint: program_live_archives_constraint
     update_columns: List[program_live_archives_update_column] = Field(
@@ -6212,60 +2878,6 @@ class program_live_archives_on_conflict(BaseModel):
     where: Optional["program_live_archives_bool_exp"] = None
 
 
-class program_live_archives_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    end_time: Optional[order_by] = None
-    id: Optional[order_by] = None
-    person: Optional["persons_order_by"] = None
-    person_id: Optional[order_by] = None
-    program: Optional["programs_order_by"] = None
-    program_id: Optional[order_by] = None
-    start_time: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-    youtube_live: Optional["youtube_lives_order_by"] = None
-    youtube_live_id: Optional[order_by] = None
-    youtube_video: Optional["youtube_videos_order_by"] = None
-    youtube_video_id: Optional[order_by] = None
-
-
-class program_live_archives_pk_columns_input(BaseModel):
-    id: Any
-
-
-class program_live_archives_set_input(BaseModel):
-    created_at: Optional[Any] = None
-    end_time: Optional[Any] = None
-    id: Optional[Any] = None
-    person_id: Optional[Any] = None
-    program_id: Optional[Any] = None
-    start_time: Optional[Any] = None
-    updated_at: Optional[Any] = None
-    youtube_live_id: Optional[Any] = None
-    youtube_video_id: Optional[Any] = None
-
-
-class program_live_archives_stream_cursor_input(BaseModel):
-    initial_value: "program_live_archives_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class program_live_archives_stream_cursor_value_input(BaseModel):
-    created_at: Optional[Any] = None
-    end_time: Optional[Any] = None
-    id: Optional[Any] = None
-    person_id: Optional[Any] = None
-    program_id: Optional[Any] = None
-    start_time: Optional[Any] = None
-    updated_at: Optional[Any] = None
-    youtube_live_id: Optional[Any] = None
-    youtube_video_id: Optional[Any] = None
-
-
-class program_live_archives_updates(BaseModel):
-    set: Optional["program_live_archives_set_input"] = Field(alias="_set", default=None)
-    where: "program_live_archives_bool_exp"
-
-
 class program_niconico_videos_aggregate_bool_exp(BaseModel):
     count: Optional["program_niconico_videos_aggregate_bool_exp_count"] = None
 
@@ -6277,12 +2889,6 @@ class program_niconico_videos_aggregate_bool_exp_count(BaseModel):
     predicate: "Int_comparison_exp"
 
 
-class program_niconico_videos_aggregate_order_by(BaseModel):
-    count: Optional[order_by] = None
-    max: Optional["program_niconico_videos_max_order_by"] = None
-    min: Optional["program_niconico_videos_min_order_by"] = None
-
-
 class program_niconico_videos_arr_rel_insert_input(BaseModel):
     data: List["program_niconico_videos_insert_input"]
     on_conflict: Optional["program_niconico_videos_on_conflict"] = None
@@ -6321,24 +2927,6 @@ class program_niconico_videos_insert_input(BaseModel):
     updated_at: Optional[Any] = None
 
 
-class program_niconico_videos_max_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    niconico_video_id: Optional[order_by] = None
-    person_id: Optional[order_by] = None
-    program_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class program_niconico_videos_min_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    niconico_video_id: Optional[order_by] = None
-    person_id: Optional[order_by] = None
-    program_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
 class program_niconico_videos_on_conflict(BaseModel):
     constraint: program_niconico_videos_constraint
     update_columns: List[program_niconico_videos_update_column] = Field(
@@ -6347,52 +2935,6 @@ class program_niconico_videos_on_conflict(BaseModel):
     where: Optional["program_niconico_videos_bool_exp"] = None
 
 
-class program_niconico_videos_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    niconico_video: Optional["niconico_videos_order_by"] = None
-    niconico_video_id: Optional[order_by] = None
-    person: Optional["persons_order_by"] = None
-    person_id: Optional[order_by] = None
-    program: Optional["programs_order_by"] = None
-    program_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class program_niconico_videos_pk_columns_input(BaseModel):
-    id: Any
-
-
-class program_niconico_videos_set_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    niconico_video_id: Optional[Any] = None
-    person_id: Optional[Any] = None
-    program_id: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class program_niconico_videos_stream_cursor_input(BaseModel):
-    initial_value: "program_niconico_videos_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class program_niconico_videos_stream_cursor_value_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    niconico_video_id: Optional[Any] = None
-    person_id: Optional[Any] = None
-    program_id: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class program_niconico_videos_updates(BaseModel):
-    set: Optional["program_niconico_videos_set_input"] = Field(
-        alias="_set", default=None
-    )
-    where: "program_niconico_videos_bool_exp"
-
-
 class program_persons_aggregate_bool_exp(BaseModel):
     bool_and: Optional["program_persons_aggregate_bool_exp_bool_and"] = None
     bool_or: Optional["program_persons_aggregate_bool_exp_bool_or"] = None
@@ -6420,12 +2962,6 @@ class program_persons_aggregate_bool_exp_count(BaseModel):
     predicate: "Int_comparison_exp"
 
 
-class program_persons_aggregate_order_by(BaseModel):
-    count: Optional[order_by] = None
-    max: Optional["program_persons_max_order_by"] = None
-    min: Optional["program_persons_min_order_by"] = None
-
-
 class program_persons_arr_rel_insert_input(BaseModel):
     data: List["program_persons_insert_input"]
     on_conflict: Optional["program_persons_on_conflict"] = None
@@ -6456,22 +2992,6 @@ class program_persons_insert_input(BaseModel):
     updated_at: Optional[Any] = None
 
 
-class program_persons_max_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    person_id: Optional[order_by] = None
-    program_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class program_persons_min_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    person_id: Optional[order_by] = None
-    program_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
 class program_persons_on_conflict(BaseModel):
     constraint: program_persons_constraint
     update_columns: List[program_persons_update_column] = Field(
@@ -6480,49 +3000,6 @@ class program_persons_on_conflict(BaseModel):
     where: Optional["program_persons_bool_exp"] = None
 
 
-class program_persons_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    is_absent: Optional[order_by] = None
-    person: Optional["persons_order_by"] = None
-    person_id: Optional[order_by] = None
-    program: Optional["programs_order_by"] = None
-    program_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class program_persons_pk_columns_input(BaseModel):
-    id: Any
-
-
-class program_persons_set_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    is_absent: Optional[bool] = None
-    person_id: Optional[Any] = None
-    program_id: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class program_persons_stream_cursor_input(BaseModel):
-    initial_value: "program_persons_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class program_persons_stream_cursor_value_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    is_absent: Optional[bool] = None
-    person_id: Optional[Any] = None
-    program_id: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class program_persons_updates(BaseModel):
-    set: Optional["program_persons_set_input"] = Field(alias="_set", default=None)
-    where: "program_persons_bool_exp"
-
-
 class program_projects_aggregate_bool_exp(BaseModel):
     count: Optional["program_projects_aggregate_bool_exp_count"] = None
 
@@ -6534,12 +3011,6 @@ class program_projects_aggregate_bool_exp_count(BaseModel):
     predicate: "Int_comparison_exp"
 
 
-class program_projects_aggregate_order_by(BaseModel):
-    count: Optional[order_by] = None
-    max: Optional["program_projects_max_order_by"] = None
-    min: Optional["program_projects_min_order_by"] = None
-
-
 class program_projects_arr_rel_insert_input(BaseModel):
     data: List["program_projects_insert_input"]
     on_conflict: Optional["program_projects_on_conflict"] = None
@@ -6570,22 +3041,6 @@ class program_projects_insert_input(BaseModel):
     updated_at: Optional[Any] = None
 
 
-class program_projects_max_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    program_id: Optional[order_by] = None
-    project_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class program_projects_min_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    program_id: Optional[order_by] = None
-    project_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
 class program_projects_on_conflict(BaseModel):
     constraint: program_projects_constraint
     update_columns: List[program_projects_update_column] = Field(
@@ -6594,46 +3049,6 @@ class program_projects_on_conflict(BaseModel):
     where: Optional["program_projects_bool_exp"] = None
 
 
-class program_projects_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    program: Optional["programs_order_by"] = None
-    program_id: Optional[order_by] = None
-    project: Optional["projects_order_by"] = None
-    project_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class program_projects_pk_columns_input(BaseModel):
-    id: Any
-
-
-class program_projects_set_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    program_id: Optional[Any] = None
-    project_id: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class program_projects_stream_cursor_input(BaseModel):
-    initial_value: "program_projects_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class program_projects_stream_cursor_value_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    program_id: Optional[Any] = None
-    project_id: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class program_projects_updates(BaseModel):
-    set: Optional["program_projects_set_input"] = Field(alias="_set", default=None)
-    where: "program_projects_bool_exp"
-
-
 class program_twitter_announcements_aggregate_bool_exp(BaseModel):
     count: Optional["program_twitter_announcements_aggregate_bool_exp_count"] = None
 
@@ -6645,12 +3060,6 @@ class program_twitter_announcements_aggregate_bool_exp_count(BaseModel):
     predicate: "Int_comparison_exp"
 
 
-class program_twitter_announcements_aggregate_order_by(BaseModel):
-    count: Optional[order_by] = None
-    max: Optional["program_twitter_announcements_max_order_by"] = None
-    min: Optional["program_twitter_announcements_min_order_by"] = None
-
-
 class program_twitter_announcements_arr_rel_insert_input(BaseModel):
     data: List["program_twitter_announcements_insert_input"]
     on_conflict: Optional["program_twitter_announcements_on_conflict"] = None
@@ -6693,26 +3102,6 @@ class program_twitter_announcements_insert_input(BaseModel):
     updated_at: Optional[Any] = None
 
 
-class program_twitter_announcements_max_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    person_id: Optional[order_by] = None
-    program_id: Optional[order_by] = None
-    twitter_tweet_id: Optional[order_by] = None
-    twitter_tweet_image_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class program_twitter_announcements_min_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    person_id: Optional[order_by] = None
-    program_id: Optional[order_by] = None
-    twitter_tweet_id: Optional[order_by] = None
-    twitter_tweet_image_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
 class program_twitter_announcements_on_conflict(BaseModel):
     constraint: program_twitter_announcements_constraint
     update_columns: List[program_twitter_announcements_update_column] = Field(
@@ -6721,56 +3110,6 @@ class program_twitter_announcements_on_conflict(BaseModel):
     where: Optional["program_twitter_announcements_bool_exp"] = None
 
 
-class program_twitter_announcements_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    person: Optional["persons_order_by"] = None
-    person_id: Optional[order_by] = None
-    program: Optional["programs_order_by"] = None
-    program_id: Optional[order_by] = None
-    twitter_tweet: Optional["twitter_tweets_order_by"] = None
-    twitter_tweet_id: Optional[order_by] = None
-    twitter_tweet_image: Optional["twitter_tweet_images_order_by"] = None
-    twitter_tweet_image_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class program_twitter_announcements_pk_columns_input(BaseModel):
-    id: Any
-
-
-class program_twitter_announcements_set_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    person_id: Optional[Any] = None
-    program_id: Optional[Any] = None
-    twitter_tweet_id: Optional[Any] = None
-    twitter_tweet_image_id: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class program_twitter_announcements_stream_cursor_input(BaseModel):
-    initial_value: "program_twitter_announcements_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class program_twitter_announcements_stream_cursor_value_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    person_id: Optional[Any] = None
-    program_id: Optional[Any] = None
-    twitter_tweet_id: Optional[Any] = None
-    twitter_tweet_image_id: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class program_twitter_announcements_updates(BaseModel):
-    set: Optional["program_twitter_announcements_set_input"] = Field(
-        alias="_set", default=None
-    )
-    where: "program_twitter_announcements_bool_exp"
-
-
 class programs_bool_exp(BaseModel):
     and_: Optional[List["programs_bool_exp"]] = Field(alias="_and", default=None)
     not_: Optional["programs_bool_exp"] = Field(alias="_not", default=None)
@@ -6859,99 +3198,25 @@ class programs_insert_input(BaseModel):
     program_niconico_videos: Optional[
         "program_niconico_videos_arr_rel_insert_input"
     ] = None
-    program_persons: Optional["program_persons_arr_rel_insert_input"] = None
-    program_projects: Optional["program_projects_arr_rel_insert_input"] = None
-    program_twitter_announcements: Optional[
-        "program_twitter_announcements_arr_rel_insert_input"
-    ] = None
-    start_time: Optional[Any] = None
-    title: Optional[str] = None
-    updated_at: Optional[Any] = None
-
-
-class programs_obj_rel_insert_input(BaseModel):
-    data: "programs_insert_input"
-    on_conflict: Optional["programs_on_conflict"] = None
-
-
-class programs_on_conflict(BaseModel):
-    constraint: programs_constraint
-    update_columns: List[programs_update_column] = Field(default_factory=lambda: [])
-    where: Optional["programs_bool_exp"] = None
-
-
-class programs_order_by(BaseModel):
-    amongus_matches_aggregate: Optional["amongus_matches_aggregate_order_by"] = None
-    amongusvr_matches_aggregate: Optional["amongusvr_matches_aggregate_order_by"] = None
-    created_at: Optional[order_by] = None
-    end_time: Optional[order_by] = None
-    fallguys_matches_aggregate: Optional["fallguys_matches_aggregate_order_by"] = None
-    game: Optional["games_order_by"] = None
-    game_id: Optional[order_by] = None
-    id: Optional[order_by] = None
-    mariokart_8_deluxe_battle_matches_aggregate: Optional[
-        "mariokart8deluxe_battle_matches_aggregate_order_by"
-    ] = Field(alias="mariokart8deluxe_battle_matches_aggregate", default=None)
-    mariokart_8_deluxe_races_aggregate: Optional[
-        "mariokart8deluxe_races_aggregate_order_by"
-    ] = Field(alias="mariokart8deluxe_races_aggregate", default=None)
-    program_amongus_maps_aggregate: Optional[
-        "program_amongus_maps_aggregate_order_by"
-    ] = None
-    program_amongus_mods_aggregate: Optional[
-        "program_amongus_mods_aggregate_order_by"
-    ] = None
-    program_amongus_vanilla_versions_aggregate: Optional[
-        "program_amongus_vanilla_versions_aggregate_order_by"
-    ] = None
-    program_live_archives_aggregate: Optional[
-        "program_live_archives_aggregate_order_by"
-    ] = None
-    program_niconico_videos_aggregate: Optional[
-        "program_niconico_videos_aggregate_order_by"
-    ] = None
-    program_persons_aggregate: Optional["program_persons_aggregate_order_by"] = None
-    program_projects_aggregate: Optional["program_projects_aggregate_order_by"] = None
-    program_twitter_announcements_aggregate: Optional[
-        "program_twitter_announcements_aggregate_order_by"
-    ] = None
-    start_time: Optional[order_by] = None
-    title: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class programs_pk_columns_input(BaseModel):
-    id: Any
-
-
-class programs_set_input(BaseModel):
-    created_at: Optional[Any] = None
-    end_time: Optional[Any] = None
-    game_id: Optional[Any] = None
-    id: Optional[Any] = None
-    start_time: Optional[Any] = None
-    title: Optional[str] = None
-    updated_at: Optional[Any] = None
-
-
-class programs_stream_cursor_input(BaseModel):
-    initial_value: "programs_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class programs_stream_cursor_value_input(BaseModel):
-    created_at: Optional[Any] = None
-    end_time: Optional[Any] = None
-    game_id: Optional[Any] = None
-    id: Optional[Any] = None
+    program_persons: Optional["program_persons_arr_rel_insert_input"] = None
+    program_projects: Optional["program_projects_arr_rel_insert_input"] = None
+    program_twitter_announcements: Optional[
+        "program_twitter_announcements_arr_rel_insert_input"
+    ] = None
     start_time: Optional[Any] = None
     title: Optional[str] = None
     updated_at: Optional[Any] = None
 
 
-class programs_updates(BaseModel):
-    set: Optional["programs_set_input"] = Field(alias="_set", default=None)
-    where: "programs_bool_exp"
+class programs_obj_rel_insert_input(BaseModel):
+    data: "programs_insert_input"
+    on_conflict: Optional["programs_on_conflict"] = None
+
+
+class programs_on_conflict(BaseModel):
+    constraint: programs_constraint
+    update_columns: List[programs_update_column] = Field(default_factory=lambda: [])
+    where: Optional["programs_bool_exp"] = None
 
 
 class project_niconico_videos_aggregate_bool_exp(BaseModel):
@@ -6965,12 +3230,6 @@ class project_niconico_videos_aggregate_bool_exp_count(BaseModel):
     predicate: "Int_comparison_exp"
 
 
-class project_niconico_videos_aggregate_order_by(BaseModel):
-    count: Optional[order_by] = None
-    max: Optional["project_niconico_videos_max_order_by"] = None
-    min: Optional["project_niconico_videos_min_order_by"] = None
-
-
 class project_niconico_videos_arr_rel_insert_input(BaseModel):
     data: List["project_niconico_videos_insert_input"]
     on_conflict: Optional["project_niconico_videos_on_conflict"] = None
@@ -7001,22 +3260,6 @@ class project_niconico_videos_insert_input(BaseModel):
     updated_at: Optional[Any] = None
 
 
-class project_niconico_videos_max_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    niconico_video_id: Optional[order_by] = None
-    project_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class project_niconico_videos_min_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    niconico_video_id: Optional[order_by] = None
-    project_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
 class project_niconico_videos_on_conflict(BaseModel):
     constraint: project_niconico_videos_constraint
     update_columns: List[project_niconico_videos_update_column] = Field(
@@ -7025,46 +3268,6 @@ class project_niconico_videos_on_conflict(BaseModel):
     where: Optional["project_niconico_videos_bool_exp"] = None
 
 
-class project_niconico_videos_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    niconico_video_id: Optional[order_by] = None
-    project_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class project_niconico_videos_pk_columns_input(BaseModel):
-    id: Any
-
-
-class project_niconico_videos_set_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    niconico_video_id: Optional[Any] = None
-    project_id: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class project_niconico_videos_stream_cursor_input(BaseModel):
-    initial_value: "project_niconico_videos_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class project_niconico_videos_stream_cursor_value_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    niconico_video_id: Optional[Any] = None
-    project_id: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class project_niconico_videos_updates(BaseModel):
-    set: Optional["project_niconico_videos_set_input"] = Field(
-        alias="_set", default=None
-    )
-    where: "project_niconico_videos_bool_exp"
-
-
 class projects_bool_exp(BaseModel):
     and_: Optional[List["projects_bool_exp"]] = Field(alias="_and", default=None)
     not_: Optional["projects_bool_exp"] = Field(alias="_not", default=None)
@@ -7098,45 +3301,6 @@ class projects_on_conflict(BaseModel):
     where: Optional["projects_bool_exp"] = None
 
 
-class projects_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    name: Optional[order_by] = None
-    program_projects_aggregate: Optional["program_projects_aggregate_order_by"] = None
-    start_time: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class projects_pk_columns_input(BaseModel):
-    id: Any
-
-
-class projects_set_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    name: Optional[str] = None
-    start_time: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class projects_stream_cursor_input(BaseModel):
-    initial_value: "projects_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class projects_stream_cursor_value_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    name: Optional[str] = None
-    start_time: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class projects_updates(BaseModel):
-    set: Optional["projects_set_input"] = Field(alias="_set", default=None)
-    where: "projects_bool_exp"
-
-
 class timestamptz_comparison_exp(BaseModel):
     eq: Optional[Any] = Field(alias="_eq", default=None)
     gt: Optional[Any] = Field(alias="_gt", default=None)
@@ -7185,47 +3349,6 @@ class twitter_accounts_on_conflict(BaseModel):
     where: Optional["twitter_accounts_bool_exp"] = None
 
 
-class twitter_accounts_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    name: Optional[order_by] = None
-    remote_twitter_user_id: Optional[order_by] = None
-    twitter_screen_name: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-
-
-class twitter_accounts_pk_columns_input(BaseModel):
-    id: Any
-
-
-class twitter_accounts_set_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    name: Optional[str] = None
-    remote_twitter_user_id: Optional[str] = None
-    twitter_screen_name: Optional[str] = None
-    updated_at: Optional[Any] = None
-
-
-class twitter_accounts_stream_cursor_input(BaseModel):
-    initial_value: "twitter_accounts_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class twitter_accounts_stream_cursor_value_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    name: Optional[str] = None
-    remote_twitter_user_id: Optional[str] = None
-    twitter_screen_name: Optional[str] = None
-    updated_at: Optional[Any] = None
-
-
-class twitter_accounts_updates(BaseModel):
-    set: Optional["twitter_accounts_set_input"] = Field(alias="_set", default=None)
-    where: "twitter_accounts_bool_exp"
-
-
 class twitter_tweet_images_aggregate_bool_exp(BaseModel):
     count: Optional["twitter_tweet_images_aggregate_bool_exp_count"] = None
 
@@ -7237,29 +3360,11 @@ class twitter_tweet_images_aggregate_bool_exp_count(BaseModel):
     predicate: "Int_comparison_exp"
 
 
-class twitter_tweet_images_aggregate_order_by(BaseModel):
-    avg: Optional["twitter_tweet_images_avg_order_by"] = None
-    count: Optional[order_by] = None
-    max: Optional["twitter_tweet_images_max_order_by"] = None
-    min: Optional["twitter_tweet_images_min_order_by"] = None
-    stddev: Optional["twitter_tweet_images_stddev_order_by"] = None
-    stddev_pop: Optional["twitter_tweet_images_stddev_pop_order_by"] = None
-    stddev_samp: Optional["twitter_tweet_images_stddev_samp_order_by"] = None
-    sum: Optional["twitter_tweet_images_sum_order_by"] = None
-    var_pop: Optional["twitter_tweet_images_var_pop_order_by"] = None
-    var_samp: Optional["twitter_tweet_images_var_samp_order_by"] = None
-    variance: Optional["twitter_tweet_images_variance_order_by"] = None
-
-
 class twitter_tweet_images_arr_rel_insert_input(BaseModel):
     data: List["twitter_tweet_images_insert_input"]
     on_conflict: Optional["twitter_tweet_images_on_conflict"] = None
 
 
-class twitter_tweet_images_avg_order_by(BaseModel):
-    index: Optional[order_by] = None
-
-
 class twitter_tweet_images_bool_exp(BaseModel):
     and_: Optional[List["twitter_tweet_images_bool_exp"]] = Field(
         alias="_and", default=None
@@ -7276,10 +3381,6 @@ class twitter_tweet_images_bool_exp(BaseModel):
     url: Optional["String_comparison_exp"] = None
 
 
-class twitter_tweet_images_inc_input(BaseModel):
-    index: Optional[int] = None
-
-
 class twitter_tweet_images_insert_input(BaseModel):
     created_at: Optional[Any] = None
     id: Optional[Any] = None
@@ -7289,24 +3390,6 @@ class twitter_tweet_images_insert_input(BaseModel):
     url: Optional[str] = None
 
 
-class twitter_tweet_images_max_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    index: Optional[order_by] = None
-    twitter_tweet_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-    url: Optional[order_by] = None
-
-
-class twitter_tweet_images_min_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    index: Optional[order_by] = None
-    twitter_tweet_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-    url: Optional[order_by] = None
-
-
 class twitter_tweet_images_obj_rel_insert_input(BaseModel):
     data: "twitter_tweet_images_insert_input"
     on_conflict: Optional["twitter_tweet_images_on_conflict"] = None
@@ -7320,76 +3403,6 @@ class twitter_tweet_images_on_conflict(BaseModel):
     where: Optional["twitter_tweet_images_bool_exp"] = None
 
 
-class twitter_tweet_images_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    index: Optional[order_by] = None
-    twitter_tweet_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-    url: Optional[order_by] = None
-
-
-class twitter_tweet_images_pk_columns_input(BaseModel):
-    id: Any
-
-
-class twitter_tweet_images_set_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    index: Optional[int] = None
-    twitter_tweet_id: Optional[Any] = None
-    updated_at: Optional[Any] = None
-    url: Optional[str] = None
-
-
-class twitter_tweet_images_stddev_order_by(BaseModel):
-    index: Optional[order_by] = None
-
-
-class twitter_tweet_images_stddev_pop_order_by(BaseModel):
-    index: Optional[order_by] = None
-
-
-class twitter_tweet_images_stddev_samp_order_by(BaseModel):
-    index: Optional[order_by] = None
-
-
-class twitter_tweet_images_stream_cursor_input(BaseModel):
-    initial_value: "twitter_tweet_images_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class twitter_tweet_images_stream_cursor_value_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    index: Optional[int] = None
-    twitter_tweet_id: Optional[Any] = None
-    updated_at: Optional[Any] = None
-    url: Optional[str] = None
-
-
-class twitter_tweet_images_sum_order_by(BaseModel):
-    index: Optional[order_by] = None
-
-
-class twitter_tweet_images_updates(BaseModel):
-    inc: Optional["twitter_tweet_images_inc_input"] = Field(alias="_inc", default=None)
-    set: Optional["twitter_tweet_images_set_input"] = Field(alias="_set", default=None)
-    where: "twitter_tweet_images_bool_exp"
-
-
-class twitter_tweet_images_var_pop_order_by(BaseModel):
-    index: Optional[order_by] = None
-
-
-class twitter_tweet_images_var_samp_order_by(BaseModel):
-    index: Optional[order_by] = None
-
-
-class twitter_tweet_images_variance_order_by(BaseModel):
-    index: Optional[order_by] = None
-
-
 class twitter_tweets_bool_exp(BaseModel):
     and_: Optional[List["twitter_tweets_bool_exp"]] = Field(alias="_and", default=None)
     not_: Optional["twitter_tweets_bool_exp"] = Field(alias="_not", default=None)
@@ -7433,54 +3446,6 @@ class twitter_tweets_on_conflict(BaseModel):
     where: Optional["twitter_tweets_bool_exp"] = None
 
 
-class twitter_tweets_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    remote_tweet_id: Optional[order_by] = None
-    tweet_embed_html: Optional[order_by] = None
-    tweet_time: Optional[order_by] = None
-    twitter_account: Optional["twitter_accounts_order_by"] = None
-    twitter_account_id: Optional[order_by] = None
-    twitter_tweet_images_aggregate: Optional[
-        "twitter_tweet_images_aggregate_order_by"
-    ] = None
-    updated_at: Optional[order_by] = None
-
-
-class twitter_tweets_pk_columns_input(BaseModel):
-    id: Any
-
-
-class twitter_tweets_set_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    remote_tweet_id: Optional[str] = None
-    tweet_embed_html: Optional[str] = None
-    tweet_time: Optional[Any] = None
-    twitter_account_id: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class twitter_tweets_stream_cursor_input(BaseModel):
-    initial_value: "twitter_tweets_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class twitter_tweets_stream_cursor_value_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    remote_tweet_id: Optional[str] = None
-    tweet_embed_html: Optional[str] = None
-    tweet_time: Optional[Any] = None
-    twitter_account_id: Optional[Any] = None
-    updated_at: Optional[Any] = None
-
-
-class twitter_tweets_updates(BaseModel):
-    set: Optional["twitter_tweets_set_input"] = Field(alias="_set", default=None)
-    where: "twitter_tweets_bool_exp"
-
-
 class uuid_comparison_exp(BaseModel):
     eq: Optional[Any] = Field(alias="_eq", default=None)
     gt: Optional[Any] = Field(alias="_gt", default=None)
@@ -7539,51 +3504,6 @@ class youtube_channels_on_conflict(BaseModel):
     where: Optional["youtube_channels_bool_exp"] = None
 
 
-class youtube_channels_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    name: Optional[order_by] = None
-    person_youtube_channels_aggregate: Optional[
-        "person_youtube_channels_aggregate_order_by"
-    ] = None
-    remote_youtube_channel_id: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-    youtube_channel_handle: Optional[order_by] = None
-    youtube_lives_aggregate: Optional["youtube_lives_aggregate_order_by"] = None
-
-
-class youtube_channels_pk_columns_input(BaseModel):
-    id: Any
-
-
-class youtube_channels_set_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    name: Optional[str] = None
-    remote_youtube_channel_id: Optional[str] = None
-    updated_at: Optional[Any] = None
-    youtube_channel_handle: Optional[str] = None
-
-
-class youtube_channels_stream_cursor_input(BaseModel):
-    initial_value: "youtube_channels_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class youtube_channels_stream_cursor_value_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    name: Optional[str] = None
-    remote_youtube_channel_id: Optional[str] = None
-    updated_at: Optional[Any] = None
-    youtube_channel_handle: Optional[str] = None
-
-
-class youtube_channels_updates(BaseModel):
-    set: Optional["youtube_channels_set_input"] = Field(alias="_set", default=None)
-    where: "youtube_channels_bool_exp"
-
-
 class youtube_lives_aggregate_bool_exp(BaseModel):
     count: Optional["youtube_lives_aggregate_bool_exp_count"] = None
 
@@ -7595,12 +3515,6 @@ class youtube_lives_aggregate_bool_exp_count(BaseModel):
     predicate: "Int_comparison_exp"
 
 
-class youtube_lives_aggregate_order_by(BaseModel):
-    count: Optional[order_by] = None
-    max: Optional["youtube_lives_max_order_by"] = None
-    min: Optional["youtube_lives_min_order_by"] = None
-
-
 class youtube_lives_arr_rel_insert_input(BaseModel):
     data: List["youtube_lives_insert_input"]
     on_conflict: Optional["youtube_lives_on_conflict"] = None
@@ -7633,28 +3547,6 @@ class youtube_lives_insert_input(BaseModel):
     youtube_channel_id: Optional[Any] = None
 
 
-class youtube_lives_max_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    end_time: Optional[order_by] = None
-    id: Optional[order_by] = None
-    remote_youtube_video_id: Optional[order_by] = None
-    start_time: Optional[order_by] = None
-    title: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-    youtube_channel_id: Optional[order_by] = None
-
-
-class youtube_lives_min_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    end_time: Optional[order_by] = None
-    id: Optional[order_by] = None
-    remote_youtube_video_id: Optional[order_by] = None
-    start_time: Optional[order_by] = None
-    title: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-    youtube_channel_id: Optional[order_by] = None
-
-
 class youtube_lives_obj_rel_insert_input(BaseModel):
     data: "youtube_lives_insert_input"
     on_conflict: Optional["youtube_lives_on_conflict"] = None
@@ -7668,54 +3560,6 @@ class youtube_lives_on_conflict(BaseModel):
     where: Optional["youtube_lives_bool_exp"] = None
 
 
-class youtube_lives_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    end_time: Optional[order_by] = None
-    id: Optional[order_by] = None
-    remote_youtube_video_id: Optional[order_by] = None
-    start_time: Optional[order_by] = None
-    title: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-    youtube_channel: Optional["youtube_channels_order_by"] = None
-    youtube_channel_id: Optional[order_by] = None
-
-
-class youtube_lives_pk_columns_input(BaseModel):
-    id: Any
-
-
-class youtube_lives_set_input(BaseModel):
-    created_at: Optional[Any] = None
-    end_time: Optional[Any] = None
-    id: Optional[Any] = None
-    remote_youtube_video_id: Optional[str] = None
-    start_time: Optional[Any] = None
-    title: Optional[str] = None
-    updated_at: Optional[Any] = None
-    youtube_channel_id: Optional[Any] = None
-
-
-class youtube_lives_stream_cursor_input(BaseModel):
-    initial_value: "youtube_lives_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class youtube_lives_stream_cursor_value_input(BaseModel):
-    created_at: Optional[Any] = None
-    end_time: Optional[Any] = None
-    id: Optional[Any] = None
-    remote_youtube_video_id: Optional[str] = None
-    start_time: Optional[Any] = None
-    title: Optional[str] = None
-    updated_at: Optional[Any] = None
-    youtube_channel_id: Optional[Any] = None
-
-
-class youtube_lives_updates(BaseModel):
-    set: Optional["youtube_lives_set_input"] = Field(alias="_set", default=None)
-    where: "youtube_lives_bool_exp"
-
-
 class youtube_videos_bool_exp(BaseModel):
     and_: Optional[List["youtube_videos_bool_exp"]] = Field(alias="_and", default=None)
     not_: Optional["youtube_videos_bool_exp"] = Field(alias="_not", default=None)
@@ -7759,54 +3603,3 @@ class youtube_videos_on_conflict(BaseModel):
         default_factory=lambda: []
     )
     where: Optional["youtube_videos_bool_exp"] = None
-
-
-class youtube_videos_order_by(BaseModel):
-    created_at: Optional[order_by] = None
-    id: Optional[order_by] = None
-    is_premiere: Optional[order_by] = None
-    post_time: Optional[order_by] = None
-    program_live_archives_aggregate: Optional[
-        "program_live_archives_aggregate_order_by"
-    ] = None
-    remote_youtube_video_id: Optional[order_by] = None
-    title: Optional[order_by] = None
-    updated_at: Optional[order_by] = None
-    youtube_channel: Optional["youtube_channels_order_by"] = None
-    youtube_channel_id: Optional[order_by] = None
-
-
-class youtube_videos_pk_columns_input(BaseModel):
-    id: Any
-
-
-class youtube_videos_set_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    is_premiere: Optional[bool] = None
-    post_time: Optional[Any] = None
-    remote_youtube_video_id: Optional[str] = None
-    title: Optional[str] = None
-    updated_at: Optional[Any] = None
-    youtube_channel_id: Optional[Any] = None
-
-
-class youtube_videos_stream_cursor_input(BaseModel):
-    initial_value: "youtube_videos_stream_cursor_value_input"
-    ordering: Optional[cursor_ordering] = None
-
-
-class youtube_videos_stream_cursor_value_input(BaseModel):
-    created_at: Optional[Any] = None
-    id: Optional[Any] = None
-    is_premiere: Optional[bool] = None
-    post_time: Optional[Any] = None
-    remote_youtube_video_id: Optional[str] = None
-    title: Optional[str] = None
-    updated_at: Optional[Any] = None
-    youtube_channel_id: Optional[Any] = None
-
-
-class youtube_videos_updates(BaseModel):
-    set: Optional["youtube_videos_set_input"] = Field(alias="_set", default=None)
-    where: "youtube_videos_bool_exp"
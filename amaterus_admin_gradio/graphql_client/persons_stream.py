@@ -0,0 +1,19 @@
+# Generated by ariadne-codegen
+# Source: queries/
+
+from typing import Any, List
+
+from .base_model import BaseModel
+
+
+class PersonsStream(BaseModel):
+    person_list: List["PersonsStreamPersonList"]
+
+
+class PersonsStreamPersonList(BaseModel):
+    id: Any
+    name: str
+    updated_at: Any
+
+
+PersonsStream.model_rebuild()
@@ -0,0 +1,27 @@
+# Generated by ariadne-codegen
+# Source: queries/
+
+from typing import Any, List, Optional
+
+from .base_model import BaseModel
+
+
+class ProgramProjectsStream(BaseModel):
+    program_project_list: List["ProgramProjectsStreamProgramProjectList"]
+
+
+class ProgramProjectsStreamProgramProjectList(BaseModel):
+    project_id: Any
+    updated_at: Any
+    program: "ProgramProjectsStreamProgramProjectListProgram"
+
+
+class ProgramProjectsStreamProgramProjectListProgram(BaseModel):
+    id: Any
+    title: str
+    start_time: Optional[Any]
+    end_time: Optional[Any]
+
+
+ProgramProjectsStream.model_rebuild()
+ProgramProjectsStreamProgramProjectList.model_rebuild()
@@ -0,0 +1,27 @@
+# Generated by ariadne-codegen
+# Source: queries/
+
+from typing import Any, List, Optional
+
+from .base_model import BaseModel
+
+
+class ProgramsStream(BaseModel):
+    program_list: List["ProgramsStreamProgramList"]
+
+
+class ProgramsStreamProgramList(BaseModel):
+    id: Any
+    title: str
+    start_time: Optional[Any]
+    end_time: Optional[Any]
+    updated_at: Any
+    program_project_list: List["ProgramsStreamProgramListProgramProjectList"]
+
+
+class ProgramsStreamProgramListProgramProjectList(BaseModel):
+    project_id: Any
+
+
+ProgramsStream.model_rebuild()
+ProgramsStreamProgramList.model_rebuild()
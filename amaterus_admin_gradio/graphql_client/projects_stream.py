@@ -0,0 +1,19 @@
+# Generated by ariadne-codegen
+# Source: queries/
+
+from typing import Any, List
+
+from .base_model import BaseModel
+
+
+class ProjectsStream(BaseModel):
+    project_list: List["ProjectsStreamProjectList"]
+
+
+class ProjectsStreamProjectList(BaseModel):
+    id: Any
+    name: str
+    updated_at: Any
+
+
+ProjectsStream.model_rebuild()
@@ -0,0 +1,20 @@
+# Generated by ariadne-codegen
+# Source: queries/
+
+from typing import Any, List
+
+from .base_model import BaseModel
+
+
+class TwitterAccountsStream(BaseModel):
+    twitter_account_list: List["TwitterAccountsStreamTwitterAccountList"]
+
+
+class TwitterAccountsStreamTwitterAccountList(BaseModel):
+    id: Any
+    twitter_screen_name: str
+    name: str
+    updated_at: Any
+
+
+TwitterAccountsStream.model_rebuild()
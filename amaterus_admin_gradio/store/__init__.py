@@ -0,0 +1,22 @@
+from .live_update_subscriber import LiveUpdateSubscriber
+from .person_account_index_store import (
+    PersonAccountIndex,
+    PersonAccountIndexStore,
+    PersonAccountProvider,
+)
+from .program_list_store import ProgramIntervalIndex, ProgramListItem, ProgramListStore
+from .reference_data_store import ReferenceDataStore
+from .ttl_store import TtlStore, TtlStoreStatistics
+
+__all__ = [
+    "LiveUpdateSubscriber",
+    "PersonAccountIndex",
+    "PersonAccountIndexStore",
+    "PersonAccountProvider",
+    "ProgramIntervalIndex",
+    "ProgramListItem",
+    "ProgramListStore",
+    "ReferenceDataStore",
+    "TtlStore",
+    "TtlStoreStatistics",
+]
@@ -0,0 +1,217 @@
+import asyncio
+import threading
+from datetime import datetime, timedelta, timezone
+from logging import Logger
+from typing import AsyncIterator, Callable, TypeVar
+
+from ..graphql_client import (
+    Client,
+    GamesStream,
+    PersonsStream,
+    ProgramProjectsStream,
+    ProgramsStream,
+    ProjectsStream,
+    TwitterAccountsStream,
+)
+from .program_list_store import ProgramListItem, ProgramListStore
+from .reference_data_store import ReferenceDataStore
+
+StreamBatch = TypeVar("StreamBatch")
+
+DEFAULT_INITIAL_CURSOR_MARGIN = timedelta(minutes=5)
+
+
+class LiveUpdateSubscriber:
+    def __init__(
+        self,
+        graphql_client: Client,
+        reference_data_store: ReferenceDataStore,
+        program_list_store: ProgramListStore,
+        logger: Logger,
+        initial_cursor_margin: timedelta = DEFAULT_INITIAL_CURSOR_MARGIN,
+        reconnect_interval_seconds: float = 1.0,
+        max_reconnect_interval_seconds: float = 60.0,
+    ) -> None:
+        self.graphql_client = graphql_client
+        self.reference_data_store = reference_data_store
+        self.program_list_store = program_list_store
+        self.logger = logger
+        self.initial_cursor_margin = initial_cursor_margin
+        self.reconnect_interval_seconds = reconnect_interval_seconds
+        self.max_reconnect_interval_seconds = max_reconnect_interval_seconds
+
+        self._connected_stream_names: set[str] = set()
+        self._connected_stream_names_lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+
+        # Runs on its own event loop so that it does not depend on
+        # the lifecycle of the Gradio server loop.
+        # The stores guard the state shared with it by thread locks
+        self._thread = threading.Thread(
+            target=asyncio.run,
+            args=(self.run(),),
+            name="LiveUpdateSubscriber",
+            daemon=True,
+        )
+        self._thread.start()
+
+    async def run(self) -> None:
+        # Hasura compares the cursor with the database clock.
+        # Start a little in the past to tolerate clock skew;
+        # replayed rows are applied idempotently.
+        initial_cursor = (
+            datetime.now(tz=timezone.utc) - self.initial_cursor_margin
+        ).isoformat()
+
+        await asyncio.gather(
+            self._follow_stream(
+                stream_name="projects",
+                subscribe=self.graphql_client.projects_stream,
+                apply=self._apply_projects,
+                initial_cursor=initial_cursor,
+            ),
+            self._follow_stream(
+                stream_name="persons",
+                subscribe=self.graphql_client.persons_stream,
+                apply=self._apply_persons,
+                initial_cursor=initial_cursor,
+            ),
+            self._follow_stream(
+                stream_name="games",
+                subscribe=self.graphql_client.games_stream,
+                apply=self._apply_games,
+                initial_cursor=initial_cursor,
+            ),
+            self._follow_stream(
+                stream_name="twitter_accounts",
+                subscribe=self.graphql_client.twitter_accounts_stream,
+                apply=self._apply_twitter_accounts,
+                initial_cursor=initial_cursor,
+            ),
+            self._follow_stream(
+                stream_name="programs",
+                subscribe=self.graphql_client.programs_stream,
+                apply=self._apply_programs,
+                initial_cursor=initial_cursor,
+            ),
+            self._follow_stream(
+                stream_name="program_projects",
+                subscribe=self.graphql_client.program_projects_stream,
+                apply=self._apply_program_projects,
+                initial_cursor=initial_cursor,
+            ),
+        )
+
+    def _set_stream_connected(self, stream_name: str, connected: bool) -> None:
+        with self._connected_stream_names_lock:
+            if connected:
+                self._connected_stream_names.add(stream_name)
+            else:
+                self._connected_stream_names.discard(stream_name)
+
+            self._update_store_liveness()
+
+    def _update_store_liveness(self) -> None:
+        self.reference_data_store.is_live = {
+            "projects",
+            "persons",
+            "games",
+            "twitter_accounts",
+        }.issubset(self._connected_stream_names)
+        self.program_list_store.is_live = {
+            "programs",
+            "program_projects",
+        }.issubset(self._connected_stream_names)
+
+    async def _follow_stream(
+        self,
+        stream_name: str,
+        subscribe: Callable[..., AsyncIterator[StreamBatch]],
+        apply: Callable[[StreamBatch], str | None],
+        initial_cursor: str,
+    ) -> None:
+        cursor = initial_cursor
+        reconnect_interval = self.reconnect_interval_seconds
+
+        while True:
+            try:
+                # The stores stop expiring by TTL only once Hasura has accepted
+                # the connection, not while the handshake may still fail or hang
+                async for batch in subscribe(
+                    updated_at=cursor,
+                    on_connection_ack=lambda: self._set_stream_connected(
+                        stream_name=stream_name,
+                        connected=True,
+                    ),
+                ):
+                    # Continue from the last applied row after a reconnection
+                    # so that no update is missed while disconnected
+                    last_updated_at = apply(batch)
+                    if last_updated_at is not None:
+                        cursor = last_updated_at
+
+                    reconnect_interval = self.reconnect_interval_seconds
+
+                self.logger.warning("Stream %s completed. Reconnecting", stream_name)
+            except Exception:
+                self.logger.exception("Stream %s failed. Reconnecting", stream_name)
+            finally:
+                # The stores expire by TTL again while reconnecting
+                self._set_stream_connected(stream_name=stream_name, connected=False)
+
+            await asyncio.sleep(reconnect_interval)
+            reconnect_interval = min(
+                reconnect_interval * 2,
+                self.max_reconnect_interval_seconds,
+            )
+
+    def _apply_projects(self, batch: ProjectsStream) -> str | None:
+        self.reference_data_store.upsert(project_list=batch.project_list)
+        return batch.project_list[-1].updated_at if batch.project_list else None
+
+    def _apply_persons(self, batch: PersonsStream) -> str | None:
+        self.reference_data_store.upsert(person_list=batch.person_list)
+        return batch.person_list[-1].updated_at if batch.person_list else None
+
+    def _apply_games(self, batch: GamesStream) -> str | None:
+        self.reference_data_store.upsert(game_list=batch.game_list)
+        return batch.game_list[-1].updated_at if batch.game_list else None
+
+    def _apply_twitter_accounts(self, batch: TwitterAccountsStream) -> str | None:
+        self.reference_data_store.upsert(
+            twitter_account_list=batch.twitter_account_list,
+        )
+        return (
+            batch.twitter_account_list[-1].updated_at
+            if batch.twitter_account_list
+            else None
+        )
+
+    def _apply_programs(self, batch: ProgramsStream) -> str | None:
+        for program in batch.program_list:
+            for program_project in program.program_project_list:
+                self.program_list_store.add_program(
+                    project_id=program_project.project_id,
+                    program=ProgramListItem.model_validate(program.model_dump()),
+                )
+
+        return batch.program_list[-1].updated_at if batch.program_list else None
+
+    def _apply_program_projects(self, batch: ProgramProjectsStream) -> str | None:
+        for program_project in batch.program_project_list:
+            self.program_list_store.add_program(
+                project_id=program_project.project_id,
+                program=ProgramListItem.model_validate(
+                    program_project.program.model_dump(),
+                ),
+            )
+
+        return (
+            batch.program_project_list[-1].updated_at
+            if batch.program_project_list
+            else None
+        )
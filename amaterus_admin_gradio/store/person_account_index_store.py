@@ -0,0 +1,132 @@
+import time
+from logging import Logger
+from typing import Iterable, Literal
+
+from ..graphql_client import Client, GetPersonAccountIndex
+from .ttl_store import TtlStore
+
+PersonAccountProvider = Literal["youtube", "niconico", "twitter"]
+
+
+def create_person_id_index(
+    account_person_id_pairs: Iterable[tuple[str, str]],
+) -> dict[str, str | None]:
+    # An account shared by several persons (e.g. a group channel) maps to None,
+    # so that no person is selected for it
+    person_id_by_account_id: dict[str, str | None] = {}
+    for account_id, person_id in account_person_id_pairs:
+        if person_id_by_account_id.get(account_id, person_id) != person_id:
+            person_id_by_account_id[account_id] = None
+        else:
+            person_id_by_account_id[account_id] = person_id
+
+    return person_id_by_account_id
+
+
+class PersonAccountIndex:
+    def __init__(
+        self,
+        person_account_index: GetPersonAccountIndex,
+    ) -> None:
+        # YouTube channels and Niconico accounts by their remote IDs,
+        # X accounts by their IDs in the database
+        self._person_id_by_account_id: dict[
+            PersonAccountProvider, dict[str, str | None]
+        ] = {
+            "youtube": create_person_id_index(
+                (
+                    person_youtube_channel.youtube_channel.remote_youtube_channel_id,
+                    str(person_youtube_channel.person_id),
+                )
+                for person_youtube_channel in (
+                    person_account_index.person_youtube_channel_list
+                )
+            ),
+            "niconico": create_person_id_index(
+                (
+                    person_niconico_account.niconico_account.remote_niconico_account_id,
+                    str(person_niconico_account.person_id),
+                )
+                for person_niconico_account in (
+                    person_account_index.person_niconico_account_list
+                )
+            ),
+            "twitter": create_person_id_index(
+                (
+                    str(person_twitter_account.twitter_account_id),
+                    str(person_twitter_account.person_id),
+                )
+                for person_twitter_account in (
+                    person_account_index.person_twitter_account_list
+                )
+            ),
+        }
+
+    def find_person_id(
+        self,
+        provider: PersonAccountProvider,
+        account_id: str,
+    ) -> str | None:
+        return self._person_id_by_account_id[provider].get(account_id)
+
+
+class PersonAccountIndexStore(TtlStore[None, PersonAccountIndex]):
+    def __init__(
+        self,
+        graphql_client: Client,
+        ttl_seconds: float,
+        logger: Logger,
+    ) -> None:
+        super().__init__(
+            ttl_seconds=ttl_seconds,
+            logger=logger,
+        )
+        self.graphql_client = graphql_client
+
+    async def _fetch(self, key: None) -> PersonAccountIndex:
+        started_at = time.monotonic()
+        response = await self.graphql_client.get_person_account_index()
+        person_account_index = PersonAccountIndex(
+            person_account_index=response,
+        )
+
+        self.logger.debug(
+            "Person account index refreshed in %.3f seconds "
+            "(youtube_channels: %d, niconico_accounts: %d, twitter_accounts: %d)",
+            time.monotonic() - started_at,
+            len(response.person_youtube_channel_list),
+            len(response.person_niconico_account_list),
+            len(response.person_twitter_account_list),
+        )
+
+        return person_account_index
+
+    async def get(self) -> PersonAccountIndex:
+        person_account_index = await self._get_value(key=None)
+        if person_account_index is None:
+            raise Exception("Person account index must not be None")
+
+        return person_account_index
+
+    async def get_or_none(self) -> PersonAccountIndex | None:
+        # The person is only a suggestion, so a failed query must not fail the
+        # metadata fetch running beside it
+        try:
+            return await self.get()
+        except Exception:
+            self.logger.warning("Failed to get person account index", exc_info=True)
+            return None
+
+    async def find_person_id(
+        self,
+        provider: PersonAccountProvider,
+        account_id: str,
+    ) -> str | None:
+        person_account_index = await self.get()
+        return person_account_index.find_person_id(
+            provider=provider,
+            account_id=account_id,
+        )
+
+    def invalidate(self) -> None:
+        self._expire()
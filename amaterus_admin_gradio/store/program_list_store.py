@@ -0,0 +1,237 @@
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime
+from logging import Logger
+
+from pydantic import BaseModel
+
+from ..graphql_client import Client
+from .ttl_store import TtlStore
+
+
+class ProgramListItem(BaseModel):
+    id: str
+    title: str
+    start_time: datetime | None
+    end_time: datetime | None
+
+
+# Programs longer than this (e.g. a multi-day event or a wrong end time) are
+# searched separately so that they do not widen the search of the others
+LONG_PROGRAM_DURATION_SECONDS = 24 * 60 * 60
+
+ProgramInterval = tuple[float, float, ProgramListItem]
+
+
+class ProgramIntervalIndex:
+    def __init__(
+        self,
+        program_list: list[ProgramListItem],
+    ) -> None:
+        # Programs with a start time, sorted by the start time.
+        # A program without an end time is indexed as an instant
+        intervals: list[ProgramInterval] = []
+        long_intervals: list[ProgramInterval] = []
+        for program in program_list:
+            if program.start_time is None:
+                continue
+
+            start_timestamp = program.start_time.timestamp()
+            end_timestamp = start_timestamp
+            if program.end_time is not None:
+                end_timestamp = max(start_timestamp, program.end_time.timestamp())
+
+            interval = (start_timestamp, end_timestamp, program)
+            if end_timestamp - start_timestamp > LONG_PROGRAM_DURATION_SECONDS:
+                long_intervals.append(interval)
+            else:
+                intervals.append(interval)
+
+        intervals.sort(key=lambda interval: interval[0])
+
+        self._intervals = intervals
+        self._start_timestamps = [interval[0] for interval in intervals]
+        self._max_duration = max(
+            (
+                end_timestamp - start_timestamp
+                for start_timestamp, end_timestamp, _ in intervals
+            ),
+            default=0.0,
+        )
+        # Few, so they are checked one by one
+        self._long_intervals = long_intervals
+
+    def _find_candidate_intervals(
+        self,
+        start_timestamp: float,
+        end_timestamp: float,
+    ) -> list[ProgramInterval]:
+        # A program overlapping the range starts before the range ends and
+        # no earlier than the longest (not long) program before the range starts
+        low = bisect_left(self._start_timestamps, start_timestamp - self._max_duration)
+        high = bisect_right(self._start_timestamps, end_timestamp)
+
+        return self._intervals[low:high] + self._long_intervals
+
+    def find_overlapping_programs(
+        self,
+        start_time: datetime,
+        end_time: datetime | None,
+    ) -> list[ProgramListItem]:
+        # Programs overlapping the time range (or containing the instant
+        # if end_time is None), the closest match first.
+        # The overlap is divided by the union so that a long program around
+        # the range (e.g. a whole-day event) ranks below the matching one
+        start_timestamp = start_time.timestamp()
+        end_timestamp = start_timestamp
+        if end_time is not None:
+            end_timestamp = max(start_timestamp, end_time.timestamp())
+
+        overlaps: list[tuple[float, float, ProgramListItem]] = []
+        for (
+            program_start_timestamp,
+            program_end_timestamp,
+            program,
+        ) in self._find_candidate_intervals(
+            start_timestamp=start_timestamp,
+            end_timestamp=end_timestamp,
+        ):
+            if (
+                program_end_timestamp < start_timestamp
+                or program_start_timestamp > end_timestamp
+            ):
+                continue
+
+            overlap_duration = min(end_timestamp, program_end_timestamp) - max(
+                start_timestamp, program_start_timestamp
+            )
+            union_duration = max(end_timestamp, program_end_timestamp) - min(
+                start_timestamp, program_start_timestamp
+            )
+            overlap_ratio = (
+                overlap_duration / union_duration if union_duration > 0 else 1.0
+            )
+            start_distance = abs(program_start_timestamp - start_timestamp)
+            overlaps.append((overlap_ratio, start_distance, program))
+
+        overlaps.sort(key=lambda overlap: (-overlap[0], overlap[1]))
+
+        return [program for _, _, program in overlaps]
+
+
+class _ProgramList:
+    def __init__(
+        self,
+        program_list: list[ProgramListItem],
+    ) -> None:
+        self.program_list = program_list
+
+        # Built on the first lookup by time and dropped when the list is replaced
+        self.interval_index: ProgramIntervalIndex | None = None
+
+
+def program_list_sort_key(program: ProgramListItem) -> tuple[bool, float]:
+    # Same order as `order_by: {program: {start_time: desc}}` (NULLs first)
+    if program.start_time is None:
+        return (False, 0.0)
+
+    return (True, -program.start_time.timestamp())
+
+
+class ProgramListStore(TtlStore[str, _ProgramList]):
+    def __init__(
+        self,
+        graphql_client: Client,
+        ttl_seconds: float,
+        logger: Logger,
+    ) -> None:
+        super().__init__(
+            ttl_seconds=ttl_seconds,
+            logger=logger,
+        )
+        self.graphql_client = graphql_client
+
+    async def _fetch(self, key: str) -> _ProgramList | None:
+        response = await self.graphql_client.get_program_project_list_by_project_id(
+            project_id=key,
+        )
+        project = response.project
+        if project is None:
+            return None
+
+        program_list = list(
+            map(
+                lambda program_project: ProgramListItem.model_validate(
+                    program_project.program.model_dump(),
+                ),
+                project.program_project_list,
+            ),
+        )
+
+        self.logger.debug(
+            "Program list of project %s refreshed (%d programs)",
+            key,
+            len(program_list),
+        )
+
+        return _ProgramList(program_list=program_list)
+
+    async def get(self, project_id: str) -> list[ProgramListItem] | None:
+        program_list = await self._get_value(key=project_id)
+        if program_list is None:
+            return None
+
+        return program_list.program_list
+
+    async def get_or_none(self, project_id: str) -> list[ProgramListItem] | None:
+        # For the suggestions beside another fetch; a failed query must not fail it
+        try:
+            return await self.get(project_id=project_id)
+        except Exception:
+            self.logger.warning(
+                "Failed to get program list of project %s",
+                project_id,
+                exc_info=True,
+            )
+            return None
+
+    async def find_overlapping_programs(
+        self,
+        project_id: str,
+        start_time: datetime,
+        end_time: datetime | None,
+    ) -> list[ProgramListItem] | None:
+        program_list = await self._get_value(key=project_id)
+        if program_list is None:
+            return None
+
+        interval_index = program_list.interval_index
+        if interval_index is None:
+            interval_index = ProgramIntervalIndex(
+                program_list=program_list.program_list,
+            )
+            program_list.interval_index = interval_index
+
+        return interval_index.find_overlapping_programs(
+            start_time=start_time,
+            end_time=end_time,
+        )
+
+    def add_program(
+        self,
+        project_id: str,
+        program: ProgramListItem,
+    ) -> None:
+        def update(program_list: _ProgramList) -> _ProgramList:
+            updated_program_list = [
+                other_program
+                for other_program in program_list.program_list
+                if other_program.id != program.id
+            ]
+            insort(updated_program_list, program, key=program_list_sort_key)
+
+            return _ProgramList(program_list=updated_program_list)
+
+        self._update_value(key=project_id, update=update)
+
+    def invalidate(self, project_id: str | None = None) -> None:
+        self._expire(key=project_id)
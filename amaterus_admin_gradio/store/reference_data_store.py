@@ -0,0 +1,169 @@
+import time
+from logging import Logger
+from typing import Sequence, TypeVar
+
+from pydantic import BaseModel
+
+from ..graphql_client import (
+    Client,
+    GetReferenceData,
+    GetReferenceDataGameList,
+    GetReferenceDataPersonList,
+    GetReferenceDataProjectList,
+    GetReferenceDataTwitterAccountList,
+)
+from .ttl_store import TtlStore
+
+ReferenceDataItem = TypeVar(
+    "ReferenceDataItem",
+    GetReferenceDataProjectList,
+    GetReferenceDataPersonList,
+    GetReferenceDataGameList,
+    GetReferenceDataTwitterAccountList,
+)
+
+
+def upsert_reference_data_items(
+    item_list: list[ReferenceDataItem],
+    item_type: type[ReferenceDataItem],
+    updated_item_list: Sequence[BaseModel],
+) -> list[ReferenceDataItem]:
+    if len(updated_item_list) == 0:
+        return item_list
+
+    item_by_id = {item.id: item for item in item_list}
+    for updated_item in updated_item_list:
+        item = item_type.model_validate(updated_item.model_dump())
+        item_by_id[item.id] = item
+
+    return list(item_by_id.values())
+
+
+def create_twitter_account_id_by_screen_name(
+    twitter_account_list: list[GetReferenceDataTwitterAccountList],
+) -> dict[str, str]:
+    # Screen names are case-insensitive on X
+    twitter_account_id_by_screen_name: dict[str, str] = {}
+    for twitter_account in twitter_account_list:
+        twitter_account_id_by_screen_name.setdefault(
+            twitter_account.twitter_screen_name.lower(),
+            str(twitter_account.id),
+        )
+
+    return twitter_account_id_by_screen_name
+
+
+class _IndexedReferenceData:
+    def __init__(
+        self,
+        reference_data: GetReferenceData,
+    ) -> None:
+        # The index follows every refresh and live update of the data
+        self.reference_data = reference_data
+        self.twitter_account_id_by_screen_name = (
+            create_twitter_account_id_by_screen_name(
+                twitter_account_list=reference_data.twitter_account_list,
+            )
+        )
+
+
+class ReferenceDataStore(TtlStore[None, _IndexedReferenceData]):
+    def __init__(
+        self,
+        graphql_client: Client,
+        ttl_seconds: float,
+        logger: Logger,
+    ) -> None:
+        super().__init__(
+            ttl_seconds=ttl_seconds,
+            logger=logger,
+        )
+        self.graphql_client = graphql_client
+
+    async def _fetch(self, key: None) -> _IndexedReferenceData:
+        started_at = time.monotonic()
+        reference_data = await self.graphql_client.get_reference_data()
+
+        self.logger.debug(
+            "Reference data refreshed in %.3f seconds "
+            "(projects: %d, persons: %d, games: %d, twitter_accounts: %d)",
+            time.monotonic() - started_at,
+            len(reference_data.project_list),
+            len(reference_data.person_list),
+            len(reference_data.game_list),
+            len(reference_data.twitter_account_list),
+        )
+
+        return _IndexedReferenceData(reference_data=reference_data)
+
+    async def _get_indexed_reference_data(self) -> _IndexedReferenceData:
+        indexed_reference_data = await self._get_value(key=None)
+        if indexed_reference_data is None:
+            raise Exception("Reference data must not be None")
+
+        return indexed_reference_data
+
+    async def get(self) -> GetReferenceData:
+        indexed_reference_data = await self._get_indexed_reference_data()
+        return indexed_reference_data.reference_data
+
+    def peek(self) -> GetReferenceData:
+        # For the code that cannot await (e.g. a gr.render function),
+        # after get() has been awaited
+        indexed_reference_data = self._peek_value(key=None)
+        if indexed_reference_data is None:
+            raise Exception("Reference data has not been fetched yet")
+
+        return indexed_reference_data.reference_data
+
+    def upsert(
+        self,
+        project_list: Sequence[BaseModel] = (),
+        person_list: Sequence[BaseModel] = (),
+        game_list: Sequence[BaseModel] = (),
+        twitter_account_list: Sequence[BaseModel] = (),
+    ) -> None:
+        def update(
+            indexed_reference_data: _IndexedReferenceData,
+        ) -> _IndexedReferenceData:
+            reference_data = indexed_reference_data.reference_data
+            return _IndexedReferenceData(
+                reference_data=GetReferenceData(
+                    project_list=upsert_reference_data_items(
+                        item_list=reference_data.project_list,
+                        item_type=GetReferenceDataProjectList,
+                        updated_item_list=project_list,
+                    ),
+                    person_list=upsert_reference_data_items(
+                        item_list=reference_data.person_list,
+                        item_type=GetReferenceDataPersonList,
+                        updated_item_list=person_list,
+                    ),
+                    game_list=upsert_reference_data_items(
+                        item_list=reference_data.game_list,
+                        item_type=GetReferenceDataGameList,
+                        updated_item_list=game_list,
+                    ),
+                    twitter_account_list=upsert_reference_data_items(
+                        item_list=reference_data.twitter_account_list,
+                        item_type=GetReferenceDataTwitterAccountList,
+                        updated_item_list=twitter_account_list,
+                    ),
+                ),
+            )
+
+        # Replace the whole model so readers never see a half-applied update
+        self._update_value(key=None, update=update)
+
+    async def find_twitter_account_id(
+        self,
+        twitter_screen_name: str,
+    ) -> str | None:
+        # No network I/O while the reference data is fresh
+        indexed_reference_data = await self._get_indexed_reference_data()
+        return indexed_reference_data.twitter_account_id_by_screen_name.get(
+            twitter_screen_name.lower(),
+        )
+
+    def invalidate(self) -> None:
+        self._expire()
@@ -0,0 +1,166 @@
+import abc
+import asyncio
+import threading
+import time
+from logging import Logger
+from typing import Callable, Generic, Hashable, TypeVar
+
+from pydantic import BaseModel
+
+StoreKey = TypeVar("StoreKey", bound=Hashable)
+StoreValue = TypeVar("StoreValue")
+
+
+class TtlStoreStatistics(BaseModel):
+    hit_count: int
+    miss_count: int
+
+
+class _TtlStoreEntry(Generic[StoreValue]):
+    def __init__(
+        self,
+        value: StoreValue,
+        fetched_at: float | None,
+    ) -> None:
+        self.value = value
+        self.fetched_at = fetched_at
+
+
+class TtlStore(abc.ABC, Generic[StoreKey, StoreValue]):
+    # Values fetched from Hasura by key. A value expires after the TTL unless
+    # LiveUpdateSubscriber keeps it up to date (is_live), and concurrent callers
+    # share one refresh per key
+    def __init__(
+        self,
+        ttl_seconds: float,
+        logger: Logger,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.logger = logger
+
+        self.is_live = False
+
+        self._entries: dict[StoreKey, _TtlStoreEntry[StoreValue]] = {}
+        self._refresh_locks: dict[StoreKey, asyncio.Lock] = {}
+        self._pending_updates: dict[
+            StoreKey, list[Callable[[StoreValue], StoreValue]]
+        ] = {}
+        # LiveUpdateSubscriber updates the values from its own thread
+        self._state_lock = threading.Lock()
+
+        # Incremented whenever a value is stored or updated
+        self._version = 0
+
+        self._hit_count = 0
+        self._miss_count = 0
+
+    @abc.abstractmethod
+    async def _fetch(self, key: StoreKey) -> StoreValue | None:
+        # None is not stored (e.g. a project that does not exist)
+        ...
+
+    def _get_fresh_value(self, key: StoreKey) -> StoreValue | None:
+        entry = self._entries.get(key)
+        if entry is None or entry.fetched_at is None:
+            return None
+
+        if self.is_live:
+            return entry.value
+
+        if time.monotonic() - entry.fetched_at >= self.ttl_seconds:
+            return None
+
+        return entry.value
+
+    async def _get_value(self, key: StoreKey) -> StoreValue | None:
+        value = self._get_fresh_value(key=key)
+        if value is not None:
+            self._hit_count += 1
+            return value
+
+        refresh_lock = self._refresh_locks.setdefault(key, asyncio.Lock())
+        async with refresh_lock:
+            # Another caller may have refreshed the value while we were waiting
+            value = self._get_fresh_value(key=key)
+            if value is not None:
+                self._hit_count += 1
+                return value
+
+            self._miss_count += 1
+
+            # Updates made while fetching may be missing from the fetched value,
+            # so they are recorded and applied to it again
+            pending_updates: list[Callable[[StoreValue], StoreValue]] = []
+            with self._state_lock:
+                self._pending_updates[key] = pending_updates
+
+            try:
+                value = await self._fetch(key=key)
+            except BaseException:
+                with self._state_lock:
+                    self._pending_updates.pop(key, None)
+                raise
+
+            with self._state_lock:
+                self._pending_updates.pop(key, None)
+                if value is None:
+                    self._entries.pop(key, None)
+                else:
+                    for update in pending_updates:
+                        value = update(value)
+
+                    self._entries[key] = _TtlStoreEntry(
+                        value=value,
+                        fetched_at=time.monotonic(),
+                    )
+                    self._version += 1
+
+            return value
+
+    def _update_value(
+        self,
+        key: StoreKey,
+        update: Callable[[StoreValue], StoreValue],
+    ) -> None:
+        # A value not fetched yet is not updated; it is fetched in full later
+        with self._state_lock:
+            pending_updates = self._pending_updates.get(key)
+            if pending_updates is not None:
+                pending_updates.append(update)
+
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+
+            # Replace the value instead of mutating it; callers may still read it
+            entry.value = update(entry.value)
+            self._version += 1
+
+    def _peek_value(self, key: StoreKey) -> StoreValue | None:
+        # The last fetched value, even if expired; no network I/O
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        return entry.value
+
+    def _expire(self, key: StoreKey | None = None) -> None:
+        # The values are kept so that live updates still apply to them
+        with self._state_lock:
+            if key is not None:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    entry.fetched_at = None
+                return
+
+            for entry in self._entries.values():
+                entry.fetched_at = None
+
+    def get_version(self) -> int:
+        return self._version
+
+    def get_statistics(self) -> TtlStoreStatistics:
+        return TtlStoreStatistics(
+            hit_count=self._hit_count,
+            miss_count=self._miss_count,
+        )
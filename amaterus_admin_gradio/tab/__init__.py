@@ -8,16 +8,22 @@ from .create_program_twitter_announcement_tab import (
 from .create_program_youtube_live_live_archive_tab import (
     create_create_program_youtube_live_live_archive_tab,
 )
+from .create_program_youtube_live_live_archives_bulk_tab import (
+    create_create_program_youtube_live_live_archives_bulk_tab,
+)
 from .create_program_youtube_video_live_archive_tab import (
     create_create_program_youtube_video_live_archive_tab,
 )
+from .event_concurrency import EventConcurrencyConfig
 
 __all__ = [
     "create_create_program_youtube_live_live_archive_tab",
+    "create_create_program_youtube_live_live_archives_bulk_tab",
     "create_create_program_niconico_video_tab",
     "create_create_program_twitter_announcement_tab",
     "create_create_program_youtube_video_live_archive_tab",
     "create_create_program_tab",
     "create_create_game_tab",
     "create_create_program_person_tab",
+    "EventConcurrencyConfig",
 ]
@@ -1,331 +1,398 @@
-import json
-import os
-import re
+import asyncio
 from datetime import datetime
 from logging import Logger
 from typing import Any
-from urllib.parse import urlparse
 from zoneinfo import ZoneInfo
 
 import gradio as gr
-import requests
-from bs4 import BeautifulSoup
-from pydantic import BaseModel
 
-from ..graphql_client import Client
+from ..external_api import (
+    ExternalApiHttpClients,
+    ExternalApiMetadataCache,
+    ExternalApiPrefetcher,
+    fetch_niconico_video_data,
+    parse_remote_niconico_content_id,
+)
+from ..graphql_client import Client, GetReferenceData
+from ..store import PersonAccountIndexStore, ProgramListStore, ReferenceDataStore
+from ..utility.metrics_utility import instrument_handler
+from .event_concurrency import (
+    EXTERNAL_API_CONCURRENCY_ID,
+    HASURA_CONCURRENCY_ID,
+    EventConcurrencyConfig,
+)
+from .lazy_tab import render_on_first_select
+from .program_suggestion import load_program_list, suggest_program_id
+from .reference_data_choices import create_person_choices, create_project_choices
 
 JST = ZoneInfo("Asia/Tokyo")
 
-
-class NiconicoVideoApiDataResponseVideoThumbnail(BaseModel):
-    url: str
-
-
-class NiconicoVideoApiDataResponseVideo(BaseModel):
-    id: str
-    title: str
-    registeredAt: datetime
-    thumbnail: NiconicoVideoApiDataResponseVideoThumbnail
-
-
-class NiconicoVideoApiDataResponseOwner(BaseModel):
-    id: int
-    nickname: str
-
-
-class NiconicoVideoApiDataResponse(BaseModel):
-    video: NiconicoVideoApiDataResponseVideo
-    owner: NiconicoVideoApiDataResponseOwner
-
-
-def fetch_niconico_video_data(
-    niconico_video_url_or_id: str,
-) -> NiconicoVideoApiDataResponse:
-    niconico_video_url_or_id = niconico_video_url_or_id.strip()
-
-    remote_niconico_content_id: str | None = None
-    if niconico_video_url_or_id.startswith("https://"):
-        urlp = urlparse(niconico_video_url_or_id)
-        if urlp.netloc != "www.nicovideo.jp":
-            raise Exception(f"Invalid URL: {niconico_video_url_or_id}")
-
-        remote_niconico_content_id = os.path.basename(urlp.path)
-        if len(remote_niconico_content_id) == 0:
-            raise Exception(f"Invalid URL: {niconico_video_url_or_id}")
-    else:
-        if not re.match(r"^sm\d+$", niconico_video_url_or_id) and not re.match(
-            r"^so\d+$", niconico_video_url_or_id
-        ):
-            raise Exception(f"Invalid Niconico video ID: {niconico_video_url_or_id}")
-
-        remote_niconico_content_id = niconico_video_url_or_id
-
-    res = requests.get(
-        f"https://www.nicovideo.jp/watch/{remote_niconico_content_id}",
-        headers={
-            "User-Agent": (
-                "facebookexternalhit/1.1;Googlebot/2.1;"
-                "Amaterusbot (+https://amaterus.aoirint.com)"
-            ),
-        },
-    )
-    res.raise_for_status()
-
-    bs = BeautifulSoup(res.text, "html5lib")
-    js_initial_watch_data_tag = bs.find(id="js-initial-watch-data")
-
-    api_data_json_text = js_initial_watch_data_tag.attrs.get("data-api-data")
-    api_data_dict = json.loads(api_data_json_text)
-    api_data_response = NiconicoVideoApiDataResponse.model_validate(api_data_dict)
-
-    return api_data_response
+TAB_NAME = "create_program_niconico_video"
 
 
 def create_create_program_niconico_video_tab(
     graphql_client: Client,
+    reference_data_store: ReferenceDataStore,
+    program_list_store: ProgramListStore,
+    person_account_index_store: PersonAccountIndexStore,
+    external_api_http_clients: ExternalApiHttpClients,
+    external_api_metadata_cache: ExternalApiMetadataCache,
+    external_api_prefetcher: ExternalApiPrefetcher,
+    event_concurrency_config: EventConcurrencyConfig,
     logger: Logger,
 ) -> gr.Tab:
     with gr.Tab(label="プログラムにニコニコ動画の動画を追加") as tab:
-        gr.Markdown("# プログラムにニコニコ動画の動画を追加")
-        with gr.Row():
-            with gr.Column():
-                with gr.Row():
-                    clear_niconico_video_field_button = gr.ClearButton(
-                        value="以下のフィールドをクリア",
-                    )
-                with gr.Row():
-                    niconico_video_url_or_id_text_field = gr.Textbox(
-                        label="ニコニコ動画の動画URL または ID",
-                        interactive=True,
-                    )
-                with gr.Row():
-                    fetch_niconico_video_data_button = gr.Button(
-                        value="ニコニコ動画 から動画情報を取得",
-                    )
-                with gr.Row():
-                    remote_niconico_content_id_text_field = gr.Textbox(
-                        label="動画ID",
-                        interactive=False,
-                    )
-                    niconico_video_title_text_field = gr.Textbox(
-                        label="タイトル",
-                        interactive=False,
-                    )
-                with gr.Row():
-                    remote_niconico_account_id_text_field = gr.Textbox(
-                        label="ニコニコ動画上のアカウントID",
-                        interactive=False,
-                    )
-                    niconico_account_name_text_field = gr.Textbox(
-                        label="アカウント名",
-                        interactive=False,
-                    )
-                with gr.Row():
-                    start_time_text_field = gr.Textbox(
-                        label="投稿時間",
-                        interactive=False,
-                    )
-                    thumbnail_url_text_field = gr.Textbox(
-                        label="サムネイルURL",
-                        interactive=False,
-                    )
 
-            with gr.Column():
-                with gr.Row():
-                    clear_project_field_button = gr.ClearButton(
-                        value="以下のフィールドをクリア",
-                    )
-                with gr.Row():
-                    project_drop = gr.Dropdown(
-                        label="プロジェクト",
-                        interactive=True,
-                    )
-                with gr.Row():
-                    program_drop = gr.Dropdown(
-                        label="プログラム",
-                        interactive=True,
-                    )
-                with gr.Row():
-                    person_drop = gr.Dropdown(
-                        label="投稿者",
-                        interactive=True,
-                    )
-                with gr.Row():
-                    add_niconico_video_button = gr.Button(
-                        value="動画を追加",
-                        variant="primary",
-                    )
-                with gr.Row():
-                    added_program_niconico_video_id_text_field = gr.Textbox(
-                        label="追加された動画のデータベース上のID",
-                        interactive=False,
+        @render_on_first_select(
+            tab=tab,
+            tab_name=TAB_NAME,
+            reference_data_store=reference_data_store,
+            concurrency_limit=event_concurrency_config.hasura_concurrency_limit,
+            concurrency_id=HASURA_CONCURRENCY_ID,
+        )
+        def render_tab(
+            reference_data: GetReferenceData,
+            reference_data_version_state: gr.State,
+        ) -> None:
+            gr.Markdown("# プログラムにニコニコ動画の動画を追加")
+            with gr.Row():
+                with gr.Column():
+                    with gr.Row():
+                        clear_niconico_video_field_button = gr.ClearButton(
+                            value="以下のフィールドをクリア",
+                        )
+                    with gr.Row():
+                        niconico_video_url_or_id_text_field = gr.Textbox(
+                            label="ニコニコ動画の動画URL または ID",
+                            interactive=True,
+                        )
+                    with gr.Row():
+                        fetch_niconico_video_data_button = gr.Button(
+                            value="ニコニコ動画 から動画情報を取得",
+                        )
+                    with gr.Row():
+                        remote_niconico_content_id_text_field = gr.Textbox(
+                            label="動画ID",
+                            interactive=False,
+                        )
+                        niconico_video_title_text_field = gr.Textbox(
+                            label="タイトル",
+                            interactive=False,
+                        )
+                    with gr.Row():
+                        remote_niconico_account_id_text_field = gr.Textbox(
+                            label="ニコニコ動画上のアカウントID",
+                            interactive=False,
+                        )
+                        niconico_account_name_text_field = gr.Textbox(
+                            label="アカウント名",
+                            interactive=False,
+                        )
+                    with gr.Row():
+                        start_time_text_field = gr.Textbox(
+                            label="投稿時間",
+                            interactive=False,
+                        )
+                        thumbnail_url_text_field = gr.Textbox(
+                            label="サムネイルURL",
+                            interactive=False,
+                        )
+
+                with gr.Column():
+                    with gr.Row():
+                        clear_project_field_button = gr.ClearButton(
+                            value="以下のフィールドをクリア",
+                        )
+                    with gr.Row():
+                        project_drop = gr.Dropdown(
+                            label="プロジェクト",
+                            interactive=True,
+                            choices=create_project_choices(reference_data),
+                        )
+                    with gr.Row():
+                        program_drop = gr.Dropdown(
+                            label="プログラム",
+                            interactive=True,
+                        )
+                    with gr.Row():
+                        person_drop = gr.Dropdown(
+                            label="投稿者",
+                            interactive=True,
+                            choices=create_person_choices(reference_data),
+                        )
+                    with gr.Row():
+                        add_niconico_video_button = gr.Button(
+                            value="動画を追加",
+                            variant="primary",
+                        )
+                    with gr.Row():
+                        added_program_niconico_video_id_text_field = gr.Textbox(
+                            label="追加された動画のデータベース上のID",
+                            interactive=False,
+                        )
+
+            @instrument_handler(tab=TAB_NAME)
+            async def handle_reference_data_updated() -> Any:
+                reference_data = await reference_data_store.get()
+                return [
+                    gr.Dropdown(
+                        choices=create_project_choices(reference_data),
+                    ),
+                    gr.Dropdown(
+                        choices=create_person_choices(reference_data),
+                    ),
+                ]
+
+            @instrument_handler(tab=TAB_NAME)
+            async def handle_project_changed(
+                project_id: str,
+            ) -> Any:
+                if project_id is None or len(project_id) == 0:
+                    return gr.Dropdown(
+                        value=None,
+                        choices=None,
                     )
 
-        def handle_tab_selected() -> Any:
-            initial_data = (
-                graphql_client.get_create_program_niconico_video_initial_data()
-            )
-            return [
-                gr.Dropdown(
+                program_list = await program_list_store.get(
+                    project_id=project_id,
+                )
+                if program_list is None:
+                    raise Exception("Project must not be None")
+
+                return gr.Dropdown(
                     choices=list(
                         map(
-                            lambda project: (project.name, project.id),
-                            initial_data.project_list,
+                            lambda program: (
+                                program.title,
+                                program.id,
+                            ),
+                            program_list,
                         ),
                     ),
-                ),
-                gr.Dropdown(
-                    choices=list(
-                        map(
-                            lambda person: (person.name, person.id),
-                            initial_data.person_list,
-                        ),
+                )
+
+            @instrument_handler(tab=TAB_NAME)
+            async def handle_niconico_video_url_or_id_changed(
+                niconico_video_url_or_id: str | None,
+                request: gr.Request,
+            ) -> None:
+                # Starts fetching once the input is a valid ID, so that the fetch
+                # button gets the prefetched (or in-flight) result
+                session_id = request.session_hash or ""
+                try:
+                    remote_niconico_content_id = parse_remote_niconico_content_id(
+                        niconico_video_url_or_id=niconico_video_url_or_id or "",
+                    )
+                except Exception:
+                    external_api_prefetcher.cancel(
+                        session_id=session_id,
+                        field="niconico_video_url_or_id",
+                    )
+                    return
+
+                external_api_prefetcher.schedule(
+                    session_id=session_id,
+                    field="niconico_video_url_or_id",
+                    key=("niconico", remote_niconico_content_id),
+                    fn=lambda: fetch_niconico_video_data(
+                        niconico_video_url_or_id=remote_niconico_content_id,
+                        http_client=external_api_http_clients.niconico,
+                        metadata_cache=external_api_metadata_cache,
                     ),
-                ),
-            ]
+                )
 
-        def handle_project_changed(
-            project_id: str,
-        ) -> Any:
-            if project_id is None or len(project_id) == 0:
-                return gr.Dropdown(
-                    value=None,
-                    choices=None,
+            @instrument_handler(tab=TAB_NAME)
+            async def handle_fetch_niconico_video_data_button_clicked(
+                niconico_video_url_or_id: str | None,
+                project_id: str | None,
+                program_id: str | None,
+            ) -> Any:
+                if (
+                    niconico_video_url_or_id is None
+                    or len(niconico_video_url_or_id) == 0
+                ):
+                    raise Exception("Invalid Niconico video URL or ID")
+
+                remote_niconico_content_id = parse_remote_niconico_content_id(
+                    niconico_video_url_or_id=niconico_video_url_or_id,
+                )
+                # The index and the program list are usually cached,
+                # and their first loads overlap the fetch
+                niconico_video_api_response, person_account_index, _ = (
+                    await asyncio.gather(
+                        external_api_prefetcher.fetch(
+                            key=("niconico", remote_niconico_content_id),
+                            fn=lambda: fetch_niconico_video_data(
+                                niconico_video_url_or_id=remote_niconico_content_id,
+                                http_client=external_api_http_clients.niconico,
+                                metadata_cache=external_api_metadata_cache,
+                            ),
+                        ),
+                        person_account_index_store.get_or_none(),
+                        load_program_list(
+                            program_list_store=program_list_store,
+                            project_id=project_id,
+                        ),
+                    )
                 )
+                video = niconico_video_api_response.video
+                owner = niconico_video_api_response.owner
+
+                person_id: str | None = None
+                if person_account_index is not None:
+                    person_id = person_account_index.find_person_id(
+                        provider="niconico",
+                        account_id=str(owner.id),
+                    )
 
-            response = graphql_client.get_program_project_list_by_project_id(
-                project_id=project_id,
-            )
-            project = response.project
-            if project is None:
-                raise Exception("Project must not be None")
+                suggested_program_id = await suggest_program_id(
+                    program_list_store=program_list_store,
+                    project_id=project_id,
+                    program_id=program_id,
+                    start_time=video.registeredAt,
+                    end_time=None,
+                    logger=logger,
+                )
 
-            return gr.Dropdown(
-                choices=list(
-                    map(
-                        lambda program_project: (
-                            program_project.program.title,
-                            program_project.program.id,
-                        ),
-                        project.program_project_list,
+                return [
+                    video.id,
+                    video.title,
+                    str(owner.id),
+                    owner.nickname,
+                    video.registeredAt.astimezone(JST).isoformat(),
+                    video.thumbnail.url,
+                    # Selects the person linked to the account, if any
+                    (
+                        gr.Dropdown(value=person_id)
+                        if person_id is not None
+                        else gr.Dropdown()
                     ),
-                ),
+                    # Selects the program overlapping the video, if any
+                    (
+                        gr.Dropdown(value=suggested_program_id)
+                        if suggested_program_id is not None
+                        else gr.Dropdown()
+                    ),
+                ]
+
+            @instrument_handler(tab=TAB_NAME)
+            async def handle_add_niconico_video_button_clicked(
+                remote_niconico_content_id: str,
+                niconico_video_title: str,
+                remote_niconico_account_id: str,
+                niconico_account_name: str,
+                start_time_string: str,
+                thumbnail_url: str,
+                project_id: str,
+                program_id: str,
+                person_id: str,
+            ) -> Any:
+                response = await graphql_client.create_program_niconico_video(
+                    project_id=project_id,
+                    program_id=program_id,
+                    person_id=person_id,
+                    start_time=datetime.fromisoformat(start_time_string),
+                    remote_niconico_content_id=remote_niconico_content_id,
+                    title=niconico_video_title,
+                    thumbnail_url=thumbnail_url,
+                    remote_niconico_account_id=remote_niconico_account_id,
+                    niconico_account_name=niconico_account_name,
+                )
+                program_niconico_video = response.program_niconico_video
+                if program_niconico_video is None:
+                    raise Exception("program_niconico_video must not be None")
+
+                return [
+                    program_niconico_video.id,
+                ]
+
+            clear_niconico_video_field_button.add(
+                components=[
+                    niconico_video_url_or_id_text_field,
+                    remote_niconico_content_id_text_field,
+                    niconico_video_title_text_field,
+                    remote_niconico_account_id_text_field,
+                    niconico_account_name_text_field,
+                    start_time_text_field,
+                    thumbnail_url_text_field,
+                ],
             )
 
-        def handle_fetch_niconico_video_data_button_clicked(
-            niconico_video_url_or_id: str | None,
-        ) -> Any:
-            if niconico_video_url_or_id is None or len(niconico_video_url_or_id) == 0:
-                raise Exception("Invalid Niconico video URL or ID")
-
-            niconico_video_api_response = fetch_niconico_video_data(
-                niconico_video_url_or_id=niconico_video_url_or_id,
+            clear_project_field_button.add(
+                components=[
+                    project_drop,
+                    program_drop,
+                    person_drop,
+                ],
             )
-            video = niconico_video_api_response.video
-            owner = niconico_video_api_response.owner
 
-            return [
-                video.id,
-                video.title,
-                str(owner.id),
-                owner.nickname,
-                video.registeredAt.astimezone(JST).isoformat(),
-                video.thumbnail.url,
-            ]
-
-        def handle_add_niconico_video_button_clicked(
-            remote_niconico_content_id: str,
-            niconico_video_title: str,
-            remote_niconico_account_id: str,
-            niconico_account_name: str,
-            start_time_string: str,
-            thumbnail_url: str,
-            project_id: str,
-            program_id: str,
-            person_id: str,
-        ) -> Any:
-            response = graphql_client.create_program_niconico_video(
-                project_id=project_id,
-                program_id=program_id,
-                person_id=person_id,
-                start_time=datetime.fromisoformat(start_time_string),
-                remote_niconico_content_id=remote_niconico_content_id,
-                title=niconico_video_title,
-                thumbnail_url=thumbnail_url,
-                remote_niconico_account_id=remote_niconico_account_id,
-                niconico_account_name=niconico_account_name,
+            reference_data_version_state.change(
+                fn=handle_reference_data_updated,
+                outputs=[
+                    project_drop,
+                    person_drop,
+                ],
+                concurrency_limit=event_concurrency_config.hasura_concurrency_limit,
+                concurrency_id=HASURA_CONCURRENCY_ID,
             )
-            program_niconico_video = response.program_niconico_video
-            if program_niconico_video is None:
-                raise Exception("program_niconico_video must not be None")
-
-            return [
-                program_niconico_video.id,
-            ]
-
-        clear_niconico_video_field_button.add(
-            components=[
-                niconico_video_url_or_id_text_field,
-                remote_niconico_content_id_text_field,
-                niconico_video_title_text_field,
-                remote_niconico_account_id_text_field,
-                niconico_account_name_text_field,
-                start_time_text_field,
-                thumbnail_url_text_field,
-            ],
-        )
-
-        clear_project_field_button.add(
-            components=[
-                project_drop,
-                program_drop,
-                person_drop,
-            ],
-        )
 
-        tab.select(
-            fn=handle_tab_selected,
-            outputs=[
-                project_drop,
-                person_drop,
-            ],
-        )
+            project_drop.select(
+                fn=handle_project_changed,
+                inputs=project_drop,
+                outputs=program_drop,
+                concurrency_limit=event_concurrency_config.hasura_concurrency_limit,
+                concurrency_id=HASURA_CONCURRENCY_ID,
+            )
 
-        project_drop.select(
-            fn=handle_project_changed,
-            inputs=project_drop,
-            outputs=program_drop,
-        )
+            niconico_video_url_or_id_text_field.change(
+                fn=handle_niconico_video_url_or_id_changed,
+                inputs=[niconico_video_url_or_id_text_field],
+                show_progress="hidden",
+                trigger_mode="always_last",
+                # Only schedules the prefetch, so keystrokes skip the queue and
+                # do not wait for (or hold up) the fetch buttons
+                queue=False,
+            )
 
-        fetch_niconico_video_data_button.click(
-            fn=handle_fetch_niconico_video_data_button_clicked,
-            inputs=[niconico_video_url_or_id_text_field],
-            outputs=[
-                remote_niconico_content_id_text_field,
-                niconico_video_title_text_field,
-                remote_niconico_account_id_text_field,
-                niconico_account_name_text_field,
-                start_time_text_field,
-                thumbnail_url_text_field,
-            ],
-        )
+            fetch_niconico_video_data_button.click(
+                fn=handle_fetch_niconico_video_data_button_clicked,
+                inputs=[
+                    niconico_video_url_or_id_text_field,
+                    project_drop,
+                    program_drop,
+                ],
+                outputs=[
+                    remote_niconico_content_id_text_field,
+                    niconico_video_title_text_field,
+                    remote_niconico_account_id_text_field,
+                    niconico_account_name_text_field,
+                    start_time_text_field,
+                    thumbnail_url_text_field,
+                    person_drop,
+                    program_drop,
+                ],
+                concurrency_limit=event_concurrency_config.external_api_concurrency_limit,
+                concurrency_id=EXTERNAL_API_CONCURRENCY_ID,
+            )
 
-        add_niconico_video_button.click(
-            fn=handle_add_niconico_video_button_clicked,
-            inputs=[
-                remote_niconico_content_id_text_field,
-                niconico_video_title_text_field,
-                remote_niconico_account_id_text_field,
-                niconico_account_name_text_field,
-                start_time_text_field,
-                thumbnail_url_text_field,
-                project_drop,
-                program_drop,
-                person_drop,
-            ],
-            outputs=[
-                added_program_niconico_video_id_text_field,
-            ],
-        )
+            add_niconico_video_button.click(
+                fn=handle_add_niconico_video_button_clicked,
+                inputs=[
+                    remote_niconico_content_id_text_field,
+                    niconico_video_title_text_field,
+                    remote_niconico_account_id_text_field,
+                    niconico_account_name_text_field,
+                    start_time_text_field,
+                    thumbnail_url_text_field,
+                    project_drop,
+                    program_drop,
+                    person_drop,
+                ],
+                outputs=[
+                    added_program_niconico_video_id_text_field,
+                ],
+                concurrency_limit=event_concurrency_config.hasura_concurrency_limit,
+                concurrency_id=HASURA_CONCURRENCY_ID,
+            )
 
     return tab
@@ -4,167 +4,189 @@ from zoneinfo import ZoneInfo
 
 import gradio as gr
 
-from ..graphql_client import Client
+from ..graphql_client import Client, GetReferenceData
+from ..store import ProgramListStore, ReferenceDataStore
+from ..utility.metrics_utility import instrument_handler
+from .event_concurrency import HASURA_CONCURRENCY_ID, EventConcurrencyConfig
+from .lazy_tab import render_on_first_select
+from .reference_data_choices import create_person_choices, create_project_choices
 
 JST = ZoneInfo("Asia/Tokyo")
 
+TAB_NAME = "create_program_person"
+
 
 def create_create_program_person_tab(
     graphql_client: Client,
+    reference_data_store: ReferenceDataStore,
+    program_list_store: ProgramListStore,
+    event_concurrency_config: EventConcurrencyConfig,
     logger: Logger,
 ) -> gr.Tab:
     with gr.Tab(label="プログラムの参加者を追加") as tab:
-        gr.Markdown("# プログラムの参加者を追加")
 
-        with gr.Row():
-            clear_field_button = gr.ClearButton(
-                value="以下のフィールドをクリア",
-            )
-        with gr.Row():
-            project_drop = gr.Dropdown(
-                label="プロジェクト",
-                interactive=True,
-            )
-        with gr.Row():
-            program_drop = gr.Dropdown(
-                label="プログラム",
-                interactive=True,
-            )
-        with gr.Row():
-            person_drop = gr.Dropdown(
-                label="参加者",
-                interactive=True,
-            )
-        with gr.Row():
-            is_absent_radio = gr.Radio(
-                label="欠席?",
-                interactive=True,
-                choices=[
-                    ("データなし", 0),
-                    ("出席", 1),
-                    ("欠席", 2),
-                ],
-            )
-        with gr.Row():
-            add_program_person_button = gr.Button(
-                value="プログラム参加者を追加",
-                variant="primary",
-            )
-        with gr.Row():
-            added_program_person_id_text_field = gr.Textbox(
-                label="追加されたプログラム参加者のデータベース上のID",
-                interactive=False,
-            )
+        @render_on_first_select(
+            tab=tab,
+            tab_name=TAB_NAME,
+            reference_data_store=reference_data_store,
+            concurrency_limit=event_concurrency_config.hasura_concurrency_limit,
+            concurrency_id=HASURA_CONCURRENCY_ID,
+        )
+        def render_tab(
+            reference_data: GetReferenceData,
+            reference_data_version_state: gr.State,
+        ) -> None:
+            gr.Markdown("# プログラムの参加者を追加")
+
+            with gr.Row():
+                clear_field_button = gr.ClearButton(
+                    value="以下のフィールドをクリア",
+                )
+            with gr.Row():
+                project_drop = gr.Dropdown(
+                    label="プロジェクト",
+                    interactive=True,
+                    choices=create_project_choices(reference_data),
+                )
+            with gr.Row():
+                program_drop = gr.Dropdown(
+                    label="プログラム",
+                    interactive=True,
+                )
+            with gr.Row():
+                person_drop = gr.Dropdown(
+                    label="参加者",
+                    interactive=True,
+                    choices=create_person_choices(reference_data),
+                )
+            with gr.Row():
+                is_absent_radio = gr.Radio(
+                    label="欠席?",
+                    interactive=True,
+                    choices=[
+                        ("データなし", 0),
+                        ("出席", 1),
+                        ("欠席", 2),
+                    ],
+                )
+            with gr.Row():
+                add_program_person_button = gr.Button(
+                    value="プログラム参加者を追加",
+                    variant="primary",
+                )
+            with gr.Row():
+                added_program_person_id_text_field = gr.Textbox(
+                    label="追加されたプログラム参加者のデータベース上のID",
+                    interactive=False,
+                )
 
-        def handle_tab_selected() -> Any:
-            initial_data = graphql_client.get_create_program_person_initial_data()
-            return [
-                gr.Dropdown(
-                    choices=list(
-                        map(
-                            lambda project: (project.name, project.id),
-                            initial_data.project_list,
-                        ),
+            @instrument_handler(tab=TAB_NAME)
+            async def handle_reference_data_updated() -> Any:
+                reference_data = await reference_data_store.get()
+                return [
+                    gr.Dropdown(
+                        choices=create_project_choices(reference_data),
+                    ),
+                    gr.Dropdown(
+                        choices=create_person_choices(reference_data),
                     ),
-                ),
-                gr.Dropdown(
+                ]
+
+            @instrument_handler(tab=TAB_NAME)
+            async def handle_project_changed(
+                project_id: str,
+            ) -> Any:
+                if project_id is None or len(project_id) == 0:
+                    return gr.Dropdown(
+                        value=None,
+                        choices=None,
+                    )
+
+                program_list = await program_list_store.get(
+                    project_id=project_id,
+                )
+                if program_list is None:
+                    raise Exception("Project must not be None")
+
+                return gr.Dropdown(
                     choices=list(
                         map(
-                            lambda person: (person.name, person.id),
-                            initial_data.person_list,
+                            lambda program: (
+                                program.title,
+                                program.id,
+                            ),
+                            program_list,
                         ),
                     ),
-                ),
-            ]
-
-        def handle_project_changed(
-            project_id: str,
-        ) -> Any:
-            if project_id is None or len(project_id) == 0:
-                return gr.Dropdown(
-                    value=None,
-                    choices=None,
                 )
 
-            response = graphql_client.get_program_project_list_by_project_id(
-                project_id=project_id,
-            )
-            project = response.project
-            if project is None:
-                raise Exception("Project must not be None")
-
-            return gr.Dropdown(
-                choices=list(
-                    map(
-                        lambda program_project: (
-                            program_project.program.title,
-                            program_project.program.id,
-                        ),
-                        project.program_project_list,
-                    ),
-                ),
+            @instrument_handler(tab=TAB_NAME)
+            async def handle_add_proram_person_button_clicked(
+                program_id: str,
+                person_id: str,
+                is_absent_int: int,
+            ) -> Any:
+                is_absent: bool | None = None
+                if is_absent_int == 0:
+                    is_absent = None
+                elif is_absent_int == 1:
+                    is_absent = False
+                elif is_absent_int == 2:
+                    is_absent = True
+
+                response = await graphql_client.create_program_person(
+                    program_id=program_id,
+                    person_id=person_id,
+                    is_absent=is_absent,
+                )
+                program_person = response.program_person
+                if program_person is None:
+                    raise Exception("program_person must not be None")
+
+                return [
+                    program_person.id,
+                ]
+
+            clear_field_button.add(
+                components=[
+                    project_drop,
+                    program_drop,
+                    person_drop,
+                    is_absent_radio,
+                    added_program_person_id_text_field,
+                ],
             )
 
-        def handle_add_proram_person_button_clicked(
-            program_id: str,
-            person_id: str,
-            is_absent_int: int,
-        ) -> Any:
-            is_absent: bool | None = None
-            if is_absent_int == 0:
-                is_absent = None
-            elif is_absent_int == 1:
-                is_absent = False
-            elif is_absent_int == 2:
-                is_absent = True
-
-            response = graphql_client.create_program_person(
-                program_id=program_id,
-                person_id=person_id,
-                is_absent=is_absent,
+            reference_data_version_state.change(
+                fn=handle_reference_data_updated,
+                outputs=[
+                    project_drop,
+                    person_drop,
+                ],
+                concurrency_limit=event_concurrency_config.hasura_concurrency_limit,
+                concurrency_id=HASURA_CONCURRENCY_ID,
             )
-            program_person = response.program_person
-            if program_person is None:
-                raise Exception("program_person must not be None")
-
-            return [
-                program_person.id,
-            ]
-
-        clear_field_button.add(
-            components=[
-                project_drop,
-                program_drop,
-                person_drop,
-                is_absent_radio,
-                added_program_person_id_text_field,
-            ],
-        )
 
-        tab.select(
-            fn=handle_tab_selected,
-            outputs=[
-                project_drop,
-                person_drop,
-            ],
-        )
-
-        project_drop.select(
-            fn=handle_project_changed,
-            inputs=project_drop,
-            outputs=program_drop,
-        )
+            project_drop.select(
+                fn=handle_project_changed,
+                inputs=project_drop,
+                outputs=program_drop,
+                concurrency_limit=event_concurrency_config.hasura_concurrency_limit,
+                concurrency_id=HASURA_CONCURRENCY_ID,
+            )
 
-        add_program_person_button.click(
-            fn=handle_add_proram_person_button_clicked,
-            inputs=[
-                program_drop,
-                person_drop,
-                is_absent_radio,
-            ],
-            outputs=[
-                added_program_person_id_text_field,
-            ],
-        )
+            add_program_person_button.click(
+                fn=handle_add_proram_person_button_clicked,
+                inputs=[
+                    program_drop,
+                    person_drop,
+                    is_absent_radio,
+                ],
+                outputs=[
+                    added_program_person_id_text_field,
+                ],
+                concurrency_limit=event_concurrency_config.hasura_concurrency_limit,
+                concurrency_id=HASURA_CONCURRENCY_ID,
+            )
 
     return tab
@@ -1,397 +1,661 @@
+import asyncio
 import os
-import re
+import uuid
 from datetime import datetime
 from logging import Logger
 from typing import Any
-from urllib.parse import urlparse
 from zoneinfo import ZoneInfo
 
 import gradio as gr
-import requests
-from pydantic import BaseModel
 
-from ..graphql_client import Client
+from ..external_api import (
+    ExternalApiHttpClients,
+    ExternalApiMetadataCache,
+    ExternalApiPrefetcher,
+    fetch_twitter_tweet_oembed_data,
+    parse_remote_tweet_id,
+    parse_twitter_screen_name,
+)
+from ..graphql_client import (
+    Client,
+    GetReferenceData,
+    GraphQLClientGraphQLMultiError,
+    GraphQLOperation,
+)
+from ..store import PersonAccountIndexStore, ProgramListStore, ReferenceDataStore
+from ..utility.metrics_utility import instrument_handler
+from .event_concurrency import (
+    EXTERNAL_API_CONCURRENCY_ID,
+    HASURA_CONCURRENCY_ID,
+    EventConcurrencyConfig,
+)
+from .lazy_tab import render_on_first_select
+from .reference_data_choices import (
+    create_person_choices,
+    create_project_choices,
+    create_twitter_account_choices,
+)
 
 JST = ZoneInfo("Asia/Tokyo")
 
+TAB_NAME = "create_program_twitter_announcement"
 
-class FetchTwitterTweetOembedApiResponse(BaseModel):
-    author_url: str
-    author_name: str
-    url: str
-    html: str
-
-
-def fetch_twitter_tweet_oembed_data(
-    twitter_tweet_url_or_id: str,
-) -> FetchTwitterTweetOembedApiResponse:
-    twitter_tweet_url_or_id = twitter_tweet_url_or_id.strip()
-
-    remote_tweet_id: str | None = None
-    if twitter_tweet_url_or_id.startswith("https://"):
-        urlp = urlparse(twitter_tweet_url_or_id)
-        if urlp.netloc != "twitter.com" and urlp.netloc != "x.com":
-            raise Exception(f"Invalid URL: {twitter_tweet_url_or_id}")
-
-        remote_tweet_id = os.path.basename(urlp.path)
-        if len(remote_tweet_id) == 0:
-            raise Exception(f"Invalid URL: {twitter_tweet_url_or_id}")
-    else:
-        if not re.match(r"^\d+$", twitter_tweet_url_or_id):
-            raise Exception(f"Invalid Twitter tweet ID: {twitter_tweet_url_or_id}")
-
-        remote_tweet_id = twitter_tweet_url_or_id
-
-    res = requests.get(
-        "https://publish.twitter.com/oembed",
-        headers={
-            "User-Agent": "Amaterusbot (+https://amaterus.aoirint.com)",
-        },
-        params={
-            "url": f"https://twitter.com/i/status/{remote_tweet_id}",
-            "partner": "",
-            "hide_thread": "false",
-        },
+
+async def create_program_twitter_announcement_with_tweet(
+    graphql_client: Client,
+    program_id: str,
+    person_id: str,
+    remote_tweet_id: str,
+    twitter_account_id: str,
+    tweet_time: datetime,
+    tweet_embed_html: str,
+) -> str:
+    # The tweet and the announcement are created by one mutation
+    # so that a failure does not leave a partial record
+    response = await graphql_client.create_program_twitter_announcement_with_tweet(
+        program_id=program_id,
+        person_id=person_id,
+        remote_tweet_id=remote_tweet_id,
+        twitter_account_id=twitter_account_id,
+        tweet_time=tweet_time,
+        tweet_embed_html=tweet_embed_html,
+    )
+    program_twitter_announcement = response.program_twitter_announcement
+    if program_twitter_announcement is None:
+        raise Exception("program_twitter_announcement must not be None")
+
+    return str(program_twitter_announcement.id)
+
+
+async def find_twitter_tweet_id(
+    graphql_client: Client,
+    remote_tweet_id: str,
+) -> str | None:
+    response = await graphql_client.get_twitter_tweet_by_remote_tweet_id(
+        remote_tweet_id=remote_tweet_id,
     )
-    res.raise_for_status()
+    if len(response.twitter_tweet_list) == 0:
+        return None
 
-    api_response = FetchTwitterTweetOembedApiResponse.model_validate(res.json())
-    return api_response
+    return str(response.twitter_tweet_list[0].id)
+
+
+def is_twitter_tweet_id_violation(error: GraphQLClientGraphQLMultiError) -> bool:
+    # A foreign key on twitter_tweet_id rejected a new tweet ID, because the
+    # upsert of a registered tweet keeps the registered ID
+    return any(
+        graphql_error.extensions is not None
+        and graphql_error.extensions.get("code") == "constraint-violation"
+        and "twitter_tweet_id" in graphql_error.message
+        for graphql_error in error.errors
+    )
+
+
+async def create_program_twitter_announcement_with_tweet_image(
+    graphql_client: Client,
+    program_id: str,
+    person_id: str,
+    twitter_tweet_id: str | None,
+    remote_tweet_id: str,
+    twitter_account_id: str,
+    tweet_time: datetime,
+    tweet_embed_html: str,
+    twitter_tweet_image_index: int,
+    twitter_tweet_image_url: str,
+) -> str:
+    # The tweet, the image and the announcement are created by one mutation
+    async def create(twitter_tweet_id: str) -> str:
+        response = (
+            await graphql_client.create_program_twitter_announcement_with_tweet_image(
+                program_id=program_id,
+                person_id=person_id,
+                twitter_tweet_id=twitter_tweet_id,
+                remote_tweet_id=remote_tweet_id,
+                twitter_account_id=twitter_account_id,
+                tweet_time=tweet_time,
+                tweet_embed_html=tweet_embed_html,
+                twitter_tweet_image_index=twitter_tweet_image_index,
+                twitter_tweet_image_url=twitter_tweet_image_url,
+            )
+        )
+        program_twitter_announcement = response.program_twitter_announcement
+        if program_twitter_announcement is None:
+            raise Exception("program_twitter_announcement must not be None")
+
+        return str(program_twitter_announcement.id)
+
+    # The image refers to the tweet by ID. twitter_tweet_id is the ID of the
+    # registered tweet loaded with the tweet data, or None for a new tweet
+    if twitter_tweet_id is not None:
+        return await create(twitter_tweet_id=twitter_tweet_id)
+
+    try:
+        return await create(twitter_tweet_id=str(uuid.uuid4()))
+    except GraphQLClientGraphQLMultiError as error:
+        if not is_twitter_tweet_id_violation(error=error):
+            raise
+
+        # The tweet has been registered since the tweet data was loaded.
+        # The transaction was rolled back, so retry once with its ID
+        twitter_tweet_id = await find_twitter_tweet_id(
+            graphql_client=graphql_client,
+            remote_tweet_id=remote_tweet_id,
+        )
+        if twitter_tweet_id is None:
+            raise
+
+        return await create(twitter_tweet_id=twitter_tweet_id)
 
 
 def create_create_program_twitter_announcement_tab(
     graphql_client: Client,
+    reference_data_store: ReferenceDataStore,
+    program_list_store: ProgramListStore,
+    person_account_index_store: PersonAccountIndexStore,
+    external_api_http_clients: ExternalApiHttpClients,
+    external_api_metadata_cache: ExternalApiMetadataCache,
+    external_api_prefetcher: ExternalApiPrefetcher,
+    event_concurrency_config: EventConcurrencyConfig,
     logger: Logger,
 ) -> gr.Tab:
     with gr.Tab(label="プログラムにXの投稿を追加") as tab:
-        gr.Markdown("# プログラムにXの投稿を追加")
-        with gr.Row():
-            with gr.Column():
-                with gr.Row():
-                    clear_twitter_tweet_field_button = gr.ClearButton(
-                        value="以下のフィールドをクリア",
-                    )
-                with gr.Row():
-                    twitter_tweet_url_or_id_text_field = gr.Textbox(
-                        label="Xの投稿URL または 投稿ID",
-                        interactive=True,
-                    )
-                with gr.Row():
-                    fetch_tweet_data_button = gr.Button(
-                        value="X から投稿情報を取得",
-                    )
-                with gr.Row():
-                    remote_tweet_id_text_field = gr.Textbox(
-                        label="X 上の投稿ID",
-                        interactive=False,
-                    )
-                    tweet_time_text_field = gr.Textbox(
-                        label="投稿時間",
-                        interactive=False,
-                    )
-                with gr.Row():
-                    twitter_screen_name_text_field = gr.Textbox(
-                        label="スクリーンネーム",
-                        interactive=False,
-                    )
-                    twitter_display_name_text_field = gr.Textbox(
-                        label="アカウント表示名",
-                        interactive=False,
-                    )
-                with gr.Row():
-                    twitter_account_drop = gr.Dropdown(
-                        label="X アカウント",
-                        interactive=True,
-                    )
-                with gr.Row():
-                    tweet_embed_html_text_field = gr.Textbox(
-                        label="埋め込みコード",
-                        interactive=False,
-                    )
 
-            with gr.Column():
-                with gr.Row():
-                    clear_twitter_tweet_image_field_button = gr.ClearButton(
-                        value="以下のフィールドをクリア",
-                    )
-                with gr.Row():
-                    twitter_tweet_image_index_text_field = gr.Textbox(
-                        label="画像インデックス",
-                        interactive=True,
-                    )
-                with gr.Row():
-                    twitter_tweet_image_url_text_field = gr.Textbox(
-                        label="画像URL",
-                        interactive=True,
+        @render_on_first_select(
+            tab=tab,
+            tab_name=TAB_NAME,
+            reference_data_store=reference_data_store,
+            concurrency_limit=event_concurrency_config.hasura_concurrency_limit,
+            concurrency_id=HASURA_CONCURRENCY_ID,
+        )
+        def render_tab(
+            reference_data: GetReferenceData,
+            reference_data_version_state: gr.State,
+        ) -> None:
+            gr.Markdown("# プログラムにXの投稿を追加")
+            with gr.Row():
+                with gr.Column():
+                    with gr.Row():
+                        clear_twitter_tweet_field_button = gr.ClearButton(
+                            value="以下のフィールドをクリア",
+                        )
+                    with gr.Row():
+                        twitter_tweet_url_or_id_text_field = gr.Textbox(
+                            label="Xの投稿URL または 投稿ID",
+                            interactive=True,
+                        )
+                    with gr.Row():
+                        fetch_tweet_data_button = gr.Button(
+                            value="X から投稿情報を取得",
+                        )
+                    with gr.Row():
+                        remote_tweet_id_text_field = gr.Textbox(
+                            label="X 上の投稿ID",
+                            interactive=False,
+                        )
+                        tweet_time_text_field = gr.Textbox(
+                            label="投稿時間",
+                            interactive=False,
+                        )
+                    with gr.Row():
+                        twitter_screen_name_text_field = gr.Textbox(
+                            label="スクリーンネーム",
+                            interactive=False,
+                        )
+                        twitter_display_name_text_field = gr.Textbox(
+                            label="アカウント表示名",
+                            interactive=False,
+                        )
+                    with gr.Row():
+                        twitter_account_drop = gr.Dropdown(
+                            label="X アカウント",
+                            interactive=True,
+                            choices=create_twitter_account_choices(reference_data),
+                        )
+                    with gr.Row():
+                        tweet_embed_html_text_field = gr.Textbox(
+                            label="埋め込みコード",
+                            interactive=False,
+                        )
+                    with gr.Row():
+                        twitter_tweet_id_text_field = gr.Textbox(
+                            label="データベース上の投稿ID (登録済みの場合)",
+                            interactive=False,
+                        )
+
+                with gr.Column():
+                    with gr.Row():
+                        clear_twitter_tweet_image_field_button = gr.ClearButton(
+                            value="以下のフィールドをクリア",
+                        )
+                    with gr.Row():
+                        twitter_tweet_image_index_text_field = gr.Textbox(
+                            label="画像インデックス",
+                            interactive=True,
+                        )
+                    with gr.Row():
+                        twitter_tweet_image_url_text_field = gr.Textbox(
+                            label="画像URL",
+                            interactive=True,
+                        )
+
+                with gr.Column():
+                    with gr.Row():
+                        clear_project_field_button = gr.ClearButton(
+                            value="以下のフィールドをクリア",
+                        )
+                    with gr.Row():
+                        project_drop = gr.Dropdown(
+                            label="プロジェクト",
+                            interactive=True,
+                            choices=create_project_choices(reference_data),
+                        )
+                    with gr.Row():
+                        program_drop = gr.Dropdown(
+                            label="プログラム",
+                            interactive=True,
+                        )
+                    with gr.Row():
+                        person_drop = gr.Dropdown(
+                            label="投稿者",
+                            interactive=True,
+                            choices=create_person_choices(reference_data),
+                        )
+                    with gr.Row():
+                        add_program_twitter_announcement_button = gr.Button(
+                            value="X の投稿を追加",
+                            variant="primary",
+                        )
+                    with gr.Row():
+                        added_program_twitter_announcement_id_text_field = gr.Textbox(
+                            label="追加された X の投稿のデータベース上のID",
+                            interactive=False,
+                        )
+
+            @instrument_handler(tab=TAB_NAME)
+            async def handle_reference_data_updated() -> Any:
+                reference_data = await reference_data_store.get()
+                return [
+                    gr.Dropdown(
+                        choices=create_twitter_account_choices(reference_data),
+                    ),
+                    gr.Dropdown(
+                        choices=create_project_choices(reference_data),
+                    ),
+                    gr.Dropdown(
+                        choices=create_person_choices(reference_data),
+                    ),
+                ]
+
+            @instrument_handler(tab=TAB_NAME)
+            async def handle_project_changed(
+                project_id: str,
+            ) -> Any:
+                if project_id is None or len(project_id) == 0:
+                    return gr.Dropdown(
+                        value=None,
+                        choices=None,
                     )
 
-            with gr.Column():
-                with gr.Row():
-                    clear_project_field_button = gr.ClearButton(
-                        value="以下のフィールドをクリア",
-                    )
-                with gr.Row():
-                    project_drop = gr.Dropdown(
-                        label="プロジェクト",
-                        interactive=True,
-                    )
-                with gr.Row():
-                    program_drop = gr.Dropdown(
-                        label="プログラム",
-                        interactive=True,
-                    )
-                with gr.Row():
-                    person_drop = gr.Dropdown(
-                        label="投稿者",
-                        interactive=True,
-                    )
-                with gr.Row():
-                    add_program_twitter_announcement_button = gr.Button(
-                        value="X の投稿を追加",
-                        variant="primary",
-                    )
-                with gr.Row():
-                    added_program_twitter_announcement_id_text_field = gr.Textbox(
-                        label="追加された X の投稿のデータベース上のID",
-                        interactive=False,
-                    )
+                program_list = await program_list_store.get(
+                    project_id=project_id,
+                )
+                if program_list is None:
+                    raise Exception("Project must not be None")
 
-        def handle_tab_selected() -> Any:
-            initial_data = (
-                graphql_client.get_create_program_twitter_announcement_initial_data()
-            )
-            return [
-                gr.Dropdown(
+                return gr.Dropdown(
                     choices=list(
                         map(
-                            lambda twitter_account: (
-                                f"{twitter_account.name} "
-                                f"(@{twitter_account.twitter_screen_name})",
-                                twitter_account.id,
+                            lambda program: (
+                                program.title,
+                                program.id,
                             ),
-                            initial_data.twitter_account_list,
+                            program_list,
                         ),
                     ),
-                ),
-                gr.Dropdown(
-                    choices=list(
-                        map(
-                            lambda project: (project.name, project.id),
-                            initial_data.project_list,
-                        ),
-                    ),
-                ),
-                gr.Dropdown(
-                    choices=list(
-                        map(
-                            lambda person: (person.name, person.id),
-                            initial_data.person_list,
-                        ),
-                    ),
-                ),
-            ]
-
-        def handle_project_changed(
-            project_id: str,
-        ) -> Any:
-            if project_id is None or len(project_id) == 0:
-                return gr.Dropdown(
-                    value=None,
-                    choices=None,
                 )
 
-            response = graphql_client.get_program_project_list_by_project_id(
-                project_id=project_id,
-            )
-            project = response.project
-            if project is None:
-                raise Exception("Project must not be None")
-
-            return gr.Dropdown(
-                choices=list(
-                    map(
-                        lambda program_project: (
-                            program_project.program.title,
-                            program_project.program.id,
-                        ),
-                        project.program_project_list,
+            @instrument_handler(tab=TAB_NAME)
+            async def handle_twitter_tweet_url_or_id_changed(
+                twitter_tweet_url_or_id: str | None,
+                request: gr.Request,
+            ) -> None:
+                # Starts fetching once the input is a valid ID, so that the fetch
+                # button gets the prefetched (or in-flight) result
+                session_id = request.session_hash or ""
+                try:
+                    remote_tweet_id = parse_remote_tweet_id(
+                        twitter_tweet_url_or_id=twitter_tweet_url_or_id or "",
+                    )
+                except Exception:
+                    external_api_prefetcher.cancel(
+                        session_id=session_id,
+                        field="twitter_tweet_url_or_id",
+                    )
+                    return
+
+                external_api_prefetcher.schedule(
+                    session_id=session_id,
+                    field="twitter_tweet_url_or_id",
+                    key=("twitter", remote_tweet_id),
+                    fn=lambda: fetch_twitter_tweet_oembed_data(
+                        twitter_tweet_url_or_id=remote_tweet_id,
+                        http_client=external_api_http_clients.twitter,
+                        metadata_cache=external_api_metadata_cache,
                     ),
-                ),
-            )
+                )
 
-        def handle_fetch_tweet_data_button_clicked(
-            twitter_tweet_url_or_id: str | None,
-        ) -> Any:
-            if twitter_tweet_url_or_id is None or len(twitter_tweet_url_or_id) == 0:
-                raise Exception("Invalid Twitter tweet URL or ID")
+            async def resolve_twitter_account_id(
+                twitter_screen_name: str,
+            ) -> str | None:
+                # Hasura is asked only for an account missing from the reference data
+                # (e.g. registered after the reference data was loaded)
+                twitter_account_id = await reference_data_store.find_twitter_account_id(
+                    twitter_screen_name=twitter_screen_name,
+                )
+                if twitter_account_id is not None:
+                    return twitter_account_id
 
-            twitter_tweet_oembed_response = fetch_twitter_tweet_oembed_data(
-                twitter_tweet_url_or_id=twitter_tweet_url_or_id,
-            )
-            tweet_url = twitter_tweet_oembed_response.url
-            remote_tweet_id = os.path.basename(tweet_url)
+                response = await graphql_client.get_twitter_account_by_screen_name(
+                    twitter_screen_name=twitter_screen_name,
+                )
+                if len(response.twitter_account_list) == 0:
+                    return None
 
-            snowflake_timestamp = ((int(remote_tweet_id) >> 22) + 1288834974657) / 1000
-            snowflake_tweet_time = datetime.fromtimestamp(
-                snowflake_timestamp
-            ).astimezone(JST)
+                return str(response.twitter_account_list[0].id)
 
-            author_url = twitter_tweet_oembed_response.author_url
-            screen_name = os.path.basename(author_url)
+            @instrument_handler(tab=TAB_NAME)
+            async def handle_fetch_tweet_data_button_clicked(
+                twitter_tweet_url_or_id: str | None,
+            ) -> Any:
+                if twitter_tweet_url_or_id is None or len(twitter_tweet_url_or_id) == 0:
+                    raise Exception("Invalid Twitter tweet URL or ID")
 
-            author_name = twitter_tweet_oembed_response.author_name
+                remote_tweet_id = parse_remote_tweet_id(
+                    twitter_tweet_url_or_id=twitter_tweet_url_or_id,
+                )
+                # Known before oEmbed when the input is a URL with the screen name
+                url_screen_name = parse_twitter_screen_name(
+                    twitter_tweet_url_or_id=twitter_tweet_url_or_id,
+                )
 
-            unsafe_html = twitter_tweet_oembed_response.html
-            sanitized_html = unsafe_html.strip()
+                url_twitter_account_id: str | None = None
+                if url_screen_name is not None:
+                    url_twitter_account_id = (
+                        await reference_data_store.find_twitter_account_id(
+                            twitter_screen_name=url_screen_name,
+                        )
+                    )
 
-            script_tag_text = '<script async src="https://platform.twitter.com/widgets.js" charset="utf-8"></script>'  # noqa: B950
-            if sanitized_html.endswith(script_tag_text):
-                sanitized_html = sanitized_html[: -len(script_tag_text)]
+                # Look up an already registered tweet (and the account in the URL
+                # missing from the reference data) in one request, while oEmbed
+                # is fetched
+                tweet_operation = (
+                    graphql_client.get_twitter_tweet_by_remote_tweet_id_operation(
+                        remote_tweet_id=remote_tweet_id,
+                    )
+                )
+                account_operation = (
+                    graphql_client.get_twitter_account_by_screen_name_operation(
+                        twitter_screen_name=url_screen_name,
+                    )
+                    if url_screen_name is not None and url_twitter_account_id is None
+                    else None
+                )
+                operations: list[GraphQLOperation[Any]] = [tweet_operation]
+                if account_operation is not None:
+                    operations.append(account_operation)
+
+                (
+                    twitter_tweet_oembed_response,
+                    batch_result,
+                    person_account_index,
+                ) = await asyncio.gather(
+                    external_api_prefetcher.fetch(
+                        key=("twitter", remote_tweet_id),
+                        fn=lambda: fetch_twitter_tweet_oembed_data(
+                            twitter_tweet_url_or_id=remote_tweet_id,
+                            http_client=external_api_http_clients.twitter,
+                            metadata_cache=external_api_metadata_cache,
+                        ),
+                    ),
+                    graphql_client.execute_batch(
+                        operations=operations,
+                        merge=True,
+                    ),
+                    person_account_index_store.get_or_none(),
+                )
 
-            if "<script" in sanitized_html:
-                raise Exception(f"Invalid Twitter tweet embed html: {sanitized_html}")
+                tweet_url = twitter_tweet_oembed_response.url
+                if os.path.basename(tweet_url) != remote_tweet_id:
+                    raise Exception(f"Invalid Twitter tweet oEmbed URL: {tweet_url}")
 
-            sanitized_html = sanitized_html.strip()
+                snowflake_timestamp = (
+                    (int(remote_tweet_id) >> 22) + 1288834974657
+                ) / 1000
+                snowflake_tweet_time = datetime.fromtimestamp(
+                    snowflake_timestamp
+                ).astimezone(JST)
 
-            response = graphql_client.get_twitter_account_by_screen_name(
-                twitter_screen_name=screen_name,
-            )
-            twitter_account_list = response.twitter_account_list
-            if len(twitter_account_list) == 0:
-                raise Exception("The length of Twitter Account List must not be zero")
-
-            twitter_account = twitter_account_list[0]
-
-            return [
-                remote_tweet_id,
-                snowflake_tweet_time.isoformat(),
-                sanitized_html,
-                screen_name,
-                author_name,
-                twitter_account.id,
-            ]
-
-        def handle_add_program_twitter_announcement_button_clicked(
-            remote_tweet_id: str,
-            twitter_account_id: str,
-            tweet_time_string: str,
-            tweet_embed_html: str,
-            twitter_tweet_image_index: str,
-            twitter_tweet_image_url: str,
-            program_id: str,
-            person_id: str,
-        ) -> Any:
-            tweet_time = datetime.fromisoformat(tweet_time_string)
-
-            response_tweet = graphql_client.create_twitter_tweet(
-                remote_tweet_id=remote_tweet_id,
-                twitter_account_id=twitter_account_id,
-                tweet_time=tweet_time,
-                tweet_embed_html=tweet_embed_html,
-            )
-            if response_tweet.twitter_tweet is None:
-                raise Exception("twitter_tweet must not be None")
+                author_url = twitter_tweet_oembed_response.author_url
+                screen_name = os.path.basename(author_url)
 
-            twitter_tweet_id = response_tweet.twitter_tweet.id
+                author_name = twitter_tweet_oembed_response.author_name
 
-            twitter_tweet_image_id: str | None = None
-            if len(twitter_tweet_image_index) != 0 or len(twitter_tweet_image_url) != 0:
-                response_tweet_image = graphql_client.create_twitter_tweet_image(
-                    twitter_tweet_id=twitter_tweet_id,
-                    twitter_tweet_image_index=int(twitter_tweet_image_index),
-                    twitter_tweet_image_url=twitter_tweet_image_url,
+                unsafe_html = twitter_tweet_oembed_response.html
+                sanitized_html = unsafe_html.strip()
+
+                script_tag_text = (
+                    '<script async src="https://platform.twitter.com/widgets.js" '
+                    'charset="utf-8"></script>'
                 )
-                if response_tweet_image.twitter_tweet_image is None:
-                    raise Exception("twitter_tweet_image must not be None")
+                if sanitized_html.endswith(script_tag_text):
+                    sanitized_html = sanitized_html[: -len(script_tag_text)]
 
-                twitter_tweet_image_id = response_tweet_image.twitter_tweet_image.id
+                if "<script" in sanitized_html:
+                    raise Exception(
+                        f"Invalid Twitter tweet embed html: {sanitized_html}"
+                    )
 
-            response_program_twitter_announcement = (
-                graphql_client.create_program_twitter_announcement(
-                    program_id=program_id,
-                    person_id=person_id,
-                    twitter_tweet_id=twitter_tweet_id,
-                    twitter_tweet_image_id=twitter_tweet_image_id,
-                )
+                sanitized_html = sanitized_html.strip()
+
+                # The screen name in a URL is not checked by X, so the account
+                # looked up from the URL is used only if it is the oEmbed author
+                twitter_account_id: str | None = None
+                if url_screen_name is not None:
+                    if url_screen_name.lower() != screen_name.lower():
+                        logger.info(
+                            "The screen name in the URL (%s) is not the author (%s)",
+                            url_screen_name,
+                            screen_name,
+                        )
+                    elif url_twitter_account_id is not None:
+                        twitter_account_id = url_twitter_account_id
+                    elif account_operation is not None:
+                        twitter_account_list = batch_result.get(
+                            account_operation
+                        ).twitter_account_list
+                        if len(twitter_account_list) != 0:
+                            twitter_account_id = str(twitter_account_list[0].id)
+
+                if twitter_account_id is None:
+                    twitter_account_id = await resolve_twitter_account_id(
+                        twitter_screen_name=screen_name,
+                    )
+
+                if twitter_account_id is None:
+                    raise Exception(
+                        "The length of Twitter Account List must not be zero"
+                    )
+
+                person_id: str | None = None
+                if person_account_index is not None:
+                    person_id = person_account_index.find_person_id(
+                        provider="twitter",
+                        account_id=twitter_account_id,
+                    )
+
+                response_tweet = batch_result.get(tweet_operation)
+
+                twitter_tweet_id: str | None = None
+                if len(response_tweet.twitter_tweet_list) != 0:
+                    twitter_tweet_id = response_tweet.twitter_tweet_list[0].id
+
+                return [
+                    remote_tweet_id,
+                    snowflake_tweet_time.isoformat(),
+                    sanitized_html,
+                    screen_name,
+                    author_name,
+                    twitter_account_id,
+                    twitter_tweet_id,
+                    # Selects the person linked to the account, if any
+                    (
+                        gr.Dropdown(value=person_id)
+                        if person_id is not None
+                        else gr.Dropdown()
+                    ),
+                ]
+
+            @instrument_handler(tab=TAB_NAME)
+            async def handle_add_program_twitter_announcement_button_clicked(
+                remote_tweet_id: str,
+                twitter_account_id: str,
+                tweet_time_string: str,
+                tweet_embed_html: str,
+                twitter_tweet_image_index: str,
+                twitter_tweet_image_url: str,
+                program_id: str,
+                person_id: str,
+                twitter_tweet_id: str,
+            ) -> Any:
+                tweet_time = datetime.fromisoformat(tweet_time_string)
+
+                if (
+                    len(twitter_tweet_image_index) == 0
+                    and len(twitter_tweet_image_url) == 0
+                ):
+                    program_twitter_announcement_id = (
+                        await create_program_twitter_announcement_with_tweet(
+                            graphql_client=graphql_client,
+                            program_id=program_id,
+                            person_id=person_id,
+                            remote_tweet_id=remote_tweet_id,
+                            twitter_account_id=twitter_account_id,
+                            tweet_time=tweet_time,
+                            tweet_embed_html=tweet_embed_html,
+                        )
+                    )
+                else:
+                    program_twitter_announcement_id = (
+                        await create_program_twitter_announcement_with_tweet_image(
+                            graphql_client=graphql_client,
+                            program_id=program_id,
+                            person_id=person_id,
+                            twitter_tweet_id=(
+                                twitter_tweet_id if len(twitter_tweet_id) != 0 else None
+                            ),
+                            remote_tweet_id=remote_tweet_id,
+                            twitter_account_id=twitter_account_id,
+                            tweet_time=tweet_time,
+                            tweet_embed_html=tweet_embed_html,
+                            twitter_tweet_image_index=int(twitter_tweet_image_index),
+                            twitter_tweet_image_url=twitter_tweet_image_url,
+                        )
+                    )
+
+                return [
+                    program_twitter_announcement_id,
+                ]
+
+            clear_twitter_tweet_field_button.add(
+                components=[
+                    twitter_tweet_url_or_id_text_field,
+                    remote_tweet_id_text_field,
+                    tweet_embed_html_text_field,
+                    tweet_time_text_field,
+                    twitter_tweet_id_text_field,
+                ],
             )
 
-            program_twitter_announcement = (
-                response_program_twitter_announcement.program_twitter_announcement
+            clear_twitter_tweet_image_field_button.add(
+                components=[
+                    twitter_tweet_image_index_text_field,
+                    twitter_tweet_image_url_text_field,
+                ],
             )
-            if program_twitter_announcement is None:
-                raise Exception("program_twitter_announcement must not be None")
-
-            return [
-                program_twitter_announcement.id,
-            ]
-
-        clear_twitter_tweet_field_button.add(
-            components=[
-                twitter_tweet_url_or_id_text_field,
-                remote_tweet_id_text_field,
-                tweet_embed_html_text_field,
-                tweet_time_text_field,
-            ],
-        )
 
-        clear_twitter_tweet_image_field_button.add(
-            components=[
-                twitter_tweet_image_index_text_field,
-                twitter_tweet_image_url_text_field,
-            ],
-        )
+            clear_project_field_button.add(
+                components=[
+                    project_drop,
+                    program_drop,
+                    person_drop,
+                ],
+            )
 
-        clear_project_field_button.add(
-            components=[
-                project_drop,
-                program_drop,
-                person_drop,
-            ],
-        )
+            reference_data_version_state.change(
+                fn=handle_reference_data_updated,
+                outputs=[
+                    twitter_account_drop,
+                    project_drop,
+                    person_drop,
+                ],
+                concurrency_limit=event_concurrency_config.hasura_concurrency_limit,
+                concurrency_id=HASURA_CONCURRENCY_ID,
+            )
 
-        tab.select(
-            fn=handle_tab_selected,
-            outputs=[
-                twitter_account_drop,
-                project_drop,
-                person_drop,
-            ],
-        )
+            twitter_tweet_url_or_id_text_field.change(
+                fn=handle_twitter_tweet_url_or_id_changed,
+                inputs=[twitter_tweet_url_or_id_text_field],
+                show_progress="hidden",
+                trigger_mode="always_last",
+                # Only schedules the prefetch, so keystrokes skip the queue and
+                # do not wait for (or hold up) the fetch buttons
+                queue=False,
+            )
 
-        fetch_tweet_data_button.click(
-            fn=handle_fetch_tweet_data_button_clicked,
-            inputs=[twitter_tweet_url_or_id_text_field],
-            outputs=[
-                remote_tweet_id_text_field,
-                tweet_time_text_field,
-                tweet_embed_html_text_field,
-                twitter_screen_name_text_field,
-                twitter_display_name_text_field,
-                twitter_account_drop,
-            ],
-        )
+            fetch_tweet_data_button.click(
+                fn=handle_fetch_tweet_data_button_clicked,
+                inputs=[twitter_tweet_url_or_id_text_field],
+                outputs=[
+                    remote_tweet_id_text_field,
+                    tweet_time_text_field,
+                    tweet_embed_html_text_field,
+                    twitter_screen_name_text_field,
+                    twitter_display_name_text_field,
+                    twitter_account_drop,
+                    twitter_tweet_id_text_field,
+                    person_drop,
+                ],
+                concurrency_limit=event_concurrency_config.external_api_concurrency_limit,
+                concurrency_id=EXTERNAL_API_CONCURRENCY_ID,
+            )
 
-        add_program_twitter_announcement_button.click(
-            fn=handle_add_program_twitter_announcement_button_clicked,
-            inputs=[
-                remote_tweet_id_text_field,
-                twitter_account_drop,
-                tweet_time_text_field,
-                tweet_embed_html_text_field,
-                twitter_tweet_image_index_text_field,
-                twitter_tweet_image_url_text_field,
-                program_drop,
-                person_drop,
-            ],
-            outputs=[
-                added_program_twitter_announcement_id_text_field,
-            ],
-        )
+            add_program_twitter_announcement_button.click(
+                fn=handle_add_program_twitter_announcement_button_clicked,
+                inputs=[
+                    remote_tweet_id_text_field,
+                    twitter_account_drop,
+                    tweet_time_text_field,
+                    tweet_embed_html_text_field,
+                    twitter_tweet_image_index_text_field,
+                    twitter_tweet_image_url_text_field,
+                    program_drop,
+                    person_drop,
+                    twitter_tweet_id_text_field,
+                ],
+                outputs=[
+                    added_program_twitter_announcement_id_text_field,
+                ],
+                concurrency_limit=event_concurrency_config.hasura_concurrency_limit,
+                concurrency_id=HASURA_CONCURRENCY_ID,
+            )
 
-        project_drop.select(
-            fn=handle_project_changed,
-            inputs=project_drop,
-            outputs=program_drop,
-        )
+            project_drop.select(
+                fn=handle_project_changed,
+                inputs=project_drop,
+                outputs=program_drop,
+                concurrency_limit=event_concurrency_config.hasura_concurrency_limit,
+                concurrency_id=HASURA_CONCURRENCY_ID,
+            )
 
     return tab
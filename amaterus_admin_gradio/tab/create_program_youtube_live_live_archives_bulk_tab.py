@@ -0,0 +1,587 @@
+from logging import Logger
+from typing import Any
+from zoneinfo import ZoneInfo
+
+import gradio as gr
+from pydantic import BaseModel
+
+from ..external_api import (
+    ExternalApiHttpClients,
+    ExternalApiMetadataCache,
+    YoutubeApiQuotaTracker,
+    estimate_youtube_video_quota_cost,
+    fetch_youtube_video_data_batch,
+    parse_remote_youtube_video_id,
+)
+from ..graphql_client import (
+    Client,
+    CreateProgramYoutubeLiveLiveArchives,
+    GetReferenceData,
+    GraphQLClientGraphQLMultiError,
+    program_live_archives_insert_input,
+    youtube_channels_constraint,
+    youtube_channels_insert_input,
+    youtube_channels_obj_rel_insert_input,
+    youtube_channels_on_conflict,
+    youtube_channels_update_column,
+    youtube_lives_constraint,
+    youtube_lives_insert_input,
+    youtube_lives_obj_rel_insert_input,
+    youtube_lives_on_conflict,
+    youtube_lives_update_column,
+)
+from ..store import ProgramListItem, ProgramListStore, ReferenceDataStore
+from ..utility.metrics_utility import instrument_handler
+from .event_concurrency import (
+    EXTERNAL_API_CONCURRENCY_ID,
+    HASURA_CONCURRENCY_ID,
+    EventConcurrencyConfig,
+)
+from .lazy_tab import render_on_first_select
+from .reference_data_choices import create_person_choices, create_project_choices
+
+JST = ZoneInfo("Asia/Tokyo")
+
+TAB_NAME = "create_program_youtube_live_live_archives_bulk"
+
+
+class LiveArchiveBulkRow(BaseModel):
+    row_number: int
+    youtube_live_url_or_id: str
+    remote_youtube_video_id: str | None = None
+    program_id: str | None = None
+    person_id: str | None = None
+    title: str = ""
+    program_live_archive_id: str | None = None
+    error: str | None = None
+
+
+def resolve_program_id(
+    program_id_or_title: str,
+    program_list: list[ProgramListItem],
+) -> str:
+    for program in program_list:
+        if program.id == program_id_or_title:
+            return program.id
+
+    matched_program_list = [
+        program for program in program_list if program.title == program_id_or_title
+    ]
+    if len(matched_program_list) == 0:
+        raise Exception(f"Program not found: {program_id_or_title}")
+    if len(matched_program_list) > 1:
+        raise Exception(f"Program title is ambiguous: {program_id_or_title}")
+
+    return matched_program_list[0].id
+
+
+def resolve_person_id(
+    person_id_or_name: str,
+    person_list: list[tuple[str, str]],
+) -> str:
+    for _, person_id in person_list:
+        if person_id == person_id_or_name:
+            return person_id
+
+    matched_person_id_list = [
+        person_id
+        for person_name, person_id in person_list
+        if person_name == person_id_or_name
+    ]
+    if len(matched_person_id_list) == 0:
+        raise Exception(f"Person not found: {person_id_or_name}")
+    if len(matched_person_id_list) > 1:
+        raise Exception(f"Person name is ambiguous: {person_id_or_name}")
+
+    return matched_person_id_list[0]
+
+
+def create_program_live_archive_insert_input(
+    program_id: str | None,
+    person_id: str | None,
+    remote_youtube_video_id: str,
+    title: str,
+    remote_youtube_channel_id: str,
+    youtube_channel_name: str,
+    start_time: str | None,
+    end_time: str | None,
+) -> program_live_archives_insert_input:
+    # Same nested upserts as CreateProgramYoutubeLiveLiveArchive
+    youtube_channel = youtube_channels_obj_rel_insert_input(
+        data=youtube_channels_insert_input(
+            remote_youtube_channel_id=remote_youtube_channel_id,
+            name=youtube_channel_name,
+        ),
+        on_conflict=youtube_channels_on_conflict(
+            constraint=(
+                youtube_channels_constraint.youtube_channels_youtube_channel_id_key
+            ),
+            update_columns=[
+                youtube_channels_update_column.name,
+            ],
+        ),
+    )
+
+    youtube_live = youtube_lives_obj_rel_insert_input(
+        data=youtube_lives_insert_input(
+            remote_youtube_video_id=remote_youtube_video_id,
+            title=title,
+            start_time=start_time,
+            end_time=end_time,
+            youtube_channel=youtube_channel,
+        ),
+        on_conflict=youtube_lives_on_conflict(
+            constraint=(
+                youtube_lives_constraint.youtube_lives_remote_youtube_video_id_key
+            ),
+            update_columns=[
+                youtube_lives_update_column.title,
+                youtube_lives_update_column.start_time,
+                youtube_lives_update_column.end_time,
+            ],
+        ),
+    )
+
+    return program_live_archives_insert_input(
+        program_id=program_id,
+        person_id=person_id,
+        start_time=start_time,
+        end_time=end_time,
+        youtube_live=youtube_live,
+    )
+
+
+def set_program_live_archive_ids(
+    rows: list[LiveArchiveBulkRow],
+    response: CreateProgramYoutubeLiveLiveArchives,
+) -> None:
+    insert_program_live_archives = response.insert_program_live_archives
+    if insert_program_live_archives is None:
+        raise Exception("insert_program_live_archives must not be None")
+
+    program_live_archive_ids: dict[tuple[str, str, str], str] = {}
+    for program_live_archive in insert_program_live_archives.returning:
+        youtube_live = program_live_archive.youtube_live
+        if youtube_live is None:
+            continue
+
+        program_live_archive_key = (
+            youtube_live.remote_youtube_video_id,
+            program_live_archive.program_id,
+            program_live_archive.person_id,
+        )
+        program_live_archive_ids[program_live_archive_key] = program_live_archive.id
+
+    for row in rows:
+        assert row.remote_youtube_video_id is not None
+        assert row.program_id is not None
+        assert row.person_id is not None
+
+        program_live_archive_id = program_live_archive_ids.get(
+            (row.remote_youtube_video_id, row.program_id, row.person_id),
+        )
+        if program_live_archive_id is not None:
+            row.program_live_archive_id = program_live_archive_id
+
+
+async def insert_program_live_archives(
+    graphql_client: Client,
+    objects: list[program_live_archives_insert_input],
+    rows: list[LiveArchiveBulkRow],
+    logger: Logger,
+) -> None:
+    if len(objects) == 0:
+        return
+
+    create_program_live_archives = (
+        graphql_client.create_program_youtube_live_live_archives
+    )
+
+    try:
+        response = await create_program_live_archives(objects=objects)
+    except GraphQLClientGraphQLMultiError:
+        # The mutation runs in one transaction, so one bad row rejects them all
+        # and nothing is committed. Retry row by row so that each row reports
+        # its own result. Other errors (e.g. a timeout) may follow a commit and
+        # are raised, since a retry would insert the rows twice
+        logger.warning(
+            "Failed to insert %d program live archives at once, retrying row by row",
+            len(objects),
+            exc_info=True,
+        )
+    else:
+        set_program_live_archive_ids(rows=rows, response=response)
+        return
+
+    # One by one, not to flood Hasura with a mutation per row
+    for row, obj in zip(rows, objects):
+        try:
+            row_response = await create_program_live_archives(objects=[obj])
+        except GraphQLClientGraphQLMultiError as error:
+            logger.warning(
+                "Failed to insert program live archive of row %d",
+                row.row_number,
+                exc_info=True,
+            )
+            row.error = str(error)
+            continue
+
+        set_program_live_archive_ids(rows=[row], response=row_response)
+
+
+def create_create_program_youtube_live_live_archives_bulk_tab(
+    graphql_client: Client,
+    reference_data_store: ReferenceDataStore,
+    program_list_store: ProgramListStore,
+    youtube_api_key: str,
+    external_api_http_clients: ExternalApiHttpClients,
+    external_api_metadata_cache: ExternalApiMetadataCache,
+    youtube_api_quota_tracker: YoutubeApiQuotaTracker,
+    event_concurrency_config: EventConcurrencyConfig,
+    logger: Logger,
+) -> gr.Tab:
+    with gr.Tab(label="プログラムに配信アーカイブを一括追加") as tab:
+
+        @render_on_first_select(
+            tab=tab,
+            tab_name=TAB_NAME,
+            reference_data_store=reference_data_store,
+            concurrency_limit=event_concurrency_config.hasura_concurrency_limit,
+            concurrency_id=HASURA_CONCURRENCY_ID,
+        )
+        def render_tab(
+            reference_data: GetReferenceData,
+            reference_data_version_state: gr.State,
+        ) -> None:
+            gr.Markdown("# プログラムに配信アーカイブを一括追加")
+            gr.Markdown(
+                "プログラムと放送者は ID または名前で指定します。"
+                "空欄の場合は右側で選択した値を使用します。"
+            )
+            with gr.Row():
+                with gr.Column(scale=2):
+                    with gr.Row():
+                        live_archive_dataframe = gr.Dataframe(
+                            label="追加する配信アーカイブ",
+                            headers=[
+                                "YouTube Live URL または ID",
+                                "プログラム",
+                                "放送者",
+                            ],
+                            datatype=["str", "str", "str"],
+                            col_count=(3, "fixed"),
+                            row_count=(10, "dynamic"),
+                            type="array",
+                            interactive=True,
+                        )
+
+                with gr.Column(scale=1):
+                    with gr.Row():
+                        clear_project_field_button = gr.ClearButton(
+                            value="以下のフィールドをクリア",
+                        )
+                    with gr.Row():
+                        project_drop = gr.Dropdown(
+                            label="プロジェクト",
+                            interactive=True,
+                            choices=create_project_choices(reference_data),
+                        )
+                    with gr.Row():
+                        program_drop = gr.Dropdown(
+                            label="プログラム (既定値)",
+                            interactive=True,
+                        )
+                    with gr.Row():
+                        person_drop = gr.Dropdown(
+                            label="放送者 (既定値)",
+                            interactive=True,
+                            choices=create_person_choices(reference_data),
+                        )
+                    with gr.Row():
+                        add_live_archives_button = gr.Button(
+                            value="配信アーカイブを一括追加",
+                            variant="primary",
+                        )
+                    with gr.Row():
+                        youtube_api_remaining_quota_text_field = gr.Textbox(
+                            label="本日の YouTube API 残りクォータ (推定)",
+                            interactive=False,
+                            value=str(youtube_api_quota_tracker.get_remaining_units()),
+                        )
+
+            with gr.Row():
+                result_dataframe = gr.Dataframe(
+                    label="結果",
+                    headers=[
+                        "行",
+                        "YouTube Video ID",
+                        "タイトル",
+                        "追加された配信アーカイブのデータベース上のID",
+                        "エラー",
+                    ],
+                    datatype=["number", "str", "str", "str", "str"],
+                    col_count=(5, "fixed"),
+                    type="array",
+                    interactive=False,
+                )
+
+            @instrument_handler(tab=TAB_NAME)
+            async def handle_reference_data_updated() -> Any:
+                reference_data = await reference_data_store.get()
+                return [
+                    gr.Dropdown(
+                        choices=create_project_choices(reference_data),
+                    ),
+                    gr.Dropdown(
+                        choices=create_person_choices(reference_data),
+                    ),
+                    str(await youtube_api_quota_tracker.get_remaining_units_async()),
+                ]
+
+            @instrument_handler(tab=TAB_NAME)
+            async def handle_project_changed(
+                project_id: str,
+            ) -> Any:
+                if project_id is None or len(project_id) == 0:
+                    return gr.Dropdown(
+                        value=None,
+                        choices=None,
+                    )
+
+                program_list = await program_list_store.get(
+                    project_id=project_id,
+                )
+                if program_list is None:
+                    return gr.Dropdown(
+                        value=None,
+                        choices=None,
+                    )
+
+                return gr.Dropdown(
+                    choices=list(
+                        map(
+                            lambda program: (
+                                program.title,
+                                program.id,
+                            ),
+                            program_list,
+                        ),
+                    ),
+                )
+
+            @instrument_handler(tab=TAB_NAME)
+            async def handle_add_live_archives_button_clicked(
+                live_archive_table: list[list[Any]],
+                project_id: str | None,
+                default_program_id: str | None,
+                default_person_id: str | None,
+            ) -> Any:
+                if project_id is None or len(project_id) == 0:
+                    raise Exception("Project must not be None")
+
+                program_list = await program_list_store.get(
+                    project_id=project_id,
+                )
+                if program_list is None:
+                    raise Exception("Project must not be None")
+
+                reference_data = await reference_data_store.get()
+                person_list = list(
+                    map(
+                        lambda person: (person.name, person.id),
+                        reference_data.person_list,
+                    ),
+                )
+
+                rows: list[LiveArchiveBulkRow] = []
+                row_keys: set[tuple[str, str, str]] = set()
+                for row_index, cells in enumerate(live_archive_table):
+                    youtube_live_url_or_id, program_id_or_title, person_id_or_name = (
+                        str(cell).strip() if cell is not None else "" for cell in cells
+                    )
+                    if len(youtube_live_url_or_id) == 0:
+                        continue
+
+                    row = LiveArchiveBulkRow(
+                        row_number=row_index + 1,
+                        youtube_live_url_or_id=youtube_live_url_or_id,
+                    )
+                    rows.append(row)
+
+                    try:
+                        row.remote_youtube_video_id = parse_remote_youtube_video_id(
+                            youtube_video_url_or_id=youtube_live_url_or_id,
+                        )
+
+                        if len(program_id_or_title) != 0:
+                            row.program_id = resolve_program_id(
+                                program_id_or_title=program_id_or_title,
+                                program_list=program_list,
+                            )
+                        elif default_program_id is not None:
+                            row.program_id = default_program_id
+                        else:
+                            raise Exception("Program must not be None")
+
+                        if len(person_id_or_name) != 0:
+                            row.person_id = resolve_person_id(
+                                person_id_or_name=person_id_or_name,
+                                person_list=person_list,
+                            )
+                        elif default_person_id is not None:
+                            row.person_id = default_person_id
+                        else:
+                            raise Exception("Person must not be None")
+
+                        row_key = (
+                            row.remote_youtube_video_id,
+                            row.program_id,
+                            row.person_id,
+                        )
+                        if row_key in row_keys:
+                            raise Exception("Duplicated row")
+                        row_keys.add(row_key)
+                    except Exception as error:
+                        row.error = str(error)
+
+                pending_rows = [row for row in rows if row.error is None]
+
+                estimated_quota_cost = estimate_youtube_video_quota_cost(
+                    remote_youtube_video_count=len(pending_rows),
+                )
+                remaining_quota = (
+                    await youtube_api_quota_tracker.get_remaining_units_async()
+                )
+                if estimated_quota_cost > remaining_quota:
+                    raise Exception(
+                        "Not enough YouTube API quota: "
+                        f"{estimated_quota_cost} units required, {remaining_quota} left"
+                    )
+
+                # One videos.list request per 50 videos, sent concurrently
+                youtube_video_items = await fetch_youtube_video_data_batch(
+                    youtube_video_url_or_id_list=[
+                        row.youtube_live_url_or_id for row in pending_rows
+                    ],
+                    youtube_api_key=youtube_api_key,
+                    http_client=external_api_http_clients.youtube,
+                    metadata_cache=external_api_metadata_cache,
+                    quota_tracker=youtube_api_quota_tracker,
+                )
+
+                objects: list[program_live_archives_insert_input] = []
+                inserting_rows: list[LiveArchiveBulkRow] = []
+                for row in pending_rows:
+                    assert row.remote_youtube_video_id is not None
+
+                    item = youtube_video_items.get(row.remote_youtube_video_id)
+                    if item is None or item.snippet is None:
+                        row.error = "YouTube video not found"
+                        continue
+
+                    row.title = item.snippet.title
+
+                    start_time: str | None = None
+                    end_time: str | None = None
+                    if item.liveStreamingDetails is not None:
+                        if item.liveStreamingDetails.actualStartTime is not None:
+                            start_time = (
+                                item.liveStreamingDetails.actualStartTime.astimezone(
+                                    JST
+                                ).isoformat()
+                            )
+
+                        if item.liveStreamingDetails.actualEndTime is not None:
+                            end_time = (
+                                item.liveStreamingDetails.actualEndTime.astimezone(
+                                    JST
+                                ).isoformat()
+                            )
+
+                    objects.append(
+                        create_program_live_archive_insert_input(
+                            program_id=row.program_id,
+                            person_id=row.person_id,
+                            remote_youtube_video_id=item.id,
+                            title=item.snippet.title,
+                            remote_youtube_channel_id=item.snippet.channelId,
+                            youtube_channel_name=item.snippet.channelTitle,
+                            start_time=start_time,
+                            end_time=end_time,
+                        ),
+                    )
+                    inserting_rows.append(row)
+
+                await insert_program_live_archives(
+                    graphql_client=graphql_client,
+                    objects=objects,
+                    rows=inserting_rows,
+                    logger=logger,
+                )
+
+                logger.info(
+                    "Bulk live archive import: %d rows, %d inserted",
+                    len(rows),
+                    len(
+                        [row for row in rows if row.program_live_archive_id is not None]
+                    ),
+                )
+
+                return [
+                    [
+                        [
+                            row.row_number,
+                            row.remote_youtube_video_id or "",
+                            row.title,
+                            row.program_live_archive_id or "",
+                            row.error or "",
+                        ]
+                        for row in rows
+                    ],
+                    str(await youtube_api_quota_tracker.get_remaining_units_async()),
+                ]
+
+            clear_project_field_button.add(
+                components=[
+                    project_drop,
+                    program_drop,
+                    person_drop,
+                ],
+            )
+
+            reference_data_version_state.change(
+                fn=handle_reference_data_updated,
+                outputs=[
+                    project_drop,
+                    person_drop,
+                    youtube_api_remaining_quota_text_field,
+                ],
+                concurrency_limit=event_concurrency_config.hasura_concurrency_limit,
+                concurrency_id=HASURA_CONCURRENCY_ID,
+            )
+
+            add_live_archives_button.click(
+                fn=handle_add_live_archives_button_clicked,
+                inputs=[
+                    live_archive_dataframe,
+                    project_drop,
+                    program_drop,
+                    person_drop,
+                ],
+                outputs=[
+                    result_dataframe,
+                    youtube_api_remaining_quota_text_field,
+                ],
+                concurrency_limit=event_concurrency_config.external_api_concurrency_limit,
+                concurrency_id=EXTERNAL_API_CONCURRENCY_ID,
+            )
+
+            project_drop.select(
+                fn=handle_project_changed,
+                inputs=project_drop,
+                outputs=program_drop,
+                concurrency_limit=event_concurrency_config.hasura_concurrency_limit,
+                concurrency_id=HASURA_CONCURRENCY_ID,
+            )
+
+    return tab
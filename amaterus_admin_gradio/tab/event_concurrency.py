@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+
+# Events with the same concurrency ID share one limit across all sessions,
+# so that slow external API calls do not hold up the Hasura operations
+HASURA_CONCURRENCY_ID = "hasura"
+EXTERNAL_API_CONCURRENCY_ID = "external_api"
+
+
+class EventConcurrencyConfig(BaseModel):
+    hasura_concurrency_limit: int
+    external_api_concurrency_limit: int
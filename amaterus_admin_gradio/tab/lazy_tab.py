@@ -0,0 +1,83 @@
+from typing import Any, Callable, Literal
+
+import gradio as gr
+from gradio.context import Context
+
+from ..store import ReferenceDataStore
+from ..utility.metrics_utility import instrument_handler
+
+
+def is_tab_selected_on_load(tab: gr.Tab) -> bool:
+    # Gradio groups consecutive tabs and selects the first tab of each group
+    siblings = tab.parent.children if tab.parent is not None else [tab]
+    index = siblings.index(tab)
+    return index == 0 or not isinstance(siblings[index - 1], gr.Tab)
+
+
+def render_on_first_select(
+    tab: gr.Tab,
+    tab_name: str,
+    reference_data_store: ReferenceDataStore | None = None,
+    concurrency_limit: int | None | Literal["default"] = "default",
+    concurrency_id: str | None = None,
+) -> Callable[[Callable[..., None]], Callable[..., None]]:
+    # The decorated function builds the contents of the tab (components and event
+    # listeners) when the tab is selected for the first time in a session,
+    # so that the page config has only the tab headers.
+    # The render function cannot await, so the reference data is refreshed by the
+    # select event and read from the store by the render function, which gets
+    # the reference data and a state holding its version. The state changes
+    # when a later selection finds the reference data updated, so that the tab
+    # updates its components (e.g. dropdown choices) by its change event
+    # instead of another select event.
+    # The sessions only hold the flags; the data stays in the shared store.
+    is_selected_on_load = is_tab_selected_on_load(tab=tab)
+
+    # A tab shown with the page that has nothing to load is built with the page
+    if is_selected_on_load and reference_data_store is None:
+
+        def build(fn: Callable[..., None]) -> Callable[..., None]:
+            fn()
+            return fn
+
+        return build
+
+    rendered_state = gr.State(value=False)
+    reference_data_version_state = gr.State()
+
+    @instrument_handler(tab=tab_name)
+    async def handle_lazy_tab_selected() -> Any:
+        # Returning the same values does not trigger the change events again
+        if reference_data_store is None:
+            return [True, None]
+
+        # Refreshes the reference data if it has expired
+        await reference_data_store.get()
+        return [True, reference_data_store.get_version()]
+
+    triggers = [tab.select]
+    root_block = Context.root_block
+    if root_block is not None and is_selected_on_load:
+        triggers.append(root_block.load)
+
+    gr.on(
+        triggers=triggers,
+        fn=handle_lazy_tab_selected,
+        outputs=[rendered_state, reference_data_version_state],
+        show_progress="hidden",
+        concurrency_limit=concurrency_limit,
+        concurrency_id=concurrency_id,
+    )
+
+    def render(fn: Callable[..., None]) -> Callable[..., None]:
+        def render_tab() -> None:
+            if reference_data_store is None:
+                fn()
+                return
+
+            fn(reference_data_store.peek(), reference_data_version_state)
+
+        gr.render(inputs=[], triggers=[rendered_state.change])(render_tab)
+        return fn
+
+    return render
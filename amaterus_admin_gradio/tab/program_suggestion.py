@@ -0,0 +1,49 @@
+from datetime import datetime
+from logging import Logger
+
+from ..store import ProgramListStore
+
+
+async def load_program_list(
+    program_list_store: ProgramListStore,
+    project_id: str | None,
+) -> None:
+    # Run beside the fetch of the video, so that suggest_program_id reads
+    # the program list from memory
+    if project_id is None or len(project_id) == 0:
+        return
+
+    await program_list_store.get_or_none(project_id=project_id)
+
+
+async def suggest_program_id(
+    program_list_store: ProgramListStore,
+    project_id: str | None,
+    program_id: str | None,
+    start_time: datetime | None,
+    end_time: datetime | None,
+    logger: Logger,
+) -> str | None:
+    if project_id is None or len(project_id) == 0 or start_time is None:
+        return None
+
+    # The suggestion is optional; the fetched data is shown without it
+    try:
+        program_list = await program_list_store.find_overlapping_programs(
+            project_id=project_id,
+            start_time=start_time,
+            end_time=end_time,
+        )
+    except Exception:
+        logger.warning("Failed to suggest program", exc_info=True)
+        return None
+
+    if program_list is None or len(program_list) == 0:
+        return None
+
+    # The selected program is kept if it also overlaps
+    for program in program_list:
+        if program.id == program_id:
+            return program.id
+
+    return program_list[0].id
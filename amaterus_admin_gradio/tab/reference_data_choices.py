@@ -0,0 +1,48 @@
+from ..graphql_client import GetReferenceData
+
+
+def create_project_choices(
+    reference_data: GetReferenceData,
+) -> list[tuple[str, str]]:
+    return list(
+        map(
+            lambda project: (project.name, project.id),
+            reference_data.project_list,
+        ),
+    )
+
+
+def create_person_choices(
+    reference_data: GetReferenceData,
+) -> list[tuple[str, str]]:
+    return list(
+        map(
+            lambda person: (person.name, person.id),
+            reference_data.person_list,
+        ),
+    )
+
+
+def create_game_choices(
+    reference_data: GetReferenceData,
+) -> list[tuple[str, str]]:
+    return list(
+        map(
+            lambda game: (game.name, game.id),
+            reference_data.game_list,
+        ),
+    )
+
+
+def create_twitter_account_choices(
+    reference_data: GetReferenceData,
+) -> list[tuple[str, str]]:
+    return list(
+        map(
+            lambda twitter_account: (
+                f"{twitter_account.name} (@{twitter_account.twitter_screen_name})",
+                twitter_account.id,
+            ),
+            reference_data.twitter_account_list,
+        ),
+    )
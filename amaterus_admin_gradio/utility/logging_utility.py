@@ -1,45 +1,180 @@
+import atexit
+import copy
 import datetime
 import logging
+import queue
+import time
+from logging.handlers import (
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+    TimedRotatingFileHandler,
+)
 from pathlib import Path
+from typing import Any, Literal
+
+import orjson
+
+from .tracing_utility import TraceContextFilter
+
+LogFormat = Literal["text", "json"]
+
+# Offsets of local time change on (at least) quarter-hour boundaries
+TIMEZONE_CACHE_SECONDS = 15 * 60
 
 
 class Iso8601WithTimezoneFormatter(logging.Formatter):
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._timezone: datetime.tzinfo = datetime.timezone.utc
+        self._timezone_start = 0.0
+        self._timezone_end = 0.0
+
+    def get_timezone(self, created: float) -> datetime.tzinfo:
+        # The local timezone is resolved once per quarter hour instead of per record
+        if not (self._timezone_start <= created < self._timezone_end):
+            self._timezone = datetime.timezone(
+                datetime.timedelta(seconds=time.localtime(created).tm_gmtoff),
+            )
+            self._timezone_start = (
+                created // TIMEZONE_CACHE_SECONDS * TIMEZONE_CACHE_SECONDS
+            )
+            self._timezone_end = self._timezone_start + TIMEZONE_CACHE_SECONDS
+
+        return self._timezone
+
     def formatTime(
         self,
         record: logging.LogRecord,
         datefmt: str | None = None,
     ) -> str:
-        return (
-            datetime.datetime.fromtimestamp(record.created, datetime.timezone.utc)
-            .astimezone()
-            .isoformat(sep="T", timespec="milliseconds")
+        return datetime.datetime.fromtimestamp(
+            record.created,
+            self.get_timezone(created=record.created),
+        ).isoformat(sep="T", timespec="milliseconds")
+
+
+class JsonLinesFormatter(Iso8601WithTimezoneFormatter):
+    def format(self, record: logging.LogRecord) -> str:
+        log_dict: dict[str, Any] = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "message": record.getMessage(),
+            "trace_id": getattr(record, "trace_id", "-"),
+            "span_id": getattr(record, "span_id", "-"),
+            "module": record.module,
+            "lineno": record.lineno,
+            "thread": record.threadName,
+        }
+        if record.exc_info is not None:
+            log_dict["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text is not None:
+            log_dict["exception"] = record.exc_text
+        if record.stack_info is not None:
+            log_dict["stack"] = self.formatStack(record.stack_info)
+
+        return orjson.dumps(log_dict, default=str).decode("utf-8")
+
+
+class DeferredFormatQueueHandler(QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # QueueHandler formats the record in the calling thread.
+        # Only the message is merged here (the arguments may be mutated later),
+        # and the listener formats the time, JSON and exception
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def create_formatter(log_format: LogFormat) -> logging.Formatter:
+    if log_format == "json":
+        return JsonLinesFormatter()
+
+    return Iso8601WithTimezoneFormatter(
+        fmt="%(asctime)s %(levelname)s [%(trace_id)s]: %(message)s",
+    )
+
+
+def create_file_handler(
+    log_file: str | Path,
+    log_file_max_bytes: int,
+    log_file_backup_count: int,
+    log_file_rotate_when: str | None,
+) -> logging.Handler:
+    if log_file_rotate_when is not None:
+        return TimedRotatingFileHandler(
+            log_file,
+            when=log_file_rotate_when,
+            backupCount=log_file_backup_count,
+            encoding="utf-8",
+        )
+
+    if log_file_max_bytes > 0:
+        return RotatingFileHandler(
+            log_file,
+            maxBytes=log_file_max_bytes,
+            backupCount=log_file_backup_count,
+            encoding="utf-8",
         )
 
+    return logging.FileHandler(log_file, encoding="utf-8")
+
 
 def setup_logger(
     logger: logging.Logger,
     log_level: int,
     log_file: str | Path | None,
+    log_format: LogFormat = "text",
+    log_file_max_bytes: int = 0,
+    log_file_backup_count: int = 5,
+    log_file_rotate_when: str | None = None,
+    log_queue: bool = False,
 ) -> None:
     logger.setLevel(log_level)
 
+    handlers: list[logging.Handler] = []
+
     stream_handler = logging.StreamHandler()
     stream_handler.setLevel(log_level)
-    stream_handler.setFormatter(
-        Iso8601WithTimezoneFormatter(
-            fmt="%(asctime)s %(levelname)s: %(message)s",
-        )
-    )
-
-    logger.addHandler(stream_handler)
+    stream_handler.setFormatter(create_formatter(log_format=log_format))
+    handlers.append(stream_handler)
 
     if log_file is not None:
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setLevel(log_level)
-        file_handler.setFormatter(
-            Iso8601WithTimezoneFormatter(
-                fmt="%(asctime)s %(levelname)s: %(message)s",
-            )
+        file_handler = create_file_handler(
+            log_file=log_file,
+            log_file_max_bytes=log_file_max_bytes,
+            log_file_backup_count=log_file_backup_count,
+            log_file_rotate_when=log_file_rotate_when,
         )
+        file_handler.setLevel(log_level)
+        file_handler.setFormatter(create_formatter(log_format=log_format))
+        handlers.append(file_handler)
 
-        logger.addHandler(file_handler)
+    # Correlates the logs of a Gradio event with its trace.
+    # The span is read in the logging thread, so the filter is not added
+    # to the handlers behind the queue
+    trace_context_filter = TraceContextFilter()
+
+    if not log_queue:
+        for handler in handlers:
+            handler.addFilter(trace_context_filter)
+            logger.addHandler(handler)
+        return
+
+    # The handlers run in the listener thread so that stalls of stdout or
+    # the disk do not block the request threads
+    log_record_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    queue_handler = DeferredFormatQueueHandler(log_record_queue)
+    queue_handler.setLevel(log_level)
+    queue_handler.addFilter(trace_context_filter)
+    logger.addHandler(queue_handler)
+
+    queue_listener = QueueListener(
+        log_record_queue,
+        *handlers,
+        respect_handler_level=True,
+    )
+    queue_listener.start()
+    # Flushes the queued records on exit
+    atexit.register(queue_listener.stop)
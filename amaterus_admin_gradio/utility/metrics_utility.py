@@ -0,0 +1,290 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    Optional,
+    ParamSpec,
+    Sequence,
+    Type,
+    TypeVar,
+)
+
+import httpx
+from fastapi import FastAPI, Response
+from gradio.context import LocalContext
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from pydantic import BaseModel
+
+from ..graphql_client.async_base_client import GraphQLBatchResult, GraphQLOperation
+from ..graphql_client.client import Client
+from ..graphql_client.exceptions import GraphQLClientError
+from .tracing_utility import set_span_attribute, start_span
+
+P = ParamSpec("P")
+R = TypeVar("R")
+ResultT = TypeVar("ResultT", bound=BaseModel)
+
+# Handlers wait on Hasura and external APIs, so the buckets reach 30 seconds
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+HANDLER_LATENCY_SECONDS = Histogram(
+    "amaterus_admin_gradio_handler_latency_seconds",
+    "Latency of Gradio event handlers",
+    ["tab", "handler"],
+    buckets=LATENCY_BUCKETS,
+)
+HANDLER_IN_FLIGHT = Gauge(
+    "amaterus_admin_gradio_handler_in_flight",
+    "Number of Gradio event handlers running",
+    ["tab", "handler"],
+)
+HANDLER_ERRORS_TOTAL = Counter(
+    "amaterus_admin_gradio_handler_errors_total",
+    "Number of Gradio event handlers that raised an exception",
+    ["tab", "handler", "error_type"],
+)
+
+GRAPHQL_OPERATION_LATENCY_SECONDS = Histogram(
+    "amaterus_admin_gradio_graphql_operation_latency_seconds",
+    "Latency of GraphQL requests to Hasura",
+    ["tab", "handler", "operation"],
+    buckets=LATENCY_BUCKETS,
+)
+GRAPHQL_OPERATION_IN_FLIGHT = Gauge(
+    "amaterus_admin_gradio_graphql_operation_in_flight",
+    "Number of GraphQL requests to Hasura waiting for a response",
+    ["tab", "handler", "operation"],
+)
+GRAPHQL_OPERATION_ERRORS_TOTAL = Counter(
+    "amaterus_admin_gradio_graphql_operation_errors_total",
+    "Number of GraphQL requests to Hasura that failed",
+    ["tab", "handler", "operation", "error_type"],
+)
+
+# The handler running in the current task, used to label GraphQL operations.
+# Empty outside of handlers (e.g. LiveUpdateSubscriber)
+current_handler: ContextVar[tuple[str, str]] = ContextVar(
+    "current_handler",
+    default=("", ""),
+)
+
+
+def get_gradio_event_queued_at_unix_nano() -> int | None:
+    # Gradio records when each event joined the queue
+    blocks = LocalContext.blocks.get()
+    event_id = LocalContext.event_id.get()
+    if blocks is None or blocks._queue is None or event_id is None:
+        return None
+
+    event_analytics = blocks._queue.event_analytics.get(event_id)
+    if event_analytics is None:
+        return None
+
+    queued_at = event_analytics.get("time")
+    if not isinstance(queued_at, float):
+        return None
+
+    return int(queued_at * 1_000_000_000)
+
+
+def instrument_handler(
+    tab: str,
+) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]:
+    # Records the metrics of the handler and a root span for the Gradio event
+    def decorator(fn: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        handler = fn.__name__
+
+        # functools.wraps keeps the signature Gradio inspects for the inputs
+        @wraps(fn)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            token = current_handler.set((tab, handler))
+            in_flight = HANDLER_IN_FLIGHT.labels(tab=tab, handler=handler)
+            in_flight.inc()
+            started_at = time.perf_counter()
+
+            queued_at_unix_nano = get_gradio_event_queued_at_unix_nano()
+            try:
+                with start_span(
+                    name=f"{tab}.{handler}",
+                    attributes={
+                        "gradio.tab": tab,
+                        "gradio.handler": handler,
+                        "gradio.event_id": LocalContext.event_id.get() or "",
+                    },
+                    start_time_unix_nano=queued_at_unix_nano,
+                ):
+                    if queued_at_unix_nano is not None:
+                        # Time spent waiting for a concurrency slot
+                        with start_span(
+                            name="gradio.queue",
+                            start_time_unix_nano=queued_at_unix_nano,
+                        ):
+                            pass
+
+                    return await fn(*args, **kwargs)
+            except Exception as error:
+                HANDLER_ERRORS_TOTAL.labels(
+                    tab=tab,
+                    handler=handler,
+                    error_type=type(error).__name__,
+                ).inc()
+                raise
+            finally:
+                HANDLER_LATENCY_SECONDS.labels(tab=tab, handler=handler).observe(
+                    time.perf_counter() - started_at
+                )
+                in_flight.dec()
+                current_handler.reset(token)
+
+        return wrapper
+
+    return decorator
+
+
+def count_graphql_operation_error(
+    operation: str,
+    error_type: str,
+) -> None:
+    tab, handler = current_handler.get()
+    GRAPHQL_OPERATION_ERRORS_TOTAL.labels(
+        tab=tab,
+        handler=handler,
+        operation=operation,
+        error_type=error_type,
+    ).inc()
+
+
+@contextmanager
+def observe_graphql_operation(operation: str) -> Iterator[None]:
+    tab, handler = current_handler.get()
+    in_flight = GRAPHQL_OPERATION_IN_FLIGHT.labels(
+        tab=tab,
+        handler=handler,
+        operation=operation,
+    )
+    in_flight.inc()
+    started_at = time.perf_counter()
+    try:
+        yield
+    except Exception as error:
+        count_graphql_operation_error(
+            operation=operation,
+            error_type=type(error).__name__,
+        )
+        raise
+    finally:
+        GRAPHQL_OPERATION_LATENCY_SECONDS.labels(
+            tab=tab,
+            handler=handler,
+            operation=operation,
+        ).observe(time.perf_counter() - started_at)
+        in_flight.dec()
+
+
+def set_graphql_response_span_attributes(response: httpx.Response) -> None:
+    set_span_attribute("http.request.body.size", len(response.request.content))
+    set_span_attribute("http.response.body.size", len(response.content))
+    set_span_attribute("http.response.status_code", response.status_code)
+
+
+class InstrumentedClient(Client):
+    async def execute(
+        self,
+        query: str,
+        operation_name: Optional[str] = None,
+        variables: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        operation = operation_name if operation_name is not None else "anonymous"
+        with start_span(
+            name=f"graphql {operation}",
+            attributes={"graphql.operation.name": operation},
+        ):
+            with observe_graphql_operation(operation=operation):
+                response = await super().execute(
+                    query=query,
+                    operation_name=operation_name,
+                    variables=variables,
+                    **kwargs,
+                )
+
+            set_graphql_response_span_attributes(response=response)
+
+        if not response.is_success:
+            count_graphql_operation_error(
+                operation=operation,
+                error_type=f"http_{response.status_code}",
+            )
+
+        return response
+
+    async def execute_batch(
+        self,
+        operations: Sequence[GraphQLOperation[Any]],
+        merge: bool = False,
+        **kwargs: Any,
+    ) -> GraphQLBatchResult:
+        operation = "+".join(operation.operation_name for operation in operations)
+        with start_span(
+            name=f"graphql {operation}",
+            attributes={
+                "graphql.operation.name": operation,
+                "graphql.batch.merge": merge,
+            },
+        ):
+            with observe_graphql_operation(operation=operation):
+                batch_result = await super().execute_batch(
+                    operations=operations,
+                    merge=merge,
+                    **kwargs,
+                )
+
+            set_graphql_response_span_attributes(response=batch_result.response)
+            return batch_result
+
+    def parse_response(
+        self,
+        response: httpx.Response,
+        result_type: Type[ResultT],
+    ) -> ResultT:
+        # GraphQL errors come with 200 responses and are raised here.
+        # The result types are named after their operations
+        try:
+            return super().parse_response(
+                response=response,
+                result_type=result_type,
+            )
+        except GraphQLClientError as error:
+            if response.is_success:
+                count_graphql_operation_error(
+                    operation=result_type.__name__,
+                    error_type=type(error).__name__,
+                )
+            raise
+
+
+def add_metrics_route(app: FastAPI) -> None:
+    async def get_metrics() -> Response:
+        return Response(
+            content=generate_latest(),
+            media_type=CONTENT_TYPE_LATEST,
+        )
+
+    app.add_api_route(
+        "/metrics",
+        get_metrics,
+        methods=["GET"],
+        include_in_schema=False,
+    )
@@ -0,0 +1,34 @@
+import asyncio
+from typing import Awaitable, Callable, Generic, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+# Shares one in-flight call (and its result or error) among the concurrent
+# callers with the same key. A call that has finished is not reused
+class SingleFlight(Generic[T]):
+    def __init__(self) -> None:
+        self._tasks: dict[tuple[int, Hashable], "asyncio.Future[T]"] = {}
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        # Tasks belong to an event loop
+        task_key = (id(asyncio.get_running_loop()), key)
+        task = self._tasks.get(task_key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._tasks[task_key] = task
+
+            def on_done(done_task: "asyncio.Future[T]") -> None:
+                if self._tasks.get(task_key) is done_task:
+                    del self._tasks[task_key]
+                # Retrieve the error in case every caller has been cancelled
+                if not done_task.cancelled():
+                    done_task.exception()
+
+            task.add_done_callback(on_done)
+
+        # A cancelled caller does not cancel the call shared with the others
+        return await asyncio.shield(task)
+
+    def get_in_flight_count(self) -> int:
+        return len(self._tasks)
@@ -0,0 +1,294 @@
+import abc
+import atexit
+import logging
+import queue
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Iterator, Literal, ParamSpec, TypeVar
+
+import httpx
+import orjson
+from pydantic import BaseModel, Field
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+SpanAttributeValue = str | int | float | bool
+
+SERVICE_NAME = "amaterus_admin_gradio"
+
+
+class Span(BaseModel):
+    trace_id: str
+    span_id: str
+    parent_span_id: str | None
+    name: str
+    start_time_unix_nano: int
+    end_time_unix_nano: int | None = None
+    attributes: dict[str, SpanAttributeValue] = Field(default_factory=dict)
+    status: Literal["unset", "ok", "error"] = "unset"
+    status_message: str | None = None
+
+
+def create_otlp_attribute(
+    key: str,
+    value: SpanAttributeValue,
+) -> dict[str, Any]:
+    # bool is checked first because it is a subclass of int
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": value}}
+
+
+def create_otlp_traces_json(spans: list[Span]) -> bytes:
+    # OTLP/JSON ExportTraceServiceRequest, as accepted by an OpenTelemetry
+    # collector on /v1/traces and written by its file exporter
+    status_codes = {"unset": 0, "ok": 1, "error": 2}
+    return orjson.dumps(
+        {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [
+                            create_otlp_attribute("service.name", SERVICE_NAME),
+                        ],
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": SERVICE_NAME},
+                            "spans": [
+                                {
+                                    "traceId": span.trace_id,
+                                    "spanId": span.span_id,
+                                    "parentSpanId": span.parent_span_id or "",
+                                    "name": span.name,
+                                    "kind": 1,
+                                    "startTimeUnixNano": str(span.start_time_unix_nano),
+                                    "endTimeUnixNano": str(span.end_time_unix_nano),
+                                    "attributes": [
+                                        create_otlp_attribute(key, value)
+                                        for key, value in span.attributes.items()
+                                    ],
+                                    "status": {
+                                        "code": status_codes[span.status],
+                                        "message": span.status_message or "",
+                                    },
+                                }
+                                for span in spans
+                            ],
+                        }
+                    ],
+                }
+            ],
+        }
+    )
+
+
+class SpanExporter(abc.ABC):
+    @abc.abstractmethod
+    def export(self, spans: list[Span]) -> None: ...
+
+    @abc.abstractmethod
+    def close(self) -> None: ...
+
+
+class FileSpanExporter(SpanExporter):
+    def __init__(self, trace_file: Path) -> None:
+        trace_file.parent.mkdir(parents=True, exist_ok=True)
+        self._trace_file = trace_file.open("ab")
+
+    def export(self, spans: list[Span]) -> None:
+        # One OTLP/JSON request per line
+        self._trace_file.write(create_otlp_traces_json(spans=spans) + b"\n")
+        self._trace_file.flush()
+
+    def close(self) -> None:
+        self._trace_file.close()
+
+
+class OtlpHttpSpanExporter(SpanExporter):
+    def __init__(self, endpoint: str) -> None:
+        self.endpoint = endpoint
+        self._http_client = httpx.Client(timeout=10.0)
+
+    def export(self, spans: list[Span]) -> None:
+        res = self._http_client.post(
+            self.endpoint,
+            content=create_otlp_traces_json(spans=spans),
+            headers={"Content-Type": "application/json"},
+        )
+        res.raise_for_status()
+
+    def close(self) -> None:
+        self._http_client.close()
+
+
+class BatchSpanProcessor:
+    def __init__(
+        self,
+        exporters: list[SpanExporter],
+        logger: logging.Logger,
+        max_batch_size: int = 512,
+        flush_interval: float = 1.0,
+    ) -> None:
+        self.exporters = exporters
+        self.logger = logger
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+
+        # Spans are exported from a thread so that handlers never wait on I/O
+        self._queue: queue.Queue[Span | None] = queue.Queue(maxsize=10000)
+        self._thread = threading.Thread(
+            target=self._run,
+            name="BatchSpanProcessor",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def on_end(self, span: Span) -> None:
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            self.logger.warning("Span dropped: %s", span.name)
+
+    def _export(self, spans: list[Span]) -> None:
+        for exporter in self.exporters:
+            try:
+                exporter.export(spans=spans)
+            except Exception:
+                self.logger.exception(
+                    "Failed to export %d spans with %s",
+                    len(spans),
+                    type(exporter).__name__,
+                )
+
+    def _run(self) -> None:
+        is_closed = False
+        while not is_closed:
+            spans: list[Span] = []
+            deadline = time.monotonic() + self.flush_interval
+            while len(spans) < self.max_batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+
+                try:
+                    span = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+
+                if span is None:
+                    is_closed = True
+                    break
+
+                spans.append(span)
+
+            if len(spans) > 0:
+                self._export(spans=spans)
+
+        for exporter in self.exporters:
+            exporter.close()
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._thread.join(timeout=10.0)
+
+
+_span_processor: BatchSpanProcessor | None = None
+
+current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+
+def setup_tracing(
+    exporters: list[SpanExporter],
+    logger: logging.Logger,
+) -> None:
+    # Without exporters, spans are still created for the log correlation IDs
+    global _span_processor
+    if len(exporters) == 0:
+        return
+
+    span_processor = BatchSpanProcessor(
+        exporters=exporters,
+        logger=logger,
+    )
+    atexit.register(span_processor.close)
+    _span_processor = span_processor
+
+
+def set_span_attribute(
+    key: str,
+    value: SpanAttributeValue,
+) -> None:
+    span = current_span.get()
+    if span is not None:
+        span.attributes[key] = value
+
+
+@contextmanager
+def start_span(
+    name: str,
+    attributes: dict[str, SpanAttributeValue] | None = None,
+    start_time_unix_nano: int | None = None,
+) -> Iterator[Span]:
+    # A span without a parent starts a new trace
+    parent_span = current_span.get()
+    span = Span(
+        trace_id=(
+            parent_span.trace_id if parent_span is not None else secrets.token_hex(16)
+        ),
+        span_id=secrets.token_hex(8),
+        parent_span_id=parent_span.span_id if parent_span is not None else None,
+        name=name,
+        start_time_unix_nano=(
+            start_time_unix_nano if start_time_unix_nano is not None else time.time_ns()
+        ),
+        attributes=dict(attributes) if attributes is not None else {},
+    )
+
+    token = current_span.set(span)
+    try:
+        yield span
+    except BaseException as error:
+        span.status = "error"
+        span.status_message = f"{type(error).__name__}: {error}"
+        raise
+    finally:
+        span.end_time_unix_nano = time.time_ns()
+        current_span.reset(token)
+
+        span_processor = _span_processor
+        if span_processor is not None:
+            span_processor.on_end(span)
+
+
+def trace_async(
+    name: str,
+) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]:
+    def decorator(fn: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        @wraps(fn)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            with start_span(name=name):
+                return await fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class TraceContextFilter(logging.Filter):
+    # Adds the IDs of the current span to log records as correlation IDs
+    def filter(self, record: logging.LogRecord) -> bool:
+        span = current_span.get()
+        record.trace_id = span.trace_id if span is not None else "-"
+        record.span_id = span.span_id if span is not None else "-"
+        return True
@@ -0,0 +1,282 @@
+import gzip
+import logging
+import time
+from argparse import ArgumentParser
+from typing import Any
+from uuid import UUID, uuid4
+
+import httpx
+import orjson
+from amaterus_admin_gradio.__main__ import create_gradio_blocks
+from amaterus_admin_gradio.external_api import (
+    ExternalApiHttpClientConfig,
+    ExternalApiHttpClients,
+    ExternalApiMetadataCache,
+    ExternalApiPrefetcher,
+    YoutubeApiQuotaTracker,
+)
+from amaterus_admin_gradio.graphql_client import Client
+from amaterus_admin_gradio.store import (
+    PersonAccountIndexStore,
+    ProgramListStore,
+    ReferenceDataStore,
+)
+from amaterus_admin_gradio.tab import EventConcurrencyConfig
+
+GRAPHQL_URL = "http://localhost:8080/v1/graphql"
+
+
+def create_reference_data_handler(
+    item_count: int,
+) -> httpx.MockTransport:
+    def named_list(prefix: str) -> list[dict[str, Any]]:
+        return [
+            {
+                "id": str(UUID(int=index)),
+                "name": f"{prefix} {index}",
+            }
+            for index in range(item_count)
+        ]
+
+    content = orjson.dumps(
+        {
+            "data": {
+                "project_list": named_list("Project"),
+                "person_list": named_list("Person"),
+                "game_list": named_list("Game"),
+                "twitter_account_list": [
+                    {
+                        **twitter_account,
+                        "twitter_screen_name": f"account{index}",
+                    }
+                    for index, twitter_account in enumerate(named_list("Account"))
+                ],
+            },
+        }
+    )
+
+    return httpx.MockTransport(
+        lambda request: httpx.Response(status_code=200, content=content),
+    )
+
+
+def run_event(
+    gradio_url: str,
+    config: dict[str, Any],
+    fn_index: int,
+    trigger_id: int | None,
+    session_hash: str,
+) -> None:
+    dependency = config["dependencies"][fn_index]
+
+    res = httpx.post(
+        f"{gradio_url}queue/join",
+        json={
+            "fn_index": fn_index,
+            "data": [None] * len(dependency["inputs"]),
+            "event_data": None,
+            "trigger_id": trigger_id,
+            "session_hash": session_hash,
+        },
+    )
+    res.raise_for_status()
+
+    output: dict[str, Any] | None = None
+    with httpx.stream(
+        "GET",
+        f"{gradio_url}queue/data",
+        params={"session_hash": session_hash},
+        timeout=60,
+    ) as stream:
+        for line in stream.iter_lines():
+            if not line.startswith("data:"):
+                continue
+
+            message = orjson.loads(line[len("data:") :])
+            if message["msg"] == "process_completed":
+                if not message["success"]:
+                    raise Exception(f"Event {fn_index} failed: {message}")
+                output = message["output"]
+                break
+
+    if output is None:
+        raise Exception(f"Event {fn_index} did not complete")
+
+    # Follow the state changes like the frontend (e.g. the render of a tab)
+    for state_id in output.get("changed_state_ids") or []:
+        for index, state_dependency in enumerate(config["dependencies"]):
+            if [state_id, "change"] in state_dependency["targets"]:
+                run_event(
+                    gradio_url=gradio_url,
+                    config=config,
+                    fn_index=index,
+                    trigger_id=state_id,
+                    session_hash=session_hash,
+                )
+
+
+def main() -> None:
+    parser = ArgumentParser(
+        description=(
+            "Measure the page config size and the time until the Gradio app "
+            "and each tab become interactive (without a browser)"
+        ),
+    )
+    parser.add_argument(
+        "--item_count",
+        type=int,
+        default=100,
+        help="Number of projects, persons, games and X accounts",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=10,
+    )
+    args = parser.parse_args()
+
+    item_count: int = args.item_count
+    repeat: int = args.repeat
+
+    logger = logging.getLogger("benchmark_gradio_page_load")
+
+    graphql_client = Client(
+        url=GRAPHQL_URL,
+        http_client=httpx.AsyncClient(
+            transport=create_reference_data_handler(item_count=item_count),
+        ),
+    )
+
+    started_at = time.perf_counter()
+    demo = create_gradio_blocks(
+        graphql_client=graphql_client,
+        reference_data_store=ReferenceDataStore(
+            graphql_client=graphql_client,
+            ttl_seconds=600,
+            logger=logger,
+        ),
+        program_list_store=ProgramListStore(
+            graphql_client=graphql_client,
+            ttl_seconds=600,
+            logger=logger,
+        ),
+        person_account_index_store=PersonAccountIndexStore(
+            graphql_client=graphql_client,
+            ttl_seconds=600,
+            logger=logger,
+        ),
+        youtube_api_key="",
+        external_api_http_clients=ExternalApiHttpClients(
+            config=ExternalApiHttpClientConfig(
+                connect_timeout=5,
+                read_timeout=15,
+                max_connections=20,
+                keepalive_expiry=60,
+                http2=False,
+            ),
+        ),
+        external_api_metadata_cache=ExternalApiMetadataCache(
+            database_file=None,
+            max_bytes=1024 * 1024,
+            ttl_seconds_by_provider={
+                "youtube": 60,
+                "niconico": 60,
+                "twitter": 60,
+            },
+            logger=logger,
+        ),
+        youtube_api_quota_tracker=YoutubeApiQuotaTracker(
+            database_file=None,
+            daily_quota=10000,
+            logger=logger,
+        ),
+        external_api_prefetcher=ExternalApiPrefetcher(
+            debounce_seconds=0.5,
+            logger=logger,
+        ),
+        event_concurrency_config=EventConcurrencyConfig(
+            hasura_concurrency_limit=16,
+            external_api_concurrency_limit=8,
+        ),
+        logger=logger,
+    )
+    build_seconds = time.perf_counter() - started_at
+
+    _, gradio_url, _ = demo.launch(
+        prevent_thread_lock=True,
+        quiet=True,
+    )
+
+    try:
+        config_bytes = b""
+        page_load_seconds = 0.0
+        for _ in range(repeat):
+            started_at = time.perf_counter()
+            httpx.get(gradio_url).raise_for_status()
+            res = httpx.get(f"{gradio_url}config")
+            res.raise_for_status()
+            page_load_seconds += time.perf_counter() - started_at
+            config_bytes = res.content
+
+        config: dict[str, Any] = orjson.loads(config_bytes)
+        root_id: int = demo._id
+
+        # Events run on page load (e.g. the render of the first tab)
+        interactive_seconds = 0.0
+        for _ in range(repeat):
+            session_hash = uuid4().hex
+            started_at = time.perf_counter()
+            for index, dependency in enumerate(config["dependencies"]):
+                if [root_id, "load"] in dependency["targets"]:
+                    run_event(
+                        gradio_url=gradio_url,
+                        config=config,
+                        fn_index=index,
+                        trigger_id=root_id,
+                        session_hash=session_hash,
+                    )
+            interactive_seconds += time.perf_counter() - started_at
+
+        print(f"build_ms\t{build_seconds * 1000:.0f}")
+        print(f"component_count\t{len(config['components'])}")
+        print(f"dependency_count\t{len(config['dependencies'])}")
+        print(f"config_bytes\t{len(config_bytes)}")
+        print(f"config_gzip_bytes\t{len(gzip.compress(config_bytes))}")
+        print(f"page_load_ms\t{page_load_seconds / repeat * 1000:.2f}")
+        print(
+            "time_to_interactive_ms\t"
+            f"{(page_load_seconds + interactive_seconds) / repeat * 1000:.2f}"
+        )
+
+        # Time until each tab is interactive after its first selection
+        print("tab\tfirst_select_ms")
+        for component in config["components"]:
+            if component["type"] != "tabitem":
+                continue
+
+            tab_id: int = component["id"]
+            select_seconds = 0.0
+            for _ in range(repeat):
+                session_hash = uuid4().hex
+                started_at = time.perf_counter()
+                for index, dependency in enumerate(config["dependencies"]):
+                    if [tab_id, "select"] in dependency["targets"]:
+                        run_event(
+                            gradio_url=gradio_url,
+                            config=config,
+                            fn_index=index,
+                            trigger_id=tab_id,
+                            session_hash=session_hash,
+                        )
+                select_seconds += time.perf_counter() - started_at
+
+            print(
+                f"{component['props']['label']}\t"
+                f"{select_seconds / repeat * 1000:.2f}"
+            )
+    finally:
+        demo.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+import json
+import time
+import tracemalloc
+from argparse import ArgumentParser
+from functools import partial
+from typing import Any, Callable
+from uuid import UUID
+
+import httpx
+import orjson
+from amaterus_admin_gradio.graphql_client import Client, GetReferenceData
+from amaterus_admin_gradio.tab import (
+    create_program_youtube_live_live_archives_bulk_tab as bulk_tab,
+)
+from pydantic import BaseModel
+from pydantic_core import to_jsonable_python
+
+GRAPHQL_URL = "http://localhost:8080/v1/graphql"
+
+
+class BenchmarkResult(BaseModel):
+    mean_seconds: float
+    peak_memory_bytes: int
+
+
+def benchmark(
+    func: Callable[[], Any],
+    repeat: int,
+) -> BenchmarkResult:
+    tracemalloc.start()
+    func()
+    _, peak_memory_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    started_at = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    elapsed_seconds = time.perf_counter() - started_at
+
+    return BenchmarkResult(
+        mean_seconds=elapsed_seconds / repeat,
+        peak_memory_bytes=peak_memory_bytes,
+    )
+
+
+def create_bulk_insert_payload(
+    graphql_client: Client,
+    item_count: int,
+) -> dict[str, Any]:
+    objects = [
+        bulk_tab.create_program_live_archive_insert_input(
+            program_id=str(UUID(int=index)),
+            person_id=str(UUID(int=index + 1)),
+            remote_youtube_video_id=f"video{index:06d}",
+            title=f"Live archive {index}",
+            remote_youtube_channel_id=f"channel{index % 100:04d}",
+            youtube_channel_name=f"Channel {index % 100}",
+            start_time="2024-07-01T12:00:00+09:00",
+            end_time="2024-07-01T14:00:00+09:00",
+        )
+        for index in range(item_count)
+    ]
+    variables, _, _ = graphql_client._process_variables({"objects": objects})
+    return {
+        "query": "mutation CreateProgramYoutubeLiveLiveArchives { __typename }",
+        "operationName": "CreateProgramYoutubeLiveLiveArchives",
+        "variables": variables,
+    }
+
+
+def create_reference_data_response(item_count: int) -> httpx.Response:
+    def named_list(prefix: str) -> list[dict[str, Any]]:
+        return [
+            {
+                "id": str(UUID(int=index)),
+                "name": f"{prefix} {index}",
+            }
+            for index in range(item_count)
+        ]
+
+    return httpx.Response(
+        status_code=200,
+        content=orjson.dumps(
+            {
+                "data": {
+                    "project_list": named_list("Project"),
+                    "person_list": named_list("Person"),
+                    "game_list": named_list("Game"),
+                    "twitter_account_list": [
+                        {
+                            **twitter_account,
+                            "twitter_screen_name": f"account{index}",
+                        }
+                        for index, twitter_account in enumerate(named_list("Account"))
+                    ],
+                },
+            }
+        ),
+        request=httpx.Request("POST", GRAPHQL_URL),
+    )
+
+
+def encode_json(payload: dict[str, Any]) -> bytes:
+    return json.dumps(payload, default=to_jsonable_python).encode("utf-8")
+
+
+def encode_orjson(payload: dict[str, Any]) -> bytes:
+    return orjson.dumps(payload, default=to_jsonable_python)
+
+
+def decode_dict(response: httpx.Response) -> GetReferenceData:
+    # response.json() and model_validate on the intermediate dict
+    return GetReferenceData.model_validate(json.loads(response.content)["data"])
+
+
+def decode_bytes(
+    graphql_client: Client,
+    response: httpx.Response,
+) -> GetReferenceData:
+    return graphql_client.parse_response(
+        response=response,
+        result_type=GetReferenceData,
+    )
+
+
+def main() -> None:
+    parser = ArgumentParser(
+        description=(
+            "Compare the json module and dict validation with orjson and "
+            "model_validate_json in the GraphQL client on list-sized payloads"
+        ),
+    )
+    parser.add_argument(
+        "--item_count",
+        type=int,
+        action="append",
+        default=[],
+        help="Number of list items (repeatable, default: 100, 1000 and 10000)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=10,
+    )
+    args = parser.parse_args()
+
+    item_counts: list[int] = args.item_count
+    repeat: int = args.repeat
+
+    if len(item_counts) == 0:
+        item_counts = [100, 1000, 10000]
+
+    graphql_client = Client(url=GRAPHQL_URL)
+
+    print("payload\titem_count\tbytes\tpath\tmean_ms\tpeak_memory_kib")
+    for item_count in item_counts:
+        payload = create_bulk_insert_payload(
+            graphql_client=graphql_client,
+            item_count=item_count,
+        )
+        if json.loads(encode_json(payload)) != orjson.loads(encode_orjson(payload)):
+            raise Exception("Encoded payloads differ")
+
+        response = create_reference_data_response(item_count=item_count)
+        if decode_dict(response) != decode_bytes(graphql_client, response):
+            raise Exception("Decoded results differ")
+
+        cases: list[tuple[str, int, str, Callable[[], Any]]] = [
+            (
+                "encode_bulk_insert",
+                len(encode_orjson(payload)),
+                "json",
+                partial(encode_json, payload),
+            ),
+            (
+                "encode_bulk_insert",
+                len(encode_orjson(payload)),
+                "orjson",
+                partial(encode_orjson, payload),
+            ),
+            (
+                "decode_reference_data",
+                len(response.content),
+                "dict",
+                partial(decode_dict, response),
+            ),
+            (
+                "decode_reference_data",
+                len(response.content),
+                "bytes",
+                partial(decode_bytes, graphql_client, response),
+            ),
+        ]
+        for payload_name, payload_bytes, path_name, func in cases:
+            result = benchmark(func=func, repeat=repeat)
+            print(
+                f"{payload_name}\t{item_count}\t{payload_bytes}\t{path_name}\t"
+                f"{result.mean_seconds * 1000:.2f}\t"
+                f"{result.peak_memory_bytes / 1024:.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
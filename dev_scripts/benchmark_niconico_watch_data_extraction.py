@@ -0,0 +1,195 @@
+import asyncio
+import time
+import tracemalloc
+from argparse import ArgumentParser
+from functools import partial
+from pathlib import Path
+from typing import AsyncIterator, Awaitable, Callable
+
+import httpx
+from amaterus_admin_gradio.external_api import (
+    extract_niconico_api_data_json_text_html5lib,
+    extract_niconico_api_data_json_text_streaming,
+)
+from pydantic import BaseModel
+
+NICONICO_USER_AGENT = (
+    "facebookexternalhit/1.1;Googlebot/2.1;Amaterusbot (+https://amaterus.aoirint.com)"
+)
+
+
+class BenchmarkResult(BaseModel):
+    mean_seconds: float
+    peak_memory_bytes: int
+    read_characters: int
+    found: bool
+
+
+def record_watch_page(
+    remote_niconico_content_id: str,
+    watch_page_dir: Path,
+) -> Path:
+    res = httpx.get(
+        f"https://www.nicovideo.jp/watch/{remote_niconico_content_id}",
+        headers={
+            "User-Agent": NICONICO_USER_AGENT,
+        },
+        follow_redirects=True,
+    )
+    res.raise_for_status()
+
+    watch_page_file = watch_page_dir / f"{remote_niconico_content_id}.html"
+    watch_page_file.write_text(res.text, encoding="utf-8")
+    return watch_page_file
+
+
+async def iter_html_chunks(
+    html: str,
+    chunk_size: int,
+    read_counter: list[int],
+) -> AsyncIterator[str]:
+    for index in range(0, len(html), chunk_size):
+        html_chunk = html[index : index + chunk_size]
+        read_counter[0] += len(html_chunk)
+        yield html_chunk
+
+
+async def extract_streaming(
+    read_counter: list[int],
+    html: str,
+    chunk_size: int,
+) -> str | None:
+    # Same extractor as fetch_niconico_video_data, fed from memory
+    return await extract_niconico_api_data_json_text_streaming(
+        html_chunks=iter_html_chunks(
+            html=html,
+            chunk_size=chunk_size,
+            read_counter=read_counter,
+        ),
+    )
+
+
+async def extract_html5lib(
+    read_counter: list[int],
+    html: str,
+) -> str | None:
+    read_counter[0] += len(html)
+    return extract_niconico_api_data_json_text_html5lib(html=html)
+
+
+async def benchmark(
+    extract: Callable[[list[int]], Awaitable[str | None]],
+    repeat: int,
+) -> BenchmarkResult:
+    read_counter = [0]
+    tracemalloc.start()
+    api_data_json_text = await extract(read_counter)
+    _, peak_memory_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    started_at = time.perf_counter()
+    for _ in range(repeat):
+        await extract([0])
+    elapsed_seconds = time.perf_counter() - started_at
+
+    return BenchmarkResult(
+        mean_seconds=elapsed_seconds / repeat,
+        peak_memory_bytes=peak_memory_bytes,
+        read_characters=read_counter[0],
+        found=api_data_json_text is not None,
+    )
+
+
+async def main() -> None:
+    parser = ArgumentParser(
+        description=(
+            "Compare the streaming extractor of js-initial-watch-data "
+            "with the full html5lib parse on recorded Niconico watch pages"
+        ),
+    )
+    parser.add_argument(
+        "watch_page_files",
+        type=Path,
+        nargs="*",
+    )
+    parser.add_argument(
+        "--watch_page_dir",
+        type=Path,
+        default=Path("work/niconico_watch_pages"),
+    )
+    parser.add_argument(
+        "--record_content_id",
+        type=str,
+        action="append",
+        default=[],
+        help="Download a watch page (e.g. sm9) into watch_page_dir first",
+    )
+    parser.add_argument(
+        "--chunk_size",
+        type=int,
+        default=65536,
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=10,
+    )
+    args = parser.parse_args()
+
+    watch_page_files: list[Path] = args.watch_page_files
+    watch_page_dir: Path = args.watch_page_dir
+    record_content_ids: list[str] = args.record_content_id
+    chunk_size: int = args.chunk_size
+    repeat: int = args.repeat
+
+    if len(record_content_ids) > 0:
+        watch_page_dir.mkdir(parents=True, exist_ok=True)
+        for remote_niconico_content_id in record_content_ids:
+            record_watch_page(
+                remote_niconico_content_id=remote_niconico_content_id,
+                watch_page_dir=watch_page_dir,
+            )
+
+    if len(watch_page_files) == 0 and watch_page_dir.exists():
+        watch_page_files = sorted(watch_page_dir.glob("*.html"))
+
+    if len(watch_page_files) == 0:
+        raise Exception("No recorded watch page")
+
+    print(
+        "file\tpath\tmean_ms\tpeak_memory_kib\tread_characters\t"
+        "total_characters\tfound"
+    )
+    for watch_page_file in watch_page_files:
+        html = watch_page_file.read_text(encoding="utf-8")
+
+        streaming_result = await benchmark(
+            extract=partial(
+                extract_streaming,
+                html=html,
+                chunk_size=chunk_size,
+            ),
+            repeat=repeat,
+        )
+        html5lib_result = await benchmark(
+            extract=partial(
+                extract_html5lib,
+                html=html,
+            ),
+            repeat=repeat,
+        )
+
+        for path_name, result in (
+            ("streaming", streaming_result),
+            ("html5lib", html5lib_result),
+        ):
+            print(
+                f"{watch_page_file.name}\t{path_name}\t"
+                f"{result.mean_seconds * 1000:.2f}\t"
+                f"{result.peak_memory_bytes / 1024:.0f}\t"
+                f"{result.read_characters}\t{len(html)}\t{result.found}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
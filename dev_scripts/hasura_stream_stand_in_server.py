@@ -0,0 +1,169 @@
+import asyncio
+import json
+from argparse import ArgumentParser
+from pathlib import Path
+from typing import Any
+
+from graphql import FieldNode, OperationDefinitionNode, parse
+from websockets.server import WebSocketServerProtocol, serve
+from websockets.typing import Subprotocol
+
+GRAPHQL_TRANSPORT_WS = "graphql-transport-ws"
+
+
+def get_root_field(query: str) -> tuple[str, str]:
+    document = parse(query)
+    for definition in document.definitions:
+        if not isinstance(definition, OperationDefinitionNode):
+            continue
+
+        for selection in definition.selection_set.selections:
+            if not isinstance(selection, FieldNode):
+                continue
+
+            field_name = selection.name.value
+            response_key = (
+                selection.alias.value if selection.alias is not None else field_name
+            )
+            return field_name, response_key
+
+    raise Exception("Subscription has no root field")
+
+
+async def send_batches(
+    websocket: WebSocketServerProtocol,
+    operation_id: str,
+    response_key: str,
+    batches: list[list[dict[str, Any]]],
+    interval: float,
+) -> None:
+    for batch in batches:
+        await asyncio.sleep(interval)
+        await websocket.send(
+            json.dumps(
+                {
+                    "id": operation_id,
+                    "type": "next",
+                    "payload": {
+                        "data": {
+                            response_key: batch,
+                        },
+                    },
+                }
+            )
+        )
+
+
+async def handle_connection(
+    websocket: WebSocketServerProtocol,
+    fixture: dict[str, list[list[dict[str, Any]]]],
+    interval: float,
+) -> None:
+    tasks: list[asyncio.Task[None]] = []
+    try:
+        async for message in websocket:
+            message_dict = json.loads(message)
+            message_type = message_dict.get("type")
+
+            if message_type == "connection_init":
+                await websocket.send(json.dumps({"type": "connection_ack"}))
+            elif message_type == "ping":
+                await websocket.send(json.dumps({"type": "pong"}))
+            elif message_type == "subscribe":
+                operation_id = message_dict["id"]
+                payload = message_dict["payload"]
+
+                field_name, response_key = get_root_field(query=payload["query"])
+                print(
+                    f"Subscribe {payload.get('operationName')} ({field_name}) "
+                    f"variables={payload.get('variables')}"
+                )
+
+                # The stream stays open after the fixture is exhausted,
+                # like a Hasura stream with no new rows
+                tasks.append(
+                    asyncio.create_task(
+                        send_batches(
+                            websocket=websocket,
+                            operation_id=operation_id,
+                            response_key=response_key,
+                            batches=fixture.get(field_name, []),
+                            interval=interval,
+                        )
+                    )
+                )
+            elif message_type == "complete":
+                pass
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def run_server(
+    host: str,
+    port: int,
+    fixture: dict[str, list[list[dict[str, Any]]]],
+    interval: float,
+) -> None:
+    async with serve(
+        lambda websocket: handle_connection(
+            websocket=websocket,
+            fixture=fixture,
+            interval=interval,
+        ),
+        host=host,
+        port=port,
+        subprotocols=[Subprotocol(GRAPHQL_TRANSPORT_WS)],
+    ):
+        print(f"Listening on ws://{host}:{port}")
+        await asyncio.Future()
+
+
+def main() -> None:
+    parser = ArgumentParser(
+        description=(
+            "Local graphql-transport-ws server that replays Hasura *_stream "
+            "batches from a fixture file"
+        ),
+    )
+    parser.add_argument(
+        "--host",
+        type=str,
+        default="127.0.0.1",
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=8765,
+    )
+    parser.add_argument(
+        "--fixture_file",
+        type=Path,
+        default=Path(__file__).parent / "hasura_stream_stand_in_fixture.json",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=1.0,
+    )
+    args = parser.parse_args()
+
+    host: str = args.host
+    port: int = args.port
+    fixture_file: Path = args.fixture_file
+    interval: float = args.interval
+
+    fixture = json.loads(fixture_file.read_text(encoding="utf-8"))
+
+    asyncio.run(
+        run_server(
+            host=host,
+            port=port,
+            fixture=fixture,
+            interval=interval,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
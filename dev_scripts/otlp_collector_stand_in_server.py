@@ -0,0 +1,108 @@
+import json
+from argparse import ArgumentParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+
+def format_attribute_value(value: dict[str, Any]) -> str:
+    for key in ("stringValue", "intValue", "doubleValue", "boolValue"):
+        if key in value:
+            return str(value[key])
+    return json.dumps(value)
+
+
+def print_spans(request_dict: dict[str, Any]) -> None:
+    for resource_spans in request_dict.get("resourceSpans", []):
+        for scope_spans in resource_spans.get("scopeSpans", []):
+            for span in scope_spans.get("spans", []):
+                duration_ms = (
+                    int(span["endTimeUnixNano"]) - int(span["startTimeUnixNano"])
+                ) / 1_000_000
+                attributes = " ".join(
+                    f"{attribute['key']}={format_attribute_value(attribute['value'])}"
+                    for attribute in span.get("attributes", [])
+                )
+                print(
+                    f"{span['traceId']} {span['spanId']} "
+                    f"parent={span.get('parentSpanId') or '-'} "
+                    f"{span['name']} {duration_ms:.1f}ms "
+                    f"status={span.get('status', {}).get('code', 0)} "
+                    f"{attributes}"
+                )
+
+
+def create_request_handler(
+    output_file: Path | None,
+) -> type[BaseHTTPRequestHandler]:
+    class OtlpRequestHandler(BaseHTTPRequestHandler):
+        def do_POST(self) -> None:
+            if self.path != "/v1/traces":
+                self.send_error(404)
+                return
+
+            content_length = int(self.headers.get("Content-Length", "0"))
+            content = self.rfile.read(content_length)
+            request_dict = json.loads(content)
+
+            print_spans(request_dict=request_dict)
+            if output_file is not None:
+                with output_file.open("ab") as fp:
+                    fp.write(content + b"\n")
+
+            body = b"{}"
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    return OtlpRequestHandler
+
+
+def main() -> None:
+    parser = ArgumentParser(
+        description=(
+            "Accept OTLP/JSON traces on /v1/traces like an OpenTelemetry collector "
+            "and print the spans"
+        ),
+    )
+    parser.add_argument(
+        "--host",
+        type=str,
+        default="127.0.0.1",
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=4318,
+    )
+    parser.add_argument(
+        "--output_file",
+        type=Path,
+        help="Append the received requests as JSON lines",
+    )
+    args = parser.parse_args()
+
+    host: str = args.host
+    port: int = args.port
+    output_file: Path | None = args.output_file
+
+    server = ThreadingHTTPServer(
+        (host, port),
+        create_request_handler(output_file=output_file),
+    )
+    print(f"Listening on http://{host}:{port}/v1/traces")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+import ast
+import copy
+
+from ariadne_codegen.client_generators.constants import (
+    EXCEPTIONS_FILE_PATH,
+    GRAPHQL_CLIENT_EXCEPTIONS_NAMES,
+)
+from ariadne_codegen.plugins.base import Plugin
+
+BASE_CLIENT_MODULE_NAME = "async_base_client"
+BATCH_NAMES = ["GraphQLBatchResult", "GraphQLOperation"]
+
+
+def is_execute_assign(statement: ast.stmt) -> bool:
+    # response = await self.execute(...)
+    return (
+        isinstance(statement, ast.Assign)
+        and isinstance(statement.value, ast.Await)
+        and isinstance(statement.value.value, ast.Call)
+        and isinstance(statement.value.value.func, ast.Attribute)
+        and statement.value.value.func.attr == "execute"
+    )
+
+
+def generate_operation_method(
+    method_def: ast.AsyncFunctionDef,
+) -> ast.FunctionDef | None:
+    execute_index = next(
+        (
+            index
+            for index, statement in enumerate(method_def.body)
+            if is_execute_assign(statement)
+        ),
+        None,
+    )
+    if execute_index is None or not isinstance(method_def.returns, ast.Name):
+        return None
+
+    execute_statement = method_def.body[execute_index]
+    assert isinstance(execute_statement, ast.Assign)
+    assert isinstance(execute_statement.value, ast.Await)
+    assert isinstance(execute_statement.value.value, ast.Call)
+
+    result_type_name = method_def.returns.id
+    operation_name_keyword = next(
+        keyword
+        for keyword in execute_statement.value.value.keywords
+        if keyword.arg == "operation_name"
+    )
+
+    arguments = copy.deepcopy(method_def.args)
+    # HTTP options are given to execute_batch instead
+    arguments.kwarg = None
+
+    return ast.FunctionDef(
+        name=f"{method_def.name}_operation",
+        args=arguments,
+        body=[
+            *copy.deepcopy(method_def.body[:execute_index]),
+            ast.Return(
+                value=ast.Call(
+                    func=ast.Name(id="GraphQLOperation"),
+                    args=[],
+                    keywords=[
+                        ast.keyword(arg="query", value=ast.Name(id="query")),
+                        copy.deepcopy(operation_name_keyword),
+                        ast.keyword(arg="variables", value=ast.Name(id="variables")),
+                        ast.keyword(
+                            arg="result_type",
+                            value=ast.Name(id=result_type_name),
+                        ),
+                    ],
+                ),
+            ),
+        ],
+        decorator_list=[],
+        returns=ast.Subscript(
+            value=ast.Name(id="GraphQLOperation"),
+            slice=ast.Name(id=result_type_name),
+        ),
+        lineno=method_def.lineno,
+    )
+
+
+class BatchOperationPlugin(Plugin):
+    # Adds a "<method>_operation" builder next to every query and mutation
+    # method, to be sent together with AsyncBaseClient.execute_batch
+
+    def generate_client_class(self, class_def: ast.ClassDef) -> ast.ClassDef:
+        body: list[ast.stmt] = []
+        for statement in class_def.body:
+            body.append(statement)
+            if not isinstance(statement, ast.AsyncFunctionDef):
+                continue
+
+            operation_method = generate_operation_method(statement)
+            if operation_method is not None:
+                body.append(operation_method)
+
+        class_def.body = body
+        return class_def
+
+    def generate_client_module(self, module: ast.Module) -> ast.Module:
+        for statement in module.body:
+            if (
+                isinstance(statement, ast.ImportFrom)
+                and statement.module == BASE_CLIENT_MODULE_NAME
+            ):
+                statement.names.append(ast.alias(name="GraphQLOperation"))
+        return module
+
+    def generate_init_module(self, module: ast.Module) -> ast.Module:
+        body: list[ast.stmt] = []
+        names: list[str] = []
+        for statement in module.body:
+            if isinstance(statement, ast.ImportFrom):
+                # ariadne-codegen exports the exceptions only together with
+                # its own base client
+                if statement.module == BASE_CLIENT_MODULE_NAME:
+                    statement.names.extend(ast.alias(name=name) for name in BATCH_NAMES)
+                    body.append(statement)
+                    body.append(
+                        ast.ImportFrom(
+                            module=EXCEPTIONS_FILE_PATH.stem,
+                            names=[
+                                ast.alias(name=name)
+                                for name in GRAPHQL_CLIENT_EXCEPTIONS_NAMES
+                            ],
+                            level=1,
+                        )
+                    )
+                    names.extend(alias.name for alias in statement.names)
+                    names.extend(GRAPHQL_CLIENT_EXCEPTIONS_NAMES)
+                    continue
+
+                names.extend(alias.name for alias in statement.names)
+            elif isinstance(statement, ast.Assign) and any(
+                isinstance(target, ast.Name) and target.id == "__all__"
+                for target in statement.targets
+            ):
+                statement.value = ast.List(
+                    elts=[ast.Constant(value=name) for name in sorted(names)]
+                )
+
+            body.append(statement)
+
+        module.body = body
+        return module
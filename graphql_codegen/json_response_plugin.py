@@ -0,0 +1,54 @@
+import ast
+from typing import Union
+
+from ariadne_codegen.plugins.base import Plugin
+from graphql import OperationDefinitionNode
+
+
+class JsonResponsePlugin(Plugin):
+    # Replaces
+    #     data = self.get_data(response)
+    #     return Result.model_validate(data)
+    # with AsyncBaseClient.parse_response, which validates the result from
+    # the response bytes
+
+    def generate_client_method(
+        self,
+        method_def: Union[ast.FunctionDef, ast.AsyncFunctionDef],
+        operation_definition: OperationDefinitionNode,
+    ) -> Union[ast.FunctionDef, ast.AsyncFunctionDef]:
+        if len(method_def.body) < 2 or not isinstance(method_def.returns, ast.Name):
+            return method_def
+
+        get_data_statement, return_statement = method_def.body[-2:]
+        if not (
+            isinstance(get_data_statement, ast.Assign)
+            and isinstance(get_data_statement.value, ast.Call)
+            and isinstance(get_data_statement.value.func, ast.Attribute)
+            and get_data_statement.value.func.attr == "get_data"
+            and isinstance(return_statement, ast.Return)
+        ):
+            return method_def
+
+        method_def.body[-2:] = [
+            ast.Return(
+                value=ast.Call(
+                    func=ast.Attribute(
+                        value=ast.Name(id="self"),
+                        attr="parse_response",
+                    ),
+                    args=[],
+                    keywords=[
+                        ast.keyword(
+                            arg="response",
+                            value=get_data_statement.value.args[0],
+                        ),
+                        ast.keyword(
+                            arg="result_type",
+                            value=ast.Name(id=method_def.returns.id),
+                        ),
+                    ],
+                ),
+            ),
+        ]
+        return method_def
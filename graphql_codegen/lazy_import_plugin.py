@@ -0,0 +1,94 @@
+import ast
+
+from ariadne_codegen.plugins.base import Plugin
+
+BASE_MODEL_CLASS_LINE = "class BaseModel(PydanticBaseModel):\n"
+BASE_MODEL_CONFIG_LINE = "        protected_namespaces=(),\n"
+
+LAZY_GETATTR_CODE = """
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return __all__
+"""
+
+
+class LazyImportPlugin(Plugin):
+    # Keeps the startup from importing and building every generated model:
+    # the package __init__ imports the submodules on first attribute access
+    # (PEP 562) and the models build their schema on first use
+
+    def generate_init_module(self, module: ast.Module) -> ast.Module:
+        imports: list[ast.stmt] = []
+        lazy_imports: dict[str, str] = {}
+        others: list[ast.stmt] = []
+        for statement in module.body:
+            if isinstance(statement, ast.ImportFrom) and statement.level == 1:
+                assert statement.module is not None
+                imports.append(statement)
+                for alias in statement.names:
+                    lazy_imports[alias.asname or alias.name] = statement.module
+            else:
+                others.append(statement)
+
+        module.body = [
+            ast.ImportFrom(
+                module="importlib",
+                names=[ast.alias(name="import_module")],
+                level=0,
+            ),
+            ast.ImportFrom(
+                module="typing",
+                names=[
+                    ast.alias(name="TYPE_CHECKING"),
+                    ast.alias(name="Any"),
+                    ast.alias(name="Dict"),
+                    ast.alias(name="List"),
+                ],
+                level=0,
+            ),
+            # Type checkers and IDEs still see the eager imports
+            ast.If(
+                test=ast.Name(id="TYPE_CHECKING"),
+                body=imports,
+                orelse=[],
+            ),
+            ast.AnnAssign(
+                target=ast.Name(id="_LAZY_IMPORTS"),
+                annotation=ast.Subscript(
+                    value=ast.Name(id="Dict"),
+                    slice=ast.Tuple(elts=[ast.Name(id="str"), ast.Name(id="str")]),
+                ),
+                value=ast.Dict(
+                    keys=[ast.Constant(value=name) for name in sorted(lazy_imports)],
+                    values=[
+                        ast.Constant(value=lazy_imports[name])
+                        for name in sorted(lazy_imports)
+                    ],
+                ),
+                simple=1,
+            ),
+            *others,
+            *ast.parse(LAZY_GETATTR_CODE).body,
+        ]
+        return module
+
+    def copy_code(self, copied_code: str) -> str:
+        if BASE_MODEL_CLASS_LINE not in copied_code:
+            return copied_code
+
+        if BASE_MODEL_CONFIG_LINE not in copied_code:
+            raise ValueError("Unexpected base_model.py of ariadne-codegen")
+
+        return copied_code.replace(
+            BASE_MODEL_CONFIG_LINE,
+            BASE_MODEL_CONFIG_LINE + "        defer_build=True,\n",
+        )
@@ -0,0 +1,87 @@
+import asyncio
+from collections import Counter
+from typing import Any, Awaitable, Callable, TypeVar
+
+import httpx
+import orjson
+import pytest
+from amaterus_admin_gradio.graphql_client import Client
+
+T = TypeVar("T")
+
+# Returns a response body ({"data": ...} or {"errors": ...}) or an HTTP response
+HasuraOperationHandler = Callable[[dict[str, Any]], dict[str, Any] | httpx.Response]
+
+
+def create_graphql_error_body(
+    message: str,
+    code: str = "constraint-violation",
+) -> dict[str, Any]:
+    return {"errors": [{"message": message, "extensions": {"code": code}}]}
+
+
+class HasuraStandIn:
+    # Answers the GraphQL requests by the handler registered for the operation name
+    def __init__(self) -> None:
+        self.operation_handlers: dict[str, HasuraOperationHandler] = {}
+        self.request_counts: Counter[str] = Counter()
+        self.payloads: list[Any] = []
+
+    def add_operation(
+        self,
+        operation_name: str,
+        handler: HasuraOperationHandler,
+    ) -> None:
+        self.operation_handlers[operation_name] = handler
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        payload = orjson.loads(request.content)
+        self.payloads.append(payload)
+
+        # Hasura answers an array of operations with an array of responses
+        if isinstance(payload, list):
+            response_bodies = []
+            for operation_payload in payload:
+                response_body = self.handle_operation(operation_payload)
+                assert not isinstance(response_body, httpx.Response)
+                response_bodies.append(response_body)
+
+            return httpx.Response(200, json=response_bodies)
+
+        response = self.handle_operation(payload)
+        if isinstance(response, httpx.Response):
+            return response
+
+        return httpx.Response(200, json=response)
+
+    def handle_operation(
+        self,
+        payload: dict[str, Any],
+    ) -> dict[str, Any] | httpx.Response:
+        operation_name = payload["operationName"]
+        self.request_counts[operation_name] += 1
+
+        handler = self.operation_handlers.get(operation_name)
+        if handler is None:
+            raise AssertionError(f"Unexpected operation: {operation_name}")
+
+        return handler(payload["variables"])
+
+    def run(self, fn: Callable[[Client], Awaitable[T]]) -> T:
+        async def run() -> T:
+            async with httpx.AsyncClient(
+                transport=httpx.MockTransport(self.handle),
+            ) as http_client:
+                return await fn(
+                    Client(
+                        url="http://hasura.test/v1/graphql",
+                        http_client=http_client,
+                    ),
+                )
+
+        return asyncio.run(run())
+
+
+@pytest.fixture
+def hasura() -> HasuraStandIn:
+    return HasuraStandIn()
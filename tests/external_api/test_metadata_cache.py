@@ -0,0 +1,36 @@
+import itertools
+import logging
+
+import pytest
+from amaterus_admin_gradio.external_api import ExternalApiMetadataCache
+from amaterus_admin_gradio.external_api import metadata_cache as metadata_cache_module
+
+
+def test_least_recently_used_entry_is_evicted(monkeypatch: pytest.MonkeyPatch) -> None:
+    # One second per call, so that no two accesses have the same time
+    clock = itertools.count(start=1)
+    monkeypatch.setattr(metadata_cache_module.time, "time", lambda: next(clock))
+
+    metadata_cache = ExternalApiMetadataCache(
+        database_file=None,
+        # Three 10 byte values
+        max_bytes=30,
+        ttl_seconds_by_provider={"youtube": 3600.0},
+        logger=logging.getLogger(__name__),
+    )
+    for remote_id in ("a", "b", "c"):
+        metadata_cache.put(provider="youtube", remote_id=remote_id, value="0" * 10)
+
+    # "b" becomes the least recently used one
+    assert metadata_cache.get(provider="youtube", remote_id="a") is not None
+
+    metadata_cache.put(provider="youtube", remote_id="d", value="0" * 10)
+
+    assert metadata_cache.get(provider="youtube", remote_id="b") is None
+    for remote_id in ("a", "c", "d"):
+        assert metadata_cache.get(provider="youtube", remote_id=remote_id) is not None
+
+    statistics = metadata_cache.get_statistics()
+    assert statistics.eviction_count == 1
+    assert statistics.entry_count == 3
+    assert statistics.total_bytes == 30
@@ -0,0 +1,50 @@
+import asyncio
+import html
+
+import httpx
+import orjson
+from amaterus_admin_gradio.external_api import (
+    NiconicoVideoApiDataResponse,
+    fetch_niconico_video_data,
+)
+
+API_DATA = {
+    "video": {
+        "id": "sm9",
+        "title": "title",
+        "registeredAt": "2007-03-06T00:33:00+09:00",
+        "thumbnail": {"url": "https://nicovideo.cdn.nimg.jp/thumbnails/9/9"},
+    },
+    "owner": {"id": 1, "nickname": "owner"},
+}
+
+
+def fetch_watch_page(watch_page_html: str) -> NiconicoVideoApiDataResponse:
+    def handle(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/watch/sm9"
+        return httpx.Response(200, text=watch_page_html)
+
+    async def run() -> NiconicoVideoApiDataResponse:
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(handle),
+        ) as http_client:
+            return await fetch_niconico_video_data(
+                niconico_video_url_or_id="sm9",
+                http_client=http_client,
+            )
+
+    return asyncio.run(run())
+
+
+def test_fetch_niconico_video_data() -> None:
+    api_data_attribute = html.escape(orjson.dumps(API_DATA).decode())
+    watch_page_html = (
+        "<!DOCTYPE html><html><head><title>sm9</title></head><body>"
+        f'<div id="js-initial-watch-data" data-api-data="{api_data_attribute}">'
+        "</div>" + "<p>comment</p>" * 10000 + "</body></html>"
+    )
+
+    api_data_response = fetch_watch_page(watch_page_html=watch_page_html)
+
+    assert api_data_response.video.id == "sm9"
+    assert api_data_response.owner.nickname == "owner"
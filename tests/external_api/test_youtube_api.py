@@ -0,0 +1,104 @@
+import asyncio
+import logging
+
+import httpx
+from amaterus_admin_gradio.external_api import (
+    ExternalApiMetadataCache,
+    YoutubeApiQuotaTracker,
+    YoutubeApiVideoResponseItem,
+    fetch_youtube_video_data_batch,
+    is_remote_youtube_video_id,
+    parse_remote_youtube_video_id,
+)
+
+REMOTE_YOUTUBE_VIDEO_ID = "dQw4w9WgXcQ"
+VIDEO_SNIPPET = {
+    "title": "title",
+    "channelId": "UC0",
+    "channelTitle": "channel",
+    "liveBroadcastContent": "none",
+    "publishedAt": "2009-10-25T06:57:33Z",
+}
+
+
+def test_is_remote_youtube_video_id() -> None:
+    assert is_remote_youtube_video_id(
+        parse_remote_youtube_video_id(
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+        ),
+    )
+    assert is_remote_youtube_video_id("dQw4w9WgXcQ")
+    assert not is_remote_youtube_video_id("h")
+    assert not is_remote_youtube_video_id("htt")
+    assert not is_remote_youtube_video_id("dQw4w9WgXc")
+    assert not is_remote_youtube_video_id("dQw4w9WgXcQ?")
+
+
+def test_not_modified_response_reuses_cached_item() -> None:
+    if_none_match_headers: list[str | None] = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        if_none_match = request.headers.get("If-None-Match")
+        if_none_match_headers.append(if_none_match)
+        if if_none_match == '"etag"':
+            return httpx.Response(304)
+
+        return httpx.Response(
+            200,
+            json={
+                "items": [{"id": REMOTE_YOUTUBE_VIDEO_ID, "snippet": VIDEO_SNIPPET}],
+            },
+            headers={"ETag": '"etag"'},
+        )
+
+    logger = logging.getLogger(__name__)
+    # Every entry expires at once, so the second fetch revalidates it
+    metadata_cache = ExternalApiMetadataCache(
+        database_file=None,
+        max_bytes=1024 * 1024,
+        ttl_seconds_by_provider={"youtube": 0.0},
+        logger=logger,
+    )
+    quota_tracker = YoutubeApiQuotaTracker(
+        database_file=None,
+        daily_quota=10000,
+        logger=logger,
+    )
+
+    async def run() -> list[dict[str, YoutubeApiVideoResponseItem]]:
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(handle),
+        ) as http_client:
+            return [
+                await fetch_youtube_video_data_batch(
+                    youtube_video_url_or_id_list=[REMOTE_YOUTUBE_VIDEO_ID],
+                    youtube_api_key="key",
+                    http_client=http_client,
+                    metadata_cache=metadata_cache,
+                    quota_tracker=quota_tracker,
+                )
+                for _ in range(2)
+            ]
+
+    fetched_items, revalidated_items = asyncio.run(run())
+
+    assert if_none_match_headers == [None, '"etag"']
+    assert revalidated_items == fetched_items
+    assert revalidated_items[REMOTE_YOUTUBE_VIDEO_ID].snippet is not None
+    assert quota_tracker.get_used_units() == 1
+
+
+def test_cached_item_without_published_at_is_read() -> None:
+    item = YoutubeApiVideoResponseItem.model_validate(
+        {
+            "id": REMOTE_YOUTUBE_VIDEO_ID,
+            "snippet": {
+                key: value
+                for key, value in VIDEO_SNIPPET.items()
+                if key != "publishedAt"
+            },
+        },
+    )
+
+    assert item.snippet is not None
+    assert item.snippet.publishedAt is None
@@ -0,0 +1,108 @@
+from typing import Any
+
+from amaterus_admin_gradio.graphql_client import Client, GraphQLBatchResult
+from conftest import HasuraStandIn, create_graphql_error_body
+
+MERGED_OPERATION_NAME = (
+    "Batch__GetTwitterTweetByRemoteTweetId__GetTwitterAccountByScreenName"
+)
+
+
+def execute_batch(hasura: HasuraStandIn, merge: bool) -> GraphQLBatchResult:
+    async def run(graphql_client: Client) -> GraphQLBatchResult:
+        return await graphql_client.execute_batch(
+            operations=[
+                graphql_client.get_twitter_tweet_by_remote_tweet_id_operation(
+                    remote_tweet_id="1",
+                ),
+                graphql_client.get_twitter_account_by_screen_name_operation(
+                    twitter_screen_name="example",
+                ),
+            ],
+            merge=merge,
+        )
+
+    return hasura.run(run)
+
+
+def test_merged_batch_prefixes_each_operation(hasura: HasuraStandIn) -> None:
+    def get_merged(variables: dict[str, Any]) -> dict[str, Any]:
+        assert variables == {
+            "b0_remoteTweetId": "1",
+            "b1_twitterScreenName": "example",
+        }
+        return {
+            "data": {
+                "b0_twitter_tweet_list": [{"id": "tweet"}],
+                "b1_twitter_account_list": [{"id": "account"}],
+            },
+        }
+
+    hasura.add_operation(MERGED_OPERATION_NAME, get_merged)
+
+    batch_result = execute_batch(hasura=hasura, merge=True)
+    tweet_operation, account_operation = batch_result.operations
+
+    assert hasura.request_counts == {MERGED_OPERATION_NAME: 1}
+    query = hasura.payloads[0]["query"]
+    assert "b0_twitter_tweet_list: twitter_tweets" in query
+    assert "$b0_remoteTweetId" in query
+    assert "b1_twitter_account_list: twitter_accounts" in query
+    assert "$b1_twitterScreenName" in query
+    assert batch_result.get(tweet_operation).twitter_tweet_list[0].id == "tweet"
+    assert batch_result.get(account_operation).twitter_account_list[0].id == "account"
+
+
+def test_merged_batch_error_reaches_only_its_operation(hasura: HasuraStandIn) -> None:
+    def get_merged(variables: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "data": {
+                "b0_twitter_tweet_list": [{"id": "tweet"}],
+                "b1_twitter_account_list": None,
+            },
+            "errors": [
+                {
+                    "message": "field not found",
+                    "path": ["b1_twitter_account_list", 0],
+                    "extensions": {"code": "validation-failed"},
+                },
+            ],
+        }
+
+    hasura.add_operation(MERGED_OPERATION_NAME, get_merged)
+
+    batch_result = execute_batch(hasura=hasura, merge=True)
+    tweet_operation, account_operation = batch_result.operations
+
+    assert batch_result.get_errors(tweet_operation) is None
+    assert batch_result.get(tweet_operation).twitter_tweet_list[0].id == "tweet"
+    account_errors = batch_result.get_errors(account_operation)
+    assert account_errors is not None
+    assert [error.path for error in account_errors.errors] == [
+        ["twitter_account_list", 0],
+    ]
+
+
+def test_array_batch_answers_each_operation(hasura: HasuraStandIn) -> None:
+    hasura.add_operation(
+        "GetTwitterTweetByRemoteTweetId",
+        lambda variables: {"data": {"twitter_tweet_list": [{"id": "tweet"}]}},
+    )
+    hasura.add_operation(
+        "GetTwitterAccountByScreenName",
+        lambda variables: create_graphql_error_body(
+            message="field not found",
+            code="validation-failed",
+        ),
+    )
+
+    batch_result = execute_batch(hasura=hasura, merge=False)
+    tweet_operation, account_operation = batch_result.operations
+
+    assert len(hasura.payloads) == 1
+    assert [payload["variables"] for payload in hasura.payloads[0]] == [
+        {"remoteTweetId": "1"},
+        {"twitterScreenName": "example"},
+    ]
+    assert batch_result.get(tweet_operation).twitter_tweet_list[0].id == "tweet"
+    assert batch_result.get_errors(account_operation) is not None
@@ -0,0 +1,89 @@
+import asyncio
+import logging
+from typing import Any
+
+import httpx
+from amaterus_admin_gradio.graphql_client import Client
+from amaterus_admin_gradio.store import PersonAccountIndex, PersonAccountIndexStore
+from conftest import HasuraStandIn
+
+PERSON_ID = "00000000-0000-0000-0000-000000000001"
+
+
+def get_person_account_index(variables: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "data": {
+            "person_youtube_channel_list": [
+                {
+                    "person_id": PERSON_ID,
+                    "youtube_channel": {
+                        "remote_youtube_channel_id": "UC0",
+                    },
+                },
+            ],
+            "person_niconico_account_list": [],
+            "person_twitter_account_list": [],
+        },
+    }
+
+
+def get_person_account_indexes(
+    hasura: HasuraStandIn,
+    count: int,
+    invalidate: bool = False,
+) -> tuple[list[PersonAccountIndex | None], PersonAccountIndexStore]:
+    async def run(
+        graphql_client: Client,
+    ) -> tuple[list[PersonAccountIndex | None], PersonAccountIndexStore]:
+        person_account_index_store = PersonAccountIndexStore(
+            graphql_client=graphql_client,
+            ttl_seconds=60.0,
+            logger=logging.getLogger(__name__),
+        )
+        person_account_indexes = list(
+            await asyncio.gather(
+                *(person_account_index_store.get_or_none() for _ in range(count)),
+            ),
+        )
+        if invalidate:
+            person_account_index_store.invalidate()
+            person_account_indexes.append(
+                await person_account_index_store.get_or_none(),
+            )
+
+        return person_account_indexes, person_account_index_store
+
+    return hasura.run(run)
+
+
+def test_concurrent_callers_share_one_refresh(hasura: HasuraStandIn) -> None:
+    hasura.add_operation("GetPersonAccountIndex", get_person_account_index)
+
+    person_account_indexes, person_account_index_store = get_person_account_indexes(
+        hasura=hasura,
+        count=3,
+        invalidate=True,
+    )
+
+    for person_account_index in person_account_indexes:
+        assert person_account_index is not None
+        assert (
+            person_account_index.find_person_id(provider="youtube", account_id="UC0")
+            == PERSON_ID
+        )
+
+    statistics = person_account_index_store.get_statistics()
+    assert hasura.request_counts["GetPersonAccountIndex"] == 2
+    assert statistics.hit_count == 2
+    assert statistics.miss_count == 2
+
+
+def test_failed_refresh_returns_none(hasura: HasuraStandIn) -> None:
+    hasura.add_operation(
+        "GetPersonAccountIndex",
+        lambda variables: httpx.Response(500, text="Internal Server Error"),
+    )
+
+    person_account_indexes, _ = get_person_account_indexes(hasura=hasura, count=1)
+
+    assert person_account_indexes == [None]
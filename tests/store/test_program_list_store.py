@@ -0,0 +1,163 @@
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from amaterus_admin_gradio.graphql_client import Client
+from amaterus_admin_gradio.store import (
+    ProgramIntervalIndex,
+    ProgramListItem,
+    ProgramListStore,
+)
+from conftest import HasuraStandIn
+
+BASE_TIME = datetime(2024, 1, 1, tzinfo=timezone.utc)
+HOUR = timedelta(hours=1)
+
+
+def create_program(
+    program_id: str,
+    start_time: datetime | None,
+    end_time: datetime | None,
+) -> ProgramListItem:
+    return ProgramListItem(
+        id=program_id,
+        title=program_id,
+        start_time=start_time,
+        end_time=end_time,
+    )
+
+
+def create_hourly_programs(count: int) -> list[ProgramListItem]:
+    # One-hour programs every two hours
+    return [
+        create_program(
+            program_id=f"program_{index}",
+            start_time=BASE_TIME + index * 2 * HOUR,
+            end_time=BASE_TIME + (index * 2 + 1) * HOUR,
+        )
+        for index in range(count)
+    ]
+
+
+def find_overlapping_program_ids(
+    program_interval_index: ProgramIntervalIndex,
+    start_time: datetime,
+    end_time: datetime | None,
+) -> list[str]:
+    return [
+        program.id
+        for program in program_interval_index.find_overlapping_programs(
+            start_time=start_time,
+            end_time=end_time,
+        )
+    ]
+
+
+def test_find_overlapping_programs() -> None:
+    program_interval_index = ProgramIntervalIndex(
+        program_list=[
+            create_program("a", BASE_TIME, BASE_TIME + 2 * HOUR),
+            create_program("b", BASE_TIME + 3 * HOUR, BASE_TIME + 4 * HOUR),
+            create_program("instant", BASE_TIME + 5 * HOUR, None),
+            create_program("unscheduled", None, None),
+        ],
+    )
+
+    assert find_overlapping_program_ids(
+        program_interval_index,
+        start_time=BASE_TIME + HOUR,
+        end_time=BASE_TIME + 3.5 * HOUR,
+    ) == ["a", "b"]
+    assert find_overlapping_program_ids(
+        program_interval_index,
+        start_time=BASE_TIME + 5 * HOUR,
+        end_time=None,
+    ) == ["instant"]
+    assert (
+        find_overlapping_program_ids(
+            program_interval_index,
+            start_time=BASE_TIME + 10 * HOUR,
+            end_time=BASE_TIME + 11 * HOUR,
+        )
+        == []
+    )
+
+
+def test_find_overlapping_programs_ranks_long_program_below_matching_one() -> None:
+    program_interval_index = ProgramIntervalIndex(
+        program_list=[
+            create_program("event", BASE_TIME - 24 * HOUR, BASE_TIME + 48 * HOUR),
+            create_program("stream", BASE_TIME, BASE_TIME + 2 * HOUR),
+        ],
+    )
+
+    assert find_overlapping_program_ids(
+        program_interval_index,
+        start_time=BASE_TIME + 0.5 * HOUR,
+        end_time=BASE_TIME + 2.5 * HOUR,
+    ) == ["stream", "event"]
+
+
+def test_long_program_does_not_widen_candidates() -> None:
+    program_list = create_hourly_programs(count=1000)
+    long_program = create_program(
+        "long",
+        BASE_TIME - 24 * HOUR,
+        # e.g. a wrong end time
+        BASE_TIME + 365 * 24 * HOUR,
+    )
+    program_interval_index = ProgramIntervalIndex(
+        program_list=[*program_list, long_program],
+    )
+
+    start_time = BASE_TIME + 1000 * HOUR
+    candidate_intervals = program_interval_index._find_candidate_intervals(
+        start_timestamp=start_time.timestamp(),
+        end_timestamp=(start_time + HOUR).timestamp(),
+    )
+
+    # The programs starting within one hour before the range and the long program
+    assert len(candidate_intervals) <= 3
+    assert find_overlapping_program_ids(
+        program_interval_index,
+        start_time=start_time,
+        end_time=start_time + HOUR,
+    ) == ["program_500", "long"]
+
+
+def test_program_added_while_refreshing_is_kept(hasura: HasuraStandIn) -> None:
+    project_id = "project"
+    fetched_program = create_program("fetched", BASE_TIME, BASE_TIME + HOUR)
+    added_program = create_program("added", BASE_TIME + 2 * HOUR, None)
+    program_list_store: ProgramListStore
+
+    def get_program_project_list(variables: dict[str, Any]) -> dict[str, Any]:
+        # LiveUpdateSubscriber adds a program the response does not include
+        program_list_store.add_program(project_id=project_id, program=added_program)
+        return {
+            "data": {
+                "project": {
+                    "program_project_list": [
+                        {"program": fetched_program.model_dump(mode="json")},
+                    ],
+                },
+            },
+        }
+
+    hasura.add_operation("GetProgramProjectListByProjectId", get_program_project_list)
+
+    async def run(graphql_client: Client) -> list[str]:
+        nonlocal program_list_store
+        program_list_store = ProgramListStore(
+            graphql_client=graphql_client,
+            ttl_seconds=60.0,
+            logger=logging.getLogger(__name__),
+        )
+        program_list_store.is_live = True
+
+        program_list = await program_list_store.get(project_id=project_id)
+        assert program_list is not None
+
+        return [program.id for program in program_list]
+
+    assert hasura.run(run) == ["added", "fetched"]
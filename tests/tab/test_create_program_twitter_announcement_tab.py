@@ -0,0 +1,165 @@
+import uuid
+from datetime import datetime, timezone
+from typing import Any
+
+import pytest
+from amaterus_admin_gradio.graphql_client import Client, GraphQLClientGraphQLMultiError
+from amaterus_admin_gradio.tab.create_program_twitter_announcement_tab import (
+    create_program_twitter_announcement_with_tweet_image,
+)
+from conftest import HasuraStandIn, create_graphql_error_body
+
+
+class TwitterTweetTable:
+    # Upserts tweets by remote_tweet_id like twitter_tweets_remote_tweet_id_key,
+    # and rejects an image or an announcement referring to a missing tweet
+    def __init__(self, hasura: HasuraStandIn) -> None:
+        self.twitter_tweet_id_by_remote_tweet_id: dict[str, str] = {}
+        # Registers a tweet just before the next create (another request)
+        self.remote_tweet_id_registered_before_create: str | None = None
+        # Rejects the next create by another constraint (e.g. a missing person)
+        self.failing_create_by_other_constraint = False
+
+        hasura.add_operation(
+            "GetTwitterTweetByRemoteTweetId",
+            self.get_twitter_tweet_by_remote_tweet_id,
+        )
+        hasura.add_operation(
+            "CreateProgramTwitterAnnouncementWithTweetImage",
+            self.create_program_twitter_announcement_with_tweet_image,
+        )
+
+    def get_twitter_tweet_by_remote_tweet_id(
+        self,
+        variables: dict[str, Any],
+    ) -> dict[str, Any]:
+        twitter_tweet_id = self.twitter_tweet_id_by_remote_tweet_id.get(
+            variables["remoteTweetId"],
+        )
+        twitter_tweet_list = (
+            [{"id": twitter_tweet_id}] if twitter_tweet_id is not None else []
+        )
+        return {"data": {"twitter_tweet_list": twitter_tweet_list}}
+
+    def create_program_twitter_announcement_with_tweet_image(
+        self,
+        variables: dict[str, Any],
+    ) -> dict[str, Any]:
+        if self.failing_create_by_other_constraint:
+            return create_graphql_error_body(
+                message=(
+                    "Foreign key violation. insert or update on "
+                    'table "program_twitter_announcements" violates '
+                    'foreign key constraint "program_twitter_'
+                    'announcements_person_id_fkey"'
+                ),
+            )
+
+        if self.remote_tweet_id_registered_before_create is not None:
+            self.twitter_tweet_id_by_remote_tweet_id[
+                self.remote_tweet_id_registered_before_create
+            ] = str(uuid.uuid4())
+            self.remote_tweet_id_registered_before_create = None
+
+        twitter_tweet_id = self.twitter_tweet_id_by_remote_tweet_id.setdefault(
+            variables["remoteTweetId"],
+            variables["twitterTweetId"],
+        )
+        if twitter_tweet_id != variables["twitterTweetId"]:
+            # The transaction is rolled back
+            return create_graphql_error_body(
+                message=(
+                    "Foreign key violation. insert or update on "
+                    'table "twitter_tweet_images" violates foreign '
+                    'key constraint "twitter_tweet_images_'
+                    'twitter_tweet_id_fkey"'
+                ),
+            )
+
+        return {
+            "data": {
+                "twitter_tweet": {"id": twitter_tweet_id},
+                "program_twitter_announcement": {
+                    "id": str(uuid.uuid4()),
+                    "twitter_tweet_id": twitter_tweet_id,
+                    "twitter_tweet_image_id": str(uuid.uuid4()),
+                },
+            },
+        }
+
+
+def create_program_twitter_announcement(
+    hasura: HasuraStandIn,
+    remote_tweet_id: str,
+    twitter_tweet_id: str | None = None,
+) -> str:
+    async def run(graphql_client: Client) -> str:
+        return await create_program_twitter_announcement_with_tweet_image(
+            graphql_client=graphql_client,
+            program_id=str(uuid.uuid4()),
+            person_id=str(uuid.uuid4()),
+            twitter_tweet_id=twitter_tweet_id,
+            remote_tweet_id=remote_tweet_id,
+            twitter_account_id=str(uuid.uuid4()),
+            tweet_time=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            tweet_embed_html="<blockquote></blockquote>",
+            twitter_tweet_image_index=0,
+            twitter_tweet_image_url="https://pbs.twimg.com/media/example.jpg",
+        )
+
+    return hasura.run(run)
+
+
+def test_create_with_new_tweet(hasura: HasuraStandIn) -> None:
+    twitter_tweets = TwitterTweetTable(hasura=hasura)
+
+    create_program_twitter_announcement(hasura=hasura, remote_tweet_id="1")
+
+    assert "1" in twitter_tweets.twitter_tweet_id_by_remote_tweet_id
+    assert hasura.request_counts["GetTwitterTweetByRemoteTweetId"] == 0
+    assert hasura.request_counts["CreateProgramTwitterAnnouncementWithTweetImage"] == 1
+
+
+def test_create_with_registered_tweet(hasura: HasuraStandIn) -> None:
+    twitter_tweets = TwitterTweetTable(hasura=hasura)
+    registered_twitter_tweet_id = str(uuid.uuid4())
+    twitter_tweets.twitter_tweet_id_by_remote_tweet_id["1"] = (
+        registered_twitter_tweet_id
+    )
+
+    create_program_twitter_announcement(
+        hasura=hasura,
+        remote_tweet_id="1",
+        twitter_tweet_id=registered_twitter_tweet_id,
+    )
+
+    assert twitter_tweets.twitter_tweet_id_by_remote_tweet_id["1"] == (
+        registered_twitter_tweet_id
+    )
+    assert hasura.request_counts["GetTwitterTweetByRemoteTweetId"] == 0
+    assert hasura.request_counts["CreateProgramTwitterAnnouncementWithTweetImage"] == 1
+
+
+def test_create_retries_with_tweet_registered_after_lookup(
+    hasura: HasuraStandIn,
+) -> None:
+    twitter_tweets = TwitterTweetTable(hasura=hasura)
+    twitter_tweets.remote_tweet_id_registered_before_create = "1"
+
+    create_program_twitter_announcement(hasura=hasura, remote_tweet_id="1")
+
+    assert hasura.request_counts["GetTwitterTweetByRemoteTweetId"] == 1
+    assert hasura.request_counts["CreateProgramTwitterAnnouncementWithTweetImage"] == 2
+
+
+def test_create_does_not_retry_other_constraint_violation(
+    hasura: HasuraStandIn,
+) -> None:
+    twitter_tweets = TwitterTweetTable(hasura=hasura)
+    twitter_tweets.failing_create_by_other_constraint = True
+
+    with pytest.raises(GraphQLClientGraphQLMultiError):
+        create_program_twitter_announcement(hasura=hasura, remote_tweet_id="1")
+
+    assert hasura.request_counts["GetTwitterTweetByRemoteTweetId"] == 0
+    assert hasura.request_counts["CreateProgramTwitterAnnouncementWithTweetImage"] == 1
@@ -0,0 +1,155 @@
+import logging
+import uuid
+from typing import Any
+
+import httpx
+import pytest
+from amaterus_admin_gradio.graphql_client import Client, GraphQLClientHttpError
+from amaterus_admin_gradio.tab.create_program_youtube_live_live_archives_bulk_tab import (
+    LiveArchiveBulkRow,
+    create_program_live_archive_insert_input,
+    insert_program_live_archives,
+)
+from conftest import HasuraStandIn, create_graphql_error_body
+
+PROGRAM_ID = str(uuid.uuid4())
+PERSON_ID = str(uuid.uuid4())
+
+
+class ProgramLiveArchiveTable:
+    # Inserts all objects in one transaction, like Hasura,
+    # and rejects the videos in rejected_remote_youtube_video_ids
+    def __init__(
+        self,
+        hasura: HasuraStandIn,
+        rejected_remote_youtube_video_ids: set[str],
+    ) -> None:
+        self.rejected_remote_youtube_video_ids = rejected_remote_youtube_video_ids
+        self.object_counts: list[int] = []
+        # Commits the batch but fails before responding (e.g. a timeout)
+        self.failing_after_commit = False
+
+        hasura.add_operation(
+            "CreateProgramYoutubeLiveLiveArchives",
+            self.create_program_youtube_live_live_archives,
+        )
+
+    def create_program_youtube_live_live_archives(
+        self,
+        variables: dict[str, Any],
+    ) -> dict[str, Any] | httpx.Response:
+        objects = variables["objects"]
+        self.object_counts.append(len(objects))
+
+        returning = []
+        for obj in objects:
+            remote_youtube_video_id = obj["youtube_live"]["data"][
+                "remote_youtube_video_id"
+            ]
+            if remote_youtube_video_id in self.rejected_remote_youtube_video_ids:
+                return create_graphql_error_body(message="Uniqueness violation.")
+
+            returning.append(
+                {
+                    "id": f"archive_{remote_youtube_video_id}",
+                    "program_id": obj["program_id"],
+                    "person_id": obj["person_id"],
+                    "youtube_live": {
+                        "remote_youtube_video_id": remote_youtube_video_id,
+                    },
+                },
+            )
+
+        if self.failing_after_commit:
+            return httpx.Response(504, text="Gateway Timeout")
+
+        return {"data": {"insert_program_live_archives": {"returning": returning}}}
+
+
+def insert_rows(
+    hasura: HasuraStandIn,
+    remote_youtube_video_ids: list[str],
+) -> list[LiveArchiveBulkRow]:
+    rows = [
+        LiveArchiveBulkRow(
+            row_number=row_number,
+            youtube_live_url_or_id=remote_youtube_video_id,
+            remote_youtube_video_id=remote_youtube_video_id,
+            program_id=PROGRAM_ID,
+            person_id=PERSON_ID,
+        )
+        for row_number, remote_youtube_video_id in enumerate(
+            remote_youtube_video_ids,
+            start=1,
+        )
+    ]
+    objects = [
+        create_program_live_archive_insert_input(
+            program_id=PROGRAM_ID,
+            person_id=PERSON_ID,
+            remote_youtube_video_id=remote_youtube_video_id,
+            title=remote_youtube_video_id,
+            remote_youtube_channel_id="UC0",
+            youtube_channel_name="channel",
+            start_time=None,
+            end_time=None,
+        )
+        for remote_youtube_video_id in remote_youtube_video_ids
+    ]
+
+    async def run(graphql_client: Client) -> None:
+        await insert_program_live_archives(
+            graphql_client=graphql_client,
+            objects=objects,
+            rows=rows,
+            logger=logging.getLogger(__name__),
+        )
+
+    hasura.run(run)
+
+    return rows
+
+
+def test_insert_in_one_batch(hasura: HasuraStandIn) -> None:
+    program_live_archives = ProgramLiveArchiveTable(
+        hasura=hasura,
+        rejected_remote_youtube_video_ids=set(),
+    )
+
+    rows = insert_rows(hasura=hasura, remote_youtube_video_ids=["v1", "v2"])
+
+    assert program_live_archives.object_counts == [2]
+    assert [row.program_live_archive_id for row in rows] == ["archive_v1", "archive_v2"]
+    assert [row.error for row in rows] == [None, None]
+
+
+def test_failed_batch_is_retried_row_by_row(hasura: HasuraStandIn) -> None:
+    program_live_archives = ProgramLiveArchiveTable(
+        hasura=hasura,
+        rejected_remote_youtube_video_ids={"v2"},
+    )
+
+    rows = insert_rows(hasura=hasura, remote_youtube_video_ids=["v1", "v2", "v3"])
+
+    assert program_live_archives.object_counts == [3, 1, 1, 1]
+    assert [row.program_live_archive_id for row in rows] == [
+        "archive_v1",
+        None,
+        "archive_v3",
+    ]
+    assert rows[0].error is None
+    assert rows[1].error is not None
+    assert rows[2].error is None
+
+
+def test_failed_batch_after_commit_is_not_retried(hasura: HasuraStandIn) -> None:
+    program_live_archives = ProgramLiveArchiveTable(
+        hasura=hasura,
+        rejected_remote_youtube_video_ids=set(),
+    )
+    program_live_archives.failing_after_commit = True
+
+    with pytest.raises(GraphQLClientHttpError):
+        insert_rows(hasura=hasura, remote_youtube_video_ids=["v1", "v2"])
+
+    assert program_live_archives.object_counts == [2]
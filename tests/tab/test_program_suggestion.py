@@ -0,0 +1,42 @@
+import logging
+from datetime import datetime, timezone
+
+import httpx
+from amaterus_admin_gradio.graphql_client import Client
+from amaterus_admin_gradio.store import ProgramListStore
+from amaterus_admin_gradio.tab.program_suggestion import (
+    load_program_list,
+    suggest_program_id,
+)
+from conftest import HasuraStandIn
+
+
+def test_failed_program_list_query_suggests_nothing(hasura: HasuraStandIn) -> None:
+    hasura.add_operation(
+        "GetProgramProjectListByProjectId",
+        lambda variables: httpx.Response(503, text="Service Unavailable"),
+    )
+
+    async def run(graphql_client: Client) -> str | None:
+        logger = logging.getLogger(__name__)
+        program_list_store = ProgramListStore(
+            graphql_client=graphql_client,
+            ttl_seconds=60.0,
+            logger=logger,
+        )
+
+        await load_program_list(
+            program_list_store=program_list_store,
+            project_id="project",
+        )
+        return await suggest_program_id(
+            program_list_store=program_list_store,
+            project_id="project",
+            program_id=None,
+            start_time=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            end_time=None,
+            logger=logger,
+        )
+
+    assert hasura.run(run) is None
+    assert hasura.request_counts["GetProgramProjectListByProjectId"] == 2
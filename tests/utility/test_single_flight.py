@@ -0,0 +1,59 @@
+import asyncio
+
+from amaterus_admin_gradio.utility.single_flight import SingleFlight
+
+
+def test_concurrent_callers_share_one_call() -> None:
+    single_flight: SingleFlight[str] = SingleFlight()
+    call_count = 0
+
+    async def fetch() -> str:
+        nonlocal call_count
+        call_count += 1
+        await asyncio.sleep(0.01)
+        return "value"
+
+    async def run() -> list[str]:
+        results = list(
+            await asyncio.gather(
+                single_flight.do_async("key", fetch),
+                single_flight.do_async("key", fetch),
+                single_flight.do_async("key", fetch),
+            ),
+        )
+        assert single_flight.get_in_flight_count() == 0
+
+        # A finished call is not reused
+        results.append(await single_flight.do_async("key", fetch))
+        return results
+
+    assert asyncio.run(run()) == ["value"] * 4
+    assert call_count == 2
+
+
+def test_error_reaches_every_caller_and_clears_key() -> None:
+    single_flight: SingleFlight[str] = SingleFlight()
+    call_count = 0
+
+    async def fail() -> str:
+        nonlocal call_count
+        call_count += 1
+        await asyncio.sleep(0.01)
+        raise RuntimeError("failed")
+
+    async def succeed() -> str:
+        return "value"
+
+    async def run() -> str:
+        results = await asyncio.gather(
+            single_flight.do_async("key", fail),
+            single_flight.do_async("key", fail),
+            return_exceptions=True,
+        )
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert single_flight.get_in_flight_count() == 0
+
+        return await single_flight.do_async("key", succeed)
+
+    assert asyncio.run(run()) == "value"
+    assert call_count == 1